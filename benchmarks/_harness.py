@@ -0,0 +1,36 @@
+"""Shared timing helpers for the LOCAL-only benchmark scripts."""
+
+from __future__ import annotations
+
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+
+def measure(func: Callable[[], object], *, number: int, repeat: int = 5) -> float:
+    """Return the best observed seconds per call across ``repeat`` batches."""
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def result(name: str, seconds: float, **extra: object) -> dict[str, object]:
+    """Build one benchmark record; ``seconds`` is per operation, lower is better."""
+
+    return {"name": name, "seconds": seconds, **extra}
+
+
+def write_results(results: list[dict[str, object]]) -> None:
+    """Print results as JSON so runs can be diffed or stored."""
+
+    sys.stdout.write(json.dumps(results, indent=2) + "\n")
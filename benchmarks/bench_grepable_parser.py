@@ -0,0 +1,88 @@
+"""Benchmark findings per second for grepable output against Nmap XML.
+
+Both documents describe the same scan (every host with the same open ports),
+so the two parsers emit the same number of findings.
+"""
+
+from __future__ import annotations
+
+from _harness import measure, result, write_results
+
+from mcp_scansage.services.nmap_limits import DEFAULT_NMAP_LIMITS
+from mcp_scansage.services.nmap_parser import MinimalNmapXmlParser, NmapGrepableParser
+
+HOSTS = 1_000
+"""Hosts in each synthetic scan."""
+
+PORTS = ((22, "ssh", "OpenSSH", "9.6"), (80, "http", "nginx", "1.24"))
+"""Open ports reported for every host."""
+
+LIMITS = DEFAULT_NMAP_LIMITS.with_overrides(
+    {
+        "max_xml_bytes": 64 * 1024 * 1024,
+        "max_hosts": HOSTS,
+        "max_findings": HOSTS * len(PORTS) + 1,
+        "max_parse_memory_bytes": 1 << 30,
+    }
+)
+
+
+def _address(index: int) -> str:
+    return f"192.0.{index // 250}.{index % 250}"
+
+
+def _xml_document() -> bytes:
+    ports = "".join(
+        f'<port protocol="tcp" portid="{port}"><state state="open"/>'
+        f'<service name="{name}" product="{product}" version="{version}"/></port>'
+        for port, name, product, version in PORTS
+    )
+    hosts = "".join(
+        f'<host><status state="up"/><address addr="{_address(index)}" '
+        f'addrtype="ipv4"/><ports>{ports}</ports></host>\n'
+        for index in range(HOSTS)
+    )
+    return f"<nmaprun>\n{hosts}</nmaprun>".encode()
+
+
+def _grepable_document() -> bytes:
+    ports = ", ".join(
+        f"{port}/open/tcp//{name}//{product} {version}/"
+        for port, name, product, version in PORTS
+    )
+    lines = ["# Nmap 7.94 scan initiated as: nmap -sV -oG -"]
+    for index in range(HOSTS):
+        lines.append(f"Host: {_address(index)} ()\tStatus: Up")
+        lines.append(f"Host: {_address(index)} ()\tPorts: {ports}")
+    lines.append(f"# Nmap done -- {HOSTS} IP addresses scanned")
+    return "\n".join(lines).encode()
+
+
+def run() -> list[dict[str, object]]:
+    cases = (
+        ("nmap_xml.minimal", MinimalNmapXmlParser(), _xml_document()),
+        ("nmap_grepable", NmapGrepableParser(), _grepable_document()),
+    )
+    results = []
+    for name, parser, document in cases:
+        findings = parser.parse(document, LIMITS).findings_count
+        seconds = measure(lambda: parser.parse(document, LIMITS), number=3)
+        results.append(
+            result(
+                name,
+                seconds,
+                payload_bytes=len(document),
+                findings=findings,
+                findings_per_second=round(findings / seconds),
+            )
+        )
+    results[1]["speedup"] = round(results[0]["seconds"] / results[1]["seconds"], 2)
+    return results
+
+
+def main() -> None:
+    write_results(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Benchmark how ``MinimalNmapXmlParser`` scales over generated corpora.
+
+Each case parses a seeded document from ``generate_nmap_xml``; ``scaling``
+is the per-host time relative to the smallest document of the same shape,
+so linear parsing stays close to 1.0.
+"""
+
+from __future__ import annotations
+
+from _harness import measure, result, write_results
+from synthetic_payload import (
+    NmapXmlCorpusSpec,
+    generate_nmap_xml,
+)
+
+from mcp_scansage.services.nmap_limits import DEFAULT_NMAP_LIMITS
+from mcp_scansage.services.nmap_parser import MinimalNmapXmlParser
+
+HOST_COUNTS = (200, 800, 1_600)
+"""Document sizes, in hosts; the largest stays under the process parse budget."""
+
+SHAPES = {
+    "plain": {"ports_per_host": 4},
+    "scripts": {"ports_per_host": 4, "script_output_bytes": 512},
+    "wide": {"ports_per_host": 32, "down_host_ratio": 0.5, "service_variety": 256},
+}
+"""Corpus shapes: spec fields other than ``hosts``."""
+
+
+def _case(name: str, spec: NmapXmlCorpusSpec) -> dict[str, object]:
+    document = generate_nmap_xml(spec).encode()
+    limits = DEFAULT_NMAP_LIMITS.with_overrides(
+        {
+            "max_xml_bytes": len(document),
+            "max_hosts": spec.hosts,
+            "max_ports_per_host": spec.ports_per_host,
+            "max_findings": spec.hosts * spec.ports_per_host + 1,
+            "max_parse_memory_bytes": 1 << 30,
+        }
+    )
+    parser = MinimalNmapXmlParser()
+    findings = parser.parse(document, limits).findings_count
+    seconds = measure(lambda: parser.parse(document, limits), number=1, repeat=3)
+    return result(
+        f"nmap_xml.minimal.{name}.{spec.hosts}",
+        seconds,
+        payload_bytes=len(document),
+        hosts=spec.hosts,
+        findings=findings,
+        findings_per_second=round(findings / seconds),
+    )
+
+
+def run() -> list[dict[str, object]]:
+    results = []
+    for name, fields in SHAPES.items():
+        cases = [
+            _case(name, NmapXmlCorpusSpec(hosts=hosts, **fields))  # type: ignore[arg-type]
+            for hosts in HOST_COUNTS
+        ]
+        base = cases[0]["seconds"] / cases[0]["hosts"]
+        for case in cases:
+            case["scaling"] = round(case["seconds"] / case["hosts"] / base, 2)
+        results.extend(cases)
+    return results
+
+
+def main() -> None:
+    write_results(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Benchmark the budgeted XML tree build against the previous unbudgeted parse.
+
+Also reports how the streaming memory estimate compares with what
+``tracemalloc`` sees for the same tree, so the per-element constants in
+``services/parse_memory.py`` can be re-checked on new Python versions.
+"""
+
+from __future__ import annotations
+
+import tracemalloc
+import xml.etree.ElementTree as ET
+from typing import Callable
+
+from _harness import measure, result, write_results
+from defusedxml.ElementTree import fromstring as defused_fromstring
+
+from mcp_scansage.services.nmap_limits import DEFAULT_NMAP_LIMITS
+from mcp_scansage.services.nmap_parser import _UNSAFE_XML_PATTERN, parse_xml_safely
+from mcp_scansage.services.parse_memory import ParseMemoryBudget
+
+HOSTS = 2_000
+"""Hosts in the synthetic document (one open port each)."""
+
+LIMITS = DEFAULT_NMAP_LIMITS.with_overrides(
+    {"max_xml_bytes": 64 * 1024 * 1024, "max_parse_memory_bytes": 1 << 30}
+)
+
+
+def _document() -> bytes:
+    hosts = "".join(
+        f'<host><status state="up"/><address addr="192.0.2.{index % 250}" '
+        f'addrtype="ipv4"/><ports><port protocol="tcp" portid="{index}">'
+        '<state state="open"/><service name="http" product="nginx"/>'
+        "</port></ports></host>\n"
+        for index in range(HOSTS)
+    )
+    return f"<nmaprun>\n{hosts}</nmaprun>".encode()
+
+
+def _previous_parse(document: bytes) -> ET.Element:
+    """The boundary before budgets: decode, DTD screen, defusedxml tree build."""
+
+    text = document.decode("utf-8")
+    if _UNSAFE_XML_PATTERN.search(text):
+        raise ValueError("XML payload contains forbidden declarations.")
+    return defused_fromstring(text)
+
+
+def _retained_bytes(func: Callable[[], object]) -> int:
+    """Memory still allocated after ``func`` returns (its result kept alive)."""
+
+    tracemalloc.start()
+    try:
+        kept = func()
+        current = tracemalloc.get_traced_memory()[0]
+        del kept
+        return current
+    finally:
+        tracemalloc.stop()
+
+
+def run() -> list[dict[str, object]]:
+    document = _document()
+
+    def budgeted() -> ET.Element:
+        return parse_xml_safely(document, LIMITS, ParseMemoryBudget(1 << 30))
+
+    baseline = measure(lambda: _previous_parse(document), number=5)
+    current = measure(budgeted, number=5)
+    budget = ParseMemoryBudget(1 << 30)
+    parse_xml_safely(document, LIMITS, budget)
+    tree_bytes = _retained_bytes(lambda: ET.fromstring(document))
+    return [
+        result("parse_xml_safely.unbudgeted", baseline, payload_bytes=len(document)),
+        result(
+            "parse_xml_safely.budgeted",
+            current,
+            overhead=round(current / baseline, 2),
+            estimated_bytes=budget.used,
+            tree_bytes=tree_bytes,
+            estimate_ratio=round(budget.used / tree_bytes, 2),
+        ),
+    ]
+
+
+def main() -> None:
+    write_results(run())
+
+
+if __name__ == "__main__":
+    main()
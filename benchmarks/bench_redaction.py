@@ -0,0 +1,57 @@
+"""Benchmark identifier redaction over realistic PUBLIC finding strings."""
+
+from __future__ import annotations
+
+from _harness import measure, result, write_results
+
+from mcp_scansage.services.sanitizer import IDENTIFIER_PATTERN, redact_identifiers
+
+TITLE_STRINGS = [f"Port {port} open" for port in (22, 53, 80, 135, 443, 3389, 8080)]
+"""Finding titles: never contain an identifier separator."""
+
+DETAIL_STRINGS = [
+    "domain service noted on UDP/53",
+    "http nginx service noted on TCP/80",
+    "ssh OpenSSH 8.9p1 service noted on TCP/22",
+    "https Microsoft IIS httpd 10.0 service noted on TCP/443",
+    "msrpc Microsoft Windows RPC service noted on TCP/135",
+    "ssh OpenSSH 7.4 protocol 2.0 service noted on TCP/22 host=ipv4:192.0.2.10",
+    "http Apache httpd 2.4.41 service noted on TCP/8080 "
+    "host=ipv4:198.51.100.7; hostname:web01.example.com",
+]
+"""Finding details: a mix of separator-free and identifier-bearing strings."""
+
+
+def _bench_group(name: str, values: list[str]) -> list[dict[str, object]]:
+    def regex_only() -> list[str]:
+        return [IDENTIFIER_PATTERN.sub("[redacted]", value) for value in values]
+
+    def prefiltered() -> list[str]:
+        return [redact_identifiers(value) for value in values]
+
+    if prefiltered() != regex_only():
+        raise AssertionError("Prefiltered redaction diverged from the regex.")
+    baseline = measure(regex_only, number=5_000) / len(values)
+    current = measure(prefiltered, number=5_000) / len(values)
+    return [
+        result(f"redact_identifiers.{name}.regex_only", baseline),
+        result(
+            f"redact_identifiers.{name}",
+            current,
+            speedup=round(baseline / current, 2),
+        ),
+    ]
+
+
+def run() -> list[dict[str, object]]:
+    return _bench_group("titles", TITLE_STRINGS) + _bench_group(
+        "details", DETAIL_STRINGS
+    )
+
+
+def main() -> None:
+    write_results(run())
+
+
+if __name__ == "__main__":
+    main()
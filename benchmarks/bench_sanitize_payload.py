@@ -0,0 +1,89 @@
+"""Benchmark recursive PUBLIC payload sanitization on a 10k-finding response."""
+
+from __future__ import annotations
+
+import tracemalloc
+from typing import Callable
+
+from _harness import measure, result, write_results
+
+from mcp_scansage.services.sanitizer import (
+    sanitize_public_payload,
+    sanitize_public_response,
+)
+
+FINDINGS = 10_000
+"""Findings in the synthetic response (well above the PUBLIC cap on purpose)."""
+
+
+def _response(*, dirty_every: int = 0) -> dict[str, object]:
+    findings = []
+    for index in range(FINDINGS):
+        detail = f"ssh OpenSSH 8.9p1 service noted on TCP/{index}"
+        if dirty_every and index % dirty_every == 0:
+            detail += " host=ipv4:192.0.2.10"
+        findings.append(
+            {"title": f"Port {index} open", "severity": "info", "detail": detail}
+        )
+    return {
+        "operation": "nmap_ingest",
+        "ingest_id": "0" * 32,
+        "format": "nmap_xml",
+        "summary": {"payload_bytes": 1, "payload_sha256": "a" * 64, "parsed": True},
+        "findings": [],
+        "next_steps": ["Confirm the ingestion digest matches downstream expectations."],
+        "parser_version": "nmap_xml_minimal_v1",
+        "findings_count": FINDINGS,
+        "parsed_findings": findings,
+    }
+
+
+def _flat_per_finding(response: dict[str, object]) -> list[dict[str, str]]:
+    """Closest pre-existing approach: flat-sanitize every finding mapping."""
+
+    return [sanitize_public_response(item) for item in response["parsed_findings"]]
+
+
+def _peak_bytes(func: Callable[[], object]) -> int:
+    """Peak memory allocated while ``func`` runs (the result is kept alive)."""
+
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run() -> list[dict[str, object]]:
+    results = []
+    for label, response in (
+        ("clean", _response()),
+        ("dirty_1pct", _response(dirty_every=100)),
+    ):
+        baseline = measure(lambda: _flat_per_finding(response), number=3)
+        current = measure(lambda: sanitize_public_payload(response), number=3)
+        results.append(
+            result(
+                f"sanitize_public_response.flat_findings.{label}",
+                baseline,
+                peak_bytes=_peak_bytes(lambda: _flat_per_finding(response)),
+            )
+        )
+        results.append(
+            result(
+                f"sanitize_public_payload.{label}",
+                current,
+                speedup=round(baseline / current, 2),
+                peak_bytes=_peak_bytes(lambda: sanitize_public_payload(response)),
+            )
+        )
+    return results
+
+
+def main() -> None:
+    write_results(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Benchmark per-request schema validation with and without validator caching."""
+
+from __future__ import annotations
+
+from _harness import measure, result, write_results
+from jsonschema import Draft7Validator
+
+from mcp_scansage.mcp import schema_registry
+
+REQUEST_SCHEMAS = (
+    ("nmap_ingest_input_v0.1", "nmap_ingest_input_example_min"),
+    ("nmap_ingest_public_response_v0.2", "nmap_ingest_public_response_example_v0.2"),
+)
+"""The input + response pair validated by every PUBLIC ingest request."""
+
+
+def _findings_heavy_response() -> dict[str, object]:
+    response = dict(
+        schema_registry.get_example("nmap_ingest_public_response_example_v0.2")
+    )
+    response["parsed_findings"] = [
+        {
+            "title": f"Port {port} open",
+            "detail": f"http nginx 1.21.6 service noted on TCP/{port}",
+            "confidence": "medium",
+        }
+        for port in range(8000, 8100)
+    ]
+    response["findings_count"] = 100
+    return response
+
+
+def _backend_results() -> list[dict[str, object]]:
+    """Draft7Validator vs the generated validator on a 100-finding response."""
+
+    name = "nmap_ingest_public_response_v0.2"
+    response = _findings_heavy_response()
+    draft7 = schema_registry.get_validator(name)
+    generated = schema_registry.get_generated_validator(name)
+    if generated is None:
+        raise AssertionError("Generated validators are stale; regenerate them.")
+    baseline = measure(lambda: draft7.validate(response), number=200)
+    current = measure(lambda: generated(response), number=200)
+    return [
+        result("schema_validation.response_100_findings.jsonschema", baseline),
+        result(
+            "schema_validation.response_100_findings.generated",
+            current,
+            speedup=round(baseline / current, 2),
+        ),
+    ]
+
+
+def run() -> list[dict[str, object]]:
+    pairs = [
+        (schema_name, schema_registry.get_example(example_name))
+        for schema_name, example_name in REQUEST_SCHEMAS
+    ]
+    schema_registry.precompile_validators()
+
+    def uncached() -> None:
+        for schema_name, example in pairs:
+            Draft7Validator(schema_registry.get_schema(schema_name)).validate(example)
+
+    def cached() -> None:
+        for schema_name, example in pairs:
+            schema_registry.validate(schema_name, example)
+
+    baseline = measure(uncached, number=500)
+    current = measure(cached, number=500)
+    return _backend_results() + [
+        result("schema_validation.per_request.uncached", baseline),
+        result(
+            "schema_validation.per_request",
+            current,
+            speedup=round(baseline / current, 2),
+        ),
+    ]
+
+
+def main() -> None:
+    write_results(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Benchmark the bulk ``finditer`` path of ``SyntheticNmapParser``.
+
+The line-by-line path (an identifier search plus a match per line) is the
+baseline; both must extract the same ports from the generated payload. The
+full parse, which also builds the findings, is reported as findings/s.
+"""
+
+from __future__ import annotations
+
+from _harness import measure, result, write_results
+from synthetic_payload import generate_synthetic_payload
+
+from mcp_scansage.services.nmap_parser import SyntheticNmapParser
+
+PAYLOAD_BYTES = 4 * 1024 * 1024
+"""Size of the generated synthetic payload."""
+
+
+def run() -> list[dict[str, object]]:
+    parser = SyntheticNmapParser()
+    text = generate_synthetic_payload(PAYLOAD_BYTES)
+    payload = text.encode()
+    if parser._bulk_ports(text) != parser._line_ports(text):
+        raise AssertionError("Bulk synthetic extraction diverged from the line path.")
+
+    baseline = measure(lambda: parser._line_ports(text), number=1)
+    bulk = measure(lambda: parser._bulk_ports(text), number=1)
+    findings = parser.parse(payload).findings_count
+    seconds = measure(lambda: parser.parse(payload), number=1)
+    return [
+        result("synthetic_v1.extract.line_by_line", baseline, payload_bytes=len(text)),
+        result(
+            "synthetic_v1.extract.bulk",
+            bulk,
+            payload_bytes=len(text),
+            speedup=round(baseline / bulk, 2),
+        ),
+        result(
+            "synthetic_v1.parse",
+            seconds,
+            payload_bytes=len(payload),
+            findings=findings,
+            findings_per_second=round(findings / seconds),
+        ),
+    ]
+
+
+def main() -> None:
+    write_results(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,403 @@
+"""Benchmark suite with a stored baseline and a regression threshold.
+
+``make bench`` times the hot paths of PUBLIC ingestion and compares each
+case with ``benchmarks/baseline.json``. Cases are compared by their time
+relative to a fixed reference workload timed alongside them, which keeps
+the comparison stable while the machine's speed drifts. A case slower
+than its baseline by more than the tolerance (``--tolerance`` or
+``SCANSAGE_BENCH_TOLERANCE``, default 30%) fails the run once re-runs
+confirm it. Timings only mean something on the machine that recorded
+them, so a baseline from another machine is reported but not enforced;
+``make bench-baseline`` re-records it locally.
+
+The suite also runs scaling checks: each times one workload at a small
+and a larger input size and fails when the time grows faster than the
+input allows for linear work. They compare the machine with itself, so
+they are enforced everywhere and kept out of the deterministic pytest gate.
+
+Exit codes: 0 within tolerance (or not comparable), 1 regression or
+superlinear growth.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import platform
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Collection, Iterator
+
+from _harness import measure, result, write_results
+from synthetic_payload import (
+    NmapXmlCorpusSpec,
+    generate_nmap_xml,
+)
+
+from mcp_scansage.mcp import schema_registry
+from mcp_scansage.mcp.server import NmapIngestResource
+from mcp_scansage.services import nmap_ingest_store
+from mcp_scansage.services.nmap_limits import DEFAULT_NMAP_LIMITS, NmapLimitConfig
+from mcp_scansage.services.nmap_parser import (
+    XML_PARSER_ENV,
+    XML_PARSER_REGISTRY,
+    MinimalNmapXmlParser,
+    parse_xml_safely,
+)
+from mcp_scansage.services.sanitizer import redact_identifiers
+
+BASELINE_PATH = Path(__file__).resolve().with_name("baseline.json")
+"""Stored baseline, committed alongside the suite."""
+
+TOLERANCE_ENV = "SCANSAGE_BENCH_TOLERANCE"
+"""Env var overriding the allowed slowdown (0.3 means 30%)."""
+
+DEFAULT_TOLERANCE = 0.3
+"""Allowed slowdown before a case counts as a regression."""
+
+PARSER_SPEC = NmapXmlCorpusSpec(hosts=200, script_output_bytes=128)
+"""Document parsed by the XML boundary and parser cases."""
+
+INGEST_SPEC = NmapXmlCorpusSpec(hosts=20)
+"""Document sent end to end; fits the default PUBLIC limits."""
+
+REDACTION_STRINGS = (
+    "Port 443 open",
+    "https Microsoft IIS httpd 10.0 service noted on TCP/443",
+    "ssh OpenSSH 7.4 protocol 2.0 service noted on TCP/22 host=ipv4:192.0.2.10",
+    "http Apache httpd 2.4.41 service noted on TCP/8080 "
+    "host=ipv4:198.51.100.7; hostname:web01.example.com",
+)
+"""Finding strings with and without identifiers."""
+
+ADVERSARIAL_REDACTION_INPUTS: dict[str, Callable[[int], str]] = {
+    "hex_groups": lambda n: "1:" * (n // 2),
+    "broken_hex_groups": lambda n: "aaaaa:" * (n // 6),
+    "compressed_tail": lambda n: "1::" + "1:" * (n // 2) + "x",
+    "dashed_labels": lambda n: "a-" * (n // 2),
+    "label_to_long_tld": lambda n: ("a-" * 31 + "a." + "b" * 200 + "1 ") * (n // 265),
+    "dotted_digits": lambda n: "1." * (n // 2),
+}
+"""Redaction inputs of ``n`` characters that maximise backtracking."""
+
+MIN_BATCH_SECONDS = 0.05
+"""Shortest timed batch; cheap cases are repeated until a batch is this long."""
+
+REPEAT = 7
+"""Timed batches per case; the best one is reported."""
+
+CONFIRM_RUNS = 2
+"""Re-runs of regressed cases; a regression must persist through all of them."""
+
+SCALING_FACTOR = 4
+"""Input growth between the small and large size of a scaling check."""
+
+SCALING_SLACK = 2.0
+"""Allowed time growth per unit of input growth; quadratic work would be 4x."""
+
+Case = tuple[str, Callable[[], object]]
+
+ScalingCheck = tuple[str, Callable[[int], Callable[[], object]], int]
+"""Name, factory building the timed call for an input size, and the small size."""
+
+
+def _corpus_limits(document: bytes, spec: NmapXmlCorpusSpec) -> NmapLimitConfig:
+    """Limits that let ``document`` parse completely."""
+
+    return DEFAULT_NMAP_LIMITS.with_overrides(
+        {
+            "max_xml_bytes": len(document),
+            "max_hosts": spec.hosts,
+            "max_findings": spec.hosts * spec.ports_per_host + 1,
+            "max_parse_memory_bytes": 1 << 30,
+        }
+    )
+
+
+def _parser_cases() -> Iterator[Case]:
+    document = generate_nmap_xml(PARSER_SPEC).encode()
+    limits = _corpus_limits(document, PARSER_SPEC)
+    yield "parse_xml_safely", lambda: parse_xml_safely(document, limits)
+    for name, parser_cls in sorted(XML_PARSER_REGISTRY.items()):
+        parser = parser_cls()
+        yield f"xml_parser.{name}", lambda p=parser: p.parse(document, limits)
+
+
+def _sanitizer_cases() -> Iterator[Case]:
+    def redact() -> list[str]:
+        return [redact_identifiers(value) for value in REDACTION_STRINGS]
+
+    response = schema_registry.get_example("nmap_ingest_public_response_example_v0.2")
+    schema_registry.precompile_validators()
+    yield "redact_identifiers", redact
+    yield (
+        "schema_registry.validate",
+        lambda: schema_registry.validate("nmap_ingest_public_response_v0.2", response),
+    )
+
+
+def _store_cases() -> Iterator[Case]:
+    def persist() -> None:
+        nmap_ingest_store.persist_ingest_record(
+            ingest_id="0" * 32,
+            format="nmap_xml",
+            payload_bytes=1024,
+            payload_sha256="0" * 64,
+            parsed=True,
+            findings_count=4,
+            parser_version="bench",
+            next_steps=["Confirm the ingestion digest matches."],
+        )
+
+    persist()
+    yield "nmap_ingest_store.persist_ingest_record", persist
+    yield "nmap_ingest_store.list_ingests", nmap_ingest_store.list_ingests
+
+
+def _ingest_cases() -> Iterator[Case]:
+    resource = NmapIngestResource()
+    request = {"format": "nmap_xml", "payload": generate_nmap_xml(INGEST_SPEC)}
+    response = resource.ingest(request)
+    if response.get("findings_count") != INGEST_SPEC.hosts * INGEST_SPEC.ports_per_host:
+        raise AssertionError("End-to-end ingest did not parse every finding.")
+    yield "nmap_ingest_resource.ingest", lambda: resource.ingest(request)
+
+
+CASE_GROUPS = (_parser_cases, _sanitizer_cases, _store_cases, _ingest_cases)
+"""Case factories, run in order."""
+
+
+def _minimal_parser_workload(hosts: int) -> Callable[[], object]:
+    spec = NmapXmlCorpusSpec(hosts=hosts, down_host_ratio=0.1, script_output_bytes=64)
+    document = generate_nmap_xml(spec).encode()
+    limits = _corpus_limits(document, spec)
+    parser = MinimalNmapXmlParser()
+    return lambda: parser.parse(document, limits)
+
+
+def _redaction_workload(
+    build: Callable[[int], str],
+) -> Callable[[int], Callable[[], object]]:
+    def workload(size: int) -> Callable[[], object]:
+        value = build(size)
+        return lambda: redact_identifiers(value)
+
+    return workload
+
+
+def _scaling_checks() -> Iterator[ScalingCheck]:
+    yield "scaling.xml_parser.real_minimal", _minimal_parser_workload, 150
+    for family, build in sorted(ADVERSARIAL_REDACTION_INPUTS.items()):
+        yield f"scaling.redact_identifiers.{family}", _redaction_workload(build), 8_000
+
+
+def machine_fingerprint() -> dict[str, object]:
+    """Identify the machine and interpreter a baseline was recorded on."""
+
+    return {
+        "host": hashlib.sha256(platform.node().encode()).hexdigest()[:12],
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "python": f"{platform.python_implementation()} "
+        f"{'.'.join(platform.python_version_tuple()[:2])}",
+    }
+
+
+def _reference_workload() -> list[str]:
+    """Fixed pure-Python work timed right after every case.
+
+    Cases are compared by their time relative to this workload, so a
+    machine-wide slowdown (CPU throttling, a busy neighbour) cancels out.
+    """
+
+    return sorted(str(index) for index in range(2_000))
+
+
+def _batch_size(func: Callable[[], object]) -> int:
+    """Calls per batch so one batch takes at least :data:`MIN_BATCH_SECONDS`."""
+
+    number = 1
+    while measure(func, number=number, repeat=1) * number < MIN_BATCH_SECONDS:
+        number *= 2
+    return number
+
+
+def run(
+    only: str | None = None, names: Collection[str] | None = None
+) -> list[dict[str, Any]]:
+    """Time every case whose name contains ``only`` and is in ``names``."""
+
+    ref_number = _batch_size(_reference_workload)
+    results = []
+    for group in CASE_GROUPS:
+        for name, func in group():
+            if (only and only not in name) or (names is not None and name not in names):
+                continue
+            seconds = measure(func, number=_batch_size(func), repeat=REPEAT)
+            reference = measure(_reference_workload, number=ref_number, repeat=REPEAT)
+            results.append(result(name, seconds, relative=seconds / reference))
+    return results
+
+
+def _growth(workload: Callable[[int], Callable[[], object]], size: int) -> float:
+    small = workload(size)
+    large = workload(size * SCALING_FACTOR)
+    small_seconds = measure(small, number=_batch_size(small), repeat=REPEAT)
+    large_seconds = measure(large, number=_batch_size(large), repeat=REPEAT)
+    return large_seconds / small_seconds
+
+
+def check_scaling(only: str | None = None) -> tuple[list[dict[str, Any]], list[str]]:
+    """Run the scaling checks; return their records and the superlinear names.
+
+    Like regressions, superlinear growth must persist through
+    :data:`CONFIRM_RUNS` re-runs; the smallest growth seen is reported.
+    """
+
+    limit = SCALING_FACTOR * SCALING_SLACK
+    results, superlinear = [], []
+    for name, workload, size in _scaling_checks():
+        if only and only not in name:
+            continue
+        growth = _growth(workload, size)
+        for _ in range(CONFIRM_RUNS):
+            if growth <= limit:
+                break
+            growth = min(growth, _growth(workload, size))
+        results.append({"name": name, "growth": round(growth, 3), "limit": limit})
+        if growth > limit:
+            superlinear.append(name)
+    return results, superlinear
+
+
+def compare(
+    results: list[dict[str, Any]], baseline: dict[str, float], tolerance: float
+) -> list[str]:
+    """Annotate ``results`` with their baseline; return the regressed names.
+
+    ``baseline`` maps case names to their stored ``relative`` time.
+    """
+
+    regressed = []
+    for record in results:
+        reference = baseline.get(record["name"])
+        if reference is None:
+            continue
+        ratio = record["relative"] / reference
+        record["baseline_relative"] = reference
+        record["ratio"] = round(ratio, 3)
+        if ratio > 1 + tolerance:
+            regressed.append(record["name"])
+    return regressed
+
+
+def _confirmed_regressions(
+    results: list[dict[str, Any]], baseline: dict[str, float], tolerance: float
+) -> list[str]:
+    """Re-time regressed cases, keeping each case's best run, and re-compare.
+
+    A noisy neighbour can slow one run; a real regression survives every
+    re-run.
+    """
+
+    regressed = compare(results, baseline, tolerance)
+    for _ in range(CONFIRM_RUNS):
+        if not regressed:
+            break
+        best = {record["name"]: record for record in results}
+        for record in run(names=regressed):
+            if record["relative"] < best[record["name"]]["relative"]:
+                best[record["name"]].update(record)
+        regressed = compare(results, baseline, tolerance)
+    return regressed
+
+
+def _load_baseline(path: Path) -> dict[str, Any] | None:
+    if not path.is_file():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _write_baseline(
+    path: Path, stored: dict[str, Any] | None, results: list[dict[str, Any]]
+) -> None:
+    machine = machine_fingerprint()
+    relative: dict[str, float] = {}
+    if stored is not None and stored.get("machine") == machine:
+        relative.update(stored["results"])
+    relative.update({record["name"]: record["relative"] for record in results})
+    document = {"machine": machine, "results": dict(sorted(relative.items()))}
+    path.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+
+
+def _tolerance(value: str | None) -> float:
+    return float(value or os.getenv(TOLERANCE_ENV) or DEFAULT_TOLERANCE)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--tolerance", help="Allowed slowdown, e.g. 0.3 for 30%%.")
+    parser.add_argument("--only", help="Run only cases whose name contains this.")
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Record this run as the baseline for this machine.",
+    )
+    args = parser.parse_args(argv)
+
+    # The end-to-end case measures the real parser, not the no-op default.
+    os.environ[XML_PARSER_ENV] = "real_minimal"
+    saved = nmap_ingest_store.STATE_DIR, nmap_ingest_store.RECORD_FILE
+    with tempfile.TemporaryDirectory() as state_dir:
+        # Keep benchmark records out of the real PUBLIC state directory.
+        nmap_ingest_store.STATE_DIR = Path(state_dir)
+        nmap_ingest_store.RECORD_FILE = Path(state_dir) / "records.json"
+        try:
+            return _run_suite(args)
+        finally:
+            nmap_ingest_store.STATE_DIR, nmap_ingest_store.RECORD_FILE = saved
+
+
+def _run_suite(args: argparse.Namespace) -> int:
+    results = run(args.only)
+    stored = _load_baseline(args.baseline)
+    if args.update_baseline:
+        _write_baseline(args.baseline, stored, results)
+        write_results(results)
+        return 0
+    regressed = _baseline_regressions(args, results, stored)
+    scaling, superlinear = check_scaling(args.only)
+    write_results(results + scaling)
+    for name in superlinear:
+        sys.stderr.write(f"Superlinear growth: {name}\n")
+    return 1 if regressed or superlinear else 0
+
+
+def _baseline_regressions(
+    args: argparse.Namespace,
+    results: list[dict[str, Any]],
+    stored: dict[str, Any] | None,
+) -> list[str]:
+    if stored is None:
+        sys.stderr.write("No baseline stored; run `make bench-baseline`.\n")
+        return []
+    if stored.get("machine") != machine_fingerprint():
+        sys.stderr.write(
+            "Baseline was recorded on a different machine; not compared. "
+            "Run `make bench-baseline` to record one here.\n"
+        )
+        return []
+
+    tolerance = _tolerance(args.tolerance)
+    regressed = _confirmed_regressions(results, stored["results"], tolerance)
+    for name in regressed:
+        sys.stderr.write(f"Regression beyond {tolerance:.0%}: {name}\n")
+    return regressed
+
+
+if __name__ == "__main__":
+    sys.exit(main())
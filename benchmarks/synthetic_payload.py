@@ -0,0 +1,163 @@
+"""Seeded synthetic payloads of arbitrary size for benchmarks and tests.
+
+Benchmarks and scaling tests need payloads far larger than anything worth
+checking in; tests import this module through pytest's ``pythonpath``.
+:func:`generate_synthetic_payload` builds ``synthetic_v1`` text and
+:func:`generate_nmap_xml` builds identifier-bearing Nmap XML shaped by an
+:class:`NmapXmlCorpusSpec`. Both are driven by a seed, so two runs with the
+same arguments parse to the same findings.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+
+SYNTHETIC_SERVICES = (
+    "ssh",
+    "http",
+    "https",
+    "smtp",
+    "domain",
+    "mysql",
+    "postgresql",
+    "ldap",
+    "rdp",
+    "snmp",
+)
+"""Service names drawn for generated ``PORT_OPEN`` lines."""
+
+SYNTHETIC_IDENTIFIER = "ip=192.0.2.1"
+"""Token appended to identifier-bearing lines, which the parser skips."""
+
+
+def generate_synthetic_payload(
+    size_bytes: int, seed: int = 0, identifier_every: int = 0
+) -> str:
+    """Return a ``synthetic_v1`` payload of at most ``size_bytes`` bytes.
+
+    Lines are added while they fit, so the payload ends within one line of
+    ``size_bytes``. With ``identifier_every`` > 0 every n-th line carries
+    :data:`SYNTHETIC_IDENTIFIER` and yields no finding.
+    """
+
+    rng = random.Random(seed)
+    lines: list[str] = []
+    total = -1
+    while True:
+        line = (
+            f"PORT_OPEN {rng.randint(1, 65535)}/tcp "
+            f"service={rng.choice(SYNTHETIC_SERVICES)}"
+        )
+        if identifier_every and (len(lines) + 1) % identifier_every == 0:
+            line = f"{line} {SYNTHETIC_IDENTIFIER}"
+        if total + 1 + len(line) > size_bytes:
+            return "\n".join(lines)
+        lines.append(line)
+        total += 1 + len(line)
+
+
+NMAP_XML_PRODUCTS = (
+    ("ssh", "OpenSSH"),
+    ("http", "nginx"),
+    ("https", "Apache httpd"),
+    ("smtp", "Postfix smtpd"),
+    ("domain", "dnsmasq"),
+    ("mysql", "MySQL"),
+    ("ms-wbt-server", "Microsoft Terminal Services"),
+    ("ldap", "OpenLDAP"),
+)
+"""Service names and products used for generated ``<service>`` elements."""
+
+_SCRIPT_WORDS = ("state", "banner", "title", "cipher", "negotiated", "via", "ok")
+"""Filler words for generated script output."""
+
+
+@dataclass(frozen=True)
+class NmapXmlCorpusSpec:
+    """Shape of a generated Nmap XML document.
+
+    ``service_variety`` is the number of distinct product/version strings
+    drawn from; ``script_output_bytes`` sizes one ``<script>`` element per
+    port (0 leaves scripts out).
+    """
+
+    hosts: int = 100
+    ports_per_host: int = 4
+    down_host_ratio: float = 0.0
+    service_variety: int = 16
+    script_output_bytes: int = 0
+    seed: int = 0
+
+
+def generate_nmap_xml(spec: NmapXmlCorpusSpec) -> str:
+    """Return a valid Nmap XML document shaped by ``spec``.
+
+    Up hosts carry an IPv4 (every fourth one IPv6) address, a MAC address
+    and a hostname, and report ``spec.ports_per_host`` distinct open ports,
+    so an uncapped parse yields ``ports_per_host`` findings per up host.
+    Down hosts have a status and an address only.
+    """
+
+    rng = random.Random(spec.seed)
+    services = []
+    for index in range(max(spec.service_variety, 1)):
+        name, product = NMAP_XML_PRODUCTS[index % len(NMAP_XML_PRODUCTS)]
+        major = index // len(NMAP_XML_PRODUCTS) + 1
+        services.append((name, product, f"{major}.{rng.randint(0, 20)}"))
+    parts = ['<?xml version="1.0" encoding="UTF-8"?>\n<nmaprun scanner="nmap">\n']
+    for index in range(spec.hosts):
+        if rng.random() < spec.down_host_ratio:
+            parts.append(
+                '<host><status state="down"/>'
+                f'<address addr="{_ipv4(index)}" addrtype="ipv4"/></host>\n'
+            )
+            continue
+        parts.append(_xml_host(rng, spec, index, services))
+    parts.append("</nmaprun>\n")
+    return "".join(parts)
+
+
+def _xml_host(
+    rng: random.Random,
+    spec: NmapXmlCorpusSpec,
+    index: int,
+    services: list[tuple[str, str, str]],
+) -> str:
+    if index % 4 == 3:
+        address = f'<address addr="2001:db8::{index:x}" addrtype="ipv6"/>'
+    else:
+        address = f'<address addr="{_ipv4(index)}" addrtype="ipv4"/>'
+    mac = "02:42:" + ":".join(f"{byte:02X}" for byte in index.to_bytes(4, "big"))
+    ports = []
+    for port_id in sorted(rng.sample(range(1, 65536), spec.ports_per_host)):
+        name, product, version = rng.choice(services)
+        script = ""
+        if spec.script_output_bytes:
+            output = _script_output(rng, spec.script_output_bytes, index)
+            script = f'<script id="banner" output="{output}"/>'
+        ports.append(
+            f'<port protocol="tcp" portid="{port_id}"><state state="open"/>'
+            f'<service name="{name}" product="{product}" version="{version}"/>'
+            f"{script}</port>"
+        )
+    return (
+        f'<host><status state="up"/>{address}'
+        f'<address addr="{mac}" addrtype="mac"/>'
+        f'<hostnames><hostname name="host{index}.corp.example.com"/></hostnames>'
+        f"<ports>{''.join(ports)}</ports></host>\n"
+    )
+
+
+def _ipv4(index: int) -> str:
+    return f"10.{index >> 16 & 255}.{index >> 8 & 255}.{index & 255}"
+
+
+def _script_output(rng: random.Random, size: int, index: int) -> str:
+    words = [f"peer {_ipv4(index)}"]
+    length = len(words[0])
+    while length < size:
+        word = rng.choice(_SCRIPT_WORDS)
+        words.append(word)
+        length += len(word) + 1
+    return " ".join(words)[:size]
@@ -1,16 +1,40 @@
-"""LOCAL-only CLI to dry-run PUBLIC Nmap ingestion without persistence."""
+"""LOCAL-only CLI to dry-run PUBLIC Nmap ingestion without persistence.
+
+Pass ``-`` as the path to stream XML from stdin (e.g. ``nmap -oX - ...``):
+each completed host's sanitized findings are written as NDJSON lines as soon
+as the host closes, followed by the usual summary line at EOF.
+
+Pass a directory (files matching ``--pattern``) or a quoted glob to run a
+batch: files are ingested across ``--workers`` processes, one JSON line is
+written per file as it finishes, and a final ``report`` line aggregates
+findings, cap reasons, the slowest files and throughput.
+
+``--lab`` applies the authorized lab limit profile and ``--limit NAME=VALUE``
+overrides one limit for this run, as a per-request override would.
+"""
 
 from __future__ import annotations
 
 import argparse
+import codecs
+import glob
 import json
+import os
 import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
+from typing import BinaryIO, Iterator, TextIO
 
 ROOT = Path(__file__).resolve().parent
 sys.path.insert(0, str(ROOT.parent / "src"))
 
 MINIMAL_PARSER_KEY = "minimal_xml"
+STDIN_PATH = "-"
+READ_BYTES = 64 * 1024
+DEFAULT_PATTERN = "*.xml"
+SLOWEST_FILES = 5
 
 
 def parse_args() -> argparse.Namespace:
@@ -19,8 +43,10 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "xml_path",
-        type=Path,
-        help="Path to the Nmap XML payload to evaluate locally.",
+        help=(
+            "Nmap XML file to evaluate locally, - for stdin, or a directory or "
+            "quoted glob for a batch run."
+        ),
     )
     parser.add_argument(
         "--parser",
@@ -28,9 +54,41 @@ def parse_args() -> argparse.Namespace:
         default=MINIMAL_PARSER_KEY,
         help="Parser implementation to use when evaluating caps.",
     )
+    parser.add_argument(
+        "--pattern",
+        default=DEFAULT_PATTERN,
+        help="File pattern used when the path is a directory (batch mode).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for batch mode (1 runs in-process).",
+    )
+    parser.add_argument(
+        "--lab",
+        action="store_true",
+        help="Use the authorized lab limit profile (SCANSAGE_AUTHORIZED_LAB).",
+    )
+    parser.add_argument(
+        "--limit",
+        action="append",
+        default=[],
+        type=parse_limit_override,
+        metavar="NAME=VALUE",
+        help="Override one limit, e.g. max_xml_bytes=1048576 (repeatable).",
+    )
     return parser.parse_args()
 
 
+def parse_limit_override(text: str) -> tuple[str, int]:
+    name, _, value = text.partition("=")
+    try:
+        return name.strip(), int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError("expected NAME=VALUE") from None
+
+
 def load_payload(path: Path) -> str:
     return path.read_text(encoding="utf-8")
 
@@ -43,10 +101,248 @@ def build_parser(name: str):
     return None
 
 
+def summarize(response: dict[str, object]) -> dict[str, object]:
+    summary: dict[str, object] = {
+        "summary": response["summary"],
+        "findings_count": response.get("findings_count", 0),
+    }
+    if metadata := response.get("metadata"):
+        summary["metadata"] = metadata
+    return summary
+
+
+def write_line(out: TextIO, record: dict[str, object]) -> None:
+    out.write(json.dumps(record, ensure_ascii=False) + "\n")
+    out.flush()
+
+
+def stream_ingest(
+    source: BinaryIO,
+    out: TextIO,
+    parser,
+    limit_overrides: dict[str, int] | None = None,
+) -> int:
+    """Parse XML from ``source`` host by host, writing NDJSON to ``out``.
+
+    Reads whatever bytes are available (``read1``) so findings appear while
+    the producer is still running. Findings sort by host first
+    (``stable_findings_sort_key``), so sorting each host's findings and
+    stopping at ``max_findings`` prints exactly the findings the summary's
+    ``build_ingest_response`` keeps. Size, parse, deadline and capacity
+    errors end the run with an ``error`` line. Returns the process exit code.
+    """
+
+    from mcp_scansage.services.nmap_ingest import (
+        NMAP_XML_FORMAT,
+        build_ingest_response,
+        payload_too_large,
+        stable_findings_sort_key,
+    )
+    from mcp_scansage.services.nmap_limits import resolve_limit_config
+    from mcp_scansage.services.parse_memory import ParseCapacityError
+    from mcp_scansage.services.payload_stream import (
+        PayloadAccountant,
+        PayloadSizeError,
+    )
+    from mcp_scansage.services.sanitizer import sanitize_public_payload
+
+    limits = resolve_limit_config(limit_overrides)
+    emitted = 0
+
+    def emit(findings) -> None:
+        nonlocal emitted
+        ordered = sorted(findings, key=stable_findings_sort_key)
+        for finding in ordered[: max(limits.max_findings - emitted, 0)]:
+            write_line(out, {"finding": sanitize_public_payload(finding.to_mapping())})
+            emitted += 1
+
+    accountant = PayloadAccountant(limits.max_xml_bytes)
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    stream = None
+    try:
+        # Stdin has no declared size, so admit for the largest allowed one.
+        stream = parser.open_stream(limits.max_xml_bytes, limits, on_findings=emit)
+        while block := source.read1(READ_BYTES):
+            accountant.add_bytes(block)
+            stream.feed(decoder.decode(block))
+        stream.feed(decoder.decode(b"", final=True))
+        result = stream.close()
+    except PayloadSizeError as exc:
+        write_line(out, {"error": str(payload_too_large(limits, exc.byte_count))})
+        return 1
+    except (ValueError, ParseCapacityError) as exc:
+        write_line(out, {"error": str(exc)})
+        return 1
+    finally:
+        if stream is not None:
+            stream.release()
+
+    response = build_ingest_response(
+        NMAP_XML_FORMAT,
+        result,
+        accountant.byte_count,
+        accountant.hexdigest(),
+        limits,
+        persist_record=False,
+    )
+    write_line(out, summarize(response))
+    return 0
+
+
+def batch_files(target: str, pattern: str) -> list[tuple[str, Path]]:
+    """Resolve a directory or glob to ``(label, path)`` pairs, sorted."""
+
+    root = Path(target)
+    if root.is_dir():
+        return [
+            (path.relative_to(root).as_posix(), path)
+            for path in sorted(root.glob(pattern))
+            if path.is_file()
+        ]
+    matches = sorted(glob.glob(target, recursive=True))
+    return [(match, Path(match)) for match in matches if Path(match).is_file()]
+
+
+def ingest_file(
+    label: str,
+    path: Path,
+    parser_name: str,
+    limit_overrides: dict[str, int] | None = None,
+) -> dict[str, object]:
+    """Dry-run one file and return its JSON line (batch worker entry point).
+
+    Every failure, including a file that vanished or cannot be read, is
+    reported in the record so one bad file never fails the whole batch.
+    """
+
+    from mcp_scansage.services.cap_audit import clear_cap_events, get_cap_events
+    from mcp_scansage.services.nmap_ingest import ingest_nmap_public
+    from mcp_scansage.services.parse_memory import ParseCapacityError
+
+    clear_cap_events()
+    started = time.perf_counter()
+    record: dict[str, object] = {"file": label, "payload_bytes": 0}
+    try:
+        record["payload_bytes"] = path.stat().st_size
+        response = ingest_nmap_public(
+            format="nmap_xml",
+            payload=load_payload(path),
+            parser=build_parser(parser_name),
+            persist_record=False,
+            limit_overrides=limit_overrides,
+        )
+        record.update(summarize(response))
+    except OSError:
+        record["error"] = "File could not be read."
+    except (ValueError, ParseCapacityError) as exc:
+        record["error"] = str(exc)
+    record["cap_reasons"] = sorted(
+        {str(event["cap_reason"]) for event in get_cap_events()}
+    )
+    record["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    return record
+
+
+def _run_batch(
+    files: list[tuple[str, Path]],
+    parser_name: str,
+    workers: int,
+    limit_overrides: dict[str, int] | None = None,
+) -> Iterator[dict[str, object]]:
+    if workers <= 1:
+        for label, path in files:
+            yield ingest_file(label, path, parser_name, limit_overrides)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(ingest_file, label, path, parser_name, limit_overrides)
+            for label, path in files
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def batch_report(
+    records: list[dict[str, object]], elapsed_s: float, workers: int
+) -> dict[str, object]:
+    """Aggregate per-file records into the final ``report`` line."""
+
+    total_bytes = sum(int(record["payload_bytes"]) for record in records)
+    cap_reasons = Counter(
+        reason for record in records for reason in record["cap_reasons"]
+    )
+    slowest = sorted(records, key=lambda record: record["elapsed_ms"], reverse=True)
+    return {
+        "files": len(records),
+        "failed": sum(1 for record in records if "error" in record),
+        "findings_count": sum(
+            int(record.get("findings_count", 0)) for record in records
+        ),
+        "payload_bytes": total_bytes,
+        "cap_reasons": dict(sorted(cap_reasons.items())),
+        "slowest": [
+            {"file": record["file"], "elapsed_ms": record["elapsed_ms"]}
+            for record in slowest[:SLOWEST_FILES]
+        ],
+        "workers": workers,
+        "elapsed_s": round(elapsed_s, 3),
+        "throughput_mb_s": round(total_bytes / 1_000_000 / max(elapsed_s, 1e-9), 3),
+    }
+
+
+def batch_ingest(
+    files: list[tuple[str, Path]],
+    parser_name: str,
+    workers: int,
+    out: TextIO,
+    limit_overrides: dict[str, int] | None = None,
+) -> int:
+    """Dry-run ``files`` and write one line per file plus the report."""
+
+    started = time.perf_counter()
+    records = []
+    for record in _run_batch(files, parser_name, workers, limit_overrides):
+        records.append(record)
+        write_line(out, record)
+    report = batch_report(records, time.perf_counter() - started, workers)
+    write_line(out, {"report": report})
+    return 1 if report["failed"] else 0
+
+
+def resolve_limits(lab: bool, overrides: dict[str, int] | None) -> None:
+    """Apply ``--lab`` and check ``--limit`` values before any parsing.
+
+    The lab switch goes through the environment so batch workers inherit it.
+    """
+
+    from mcp_scansage.services.nmap_limits import (
+        AUTHORIZED_LAB_ENV,
+        reload_limit_config,
+        resolve_limit_config,
+    )
+
+    if lab:
+        os.environ[AUTHORIZED_LAB_ENV] = "1"
+        reload_limit_config()
+    try:
+        resolve_limit_config(overrides)
+    except ValueError as exc:
+        sys.exit(f"Invalid --limit: {exc}")
+
+
 def main() -> None:
     args = parse_args()
-    payload = load_payload(args.xml_path)
+    overrides = dict(args.limit) or None
+    resolve_limits(args.lab, overrides)
     parser = build_parser(args.parser)
+    if args.xml_path == STDIN_PATH:
+        sys.exit(stream_ingest(sys.stdin.buffer, sys.stdout, parser, overrides))
+    if not Path(args.xml_path).is_file():
+        files = batch_files(args.xml_path, args.pattern)
+        if not files:
+            sys.exit(f"No Nmap XML files match {args.xml_path!r}.")
+        sys.exit(batch_ingest(files, args.parser, args.workers, sys.stdout, overrides))
+    payload = load_payload(Path(args.xml_path))
 
     from mcp_scansage.services.nmap_ingest import ingest_nmap_public
 
@@ -55,16 +351,10 @@ def main() -> None:
         payload=payload,
         parser=parser,
         persist_record=False,
+        limit_overrides=overrides,
     )
 
-    summary: dict[str, object] = {
-        "summary": response["summary"],
-        "findings_count": response.get("findings_count", 0),
-    }
-    if metadata := response.get("metadata"):
-        summary["metadata"] = metadata
-
-    sys.stdout.write(json.dumps(summary, ensure_ascii=False))
+    sys.stdout.write(json.dumps(summarize(response), ensure_ascii=False))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,2644 @@
+"""Specialized validators for the JSON schemas in ``schemas/``.
+
+Generated by ``tools/generate_schema_validators.py``; do not edit by hand.
+"""
+
+# ruff: noqa: C901 - generated validators are deliberately straight-line code.
+
+from __future__ import annotations
+
+import numbers
+import re
+from typing import Any, Callable, NoReturn
+
+from jsonschema import ValidationError
+
+_MISSING = object()
+
+
+def _fail(base: str, suffix: str, message: str) -> NoReturn:
+    raise ValidationError(f"{base}{suffix}: {message}")
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, numbers.Number) and not isinstance(value, bool)
+
+
+def _is_integer(value: Any) -> bool:
+    # Draft 7 treats integral floats such as 1.0 as integers.
+    if isinstance(value, float):
+        return value.is_integer()
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+_KEYS_NMAP_INGEST_INPUT_V0_1_1 = frozenset(
+    {
+        "format",
+        "payload",
+    }
+)
+_ENUM_NMAP_INGEST_INPUT_V0_1_2 = ("nmap_xml",)
+_ENUM_NMAP_INGEST_INPUT_V0_1_3 = (
+    "identity",
+    "gzip+base64",
+)
+_KEYS_NMAP_INGEST_INPUT_V0_1_4 = frozenset(
+    {
+        "source",
+        "note",
+    }
+)
+_KEYS_NMAP_INGEST_INPUT_V0_1_5 = frozenset(
+    {
+        "format",
+        "payload",
+        "payload_encoding",
+        "meta",
+    }
+)
+_KEYS_NMAP_INGEST_PUBLIC_RESPONSE_V0_1_1 = frozenset(
+    {
+        "operation",
+        "ingest_id",
+        "format",
+        "summary",
+        "findings",
+        "next_steps",
+    }
+)
+_ENUM_NMAP_INGEST_PUBLIC_RESPONSE_V0_1_2 = ("nmap_xml",)
+_KEYS_NMAP_INGEST_PUBLIC_RESPONSE_V0_1_3 = frozenset(
+    {
+        "payload_bytes",
+        "payload_sha256",
+        "parsed",
+    }
+)
+_PATTERN_NMAP_INGEST_PUBLIC_RESPONSE_V0_1_4 = re.compile("^[a-f0-9]{64}$")
+_KEYS_NMAP_INGEST_PUBLIC_RESPONSE_V0_1_5 = frozenset(
+    {
+        "payload_bytes",
+        "payload_sha256",
+        "parsed",
+    }
+)
+_KEYS_NMAP_INGEST_PUBLIC_RESPONSE_V0_1_6 = frozenset(
+    {
+        "operation",
+        "ingest_id",
+        "format",
+        "summary",
+        "findings",
+        "next_steps",
+    }
+)
+_KEYS_NMAP_INGEST_PUBLIC_RESPONSE_V0_2_1 = frozenset(
+    {
+        "operation",
+        "ingest_id",
+        "format",
+        "summary",
+        "findings",
+        "next_steps",
+        "parser_version",
+        "findings_count",
+        "parsed_findings",
+    }
+)
+_ENUM_NMAP_INGEST_PUBLIC_RESPONSE_V0_2_2 = (
+    "nmap_xml",
+    "synthetic_v1",
+    "nmap_grepable",
+    "masscan_json",
+    "masscan_list",
+)
+_KEYS_NMAP_INGEST_PUBLIC_RESPONSE_V0_2_3 = frozenset(
+    {
+        "payload_bytes",
+        "payload_sha256",
+        "parsed",
+    }
+)
+_PATTERN_NMAP_INGEST_PUBLIC_RESPONSE_V0_2_4 = re.compile("^[a-f0-9]{64}$")
+_KEYS_NMAP_INGEST_PUBLIC_RESPONSE_V0_2_5 = frozenset(
+    {
+        "payload_bytes",
+        "payload_sha256",
+        "parsed",
+    }
+)
+_KEYS_NMAP_INGEST_PUBLIC_RESPONSE_V0_2_6 = frozenset(
+    {
+        "title",
+        "detail",
+        "confidence",
+    }
+)
+_ENUM_NMAP_INGEST_PUBLIC_RESPONSE_V0_2_7 = (
+    "low",
+    "medium",
+    "high",
+)
+_KEYS_NMAP_INGEST_PUBLIC_RESPONSE_V0_2_8 = frozenset(
+    {
+        "title",
+        "detail",
+        "confidence",
+    }
+)
+_KEYS_NMAP_INGEST_PUBLIC_RESPONSE_V0_2_9 = frozenset(
+    {
+        "capped",
+        "cap_reason",
+        "limits",
+    }
+)
+_ENUM_NMAP_INGEST_PUBLIC_RESPONSE_V0_2_10 = (
+    "MAX_HOSTS",
+    "MAX_PORTS",
+    "MAX_FINDINGS",
+)
+_KEYS_NMAP_INGEST_PUBLIC_RESPONSE_V0_2_11 = frozenset(
+    {
+        "max_hosts",
+        "max_ports_per_host",
+        "max_findings",
+    }
+)
+_KEYS_NMAP_INGEST_PUBLIC_RESPONSE_V0_2_12 = frozenset(
+    {
+        "max_hosts",
+        "max_ports_per_host",
+        "max_findings",
+    }
+)
+_KEYS_NMAP_INGEST_PUBLIC_RESPONSE_V0_2_13 = frozenset(
+    {
+        "hosts_processed",
+        "ports_processed",
+        "findings_processed",
+    }
+)
+_KEYS_NMAP_INGEST_PUBLIC_RESPONSE_V0_2_14 = frozenset(
+    {
+        "capped",
+        "cap_reason",
+        "limits",
+        "counts",
+    }
+)
+_KEYS_NMAP_INGEST_PUBLIC_RESPONSE_V0_2_15 = frozenset(
+    {
+        "caps",
+    }
+)
+_KEYS_NMAP_INGEST_PUBLIC_RESPONSE_V0_2_16 = frozenset(
+    {
+        "operation",
+        "ingest_id",
+        "format",
+        "summary",
+        "findings",
+        "next_steps",
+        "parser_version",
+        "findings_count",
+        "parsed_findings",
+        "metadata",
+    }
+)
+_KEYS_NMAP_PARSED_FINDINGS_V0_1_1 = frozenset(
+    {
+        "title",
+        "detail",
+        "confidence",
+    }
+)
+_ENUM_NMAP_PARSED_FINDINGS_V0_1_2 = (
+    "low",
+    "medium",
+    "high",
+)
+_KEYS_NMAP_PARSED_FINDINGS_V0_1_3 = frozenset(
+    {
+        "title",
+        "detail",
+        "confidence",
+    }
+)
+_KEYS_NMAP_INGEST_INPUT_V0_2_1 = frozenset(
+    {
+        "format",
+        "payload",
+    }
+)
+_ENUM_NMAP_INGEST_INPUT_V0_2_2 = (
+    "nmap_xml",
+    "synthetic_v1",
+)
+_ENUM_NMAP_INGEST_INPUT_V0_2_3 = (
+    "identity",
+    "gzip+base64",
+)
+_ENUM_NMAP_INGEST_INPUT_V0_2_4 = ("synthetic_v1",)
+_KEYS_NMAP_INGEST_INPUT_V0_2_5 = frozenset(
+    {
+        "source",
+        "note",
+        "parser",
+    }
+)
+_KEYS_NMAP_INGEST_INPUT_V0_2_6 = frozenset(
+    {
+        "format",
+        "payload",
+        "payload_encoding",
+        "meta",
+    }
+)
+_KEYS_NMAP_INGEST_INPUT_V0_3_1 = frozenset(
+    {
+        "format",
+        "payload",
+    }
+)
+_ENUM_NMAP_INGEST_INPUT_V0_3_2 = (
+    "nmap_xml",
+    "synthetic_v1",
+    "nmap_grepable",
+    "masscan_json",
+    "masscan_list",
+    "auto",
+)
+_ENUM_NMAP_INGEST_INPUT_V0_3_3 = (
+    "identity",
+    "gzip+base64",
+)
+_ENUM_NMAP_INGEST_INPUT_V0_3_4 = ("synthetic_v1",)
+_KEYS_NMAP_INGEST_INPUT_V0_3_5 = frozenset(
+    {
+        "source",
+        "note",
+        "parser",
+    }
+)
+_KEYS_NMAP_INGEST_INPUT_V0_3_6 = frozenset(
+    {
+        "format",
+        "payload",
+        "payload_encoding",
+        "meta",
+    }
+)
+_KEYS_NMAP_INGESTS_LIST_RESPONSE_V0_1_1 = frozenset(
+    {
+        "operation",
+        "count",
+        "max_records",
+        "ingests",
+    }
+)
+_KEYS_NMAP_INGESTS_LIST_RESPONSE_V0_1_2 = frozenset(
+    {
+        "ingest_id",
+        "created_at",
+        "format",
+        "summary",
+        "next_steps",
+    }
+)
+_ENUM_NMAP_INGESTS_LIST_RESPONSE_V0_1_3 = (
+    "nmap_xml",
+    "nmap_grepable",
+    "masscan_json",
+    "masscan_list",
+)
+_KEYS_NMAP_INGESTS_LIST_RESPONSE_V0_1_4 = frozenset(
+    {
+        "payload_bytes",
+        "payload_sha256",
+        "parsed",
+    }
+)
+_PATTERN_NMAP_INGESTS_LIST_RESPONSE_V0_1_5 = re.compile("^[a-f0-9]{64}$")
+_KEYS_NMAP_INGESTS_LIST_RESPONSE_V0_1_6 = frozenset(
+    {
+        "payload_bytes",
+        "payload_sha256",
+        "parsed",
+    }
+)
+_KEYS_NMAP_INGESTS_LIST_RESPONSE_V0_1_7 = frozenset(
+    {
+        "ingest_id",
+        "created_at",
+        "format",
+        "summary",
+        "next_steps",
+        "parser_version",
+        "parsed",
+        "findings_count",
+    }
+)
+_KEYS_NMAP_INGESTS_LIST_RESPONSE_V0_1_8 = frozenset(
+    {
+        "operation",
+        "count",
+        "max_records",
+        "ingests",
+    }
+)
+_KEYS_NMAP_INGEST_GET_RESPONSE_V0_1_1 = frozenset(
+    {
+        "operation",
+        "ingest",
+    }
+)
+_KEYS_NMAP_INGEST_GET_RESPONSE_V0_1_2 = frozenset(
+    {
+        "ingest_id",
+        "created_at",
+        "format",
+        "summary",
+        "next_steps",
+    }
+)
+_ENUM_NMAP_INGEST_GET_RESPONSE_V0_1_3 = (
+    "nmap_xml",
+    "nmap_grepable",
+    "masscan_json",
+    "masscan_list",
+)
+_KEYS_NMAP_INGEST_GET_RESPONSE_V0_1_4 = frozenset(
+    {
+        "payload_bytes",
+        "payload_sha256",
+        "parsed",
+    }
+)
+_PATTERN_NMAP_INGEST_GET_RESPONSE_V0_1_5 = re.compile("^[a-f0-9]{64}$")
+_KEYS_NMAP_INGEST_GET_RESPONSE_V0_1_6 = frozenset(
+    {
+        "payload_bytes",
+        "payload_sha256",
+        "parsed",
+    }
+)
+_KEYS_NMAP_INGEST_GET_RESPONSE_V0_1_7 = frozenset(
+    {
+        "ingest_id",
+        "created_at",
+        "format",
+        "summary",
+        "next_steps",
+        "parser_version",
+        "parsed",
+        "findings_count",
+    }
+)
+_KEYS_NMAP_INGEST_GET_RESPONSE_V0_1_8 = frozenset(
+    {
+        "operation",
+        "ingest",
+    }
+)
+_KEYS_NMAP_INGEST_NMAP_XML_INPUT_V0_1_1 = frozenset(
+    {
+        "payload",
+    }
+)
+_ENUM_NMAP_INGEST_NMAP_XML_INPUT_V0_1_2 = ("nmap_xml",)
+_ENUM_NMAP_INGEST_NMAP_XML_INPUT_V0_1_3 = (
+    "identity",
+    "gzip+base64",
+)
+_KEYS_NMAP_INGEST_NMAP_XML_INPUT_V0_1_4 = frozenset(
+    {
+        "source",
+        "note",
+    }
+)
+_KEYS_NMAP_INGEST_NMAP_XML_INPUT_V0_1_5 = frozenset(
+    {
+        "format",
+        "payload",
+        "payload_encoding",
+        "meta",
+    }
+)
+_KEYS_NMAP_UPLOAD_BEGIN_INPUT_V0_1_1 = frozenset(
+    {
+        "format",
+    }
+)
+_ENUM_NMAP_UPLOAD_BEGIN_INPUT_V0_1_2 = ("nmap_xml",)
+_KEYS_NMAP_UPLOAD_BEGIN_INPUT_V0_1_3 = frozenset(
+    {
+        "source",
+        "note",
+    }
+)
+_KEYS_NMAP_UPLOAD_BEGIN_INPUT_V0_1_4 = frozenset(
+    {
+        "format",
+        "total_bytes",
+        "meta",
+    }
+)
+_KEYS_NMAP_UPLOAD_CHUNK_INPUT_V0_1_1 = frozenset(
+    {
+        "upload_id",
+        "chunk_index",
+        "data",
+    }
+)
+_PATTERN_NMAP_UPLOAD_CHUNK_INPUT_V0_1_2 = re.compile("^[0-9a-f]{32}$")
+_KEYS_NMAP_UPLOAD_CHUNK_INPUT_V0_1_3 = frozenset(
+    {
+        "upload_id",
+        "chunk_index",
+        "data",
+    }
+)
+_KEYS_NMAP_UPLOAD_COMMIT_INPUT_V0_1_1 = frozenset(
+    {
+        "upload_id",
+    }
+)
+_PATTERN_NMAP_UPLOAD_COMMIT_INPUT_V0_1_2 = re.compile("^[0-9a-f]{32}$")
+_PATTERN_NMAP_UPLOAD_COMMIT_INPUT_V0_1_3 = re.compile("^[0-9a-f]{64}$")
+_KEYS_NMAP_UPLOAD_COMMIT_INPUT_V0_1_4 = frozenset(
+    {
+        "upload_id",
+        "payload_sha256",
+    }
+)
+_KEYS_NMAP_UPLOAD_STATUS_INPUT_V0_1_1 = frozenset(
+    {
+        "upload_id",
+    }
+)
+_PATTERN_NMAP_UPLOAD_STATUS_INPUT_V0_1_2 = re.compile("^[0-9a-f]{32}$")
+_KEYS_NMAP_UPLOAD_STATUS_INPUT_V0_1_3 = frozenset(
+    {
+        "upload_id",
+    }
+)
+_KEYS_NMAP_UPLOAD_STATUS_RESPONSE_V0_1_1 = frozenset(
+    {
+        "operation",
+        "upload_id",
+        "next_chunk_index",
+        "received_bytes",
+        "max_bytes",
+    }
+)
+_PATTERN_NMAP_UPLOAD_STATUS_RESPONSE_V0_1_2 = re.compile("^[0-9a-f]{32}$")
+_KEYS_NMAP_UPLOAD_STATUS_RESPONSE_V0_1_3 = frozenset(
+    {
+        "operation",
+        "upload_id",
+        "next_chunk_index",
+        "received_bytes",
+        "max_bytes",
+    }
+)
+
+
+def validate_nmap_ingest_input_v0_1(instance: Any, p: str = "$") -> None:
+    """Validate ``instance`` against ``nmap_ingest_input_v0.1``."""
+
+    v = instance
+    if not isinstance(v, dict):
+        _fail(
+            p,
+            "",
+            "is not of type ['object']",
+        )
+    if not _KEYS_NMAP_INGEST_INPUT_V0_1_1 <= v.keys():
+        _fail(
+            p,
+            "",
+            "is missing a required property",
+        )
+    v1 = v.get("format", _MISSING)
+    if v1 is not _MISSING:
+        if not isinstance(v1, str):
+            _fail(
+                p,
+                ".format",
+                "is not of type ['string']",
+            )
+        if v1 not in _ENUM_NMAP_INGEST_INPUT_V0_1_2:
+            _fail(
+                p,
+                ".format",
+                "is not one of the allowed values",
+            )
+    v2 = v.get("payload", _MISSING)
+    if v2 is not _MISSING:
+        if not isinstance(v2, str):
+            _fail(
+                p,
+                ".payload",
+                "is not of type ['string']",
+            )
+        if len(v2) < 1:
+            _fail(
+                p,
+                ".payload",
+                "is too short",
+            )
+        if len(v2) > 32768:
+            _fail(
+                p,
+                ".payload",
+                "is too long",
+            )
+    v3 = v.get("payload_encoding", _MISSING)
+    if v3 is not _MISSING:
+        if not isinstance(v3, str):
+            _fail(
+                p,
+                ".payload_encoding",
+                "is not of type ['string']",
+            )
+        if v3 not in _ENUM_NMAP_INGEST_INPUT_V0_1_3:
+            _fail(
+                p,
+                ".payload_encoding",
+                "is not one of the allowed values",
+            )
+    v4 = v.get("meta", _MISSING)
+    if v4 is not _MISSING:
+        if not isinstance(v4, dict):
+            _fail(
+                p,
+                ".meta",
+                "is not of type ['object']",
+            )
+        v5 = v4.get("source", _MISSING)
+        if v5 is not _MISSING:
+            if not isinstance(v5, str):
+                _fail(
+                    p,
+                    ".meta.source",
+                    "is not of type ['string']",
+                )
+            if len(v5) > 64:
+                _fail(
+                    p,
+                    ".meta.source",
+                    "is too long",
+                )
+        v6 = v4.get("note", _MISSING)
+        if v6 is not _MISSING:
+            if not isinstance(v6, str):
+                _fail(
+                    p,
+                    ".meta.note",
+                    "is not of type ['string']",
+                )
+            if len(v6) > 200:
+                _fail(
+                    p,
+                    ".meta.note",
+                    "is too long",
+                )
+        if not v4.keys() <= _KEYS_NMAP_INGEST_INPUT_V0_1_4:
+            _fail(
+                p,
+                ".meta",
+                "has unexpected properties",
+            )
+    if not v.keys() <= _KEYS_NMAP_INGEST_INPUT_V0_1_5:
+        _fail(
+            p,
+            "",
+            "has unexpected properties",
+        )
+
+
+def validate_nmap_ingest_public_response_v0_1(instance: Any, p: str = "$") -> None:
+    """Validate ``instance`` against ``nmap_ingest_public_response_v0.1``."""
+
+    v = instance
+    if not isinstance(v, dict):
+        _fail(
+            p,
+            "",
+            "is not of type ['object']",
+        )
+    if not _KEYS_NMAP_INGEST_PUBLIC_RESPONSE_V0_1_1 <= v.keys():
+        _fail(
+            p,
+            "",
+            "is missing a required property",
+        )
+    v1 = v.get("operation", _MISSING)
+    if v1 is not _MISSING:
+        if not isinstance(v1, str):
+            _fail(
+                p,
+                ".operation",
+                "is not of type ['string']",
+            )
+        if v1 != "nmap_ingest":
+            _fail(
+                p,
+                ".operation",
+                "was expected to be 'nmap_ingest'",
+            )
+    v2 = v.get("ingest_id", _MISSING)
+    if v2 is not _MISSING:
+        if not isinstance(v2, str):
+            _fail(
+                p,
+                ".ingest_id",
+                "is not of type ['string']",
+            )
+        if len(v2) < 8:
+            _fail(
+                p,
+                ".ingest_id",
+                "is too short",
+            )
+        if len(v2) > 128:
+            _fail(
+                p,
+                ".ingest_id",
+                "is too long",
+            )
+    v3 = v.get("format", _MISSING)
+    if v3 is not _MISSING:
+        if not isinstance(v3, str):
+            _fail(
+                p,
+                ".format",
+                "is not of type ['string']",
+            )
+        if v3 not in _ENUM_NMAP_INGEST_PUBLIC_RESPONSE_V0_1_2:
+            _fail(
+                p,
+                ".format",
+                "is not one of the allowed values",
+            )
+    v4 = v.get("summary", _MISSING)
+    if v4 is not _MISSING:
+        if not isinstance(v4, dict):
+            _fail(
+                p,
+                ".summary",
+                "is not of type ['object']",
+            )
+        if not _KEYS_NMAP_INGEST_PUBLIC_RESPONSE_V0_1_3 <= v4.keys():
+            _fail(
+                p,
+                ".summary",
+                "is missing a required property",
+            )
+        v5 = v4.get("payload_bytes", _MISSING)
+        if v5 is not _MISSING:
+            if not _is_integer(v5):
+                _fail(
+                    p,
+                    ".summary.payload_bytes",
+                    "is not of type ['integer']",
+                )
+            if _is_number(v5):
+                if v5 < 1:
+                    _fail(
+                        p,
+                        ".summary.payload_bytes",
+                        "is less than the minimum of 1",
+                    )
+        v6 = v4.get("payload_sha256", _MISSING)
+        if v6 is not _MISSING:
+            if not isinstance(v6, str):
+                _fail(
+                    p,
+                    ".summary.payload_sha256",
+                    "is not of type ['string']",
+                )
+            if not _PATTERN_NMAP_INGEST_PUBLIC_RESPONSE_V0_1_4.search(v6):
+                _fail(
+                    p,
+                    ".summary.payload_sha256",
+                    "does not match the pattern",
+                )
+        v7 = v4.get("parsed", _MISSING)
+        if v7 is not _MISSING:
+            if not isinstance(v7, bool):
+                _fail(
+                    p,
+                    ".summary.parsed",
+                    "is not of type ['boolean']",
+                )
+            if v7 is not False:
+                _fail(
+                    p,
+                    ".summary.parsed",
+                    "was expected to be False",
+                )
+        if not v4.keys() <= _KEYS_NMAP_INGEST_PUBLIC_RESPONSE_V0_1_5:
+            _fail(
+                p,
+                ".summary",
+                "has unexpected properties",
+            )
+    v8 = v.get("findings", _MISSING)
+    if v8 is not _MISSING:
+        if not isinstance(v8, list):
+            _fail(
+                p,
+                ".findings",
+                "is not of type ['array']",
+            )
+        if len(v8) > 1000:
+            _fail(
+                p,
+                ".findings",
+                "is too long",
+            )
+        for i9, v10 in enumerate(v8):
+            if not isinstance(v10, dict):
+                _fail(
+                    p,
+                    f".findings[{i9}]",
+                    "is not of type ['object']",
+                )
+    v11 = v.get("next_steps", _MISSING)
+    if v11 is not _MISSING:
+        if not isinstance(v11, list):
+            _fail(
+                p,
+                ".next_steps",
+                "is not of type ['array']",
+            )
+        if len(v11) > 50:
+            _fail(
+                p,
+                ".next_steps",
+                "is too long",
+            )
+        for i12, v13 in enumerate(v11):
+            if not isinstance(v13, str):
+                _fail(
+                    p,
+                    f".next_steps[{i12}]",
+                    "is not of type ['string']",
+                )
+    if not v.keys() <= _KEYS_NMAP_INGEST_PUBLIC_RESPONSE_V0_1_6:
+        _fail(
+            p,
+            "",
+            "has unexpected properties",
+        )
+
+
+def _nmap_ingest_public_response_v0_2__nmap_parsed_finding(v: Any, p: str) -> None:
+    if not isinstance(v, dict):
+        _fail(
+            p,
+            "",
+            "is not of type ['object']",
+        )
+    if not _KEYS_NMAP_INGEST_PUBLIC_RESPONSE_V0_2_6 <= v.keys():
+        _fail(
+            p,
+            "",
+            "is missing a required property",
+        )
+    v1 = v.get("title", _MISSING)
+    if v1 is not _MISSING:
+        if not isinstance(v1, str):
+            _fail(
+                p,
+                ".title",
+                "is not of type ['string']",
+            )
+        if len(v1) < 1:
+            _fail(
+                p,
+                ".title",
+                "is too short",
+            )
+        if len(v1) > 128:
+            _fail(
+                p,
+                ".title",
+                "is too long",
+            )
+    v2 = v.get("detail", _MISSING)
+    if v2 is not _MISSING:
+        if not isinstance(v2, str):
+            _fail(
+                p,
+                ".detail",
+                "is not of type ['string']",
+            )
+        if len(v2) < 1:
+            _fail(
+                p,
+                ".detail",
+                "is too short",
+            )
+        if len(v2) > 256:
+            _fail(
+                p,
+                ".detail",
+                "is too long",
+            )
+    v3 = v.get("confidence", _MISSING)
+    if v3 is not _MISSING:
+        if not isinstance(v3, str):
+            _fail(
+                p,
+                ".confidence",
+                "is not of type ['string']",
+            )
+        if v3 not in _ENUM_NMAP_INGEST_PUBLIC_RESPONSE_V0_2_7:
+            _fail(
+                p,
+                ".confidence",
+                "is not one of the allowed values",
+            )
+    if not v.keys() <= _KEYS_NMAP_INGEST_PUBLIC_RESPONSE_V0_2_8:
+        _fail(
+            p,
+            "",
+            "has unexpected properties",
+        )
+
+
+def validate_nmap_ingest_public_response_v0_2(instance: Any, p: str = "$") -> None:
+    """Validate ``instance`` against ``nmap_ingest_public_response_v0.2``."""
+
+    v = instance
+    if not isinstance(v, dict):
+        _fail(
+            p,
+            "",
+            "is not of type ['object']",
+        )
+    if not _KEYS_NMAP_INGEST_PUBLIC_RESPONSE_V0_2_1 <= v.keys():
+        _fail(
+            p,
+            "",
+            "is missing a required property",
+        )
+    v1 = v.get("operation", _MISSING)
+    if v1 is not _MISSING:
+        if not isinstance(v1, str):
+            _fail(
+                p,
+                ".operation",
+                "is not of type ['string']",
+            )
+        if v1 != "nmap_ingest":
+            _fail(
+                p,
+                ".operation",
+                "was expected to be 'nmap_ingest'",
+            )
+    v2 = v.get("ingest_id", _MISSING)
+    if v2 is not _MISSING:
+        if not isinstance(v2, str):
+            _fail(
+                p,
+                ".ingest_id",
+                "is not of type ['string']",
+            )
+        if len(v2) < 8:
+            _fail(
+                p,
+                ".ingest_id",
+                "is too short",
+            )
+        if len(v2) > 128:
+            _fail(
+                p,
+                ".ingest_id",
+                "is too long",
+            )
+    v3 = v.get("format", _MISSING)
+    if v3 is not _MISSING:
+        if not isinstance(v3, str):
+            _fail(
+                p,
+                ".format",
+                "is not of type ['string']",
+            )
+        if v3 not in _ENUM_NMAP_INGEST_PUBLIC_RESPONSE_V0_2_2:
+            _fail(
+                p,
+                ".format",
+                "is not one of the allowed values",
+            )
+    v4 = v.get("summary", _MISSING)
+    if v4 is not _MISSING:
+        if not isinstance(v4, dict):
+            _fail(
+                p,
+                ".summary",
+                "is not of type ['object']",
+            )
+        if not _KEYS_NMAP_INGEST_PUBLIC_RESPONSE_V0_2_3 <= v4.keys():
+            _fail(
+                p,
+                ".summary",
+                "is missing a required property",
+            )
+        v5 = v4.get("payload_bytes", _MISSING)
+        if v5 is not _MISSING:
+            if not _is_integer(v5):
+                _fail(
+                    p,
+                    ".summary.payload_bytes",
+                    "is not of type ['integer']",
+                )
+            if _is_number(v5):
+                if v5 < 1:
+                    _fail(
+                        p,
+                        ".summary.payload_bytes",
+                        "is less than the minimum of 1",
+                    )
+        v6 = v4.get("payload_sha256", _MISSING)
+        if v6 is not _MISSING:
+            if not isinstance(v6, str):
+                _fail(
+                    p,
+                    ".summary.payload_sha256",
+                    "is not of type ['string']",
+                )
+            if not _PATTERN_NMAP_INGEST_PUBLIC_RESPONSE_V0_2_4.search(v6):
+                _fail(
+                    p,
+                    ".summary.payload_sha256",
+                    "does not match the pattern",
+                )
+        v7 = v4.get("parsed", _MISSING)
+        if v7 is not _MISSING:
+            if not isinstance(v7, bool):
+                _fail(
+                    p,
+                    ".summary.parsed",
+                    "is not of type ['boolean']",
+                )
+        if not v4.keys() <= _KEYS_NMAP_INGEST_PUBLIC_RESPONSE_V0_2_5:
+            _fail(
+                p,
+                ".summary",
+                "has unexpected properties",
+            )
+    v8 = v.get("findings", _MISSING)
+    if v8 is not _MISSING:
+        if not isinstance(v8, list):
+            _fail(
+                p,
+                ".findings",
+                "is not of type ['array']",
+            )
+        if len(v8) > 1000:
+            _fail(
+                p,
+                ".findings",
+                "is too long",
+            )
+        for i9, v10 in enumerate(v8):
+            if not isinstance(v10, dict):
+                _fail(
+                    p,
+                    f".findings[{i9}]",
+                    "is not of type ['object']",
+                )
+    v11 = v.get("next_steps", _MISSING)
+    if v11 is not _MISSING:
+        if not isinstance(v11, list):
+            _fail(
+                p,
+                ".next_steps",
+                "is not of type ['array']",
+            )
+        if len(v11) > 50:
+            _fail(
+                p,
+                ".next_steps",
+                "is too long",
+            )
+        for i12, v13 in enumerate(v11):
+            if not isinstance(v13, str):
+                _fail(
+                    p,
+                    f".next_steps[{i12}]",
+                    "is not of type ['string']",
+                )
+    v14 = v.get("parser_version", _MISSING)
+    if v14 is not _MISSING:
+        if not isinstance(v14, str):
+            _fail(
+                p,
+                ".parser_version",
+                "is not of type ['string']",
+            )
+        if len(v14) < 1:
+            _fail(
+                p,
+                ".parser_version",
+                "is too short",
+            )
+        if len(v14) > 64:
+            _fail(
+                p,
+                ".parser_version",
+                "is too long",
+            )
+    v15 = v.get("findings_count", _MISSING)
+    if v15 is not _MISSING:
+        if not _is_integer(v15):
+            _fail(
+                p,
+                ".findings_count",
+                "is not of type ['integer']",
+            )
+        if _is_number(v15):
+            if v15 < 0:
+                _fail(
+                    p,
+                    ".findings_count",
+                    "is less than the minimum of 0",
+                )
+    v16 = v.get("parsed_findings", _MISSING)
+    if v16 is not _MISSING:
+        if not isinstance(v16, list):
+            _fail(
+                p,
+                ".parsed_findings",
+                "is not of type ['array']",
+            )
+        if len(v16) > 100:
+            _fail(
+                p,
+                ".parsed_findings",
+                "is too long",
+            )
+        for i17, v18 in enumerate(v16):
+            _nmap_ingest_public_response_v0_2__nmap_parsed_finding(
+                v18, f"{p}.parsed_findings[{i17}]"
+            )
+    v19 = v.get("metadata", _MISSING)
+    if v19 is not _MISSING:
+        if not isinstance(v19, dict):
+            _fail(
+                p,
+                ".metadata",
+                "is not of type ['object']",
+            )
+        v20 = v19.get("caps", _MISSING)
+        if v20 is not _MISSING:
+            if not isinstance(v20, dict):
+                _fail(
+                    p,
+                    ".metadata.caps",
+                    "is not of type ['object']",
+                )
+            if not _KEYS_NMAP_INGEST_PUBLIC_RESPONSE_V0_2_9 <= v20.keys():
+                _fail(
+                    p,
+                    ".metadata.caps",
+                    "is missing a required property",
+                )
+            v21 = v20.get("capped", _MISSING)
+            if v21 is not _MISSING:
+                if not isinstance(v21, bool):
+                    _fail(
+                        p,
+                        ".metadata.caps.capped",
+                        "is not of type ['boolean']",
+                    )
+            v22 = v20.get("cap_reason", _MISSING)
+            if v22 is not _MISSING:
+                if not isinstance(v22, str):
+                    _fail(
+                        p,
+                        ".metadata.caps.cap_reason",
+                        "is not of type ['string']",
+                    )
+                if v22 not in _ENUM_NMAP_INGEST_PUBLIC_RESPONSE_V0_2_10:
+                    _fail(
+                        p,
+                        ".metadata.caps.cap_reason",
+                        "is not one of the allowed values",
+                    )
+            v23 = v20.get("limits", _MISSING)
+            if v23 is not _MISSING:
+                if not isinstance(v23, dict):
+                    _fail(
+                        p,
+                        ".metadata.caps.limits",
+                        "is not of type ['object']",
+                    )
+                if not _KEYS_NMAP_INGEST_PUBLIC_RESPONSE_V0_2_11 <= v23.keys():
+                    _fail(
+                        p,
+                        ".metadata.caps.limits",
+                        "is missing a required property",
+                    )
+                v24 = v23.get("max_hosts", _MISSING)
+                if v24 is not _MISSING:
+                    if not _is_integer(v24):
+                        _fail(
+                            p,
+                            ".metadata.caps.limits.max_hosts",
+                            "is not of type ['integer']",
+                        )
+                    if _is_number(v24):
+                        if v24 < 1:
+                            _fail(
+                                p,
+                                ".metadata.caps.limits.max_hosts",
+                                "is less than the minimum of 1",
+                            )
+                v25 = v23.get("max_ports_per_host", _MISSING)
+                if v25 is not _MISSING:
+                    if not _is_integer(v25):
+                        _fail(
+                            p,
+                            ".metadata.caps.limits.max_ports_per_host",
+                            "is not of type ['integer']",
+                        )
+                    if _is_number(v25):
+                        if v25 < 1:
+                            _fail(
+                                p,
+                                ".metadata.caps.limits.max_ports_per_host",
+                                "is less than the minimum of 1",
+                            )
+                v26 = v23.get("max_findings", _MISSING)
+                if v26 is not _MISSING:
+                    if not _is_integer(v26):
+                        _fail(
+                            p,
+                            ".metadata.caps.limits.max_findings",
+                            "is not of type ['integer']",
+                        )
+                    if _is_number(v26):
+                        if v26 < 1:
+                            _fail(
+                                p,
+                                ".metadata.caps.limits.max_findings",
+                                "is less than the minimum of 1",
+                            )
+                if not v23.keys() <= _KEYS_NMAP_INGEST_PUBLIC_RESPONSE_V0_2_12:
+                    _fail(
+                        p,
+                        ".metadata.caps.limits",
+                        "has unexpected properties",
+                    )
+            v27 = v20.get("counts", _MISSING)
+            if v27 is not _MISSING:
+                if not isinstance(v27, dict):
+                    _fail(
+                        p,
+                        ".metadata.caps.counts",
+                        "is not of type ['object']",
+                    )
+                v28 = v27.get("hosts_processed", _MISSING)
+                if v28 is not _MISSING:
+                    if not _is_integer(v28):
+                        _fail(
+                            p,
+                            ".metadata.caps.counts.hosts_processed",
+                            "is not of type ['integer']",
+                        )
+                    if _is_number(v28):
+                        if v28 < 0:
+                            _fail(
+                                p,
+                                ".metadata.caps.counts.hosts_processed",
+                                "is less than the minimum of 0",
+                            )
+                v29 = v27.get("ports_processed", _MISSING)
+                if v29 is not _MISSING:
+                    if not _is_integer(v29):
+                        _fail(
+                            p,
+                            ".metadata.caps.counts.ports_processed",
+                            "is not of type ['integer']",
+                        )
+                    if _is_number(v29):
+                        if v29 < 0:
+                            _fail(
+                                p,
+                                ".metadata.caps.counts.ports_processed",
+                                "is less than the minimum of 0",
+                            )
+                v30 = v27.get("findings_processed", _MISSING)
+                if v30 is not _MISSING:
+                    if not _is_integer(v30):
+                        _fail(
+                            p,
+                            ".metadata.caps.counts.findings_processed",
+                            "is not of type ['integer']",
+                        )
+                    if _is_number(v30):
+                        if v30 < 0:
+                            _fail(
+                                p,
+                                ".metadata.caps.counts.findings_processed",
+                                "is less than the minimum of 0",
+                            )
+                if not v27.keys() <= _KEYS_NMAP_INGEST_PUBLIC_RESPONSE_V0_2_13:
+                    _fail(
+                        p,
+                        ".metadata.caps.counts",
+                        "has unexpected properties",
+                    )
+            if not v20.keys() <= _KEYS_NMAP_INGEST_PUBLIC_RESPONSE_V0_2_14:
+                _fail(
+                    p,
+                    ".metadata.caps",
+                    "has unexpected properties",
+                )
+        if not v19.keys() <= _KEYS_NMAP_INGEST_PUBLIC_RESPONSE_V0_2_15:
+            _fail(
+                p,
+                ".metadata",
+                "has unexpected properties",
+            )
+    if not v.keys() <= _KEYS_NMAP_INGEST_PUBLIC_RESPONSE_V0_2_16:
+        _fail(
+            p,
+            "",
+            "has unexpected properties",
+        )
+
+
+def validate_nmap_parsed_findings_v0_1(instance: Any, p: str = "$") -> None:
+    """Validate ``instance`` against ``nmap_parsed_findings_v0.1``."""
+
+    v = instance
+    if not isinstance(v, dict):
+        _fail(
+            p,
+            "",
+            "is not of type ['object']",
+        )
+    if not _KEYS_NMAP_PARSED_FINDINGS_V0_1_1 <= v.keys():
+        _fail(
+            p,
+            "",
+            "is missing a required property",
+        )
+    v1 = v.get("title", _MISSING)
+    if v1 is not _MISSING:
+        if not isinstance(v1, str):
+            _fail(
+                p,
+                ".title",
+                "is not of type ['string']",
+            )
+        if len(v1) < 1:
+            _fail(
+                p,
+                ".title",
+                "is too short",
+            )
+        if len(v1) > 128:
+            _fail(
+                p,
+                ".title",
+                "is too long",
+            )
+    v2 = v.get("detail", _MISSING)
+    if v2 is not _MISSING:
+        if not isinstance(v2, str):
+            _fail(
+                p,
+                ".detail",
+                "is not of type ['string']",
+            )
+        if len(v2) < 1:
+            _fail(
+                p,
+                ".detail",
+                "is too short",
+            )
+        if len(v2) > 256:
+            _fail(
+                p,
+                ".detail",
+                "is too long",
+            )
+    v3 = v.get("confidence", _MISSING)
+    if v3 is not _MISSING:
+        if not isinstance(v3, str):
+            _fail(
+                p,
+                ".confidence",
+                "is not of type ['string']",
+            )
+        if v3 not in _ENUM_NMAP_PARSED_FINDINGS_V0_1_2:
+            _fail(
+                p,
+                ".confidence",
+                "is not one of the allowed values",
+            )
+    if not v.keys() <= _KEYS_NMAP_PARSED_FINDINGS_V0_1_3:
+        _fail(
+            p,
+            "",
+            "has unexpected properties",
+        )
+
+
+def validate_nmap_ingest_input_v0_2(instance: Any, p: str = "$") -> None:
+    """Validate ``instance`` against ``nmap_ingest_input_v0.2``."""
+
+    v = instance
+    if not isinstance(v, dict):
+        _fail(
+            p,
+            "",
+            "is not of type ['object']",
+        )
+    if not _KEYS_NMAP_INGEST_INPUT_V0_2_1 <= v.keys():
+        _fail(
+            p,
+            "",
+            "is missing a required property",
+        )
+    v1 = v.get("format", _MISSING)
+    if v1 is not _MISSING:
+        if not isinstance(v1, str):
+            _fail(
+                p,
+                ".format",
+                "is not of type ['string']",
+            )
+        if v1 not in _ENUM_NMAP_INGEST_INPUT_V0_2_2:
+            _fail(
+                p,
+                ".format",
+                "is not one of the allowed values",
+            )
+    v2 = v.get("payload", _MISSING)
+    if v2 is not _MISSING:
+        if not isinstance(v2, str):
+            _fail(
+                p,
+                ".payload",
+                "is not of type ['string']",
+            )
+        if len(v2) < 1:
+            _fail(
+                p,
+                ".payload",
+                "is too short",
+            )
+        if len(v2) > 32768:
+            _fail(
+                p,
+                ".payload",
+                "is too long",
+            )
+    v3 = v.get("payload_encoding", _MISSING)
+    if v3 is not _MISSING:
+        if not isinstance(v3, str):
+            _fail(
+                p,
+                ".payload_encoding",
+                "is not of type ['string']",
+            )
+        if v3 not in _ENUM_NMAP_INGEST_INPUT_V0_2_3:
+            _fail(
+                p,
+                ".payload_encoding",
+                "is not one of the allowed values",
+            )
+    v4 = v.get("meta", _MISSING)
+    if v4 is not _MISSING:
+        if not isinstance(v4, dict):
+            _fail(
+                p,
+                ".meta",
+                "is not of type ['object']",
+            )
+        v5 = v4.get("source", _MISSING)
+        if v5 is not _MISSING:
+            if not isinstance(v5, str):
+                _fail(
+                    p,
+                    ".meta.source",
+                    "is not of type ['string']",
+                )
+            if len(v5) > 64:
+                _fail(
+                    p,
+                    ".meta.source",
+                    "is too long",
+                )
+        v6 = v4.get("note", _MISSING)
+        if v6 is not _MISSING:
+            if not isinstance(v6, str):
+                _fail(
+                    p,
+                    ".meta.note",
+                    "is not of type ['string']",
+                )
+            if len(v6) > 200:
+                _fail(
+                    p,
+                    ".meta.note",
+                    "is too long",
+                )
+        v7 = v4.get("parser", _MISSING)
+        if v7 is not _MISSING:
+            if not isinstance(v7, str):
+                _fail(
+                    p,
+                    ".meta.parser",
+                    "is not of type ['string']",
+                )
+            if v7 not in _ENUM_NMAP_INGEST_INPUT_V0_2_4:
+                _fail(
+                    p,
+                    ".meta.parser",
+                    "is not one of the allowed values",
+                )
+        if not v4.keys() <= _KEYS_NMAP_INGEST_INPUT_V0_2_5:
+            _fail(
+                p,
+                ".meta",
+                "has unexpected properties",
+            )
+    if not v.keys() <= _KEYS_NMAP_INGEST_INPUT_V0_2_6:
+        _fail(
+            p,
+            "",
+            "has unexpected properties",
+        )
+
+
+def validate_nmap_ingest_input_v0_3(instance: Any, p: str = "$") -> None:
+    """Validate ``instance`` against ``nmap_ingest_input_v0.3``."""
+
+    v = instance
+    if not isinstance(v, dict):
+        _fail(
+            p,
+            "",
+            "is not of type ['object']",
+        )
+    if not _KEYS_NMAP_INGEST_INPUT_V0_3_1 <= v.keys():
+        _fail(
+            p,
+            "",
+            "is missing a required property",
+        )
+    v1 = v.get("format", _MISSING)
+    if v1 is not _MISSING:
+        if not isinstance(v1, str):
+            _fail(
+                p,
+                ".format",
+                "is not of type ['string']",
+            )
+        if v1 not in _ENUM_NMAP_INGEST_INPUT_V0_3_2:
+            _fail(
+                p,
+                ".format",
+                "is not one of the allowed values",
+            )
+    v2 = v.get("payload", _MISSING)
+    if v2 is not _MISSING:
+        if not isinstance(v2, str):
+            _fail(
+                p,
+                ".payload",
+                "is not of type ['string']",
+            )
+        if len(v2) < 1:
+            _fail(
+                p,
+                ".payload",
+                "is too short",
+            )
+        if len(v2) > 32768:
+            _fail(
+                p,
+                ".payload",
+                "is too long",
+            )
+    v3 = v.get("payload_encoding", _MISSING)
+    if v3 is not _MISSING:
+        if not isinstance(v3, str):
+            _fail(
+                p,
+                ".payload_encoding",
+                "is not of type ['string']",
+            )
+        if v3 not in _ENUM_NMAP_INGEST_INPUT_V0_3_3:
+            _fail(
+                p,
+                ".payload_encoding",
+                "is not one of the allowed values",
+            )
+    v4 = v.get("meta", _MISSING)
+    if v4 is not _MISSING:
+        if not isinstance(v4, dict):
+            _fail(
+                p,
+                ".meta",
+                "is not of type ['object']",
+            )
+        v5 = v4.get("source", _MISSING)
+        if v5 is not _MISSING:
+            if not isinstance(v5, str):
+                _fail(
+                    p,
+                    ".meta.source",
+                    "is not of type ['string']",
+                )
+            if len(v5) > 64:
+                _fail(
+                    p,
+                    ".meta.source",
+                    "is too long",
+                )
+        v6 = v4.get("note", _MISSING)
+        if v6 is not _MISSING:
+            if not isinstance(v6, str):
+                _fail(
+                    p,
+                    ".meta.note",
+                    "is not of type ['string']",
+                )
+            if len(v6) > 200:
+                _fail(
+                    p,
+                    ".meta.note",
+                    "is too long",
+                )
+        v7 = v4.get("parser", _MISSING)
+        if v7 is not _MISSING:
+            if not isinstance(v7, str):
+                _fail(
+                    p,
+                    ".meta.parser",
+                    "is not of type ['string']",
+                )
+            if v7 not in _ENUM_NMAP_INGEST_INPUT_V0_3_4:
+                _fail(
+                    p,
+                    ".meta.parser",
+                    "is not one of the allowed values",
+                )
+        if not v4.keys() <= _KEYS_NMAP_INGEST_INPUT_V0_3_5:
+            _fail(
+                p,
+                ".meta",
+                "has unexpected properties",
+            )
+    if not v.keys() <= _KEYS_NMAP_INGEST_INPUT_V0_3_6:
+        _fail(
+            p,
+            "",
+            "has unexpected properties",
+        )
+
+
+def _nmap_ingests_list_response_v0_1__nmap_ingest_record(v: Any, p: str) -> None:
+    if not isinstance(v, dict):
+        _fail(
+            p,
+            "",
+            "is not of type ['object']",
+        )
+    if not _KEYS_NMAP_INGESTS_LIST_RESPONSE_V0_1_2 <= v.keys():
+        _fail(
+            p,
+            "",
+            "is missing a required property",
+        )
+    v1 = v.get("ingest_id", _MISSING)
+    if v1 is not _MISSING:
+        if not isinstance(v1, str):
+            _fail(
+                p,
+                ".ingest_id",
+                "is not of type ['string']",
+            )
+        if len(v1) < 8:
+            _fail(
+                p,
+                ".ingest_id",
+                "is too short",
+            )
+        if len(v1) > 128:
+            _fail(
+                p,
+                ".ingest_id",
+                "is too long",
+            )
+    v2 = v.get("created_at", _MISSING)
+    if v2 is not _MISSING:
+        if not isinstance(v2, str):
+            _fail(
+                p,
+                ".created_at",
+                "is not of type ['string']",
+            )
+    v3 = v.get("format", _MISSING)
+    if v3 is not _MISSING:
+        if not isinstance(v3, str):
+            _fail(
+                p,
+                ".format",
+                "is not of type ['string']",
+            )
+        if v3 not in _ENUM_NMAP_INGESTS_LIST_RESPONSE_V0_1_3:
+            _fail(
+                p,
+                ".format",
+                "is not one of the allowed values",
+            )
+    v4 = v.get("summary", _MISSING)
+    if v4 is not _MISSING:
+        if not isinstance(v4, dict):
+            _fail(
+                p,
+                ".summary",
+                "is not of type ['object']",
+            )
+        if not _KEYS_NMAP_INGESTS_LIST_RESPONSE_V0_1_4 <= v4.keys():
+            _fail(
+                p,
+                ".summary",
+                "is missing a required property",
+            )
+        v5 = v4.get("payload_bytes", _MISSING)
+        if v5 is not _MISSING:
+            if not _is_integer(v5):
+                _fail(
+                    p,
+                    ".summary.payload_bytes",
+                    "is not of type ['integer']",
+                )
+            if _is_number(v5):
+                if v5 < 1:
+                    _fail(
+                        p,
+                        ".summary.payload_bytes",
+                        "is less than the minimum of 1",
+                    )
+        v6 = v4.get("payload_sha256", _MISSING)
+        if v6 is not _MISSING:
+            if not isinstance(v6, str):
+                _fail(
+                    p,
+                    ".summary.payload_sha256",
+                    "is not of type ['string']",
+                )
+            if not _PATTERN_NMAP_INGESTS_LIST_RESPONSE_V0_1_5.search(v6):
+                _fail(
+                    p,
+                    ".summary.payload_sha256",
+                    "does not match the pattern",
+                )
+        v7 = v4.get("parsed", _MISSING)
+        if v7 is not _MISSING:
+            if not isinstance(v7, bool):
+                _fail(
+                    p,
+                    ".summary.parsed",
+                    "is not of type ['boolean']",
+                )
+            if v7 is not False:
+                _fail(
+                    p,
+                    ".summary.parsed",
+                    "was expected to be False",
+                )
+        if not v4.keys() <= _KEYS_NMAP_INGESTS_LIST_RESPONSE_V0_1_6:
+            _fail(
+                p,
+                ".summary",
+                "has unexpected properties",
+            )
+    v8 = v.get("next_steps", _MISSING)
+    if v8 is not _MISSING:
+        if not isinstance(v8, list):
+            _fail(
+                p,
+                ".next_steps",
+                "is not of type ['array']",
+            )
+        if len(v8) > 50:
+            _fail(
+                p,
+                ".next_steps",
+                "is too long",
+            )
+        for i9, v10 in enumerate(v8):
+            if not isinstance(v10, str):
+                _fail(
+                    p,
+                    f".next_steps[{i9}]",
+                    "is not of type ['string']",
+                )
+    v11 = v.get("parser_version", _MISSING)
+    if v11 is not _MISSING:
+        if not isinstance(v11, str):
+            _fail(
+                p,
+                ".parser_version",
+                "is not of type ['string']",
+            )
+        if len(v11) < 1:
+            _fail(
+                p,
+                ".parser_version",
+                "is too short",
+            )
+        if len(v11) > 64:
+            _fail(
+                p,
+                ".parser_version",
+                "is too long",
+            )
+    v12 = v.get("parsed", _MISSING)
+    if v12 is not _MISSING:
+        if not isinstance(v12, bool):
+            _fail(
+                p,
+                ".parsed",
+                "is not of type ['boolean']",
+            )
+    v13 = v.get("findings_count", _MISSING)
+    if v13 is not _MISSING:
+        if not _is_integer(v13):
+            _fail(
+                p,
+                ".findings_count",
+                "is not of type ['integer']",
+            )
+        if _is_number(v13):
+            if v13 < 0:
+                _fail(
+                    p,
+                    ".findings_count",
+                    "is less than the minimum of 0",
+                )
+    if not v.keys() <= _KEYS_NMAP_INGESTS_LIST_RESPONSE_V0_1_7:
+        _fail(
+            p,
+            "",
+            "has unexpected properties",
+        )
+
+
+def validate_nmap_ingests_list_response_v0_1(instance: Any, p: str = "$") -> None:
+    """Validate ``instance`` against ``nmap_ingests_list_response_v0.1``."""
+
+    v = instance
+    if not isinstance(v, dict):
+        _fail(
+            p,
+            "",
+            "is not of type ['object']",
+        )
+    if not _KEYS_NMAP_INGESTS_LIST_RESPONSE_V0_1_1 <= v.keys():
+        _fail(
+            p,
+            "",
+            "is missing a required property",
+        )
+    v1 = v.get("operation", _MISSING)
+    if v1 is not _MISSING:
+        if not isinstance(v1, str):
+            _fail(
+                p,
+                ".operation",
+                "is not of type ['string']",
+            )
+        if v1 != "nmap_ingests_list":
+            _fail(
+                p,
+                ".operation",
+                "was expected to be 'nmap_ingests_list'",
+            )
+    v2 = v.get("count", _MISSING)
+    if v2 is not _MISSING:
+        if not _is_integer(v2):
+            _fail(
+                p,
+                ".count",
+                "is not of type ['integer']",
+            )
+        if _is_number(v2):
+            if v2 < 0:
+                _fail(
+                    p,
+                    ".count",
+                    "is less than the minimum of 0",
+                )
+    v3 = v.get("max_records", _MISSING)
+    if v3 is not _MISSING:
+        if not _is_integer(v3):
+            _fail(
+                p,
+                ".max_records",
+                "is not of type ['integer']",
+            )
+        if _is_number(v3):
+            if v3 < 1:
+                _fail(
+                    p,
+                    ".max_records",
+                    "is less than the minimum of 1",
+                )
+    v4 = v.get("ingests", _MISSING)
+    if v4 is not _MISSING:
+        if not isinstance(v4, list):
+            _fail(
+                p,
+                ".ingests",
+                "is not of type ['array']",
+            )
+        for i5, v6 in enumerate(v4):
+            _nmap_ingests_list_response_v0_1__nmap_ingest_record(
+                v6, f"{p}.ingests[{i5}]"
+            )
+    if not v.keys() <= _KEYS_NMAP_INGESTS_LIST_RESPONSE_V0_1_8:
+        _fail(
+            p,
+            "",
+            "has unexpected properties",
+        )
+
+
+def _nmap_ingest_get_response_v0_1__nmap_ingest_record(v: Any, p: str) -> None:
+    if not isinstance(v, dict):
+        _fail(
+            p,
+            "",
+            "is not of type ['object']",
+        )
+    if not _KEYS_NMAP_INGEST_GET_RESPONSE_V0_1_2 <= v.keys():
+        _fail(
+            p,
+            "",
+            "is missing a required property",
+        )
+    v1 = v.get("ingest_id", _MISSING)
+    if v1 is not _MISSING:
+        if not isinstance(v1, str):
+            _fail(
+                p,
+                ".ingest_id",
+                "is not of type ['string']",
+            )
+        if len(v1) < 8:
+            _fail(
+                p,
+                ".ingest_id",
+                "is too short",
+            )
+        if len(v1) > 128:
+            _fail(
+                p,
+                ".ingest_id",
+                "is too long",
+            )
+    v2 = v.get("created_at", _MISSING)
+    if v2 is not _MISSING:
+        if not isinstance(v2, str):
+            _fail(
+                p,
+                ".created_at",
+                "is not of type ['string']",
+            )
+    v3 = v.get("format", _MISSING)
+    if v3 is not _MISSING:
+        if not isinstance(v3, str):
+            _fail(
+                p,
+                ".format",
+                "is not of type ['string']",
+            )
+        if v3 not in _ENUM_NMAP_INGEST_GET_RESPONSE_V0_1_3:
+            _fail(
+                p,
+                ".format",
+                "is not one of the allowed values",
+            )
+    v4 = v.get("summary", _MISSING)
+    if v4 is not _MISSING:
+        if not isinstance(v4, dict):
+            _fail(
+                p,
+                ".summary",
+                "is not of type ['object']",
+            )
+        if not _KEYS_NMAP_INGEST_GET_RESPONSE_V0_1_4 <= v4.keys():
+            _fail(
+                p,
+                ".summary",
+                "is missing a required property",
+            )
+        v5 = v4.get("payload_bytes", _MISSING)
+        if v5 is not _MISSING:
+            if not _is_integer(v5):
+                _fail(
+                    p,
+                    ".summary.payload_bytes",
+                    "is not of type ['integer']",
+                )
+            if _is_number(v5):
+                if v5 < 1:
+                    _fail(
+                        p,
+                        ".summary.payload_bytes",
+                        "is less than the minimum of 1",
+                    )
+        v6 = v4.get("payload_sha256", _MISSING)
+        if v6 is not _MISSING:
+            if not isinstance(v6, str):
+                _fail(
+                    p,
+                    ".summary.payload_sha256",
+                    "is not of type ['string']",
+                )
+            if not _PATTERN_NMAP_INGEST_GET_RESPONSE_V0_1_5.search(v6):
+                _fail(
+                    p,
+                    ".summary.payload_sha256",
+                    "does not match the pattern",
+                )
+        v7 = v4.get("parsed", _MISSING)
+        if v7 is not _MISSING:
+            if not isinstance(v7, bool):
+                _fail(
+                    p,
+                    ".summary.parsed",
+                    "is not of type ['boolean']",
+                )
+            if v7 is not False:
+                _fail(
+                    p,
+                    ".summary.parsed",
+                    "was expected to be False",
+                )
+        if not v4.keys() <= _KEYS_NMAP_INGEST_GET_RESPONSE_V0_1_6:
+            _fail(
+                p,
+                ".summary",
+                "has unexpected properties",
+            )
+    v8 = v.get("next_steps", _MISSING)
+    if v8 is not _MISSING:
+        if not isinstance(v8, list):
+            _fail(
+                p,
+                ".next_steps",
+                "is not of type ['array']",
+            )
+        if len(v8) > 50:
+            _fail(
+                p,
+                ".next_steps",
+                "is too long",
+            )
+        for i9, v10 in enumerate(v8):
+            if not isinstance(v10, str):
+                _fail(
+                    p,
+                    f".next_steps[{i9}]",
+                    "is not of type ['string']",
+                )
+    v11 = v.get("parser_version", _MISSING)
+    if v11 is not _MISSING:
+        if not isinstance(v11, str):
+            _fail(
+                p,
+                ".parser_version",
+                "is not of type ['string']",
+            )
+        if len(v11) < 1:
+            _fail(
+                p,
+                ".parser_version",
+                "is too short",
+            )
+        if len(v11) > 64:
+            _fail(
+                p,
+                ".parser_version",
+                "is too long",
+            )
+    v12 = v.get("parsed", _MISSING)
+    if v12 is not _MISSING:
+        if not isinstance(v12, bool):
+            _fail(
+                p,
+                ".parsed",
+                "is not of type ['boolean']",
+            )
+    v13 = v.get("findings_count", _MISSING)
+    if v13 is not _MISSING:
+        if not _is_integer(v13):
+            _fail(
+                p,
+                ".findings_count",
+                "is not of type ['integer']",
+            )
+        if _is_number(v13):
+            if v13 < 0:
+                _fail(
+                    p,
+                    ".findings_count",
+                    "is less than the minimum of 0",
+                )
+    if not v.keys() <= _KEYS_NMAP_INGEST_GET_RESPONSE_V0_1_7:
+        _fail(
+            p,
+            "",
+            "has unexpected properties",
+        )
+
+
+def validate_nmap_ingest_get_response_v0_1(instance: Any, p: str = "$") -> None:
+    """Validate ``instance`` against ``nmap_ingest_get_response_v0.1``."""
+
+    v = instance
+    if not isinstance(v, dict):
+        _fail(
+            p,
+            "",
+            "is not of type ['object']",
+        )
+    if not _KEYS_NMAP_INGEST_GET_RESPONSE_V0_1_1 <= v.keys():
+        _fail(
+            p,
+            "",
+            "is missing a required property",
+        )
+    v1 = v.get("operation", _MISSING)
+    if v1 is not _MISSING:
+        if not isinstance(v1, str):
+            _fail(
+                p,
+                ".operation",
+                "is not of type ['string']",
+            )
+        if v1 != "nmap_ingest_get":
+            _fail(
+                p,
+                ".operation",
+                "was expected to be 'nmap_ingest_get'",
+            )
+    v2 = v.get("ingest", _MISSING)
+    if v2 is not _MISSING:
+        _nmap_ingest_get_response_v0_1__nmap_ingest_record(v2, p + ".ingest")
+    if not v.keys() <= _KEYS_NMAP_INGEST_GET_RESPONSE_V0_1_8:
+        _fail(
+            p,
+            "",
+            "has unexpected properties",
+        )
+
+
+def validate_nmap_ingest_nmap_xml_input_v0_1(instance: Any, p: str = "$") -> None:
+    """Validate ``instance`` against ``nmap_ingest_nmap_xml_input_v0.1``."""
+
+    v = instance
+    if not isinstance(v, dict):
+        _fail(
+            p,
+            "",
+            "is not of type ['object']",
+        )
+    if not _KEYS_NMAP_INGEST_NMAP_XML_INPUT_V0_1_1 <= v.keys():
+        _fail(
+            p,
+            "",
+            "is missing a required property",
+        )
+    v1 = v.get("format", _MISSING)
+    if v1 is not _MISSING:
+        if not isinstance(v1, str):
+            _fail(
+                p,
+                ".format",
+                "is not of type ['string']",
+            )
+        if v1 not in _ENUM_NMAP_INGEST_NMAP_XML_INPUT_V0_1_2:
+            _fail(
+                p,
+                ".format",
+                "is not one of the allowed values",
+            )
+    v2 = v.get("payload", _MISSING)
+    if v2 is not _MISSING:
+        if not isinstance(v2, str):
+            _fail(
+                p,
+                ".payload",
+                "is not of type ['string']",
+            )
+        if len(v2) < 1:
+            _fail(
+                p,
+                ".payload",
+                "is too short",
+            )
+        if len(v2) > 32768:
+            _fail(
+                p,
+                ".payload",
+                "is too long",
+            )
+    v3 = v.get("payload_encoding", _MISSING)
+    if v3 is not _MISSING:
+        if not isinstance(v3, str):
+            _fail(
+                p,
+                ".payload_encoding",
+                "is not of type ['string']",
+            )
+        if v3 not in _ENUM_NMAP_INGEST_NMAP_XML_INPUT_V0_1_3:
+            _fail(
+                p,
+                ".payload_encoding",
+                "is not one of the allowed values",
+            )
+    v4 = v.get("meta", _MISSING)
+    if v4 is not _MISSING:
+        if not isinstance(v4, dict):
+            _fail(
+                p,
+                ".meta",
+                "is not of type ['object']",
+            )
+        v5 = v4.get("source", _MISSING)
+        if v5 is not _MISSING:
+            if not isinstance(v5, str):
+                _fail(
+                    p,
+                    ".meta.source",
+                    "is not of type ['string']",
+                )
+            if len(v5) > 64:
+                _fail(
+                    p,
+                    ".meta.source",
+                    "is too long",
+                )
+        v6 = v4.get("note", _MISSING)
+        if v6 is not _MISSING:
+            if not isinstance(v6, str):
+                _fail(
+                    p,
+                    ".meta.note",
+                    "is not of type ['string']",
+                )
+            if len(v6) > 200:
+                _fail(
+                    p,
+                    ".meta.note",
+                    "is too long",
+                )
+        if not v4.keys() <= _KEYS_NMAP_INGEST_NMAP_XML_INPUT_V0_1_4:
+            _fail(
+                p,
+                ".meta",
+                "has unexpected properties",
+            )
+    if not v.keys() <= _KEYS_NMAP_INGEST_NMAP_XML_INPUT_V0_1_5:
+        _fail(
+            p,
+            "",
+            "has unexpected properties",
+        )
+
+
+def validate_nmap_upload_begin_input_v0_1(instance: Any, p: str = "$") -> None:
+    """Validate ``instance`` against ``nmap_upload_begin_input_v0.1``."""
+
+    v = instance
+    if not isinstance(v, dict):
+        _fail(
+            p,
+            "",
+            "is not of type ['object']",
+        )
+    if not _KEYS_NMAP_UPLOAD_BEGIN_INPUT_V0_1_1 <= v.keys():
+        _fail(
+            p,
+            "",
+            "is missing a required property",
+        )
+    v1 = v.get("format", _MISSING)
+    if v1 is not _MISSING:
+        if not isinstance(v1, str):
+            _fail(
+                p,
+                ".format",
+                "is not of type ['string']",
+            )
+        if v1 not in _ENUM_NMAP_UPLOAD_BEGIN_INPUT_V0_1_2:
+            _fail(
+                p,
+                ".format",
+                "is not one of the allowed values",
+            )
+    v2 = v.get("total_bytes", _MISSING)
+    if v2 is not _MISSING:
+        if not _is_integer(v2):
+            _fail(
+                p,
+                ".total_bytes",
+                "is not of type ['integer']",
+            )
+        if _is_number(v2):
+            if v2 < 1:
+                _fail(
+                    p,
+                    ".total_bytes",
+                    "is less than the minimum of 1",
+                )
+    v3 = v.get("meta", _MISSING)
+    if v3 is not _MISSING:
+        if not isinstance(v3, dict):
+            _fail(
+                p,
+                ".meta",
+                "is not of type ['object']",
+            )
+        v4 = v3.get("source", _MISSING)
+        if v4 is not _MISSING:
+            if not isinstance(v4, str):
+                _fail(
+                    p,
+                    ".meta.source",
+                    "is not of type ['string']",
+                )
+            if len(v4) > 64:
+                _fail(
+                    p,
+                    ".meta.source",
+                    "is too long",
+                )
+        v5 = v3.get("note", _MISSING)
+        if v5 is not _MISSING:
+            if not isinstance(v5, str):
+                _fail(
+                    p,
+                    ".meta.note",
+                    "is not of type ['string']",
+                )
+            if len(v5) > 200:
+                _fail(
+                    p,
+                    ".meta.note",
+                    "is too long",
+                )
+        if not v3.keys() <= _KEYS_NMAP_UPLOAD_BEGIN_INPUT_V0_1_3:
+            _fail(
+                p,
+                ".meta",
+                "has unexpected properties",
+            )
+    if not v.keys() <= _KEYS_NMAP_UPLOAD_BEGIN_INPUT_V0_1_4:
+        _fail(
+            p,
+            "",
+            "has unexpected properties",
+        )
+
+
+def validate_nmap_upload_chunk_input_v0_1(instance: Any, p: str = "$") -> None:
+    """Validate ``instance`` against ``nmap_upload_chunk_input_v0.1``."""
+
+    v = instance
+    if not isinstance(v, dict):
+        _fail(
+            p,
+            "",
+            "is not of type ['object']",
+        )
+    if not _KEYS_NMAP_UPLOAD_CHUNK_INPUT_V0_1_1 <= v.keys():
+        _fail(
+            p,
+            "",
+            "is missing a required property",
+        )
+    v1 = v.get("upload_id", _MISSING)
+    if v1 is not _MISSING:
+        if not isinstance(v1, str):
+            _fail(
+                p,
+                ".upload_id",
+                "is not of type ['string']",
+            )
+        if not _PATTERN_NMAP_UPLOAD_CHUNK_INPUT_V0_1_2.search(v1):
+            _fail(
+                p,
+                ".upload_id",
+                "does not match the pattern",
+            )
+    v2 = v.get("chunk_index", _MISSING)
+    if v2 is not _MISSING:
+        if not _is_integer(v2):
+            _fail(
+                p,
+                ".chunk_index",
+                "is not of type ['integer']",
+            )
+        if _is_number(v2):
+            if v2 < 0:
+                _fail(
+                    p,
+                    ".chunk_index",
+                    "is less than the minimum of 0",
+                )
+    v3 = v.get("data", _MISSING)
+    if v3 is not _MISSING:
+        if not isinstance(v3, str):
+            _fail(
+                p,
+                ".data",
+                "is not of type ['string']",
+            )
+        if len(v3) < 1:
+            _fail(
+                p,
+                ".data",
+                "is too short",
+            )
+        if len(v3) > 32768:
+            _fail(
+                p,
+                ".data",
+                "is too long",
+            )
+    if not v.keys() <= _KEYS_NMAP_UPLOAD_CHUNK_INPUT_V0_1_3:
+        _fail(
+            p,
+            "",
+            "has unexpected properties",
+        )
+
+
+def validate_nmap_upload_commit_input_v0_1(instance: Any, p: str = "$") -> None:
+    """Validate ``instance`` against ``nmap_upload_commit_input_v0.1``."""
+
+    v = instance
+    if not isinstance(v, dict):
+        _fail(
+            p,
+            "",
+            "is not of type ['object']",
+        )
+    if not _KEYS_NMAP_UPLOAD_COMMIT_INPUT_V0_1_1 <= v.keys():
+        _fail(
+            p,
+            "",
+            "is missing a required property",
+        )
+    v1 = v.get("upload_id", _MISSING)
+    if v1 is not _MISSING:
+        if not isinstance(v1, str):
+            _fail(
+                p,
+                ".upload_id",
+                "is not of type ['string']",
+            )
+        if not _PATTERN_NMAP_UPLOAD_COMMIT_INPUT_V0_1_2.search(v1):
+            _fail(
+                p,
+                ".upload_id",
+                "does not match the pattern",
+            )
+    v2 = v.get("payload_sha256", _MISSING)
+    if v2 is not _MISSING:
+        if not isinstance(v2, str):
+            _fail(
+                p,
+                ".payload_sha256",
+                "is not of type ['string']",
+            )
+        if not _PATTERN_NMAP_UPLOAD_COMMIT_INPUT_V0_1_3.search(v2):
+            _fail(
+                p,
+                ".payload_sha256",
+                "does not match the pattern",
+            )
+    if not v.keys() <= _KEYS_NMAP_UPLOAD_COMMIT_INPUT_V0_1_4:
+        _fail(
+            p,
+            "",
+            "has unexpected properties",
+        )
+
+
+def validate_nmap_upload_status_input_v0_1(instance: Any, p: str = "$") -> None:
+    """Validate ``instance`` against ``nmap_upload_status_input_v0.1``."""
+
+    v = instance
+    if not isinstance(v, dict):
+        _fail(
+            p,
+            "",
+            "is not of type ['object']",
+        )
+    if not _KEYS_NMAP_UPLOAD_STATUS_INPUT_V0_1_1 <= v.keys():
+        _fail(
+            p,
+            "",
+            "is missing a required property",
+        )
+    v1 = v.get("upload_id", _MISSING)
+    if v1 is not _MISSING:
+        if not isinstance(v1, str):
+            _fail(
+                p,
+                ".upload_id",
+                "is not of type ['string']",
+            )
+        if not _PATTERN_NMAP_UPLOAD_STATUS_INPUT_V0_1_2.search(v1):
+            _fail(
+                p,
+                ".upload_id",
+                "does not match the pattern",
+            )
+    if not v.keys() <= _KEYS_NMAP_UPLOAD_STATUS_INPUT_V0_1_3:
+        _fail(
+            p,
+            "",
+            "has unexpected properties",
+        )
+
+
+def validate_nmap_upload_status_response_v0_1(instance: Any, p: str = "$") -> None:
+    """Validate ``instance`` against ``nmap_upload_status_response_v0.1``."""
+
+    v = instance
+    if not isinstance(v, dict):
+        _fail(
+            p,
+            "",
+            "is not of type ['object']",
+        )
+    if not _KEYS_NMAP_UPLOAD_STATUS_RESPONSE_V0_1_1 <= v.keys():
+        _fail(
+            p,
+            "",
+            "is missing a required property",
+        )
+    v1 = v.get("operation", _MISSING)
+    if v1 is not _MISSING:
+        if not isinstance(v1, str):
+            _fail(
+                p,
+                ".operation",
+                "is not of type ['string']",
+            )
+        if v1 != "nmap_upload":
+            _fail(
+                p,
+                ".operation",
+                "was expected to be 'nmap_upload'",
+            )
+    v2 = v.get("upload_id", _MISSING)
+    if v2 is not _MISSING:
+        if not isinstance(v2, str):
+            _fail(
+                p,
+                ".upload_id",
+                "is not of type ['string']",
+            )
+        if not _PATTERN_NMAP_UPLOAD_STATUS_RESPONSE_V0_1_2.search(v2):
+            _fail(
+                p,
+                ".upload_id",
+                "does not match the pattern",
+            )
+    v3 = v.get("next_chunk_index", _MISSING)
+    if v3 is not _MISSING:
+        if not _is_integer(v3):
+            _fail(
+                p,
+                ".next_chunk_index",
+                "is not of type ['integer']",
+            )
+        if _is_number(v3):
+            if v3 < 0:
+                _fail(
+                    p,
+                    ".next_chunk_index",
+                    "is less than the minimum of 0",
+                )
+    v4 = v.get("received_bytes", _MISSING)
+    if v4 is not _MISSING:
+        if not _is_integer(v4):
+            _fail(
+                p,
+                ".received_bytes",
+                "is not of type ['integer']",
+            )
+        if _is_number(v4):
+            if v4 < 0:
+                _fail(
+                    p,
+                    ".received_bytes",
+                    "is less than the minimum of 0",
+                )
+    v5 = v.get("max_bytes", _MISSING)
+    if v5 is not _MISSING:
+        if not _is_integer(v5):
+            _fail(
+                p,
+                ".max_bytes",
+                "is not of type ['integer']",
+            )
+        if _is_number(v5):
+            if v5 < 1:
+                _fail(
+                    p,
+                    ".max_bytes",
+                    "is less than the minimum of 1",
+                )
+    if not v.keys() <= _KEYS_NMAP_UPLOAD_STATUS_RESPONSE_V0_1_3:
+        _fail(
+            p,
+            "",
+            "has unexpected properties",
+        )
+
+
+VALIDATORS: dict[str, Callable[[Any], None]] = {
+    "nmap_ingest_input_v0.1": validate_nmap_ingest_input_v0_1,
+    "nmap_ingest_public_response_v0.1": validate_nmap_ingest_public_response_v0_1,
+    "nmap_ingest_public_response_v0.2": validate_nmap_ingest_public_response_v0_2,
+    "nmap_parsed_findings_v0.1": validate_nmap_parsed_findings_v0_1,
+    "nmap_ingest_input_v0.2": validate_nmap_ingest_input_v0_2,
+    "nmap_ingest_input_v0.3": validate_nmap_ingest_input_v0_3,
+    "nmap_ingests_list_response_v0.1": validate_nmap_ingests_list_response_v0_1,
+    "nmap_ingest_get_response_v0.1": validate_nmap_ingest_get_response_v0_1,
+    "nmap_ingest_nmap_xml_input_v0.1": validate_nmap_ingest_nmap_xml_input_v0_1,
+    "nmap_upload_begin_input_v0.1": validate_nmap_upload_begin_input_v0_1,
+    "nmap_upload_chunk_input_v0.1": validate_nmap_upload_chunk_input_v0_1,
+    "nmap_upload_commit_input_v0.1": validate_nmap_upload_commit_input_v0_1,
+    "nmap_upload_status_input_v0.1": validate_nmap_upload_status_input_v0_1,
+    "nmap_upload_status_response_v0.1": validate_nmap_upload_status_response_v0_1,
+}
+"""Generated validator per ``schema_registry.SCHEMA_FILES`` name."""
+
+
+SCHEMA_DIGESTS = {
+    "nmap_ingest_input_v0.1": (
+        "91ba70b464503f6c040c31d4aed3e67bfe3a2d9220991fc27eb7704942c3281a"
+    ),
+    "nmap_ingest_public_response_v0.1": (
+        "e8d55b12a8b5735165cb5c3d7b426d6f7a1e9321e2f9f9790dce2a64e6595433"
+    ),
+    "nmap_ingest_public_response_v0.2": (
+        "27237ecf68cbfef28311612612053918c394879b71d17af731394005e6cf12b5"
+    ),
+    "nmap_parsed_findings_v0.1": (
+        "6e61cdf2034149e270db8115a33ee08333728560226a377f00612aca35b346e6"
+    ),
+    "nmap_ingest_input_v0.2": (
+        "88d1dadac9424dd924798b26f81781acec64c38e15b56b3d9492af40ddfa6330"
+    ),
+    "nmap_ingest_input_v0.3": (
+        "de48d67284d2a1d93d9e32871484f0456ea0e0129c688e365b167792eac6a3a6"
+    ),
+    "nmap_ingests_list_response_v0.1": (
+        "1282e25ddd5a1ee8e2dd888f2e5a8b202a86aa62869d15fc8cc0221f52b1419f"
+    ),
+    "nmap_ingest_get_response_v0.1": (
+        "cfeeaebbef26d4e9571418c79739efa1a0fa190354dd5cbe0dabd566ef43ccb9"
+    ),
+    "nmap_ingest_nmap_xml_input_v0.1": (
+        "9c61b4e8b6ba89a4c07b049aad76faab960b8cafebaa5cdc555f1d13938c23f0"
+    ),
+    "nmap_upload_begin_input_v0.1": (
+        "9db3d87b096f936d0df8c29682d8903fb1e82ec378fbb8ebea0e41d6ed5caecd"
+    ),
+    "nmap_upload_chunk_input_v0.1": (
+        "ddee174def661d1508b78e060a5a02f7daf78530e766c23f6f09d3bc6c02efc4"
+    ),
+    "nmap_upload_commit_input_v0.1": (
+        "af92ba041ec6ce016c042d09434d3b1e4620deb7a2819f70c9b9a42bf797b54c"
+    ),
+    "nmap_upload_status_input_v0.1": (
+        "4ce829ab6cb1f0228b79cfefe5b2cbc40bed236b509a0d5ae57ab045f3bebc3c"
+    ),
+    "nmap_upload_status_response_v0.1": (
+        "a4ecf5b1cb72a4bf5650223582c0943f9701e5c2dc83c3e90d99a10b1620026c"
+    ),
+}
+"""Digest of each schema at generation time, used to detect staleness."""
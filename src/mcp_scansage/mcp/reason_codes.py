@@ -8,8 +8,23 @@ PAYLOAD_TOO_LARGE = "payload_too_large"
 INVALID_INPUT = "invalid_input"
 """Input failed schema validation or format checks."""
 
+FORMAT_MISMATCH = "format_mismatch"
+"""The payload does not look like its requested format (or ``auto`` failed)."""
+
 RESPONSE_VALIDATION_FAILED = "response_validation_failed"
 """The service produced output that violated the public response schema."""
 
+PARSE_CAPACITY_EXHAUSTED = "parse_capacity_exhausted"
+"""Every parse memory slot stayed busy for the deferral window; retry later."""
+
+PARSE_DEADLINE_EXCEEDED = "parse_deadline_exceeded"
+"""Parsing was stopped because it ran past the request's deadline."""
+
 RECORD_NOT_FOUND = "record_not_found"
 """The requested PUBLIC ingestion record could not be located."""
+
+UPLOAD_NOT_FOUND = "upload_not_found"
+"""The chunked upload is unknown, expired, failed or already committed."""
+
+UPLOAD_CHUNK_OUT_OF_ORDER = "upload_chunk_out_of_order"
+"""A chunk did not continue the upload; resume from ``next_chunk_index``."""
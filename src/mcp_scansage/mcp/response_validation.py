@@ -0,0 +1,191 @@
+"""Configurable runtime validation of PUBLIC ingest responses.
+
+Input validation is always on; this module only governs the response-side
+contract check, which re-validates output our own code built. ``strict``
+checks every response, ``sampled`` checks one in N, and ``off`` relies on the
+contract tests alone. Any detected violation is counted, reported through the
+audit log, and turned into a sanitized error by the caller.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from typing import Any
+
+from ..services.audit_log import append_audit_event, next_audit_stamp
+from . import schema_registry
+from .schema_registry import SchemaValidationError
+
+_LOG = logging.getLogger(__name__)
+
+RESPONSE_VALIDATION_ENV = "SCANSAGE_RESPONSE_VALIDATION"
+"""Env var selecting the response validation mode."""
+
+RESPONSE_SAMPLE_EVERY_ENV = "SCANSAGE_RESPONSE_VALIDATION_SAMPLE_EVERY"
+"""Env var giving N for ``sampled`` mode (one response in N is validated)."""
+
+STRICT_MODE = "strict"
+"""Validate every response (default)."""
+
+SAMPLED_MODE = "sampled"
+"""Validate one response in N, counting and auditing violations."""
+
+OFF_MODE = "off"
+"""Skip response validation; the contract tests are the only guard."""
+
+VALIDATION_MODES = (STRICT_MODE, SAMPLED_MODE, OFF_MODE)
+
+DEFAULT_SAMPLE_EVERY = 100
+"""Default sampling interval for ``sampled`` mode."""
+
+VIOLATION_EVENT = "PUBLIC_RESPONSE_CONTRACT_VIOLATION"
+"""Audit event name recorded when a validated response breaks its schema."""
+
+
+@dataclass(frozen=True)
+class ResponseValidationConfig:
+    """Response validation mode plus the sampling interval."""
+
+    mode: str = STRICT_MODE
+    sample_every: int = DEFAULT_SAMPLE_EVERY
+
+    @classmethod
+    def from_env(cls) -> "ResponseValidationConfig":
+        """Read the mode and interval; unknown or invalid values stay strict."""
+
+        mode = os.getenv(RESPONSE_VALIDATION_ENV, STRICT_MODE).strip().lower()
+        if mode not in VALIDATION_MODES:
+            mode = STRICT_MODE
+        return cls(mode=mode, sample_every=_parse_sample_every())
+
+
+_SNAPSHOT: ResponseValidationConfig | None = None
+_SNAPSHOT_LOCK = threading.Lock()
+
+
+def get_validation_config() -> ResponseValidationConfig:
+    """Return the process-wide config snapshot, reading the env on first use.
+
+    The environment is not consulted again until
+    :func:`reload_validation_config`.
+    """
+
+    global _SNAPSHOT
+    snapshot = _SNAPSHOT
+    if snapshot is None:
+        with _SNAPSHOT_LOCK:
+            if _SNAPSHOT is None:
+                _SNAPSHOT = ResponseValidationConfig.from_env()
+            snapshot = _SNAPSHOT
+    return snapshot
+
+
+def reload_validation_config() -> ResponseValidationConfig:
+    """Re-read the response validation env vars and swap in a new snapshot."""
+
+    global _SNAPSHOT
+    config = ResponseValidationConfig.from_env()
+    with _SNAPSHOT_LOCK:
+        _SNAPSHOT = config
+    return config
+
+
+def _parse_sample_every() -> int:
+    raw = os.getenv(RESPONSE_SAMPLE_EVERY_ENV)
+    if raw is None:
+        return DEFAULT_SAMPLE_EVERY
+    try:
+        value = int(raw.strip())
+    except ValueError:
+        return DEFAULT_SAMPLE_EVERY
+    return max(value, 1)
+
+
+@dataclass(frozen=True)
+class ResponseValidationStats:
+    """Point-in-time counters for a :class:`ResponseValidator`."""
+
+    validated: int
+    skipped: int
+    violations: int
+
+
+class ResponseValidator:
+    """Apply the configured response validation mode and keep counters."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._seen = 0
+        self._validated = 0
+        self._skipped = 0
+        self._violations = 0
+
+    def check(
+        self,
+        schema_name: str,
+        response: Any,
+        config: ResponseValidationConfig | None = None,
+    ) -> bool:
+        """Return False only when ``response`` was validated and failed."""
+
+        config = config or get_validation_config()
+        if not self._should_validate(config):
+            return True
+        try:
+            schema_registry.validate(schema_name, response)
+        except SchemaValidationError:
+            with self._lock:
+                self._violations += 1
+            _record_violation(schema_name, config)
+            return False
+        return True
+
+    def stats(self) -> ResponseValidationStats:
+        with self._lock:
+            return ResponseValidationStats(
+                validated=self._validated,
+                skipped=self._skipped,
+                violations=self._violations,
+            )
+
+    def reset(self) -> None:
+        """Zero the counters and restart the sampling sequence."""
+
+        with self._lock:
+            self._seen = self._validated = self._skipped = self._violations = 0
+
+    def _should_validate(self, config: ResponseValidationConfig) -> bool:
+        with self._lock:
+            self._seen += 1
+            selected = config.mode == STRICT_MODE or (
+                config.mode == SAMPLED_MODE
+                and (self._seen - 1) % config.sample_every == 0
+            )
+            if selected:
+                self._validated += 1
+            else:
+                self._skipped += 1
+            return selected
+
+
+def _record_violation(schema_name: str, config: ResponseValidationConfig) -> None:
+    """Audit a violation without echoing any response content."""
+
+    entry = {
+        "event": VIOLATION_EVENT,
+        **next_audit_stamp(),
+        "schema": schema_name,
+        "mode": config.mode,
+        "sample_every": config.sample_every,
+    }
+    try:
+        append_audit_event(entry)
+    except Exception as exc:  # pragma: no cover - defensive
+        _LOG.warning("Unable to record response violation event: %s", exc)
+
+
+RESPONSE_VALIDATOR = ResponseValidator()
+"""Process-wide validator used by the PUBLIC ingest resource."""
@@ -2,12 +2,23 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import logging
+import os
+import threading
 from pathlib import Path
-from typing import Any, Mapping
+from typing import Any, Callable, Mapping
 
 from jsonschema import Draft7Validator, ValidationError
 
+try:
+    from . import generated_validators
+except ImportError:  # pragma: no cover - regenerating from a clean tree
+    generated_validators = None  # type: ignore[assignment]
+
+_LOG = logging.getLogger(__name__)
+
 PROJECT_ROOT = Path(__file__).resolve().parents[3]
 SCHEMA_DIR = PROJECT_ROOT / "schemas"
 EXAMPLE_DIR = SCHEMA_DIR / "examples"
@@ -17,15 +28,30 @@ SchemaValidationError = ValidationError
 Keeps callers unaware of the implementation.
 """
 
+SCHEMA_VALIDATOR_ENV = "SCANSAGE_SCHEMA_VALIDATOR"
+"""Env var selecting the validation backend: ``generated`` or ``jsonschema``."""
+
+GENERATED_BACKEND = "generated"
+"""Default backend: code generated by ``tools/generate_schema_validators.py``."""
+
+JSONSCHEMA_BACKEND = "jsonschema"
+"""Generic :class:`Draft7Validator` backend (always used for stale schemas)."""
+
 SCHEMA_FILES = {
     "nmap_ingest_input_v0.1": "nmap_ingest_input_schema_v0.1.json",
     "nmap_ingest_public_response_v0.1": "nmap_ingest_public_response_schema_v0.1.json",
     "nmap_ingest_public_response_v0.2": "nmap_ingest_public_response_schema_v0.2.json",
     "nmap_parsed_findings_v0.1": "nmap_parsed_findings_schema_v0.1.json",
     "nmap_ingest_input_v0.2": "nmap_ingest_input_schema_v0.2.json",
+    "nmap_ingest_input_v0.3": "nmap_ingest_input_schema_v0.3.json",
     "nmap_ingests_list_response_v0.1": "nmap_ingests_list_response_schema_v0.1.json",
     "nmap_ingest_get_response_v0.1": "nmap_ingest_get_response_schema_v0.1.json",
     "nmap_ingest_nmap_xml_input_v0.1": "nmap_ingest_nmap_xml_input_schema_v0.1.json",
+    "nmap_upload_begin_input_v0.1": "nmap_upload_begin_input_schema_v0.1.json",
+    "nmap_upload_chunk_input_v0.1": "nmap_upload_chunk_input_schema_v0.1.json",
+    "nmap_upload_commit_input_v0.1": "nmap_upload_commit_input_schema_v0.1.json",
+    "nmap_upload_status_input_v0.1": "nmap_upload_status_input_schema_v0.1.json",
+    "nmap_upload_status_response_v0.1": "nmap_upload_status_response_schema_v0.1.json",
 }
 
 EXAMPLE_FILES = {
@@ -44,13 +70,27 @@ EXAMPLE_FILES = {
     ),
     "nmap_parsed_findings_example_min": "nmap_parsed_findings_example_min.json",
     "nmap_ingest_input_example_v0.2": "nmap_ingest_input_example_v0.2.json",
+    "nmap_ingest_input_example_v0.3": "nmap_ingest_input_example_v0.3.json",
     "nmap_ingest_nmap_xml_input_example_min": (
         "nmap_ingest_nmap_xml_input_example_min.json"
     ),
+    "nmap_upload_begin_input_example_min": "nmap_upload_begin_input_example_min.json",
+    "nmap_upload_chunk_input_example_min": "nmap_upload_chunk_input_example_min.json",
+    "nmap_upload_commit_input_example_min": (
+        "nmap_upload_commit_input_example_min.json"
+    ),
+    "nmap_upload_status_input_example_min": "nmap_upload_status_input_example_min.json",
+    "nmap_upload_status_response_example_min": (
+        "nmap_upload_status_response_example_min.json"
+    ),
 }
 
 _SCHEMAS: dict[str, Mapping[str, Any]] = {}
 _EXAMPLES: dict[str, Mapping[str, Any]] = {}
+_VALIDATORS: dict[str, Draft7Validator] = {}
+_GENERATED: dict[str, Callable[[Any], None] | None] = {}
+_BACKEND: str | None = None
+_BACKEND_LOCK = threading.Lock()
 
 
 def _load_json_file(path: Path) -> Mapping[str, Any]:
@@ -76,6 +116,13 @@ def get_schema(name: str) -> Mapping[str, Any]:
     return _SCHEMAS[name]
 
 
+def schema_digest(name: str) -> str:
+    """Return a SHA-256 of the schema's canonical JSON form."""
+
+    canonical = json.dumps(get_schema(name), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
 def get_example(name: str) -> Mapping[str, Any]:
     """Return a representative example payload by name."""
 
@@ -84,8 +131,94 @@ def get_example(name: str) -> Mapping[str, Any]:
     return _EXAMPLES[name]
 
 
-def validate(name: str, instance: Any) -> None:
-    """Validate an instance against a named schema."""
+def get_validator(name: str) -> Draft7Validator:
+    """Return the cached compiled validator for a named schema."""
+
+    validator = _VALIDATORS.get(name)
+    if validator is None:
+        validator = Draft7Validator(get_schema(name))
+        _VALIDATORS[name] = validator
+    return validator
+
+
+def get_generated_validator(name: str) -> Callable[[Any], None] | None:
+    """Return the generated validator for a schema, or None when unusable.
+
+    A generated function is only used while its recorded digest matches the
+    schema on disk, so editing a schema without regenerating falls back to
+    :class:`Draft7Validator` instead of enforcing the old contract.
+    """
+
+    if name not in _GENERATED:
+        function = None
+        if generated_validators is not None:
+            function = generated_validators.VALIDATORS.get(name)
+            recorded = generated_validators.SCHEMA_DIGESTS.get(name)
+            if function is not None and recorded != schema_digest(name):
+                _LOG.warning("Generated validator for %s is stale; ignoring it.", name)
+                function = None
+        _GENERATED[name] = function
+    return _GENERATED[name]
 
-    schema = get_schema(name)
-    Draft7Validator(schema).validate(instance)
+
+def _backend_from_env() -> str:
+    backend = os.getenv(SCHEMA_VALIDATOR_ENV, GENERATED_BACKEND).strip().lower()
+    return JSONSCHEMA_BACKEND if backend == JSONSCHEMA_BACKEND else GENERATED_BACKEND
+
+
+def get_validator_backend() -> str:
+    """Return the backend snapshot, reading :data:`SCHEMA_VALIDATOR_ENV` once.
+
+    The environment is not consulted again until
+    :func:`reload_validator_backend`.
+    """
+
+    global _BACKEND
+    backend = _BACKEND
+    if backend is None:
+        with _BACKEND_LOCK:
+            if _BACKEND is None:
+                _BACKEND = _backend_from_env()
+            backend = _BACKEND
+    return backend
+
+
+def reload_validator_backend() -> str:
+    """Re-read :data:`SCHEMA_VALIDATOR_ENV` and swap in a new snapshot."""
+
+    global _BACKEND
+    backend = _backend_from_env()
+    with _BACKEND_LOCK:
+        _BACKEND = backend
+    return backend
+
+
+def precompile_validators() -> int:
+    """Load and compile every schema in :data:`SCHEMA_FILES` ahead of traffic.
+
+    Also snapshots the validation backend. Returns the number of cached
+    validators.
+    """
+
+    reload_validator_backend()
+    for name in SCHEMA_FILES:
+        get_validator(name)
+        get_generated_validator(name)
+    return len(_VALIDATORS)
+
+
+def validate(name: str, instance: Any) -> None:
+    """Validate an instance against a named schema.
+
+    Uses the generated validator unless the backend snapshot
+    (:func:`get_validator_backend`) is ``jsonschema``; both raise
+    :data:`SchemaValidationError` on failure.
+    """
+
+    generated = None
+    if get_validator_backend() == GENERATED_BACKEND:
+        generated = get_generated_validator(name)
+    if generated is None:
+        get_validator(name).validate(instance)
+    else:
+        generated(instance)
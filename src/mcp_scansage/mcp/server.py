@@ -2,33 +2,75 @@
 
 from __future__ import annotations
 
+import logging
+import signal
 import sys
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import asdict
 from typing import Any, Mapping
 
 from ..services import nmap_ingest_store
-from ..services.nmap_ingest import (
+from ..services.cap_audit_sinks import configure_cap_audit_sinks_from_env
+from ..services.chunked_upload import (
+    UPLOAD_MANAGER,
+    UploadChunkOrderError,
+    UploadNotFoundError,
+    UploadStatus,
+)
+from ..services.nmap_ingest import PayloadTooLargeError, ingest_nmap_public
+from ..services.nmap_limits import get_limit_config, reload_limit_config
+from ..services.nmap_parser import ParserTimeoutError, SyntheticNmapParser
+from ..services.parse_memory import ParseCapacityError
+from ..services.sanitizer import sanitize_public_payload, sanitize_public_response
+from ..services.scan_formats import (
+    AUTO_FORMAT,
+    MASSCAN_JSON_FORMAT,
+    MASSCAN_LIST_FORMAT,
+    NMAP_GREPABLE_FORMAT,
     NMAP_XML_FORMAT,
-    PayloadTooLargeError,
-    ingest_nmap_public,
+    SYNTHETIC_FORMAT,
+    FormatMismatchError,
 )
-from ..services.nmap_parser import SyntheticNmapParser
-from ..services.sanitizer import sanitize_public_response
 from . import reason_codes, schema_registry
+from .response_validation import RESPONSE_VALIDATOR, reload_validation_config
 from .schema_registry import SchemaValidationError
 
 INPUT_SCHEMA = "nmap_ingest_input_v0.1"
-SYNTHETIC_FORMAT = "synthetic_v1"
 NMAP_XML_ALIAS_INPUT_SCHEMA = "nmap_ingest_nmap_xml_input_v0.1"
 PUBLIC_RESPONSE_SCHEMA = "nmap_ingest_public_response_v0.2"
 LIST_RESPONSE_SCHEMA = "nmap_ingests_list_response_v0.1"
 GET_RESPONSE_SCHEMA = "nmap_ingest_get_response_v0.1"
+UPLOAD_STATUS_RESPONSE_SCHEMA = "nmap_upload_status_response_v0.1"
 
 FORMAT_SCHEMAS = {
     NMAP_XML_FORMAT: "nmap_ingest_input_v0.1",
     SYNTHETIC_FORMAT: "nmap_ingest_input_v0.2",
+    NMAP_GREPABLE_FORMAT: "nmap_ingest_input_v0.3",
+    MASSCAN_JSON_FORMAT: "nmap_ingest_input_v0.3",
+    MASSCAN_LIST_FORMAT: "nmap_ingest_input_v0.3",
+    AUTO_FORMAT: "nmap_ingest_input_v0.3",
 }
 
 
+_STREAMED_PAYLOAD_PLACEHOLDER = "<streamed/>"
+"""Stand-in for lab-profile payloads while the request schema is checked."""
+
+
+def _validate_request(schema_name: str, request: Mapping[str, Any]) -> None:
+    """Validate ``request``, leaving lab-profile payload size to the stream.
+
+    The input schemas cap ``payload`` at the default profile's size. Under the
+    lab profile the size is enforced while the payload streams into the
+    parser, so a non-empty string payload is swapped for a placeholder here.
+    """
+
+    payload = request.get("payload")
+    if get_limit_config().lab_profile and isinstance(payload, str) and payload:
+        request = {**request, "payload": _STREAMED_PAYLOAD_PLACEHOLDER}
+    schema_registry.validate(schema_name, request)
+
+
 def _sanitized_error(reason: str, detail: str) -> dict[str, str]:
     """Return a sanitized error payload with a stable reason code."""
 
@@ -36,6 +78,50 @@ def _sanitized_error(reason: str, detail: str) -> dict[str, str]:
     return sanitize_public_response(payload)
 
 
+def _ingest_error(exc: ValueError | ParseCapacityError) -> dict[str, str]:
+    """Map an ingest or upload failure to its sanitized PUBLIC error."""
+
+    if isinstance(exc, PayloadTooLargeError):
+        return _sanitized_error(
+            reason_codes.PAYLOAD_TOO_LARGE, "Payload exceeds the allowed size."
+        )
+    if isinstance(exc, ParserTimeoutError):
+        return _sanitized_error(
+            reason_codes.PARSE_DEADLINE_EXCEEDED,
+            "Parsing did not finish within the allowed time.",
+        )
+    if isinstance(exc, FormatMismatchError):
+        return _sanitized_error(
+            reason_codes.FORMAT_MISMATCH,
+            "Payload does not match the requested format.",
+        )
+    if isinstance(exc, ParseCapacityError):
+        return _sanitized_error(
+            reason_codes.PARSE_CAPACITY_EXHAUSTED,
+            "Parser capacity is exhausted; retry later.",
+        )
+    if isinstance(exc, UploadChunkOrderError):
+        return _sanitized_error(
+            reason_codes.UPLOAD_CHUNK_OUT_OF_ORDER,
+            f"Resume the upload from chunk {exc.next_chunk_index}.",
+        )
+    return _sanitized_error(
+        reason_codes.INVALID_INPUT, "Unable to process the ingestion payload."
+    )
+
+
+def _checked_ingest_response(response: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Scrub an ingest response and apply the response contract check."""
+
+    response = sanitize_public_payload(response)
+    if not RESPONSE_VALIDATOR.check(PUBLIC_RESPONSE_SCHEMA, response):
+        return _sanitized_error(
+            reason_codes.RESPONSE_VALIDATION_FAILED,
+            "Service output did not meet the public contract.",
+        )
+    return response
+
+
 class HealthResource:
     """Simple wellbeing resource returning sanitized payloads."""
 
@@ -57,9 +143,16 @@ class HealthResource:
 
 
 class NmapIngestResource:
-    """PUBLIC entrypoint that validates Nmap ingestion payloads."""
+    """PUBLIC entrypoint that validates Nmap ingestion payloads.
 
-    __slots__ = ()
+    ``limit_overrides`` lets a deployment register a resource with larger
+    caps for a specific tenant; clients can never supply limits themselves.
+    """
+
+    __slots__ = ("_limit_overrides",)
+
+    def __init__(self, limit_overrides: Mapping[str, int] | None = None) -> None:
+        self._limit_overrides = dict(limit_overrides) if limit_overrides else None
 
     def __call__(self, request: Mapping[str, Any]) -> Mapping[str, Any]:
         return self.ingest(request)
@@ -82,7 +175,7 @@ class NmapIngestResource:
             )
 
         try:
-            schema_registry.validate(schema_name, request)
+            _validate_request(schema_name, request)
         except SchemaValidationError:
             return _sanitized_error(
                 reason_codes.INVALID_INPUT, "Request failed validation."
@@ -101,27 +194,18 @@ class NmapIngestResource:
             parser = SyntheticNmapParser()
 
         try:
-            response = ingest_nmap_public(report_format, payload, meta, parser=parser)
-        except PayloadTooLargeError:
-            return _sanitized_error(
-                reason_codes.PAYLOAD_TOO_LARGE,
-                "Payload exceeds the allowed size.",
-            )
-        except ValueError:
-            return _sanitized_error(
-                reason_codes.INVALID_INPUT,
-                "Unable to process the ingestion payload.",
-            )
-
-        try:
-            schema_registry.validate(PUBLIC_RESPONSE_SCHEMA, response)
-        except SchemaValidationError:
-            return _sanitized_error(
-                reason_codes.RESPONSE_VALIDATION_FAILED,
-                "Service output did not meet the public contract.",
+            response = ingest_nmap_public(
+                report_format,
+                payload,
+                meta,
+                parser=parser,
+                limit_overrides=self._limit_overrides,
+                payload_encoding=request.get("payload_encoding"),
             )
+        except (ValueError, ParseCapacityError) as exc:
+            return _ingest_error(exc)
 
-        return response
+        return _checked_ingest_response(response)
 
 
 class IngestNmapXmlResource:
@@ -145,7 +229,7 @@ class IngestNmapXmlResource:
 
     def ingest(self, request: Mapping[str, Any]) -> Mapping[str, Any]:
         try:
-            schema_registry.validate(NMAP_XML_ALIAS_INPUT_SCHEMA, request)
+            _validate_request(NMAP_XML_ALIAS_INPUT_SCHEMA, request)
         except SchemaValidationError:
             return _sanitized_error(
                 reason_codes.INVALID_INPUT, "Request failed validation."
@@ -156,9 +240,119 @@ class IngestNmapXmlResource:
             "payload": request.get("payload"),
             "meta": request.get("meta") or {},
         }
+        payload_encoding = request.get("payload_encoding")
+        if payload_encoding is not None:
+            mapped_request["payload_encoding"] = payload_encoding
         return NmapIngestResource().ingest(mapped_request)
 
 
+class _NmapUploadResource(ABC):
+    """Shared plumbing for the chunked upload resources."""
+
+    __slots__ = ()
+
+    INPUT_SCHEMA = ""
+    DETAIL = ""
+
+    def __call__(self, request: Mapping[str, Any]) -> Mapping[str, Any]:
+        try:
+            schema_registry.validate(self.INPUT_SCHEMA, request)
+        except SchemaValidationError:
+            return _sanitized_error(
+                reason_codes.INVALID_INPUT, "Request failed validation."
+            )
+        try:
+            return self.handle(request)
+        except UploadNotFoundError:
+            return _sanitized_error(
+                reason_codes.UPLOAD_NOT_FOUND, "The upload is not open."
+            )
+        except (ValueError, ParseCapacityError) as exc:
+            return _ingest_error(exc)
+
+    def get_status(self) -> Mapping[str, str]:
+        return sanitize_public_response({"status": "ok", "detail": self.DETAIL})
+
+    @abstractmethod
+    def handle(self, request: Mapping[str, Any]) -> Mapping[str, Any]:
+        """Serve a request that passed ``INPUT_SCHEMA`` validation."""
+
+    @staticmethod
+    def _status_response(status: UploadStatus) -> Mapping[str, Any]:
+        response = {"operation": "nmap_upload", **asdict(status)}
+        try:
+            schema_registry.validate(UPLOAD_STATUS_RESPONSE_SCHEMA, response)
+        except SchemaValidationError:
+            return _sanitized_error(
+                reason_codes.RESPONSE_VALIDATION_FAILED,
+                "Upload status violated the public contract.",
+            )
+        return response
+
+
+class NmapUploadBeginResource(_NmapUploadResource):
+    """Open a chunked Nmap XML upload.
+
+    ``limit_overrides`` works as for :class:`NmapIngestResource`.
+    """
+
+    __slots__ = ("_limit_overrides",)
+
+    INPUT_SCHEMA = "nmap_upload_begin_input_v0.1"
+    DETAIL = "chunked upload begin resource ready"
+
+    def __init__(self, limit_overrides: Mapping[str, int] | None = None) -> None:
+        self._limit_overrides = dict(limit_overrides) if limit_overrides else None
+
+    def handle(self, request: Mapping[str, Any]) -> Mapping[str, Any]:
+        status = UPLOAD_MANAGER.begin(
+            request["format"], self._limit_overrides, request.get("total_bytes")
+        )
+        return self._status_response(status)
+
+
+class NmapUploadChunkResource(_NmapUploadResource):
+    """Append the next chunk of an open upload."""
+
+    __slots__ = ()
+
+    INPUT_SCHEMA = "nmap_upload_chunk_input_v0.1"
+    DETAIL = "chunked upload append resource ready"
+
+    def handle(self, request: Mapping[str, Any]) -> Mapping[str, Any]:
+        status = UPLOAD_MANAGER.append(
+            request["upload_id"], request["chunk_index"], request["data"]
+        )
+        return self._status_response(status)
+
+
+class NmapUploadCommitResource(_NmapUploadResource):
+    """Finish an upload and return the PUBLIC ingest response."""
+
+    __slots__ = ()
+
+    INPUT_SCHEMA = "nmap_upload_commit_input_v0.1"
+    DETAIL = "chunked upload commit resource ready"
+
+    def handle(self, request: Mapping[str, Any]) -> Mapping[str, Any]:
+        response = UPLOAD_MANAGER.commit(
+            request["upload_id"], request.get("payload_sha256")
+        )
+        return _checked_ingest_response(response)
+
+
+class NmapUploadStatusResource(_NmapUploadResource):
+    """Report the acknowledged progress of an upload so clients can resume."""
+
+    __slots__ = ()
+
+    INPUT_SCHEMA = "nmap_upload_status_input_v0.1"
+    DETAIL = "chunked upload status resource ready"
+
+    def handle(self, request: Mapping[str, Any]) -> Mapping[str, Any]:
+        return self._status_response(UPLOAD_MANAGER.status(request["upload_id"]))
+
+
 class NmapIngestsListResource:
     """PUBLIC resource that lists stored Nmap ingestion records."""
 
@@ -238,19 +432,61 @@ RESOURCE_REGISTRY = {
     "ingest_nmap_xml": IngestNmapXmlResource(),
     "public://nmap/ingests": NmapIngestsListResource(),
     "public://nmap/ingest/{ingest_id}": NmapIngestGetResource(),
+    "public://nmap/uploads": NmapUploadBeginResource(),
+    "public://nmap/uploads/append": NmapUploadChunkResource(),
+    "public://nmap/uploads/commit": NmapUploadCommitResource(),
+    "public://nmap/uploads/{upload_id}": NmapUploadStatusResource(),
 }
 """Resource registry for FastMCP tooling."""
 
 
+_LOG = logging.getLogger(__name__)
+_STARTED = False
+
+
+def start_services() -> None:
+    """Run one-time process setup shared by every server entrypoint."""
+
+    global _STARTED
+    if _STARTED:
+        return
+    _STARTED = True
+    configure_cap_audit_sinks_from_env()
+    schema_registry.precompile_validators()
+    reload_limit_config()
+    reload_validation_config()
+    _install_reload_signal_handler()
+
+
+def _install_reload_signal_handler() -> None:
+    """Reload the config snapshots on SIGHUP (POSIX, main thread only)."""
+
+    sighup = getattr(signal, "SIGHUP", None)
+    if sighup is None or threading.current_thread() is not threading.main_thread():
+        return
+    signal.signal(sighup, _reload_on_signal)
+
+
+def _reload_on_signal(signum: int, frame: object) -> None:
+    config = reload_limit_config()
+    _LOG.info("Reloaded Nmap ingest limits on signal %s: %s", signum, config)
+    validation = reload_validation_config()
+    _LOG.info("Reloaded response validation on signal %s: %s", signum, validation)
+    backend = schema_registry.reload_validator_backend()
+    _LOG.info("Reloaded schema validator backend on signal %s: %s", signum, backend)
+
+
 def create_server() -> Mapping[str, Mapping[str, str]]:
     """Return the configured resources for this FastMCP server."""
 
+    start_services()
     return {"resources": RESOURCE_REGISTRY}
 
 
 def main() -> None:
     """Log available resources without launching networking."""
 
+    start_services()
     sys.stdout.write("FastMCP ScanSage server initialized with resources:\n\n")
     for name, resource in RESOURCE_REGISTRY.items():
         sys.stdout.write(f"- {name}: {resource.get_status()}\n")
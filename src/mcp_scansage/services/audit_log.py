@@ -2,22 +2,39 @@
 
 from __future__ import annotations
 
+import itertools
 import json
 import logging
 import os
 import time
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
+from typing import BinaryIO, Iterator
 
 from .nmap_ingest_store import STATE_DIR
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None  # type: ignore[assignment]
+
 _LOG = logging.getLogger(__name__)
 DEFAULT_MAX_AUDIT_BYTES = 1_000_000
+MAX_AUDIT_RECORD_BYTES = 4096
+"""Largest serialized audit line written with a single ``write`` call.
+
+Matches ``PIPE_BUF`` on Linux so each record lands as one atomic append even
+when several processes share the same audit directory.
+"""
 AUDIT_DIR_ENV = "SCANSAGE_AUDIT_DIR"
 AUDIT_MAX_BYTES_ENV = "SCANSAGE_AUDIT_MAX_BYTES"
 
 _WARNING_INTERVAL_SECONDS = 60.0
 _LAST_WARN: dict[str, float] = {}
+_SEQUENCE = itertools.count(1)
+_STUB_NAME_CHARS = 256
+"""Longest event name kept in the stub written for an oversized event."""
 
 
 @dataclass(frozen=True)
@@ -27,6 +44,12 @@ class AuditConfig:
     audit_file: Path
     max_bytes: int | None
 
+    @property
+    def lock_file(self) -> Path:
+        """Sidecar file used to coordinate appends and rotation."""
+
+        return self.audit_file.with_name(self.audit_file.name + ".lock")
+
     @classmethod
     def from_env(cls) -> "AuditConfig":
         """Create a config using the current environment."""
@@ -104,8 +127,26 @@ def _should_warn(key: str) -> bool:
     return False
 
 
+def next_audit_stamp() -> dict[str, object]:
+    """Return the wall-clock ``ts``, writer ``pid`` and ``seq`` for a new event.
+
+    ``ts`` is seconds since the epoch; ``seq`` increases monotonically within
+    one process so events sharing a timestamp keep their emission order.
+    Every writer process counts from 1, so ``(pid, seq)`` is what identifies
+    an event in a log shared by several writers.
+    """
+
+    return {"ts": round(time.time(), 6), "pid": os.getpid(), "seq": next(_SEQUENCE)}
+
+
 def append_audit_event(event: dict[str, object]) -> None:
-    """Append a serialized audit event to the PUBLIC audit log."""
+    """Append a serialized audit event to the PUBLIC audit log.
+
+    Each event is encoded as one line and written with a single ``O_APPEND``
+    write while holding a shared lock, so concurrent writers never interleave
+    partial lines and rotation (exclusive lock) never races an append. Events
+    without ``ts``/``seq`` fields are stamped before writing.
+    """
 
     config = _get_audit_config()
     try:
@@ -119,43 +160,191 @@ def append_audit_event(event: dict[str, object]) -> None:
             )
         return
 
+    record = _encode_record(event)
     _rotate_if_needed(config)
 
-    line = json.dumps(event, ensure_ascii=False)
+    with _audit_lock(config, exclusive=False):
+        _write_record(config.audit_file, record)
+
+
+def _encode_record(event: dict[str, object]) -> bytes:
+    """Serialize a stamped event as one JSONL record.
+
+    An event too large for one atomic write is replaced by a stub carrying its
+    name, stamp and original size, so the trail still shows it happened.
+    """
+
+    if "ts" not in event or "seq" not in event:
+        event = {**next_audit_stamp(), **event}
+    record = (json.dumps(event, ensure_ascii=False) + "\n").encode("utf-8")
+    if len(record) <= MAX_AUDIT_RECORD_BYTES:
+        return record
+    if _should_warn("oversized"):
+        _LOG.warning(
+            "Truncating audit event larger than %d bytes", MAX_AUDIT_RECORD_BYTES
+        )
+    name = event.get("event")
+    stub = {
+        "event": name[:_STUB_NAME_CHARS] if isinstance(name, str) else None,
+        "ts": event["ts"],
+        "pid": event.get("pid"),
+        "seq": event["seq"],
+        "truncated": True,
+        "original_bytes": len(record),
+    }
+    return (json.dumps(stub, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _write_record(path: Path, record: bytes) -> None:
+    """Append ``record`` to ``path`` with exactly one ``O_APPEND`` write."""
+
     try:
-        with config.audit_file.open("a", encoding="utf-8") as fh:
-            fh.write(line)
-            fh.write("\n")
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
     except OSError as exc:
         if _should_warn("write"):
-            _LOG.warning(
-                "Unable to write audit event to %s: %s", config.audit_file, exc
-            )
+            _LOG.warning("Unable to write audit event to %s: %s", path, exc)
+        return
+    try:
+        written = os.write(fd, record)
+        if written < len(record) and _should_warn("write"):
+            _LOG.warning("Short write to audit log %s", path)
+    except OSError as exc:
+        if _should_warn("write"):
+            _LOG.warning("Unable to write audit event to %s: %s", path, exc)
+    finally:
+        os.close(fd)
 
 
-def _rotate_if_needed(config: AuditConfig) -> None:
-    if config.max_bytes is None:
-        return
+@contextmanager
+def _audit_lock(config: AuditConfig, *, exclusive: bool) -> Iterator[None]:
+    """Hold an advisory lock on the audit sidecar file (no-op without fcntl)."""
 
-    path = config.audit_file
-    if not path.exists():
+    if fcntl is None:  # pragma: no cover - non-POSIX platforms
+        yield
         return
-
     try:
-        size = path.stat().st_size
+        fd = os.open(config.lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+    except OSError as exc:
+        if _should_warn("lock"):
+            _LOG.warning("Unable to open audit lock %s: %s", config.lock_file, exc)
+        yield
+        return
+    try:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        except OSError as exc:
+            # NFS without flock support and similar: append unlocked.
+            if _should_warn("lock"):
+                _LOG.warning("Unable to lock audit file %s: %s", config.lock_file, exc)
+        yield
+    finally:
+        os.close(fd)
+
+
+def _audit_file_size(path: Path) -> int | None:
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return None
     except OSError as exc:
         if _should_warn("stat"):
             _LOG.warning("Unable to stat audit log %s: %s", path, exc)
+        return None
+
+
+def _rotate_if_needed(config: AuditConfig) -> None:
+    if config.max_bytes is None:
         return
 
-    if size < config.max_bytes:
+    size = _audit_file_size(config.audit_file)
+    if size is None or size < config.max_bytes:
         return
 
-    backup = path.with_name(path.name + ".1")
+    with _audit_lock(config, exclusive=True):
+        # Another process may have rotated while we waited for the lock.
+        size = _audit_file_size(config.audit_file)
+        if size is None or size < config.max_bytes:
+            return
+
+        path = config.audit_file
+        backup = path.with_name(path.name + ".1")
+        try:
+            os.replace(path, backup)
+        except OSError as exc:
+            if _should_warn("rotate"):
+                _LOG.warning("Unable to rotate audit log %s: %s", path, exc)
+
+
+def iter_audit_window(
+    path: Path, start_ts: float, end_ts: float | None = None
+) -> Iterator[dict[str, object]]:
+    """Yield stamped events with ``start_ts <= ts <= end_ts`` from one segment.
+
+    The segment must be sorted by ``ts`` (true for a single writer, and within
+    clock skew for several). The first matching line is located by binary
+    search over byte offsets, so only the lines inside the window are decoded
+    in full. Lines without a readable ``ts`` are skipped.
+    """
+
     try:
-        if backup.exists():
-            backup.unlink()
-        path.rename(backup)
-    except OSError as exc:
-        if _should_warn("rotate"):
-            _LOG.warning("Unable to rotate audit log %s: %s", path, exc)
+        handle = path.open("rb")
+    except FileNotFoundError:
+        return
+    with handle:
+        size = os.fstat(handle.fileno()).st_size
+        low, high = 0, size
+        while low < high:
+            middle = (low + high) // 2
+            _, ts = _next_stamped_line(handle, middle)
+            if ts is None or ts >= start_ts:
+                high = middle
+            else:
+                low = middle + 1
+
+        offset, _ = _next_stamped_line(handle, low)
+        handle.seek(offset)
+        for line in handle:
+            event = _decode_line(line)
+            if event is None:
+                continue
+            ts = _event_timestamp(event)
+            if ts is None:
+                continue
+            if end_ts is not None and ts > end_ts:
+                return
+            yield event
+
+
+def _next_stamped_line(handle: BinaryIO, offset: int) -> tuple[int, float | None]:
+    """Return the start offset and ``ts`` of the first stamped line at ``offset``."""
+
+    if offset > 0:
+        # Finish the line containing offset - 1 so we land on a line boundary.
+        handle.seek(offset - 1)
+        handle.readline()
+    else:
+        handle.seek(0)
+    while True:
+        start = handle.tell()
+        line = handle.readline()
+        if not line:
+            return start, None
+        event = _decode_line(line)
+        ts = _event_timestamp(event) if event is not None else None
+        if ts is not None:
+            return start, ts
+
+
+def _decode_line(line: bytes) -> dict[str, object] | None:
+    try:
+        event = json.loads(line)
+    except ValueError:
+        return None
+    return event if isinstance(event, dict) else None
+
+
+def _event_timestamp(event: dict[str, object]) -> float | None:
+    ts = event.get("ts")
+    if isinstance(ts, bool) or not isinstance(ts, (int, float)):
+        return None
+    return float(ts)
@@ -6,7 +6,7 @@ import logging
 from dataclasses import dataclass
 from typing import Mapping, MutableSequence, Protocol
 
-from .audit_log import append_audit_event
+from .audit_log import append_audit_event, next_audit_stamp
 
 _LOG = logging.getLogger(__name__)
 _EVENTS: MutableSequence[dict[str, object]] = []
@@ -54,16 +54,23 @@ def set_production_cap_audit_sink(sink: CapAuditSink | None) -> None:
     _PRODUCTION_SINK = sink
 
 
+def get_production_cap_audit_sink() -> CapAuditSink | None:
+    """Return the production audit sink currently installed."""
+
+    return _PRODUCTION_SINK
+
+
 def record_cap_event(
     reason: str,
     limits: Mapping[str, int],
     counts_seen: Mapping[str, int],
     counts_returned: Mapping[str, int],
 ) -> None:
-    """Record a non-sensitive cap event for auditing."""
+    """Record a non-sensitive, timestamped cap event for auditing."""
 
     entry = {
         "event": EVENT_NAME,
+        **next_audit_stamp(),
         "cap_reason": reason,
         "limits": dict(limits),
         "counts_seen": dict(counts_seen),
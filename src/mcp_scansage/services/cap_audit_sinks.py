@@ -0,0 +1,248 @@
+"""Asynchronous fan-out and local socket sinks for PUBLIC cap audit events."""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from collections import deque
+from typing import Sequence
+
+from .cap_audit import (
+    CapAuditSink,
+    ProductionCapAuditSink,
+    get_production_cap_audit_sink,
+    set_production_cap_audit_sink,
+)
+
+_LOG = logging.getLogger(__name__)
+
+AUDIT_SOCKET_ENV = "SCANSAGE_AUDIT_SOCKET"
+"""Env var naming a Unix socket collector that also receives cap events."""
+
+DEFAULT_FANOUT_QUEUE_SIZE = 1024
+"""Per-sink queue depth before new events are dropped instead of queued."""
+
+DEFAULT_SOCKET_TIMEOUT_SECONDS = 0.5
+"""Connect/send timeout for the Unix socket sink."""
+
+_WARNING_INTERVAL_SECONDS = 60.0
+_FLUSH_AT_EXIT_SECONDS = 1.0
+
+
+class _SinkLane:
+    """Bounded queue plus daemon worker feeding exactly one downstream sink."""
+
+    def __init__(self, sink: CapAuditSink, max_queue: int) -> None:
+        self.sink = sink
+        self.delivered = 0
+        self.dropped = 0
+        self.failed = 0
+        self._max_queue = max(max_queue, 1)
+        self._pending: deque[dict[str, object]] = deque()
+        self._condition = threading.Condition()
+        self._busy = False
+        self._closed = False
+        self._last_warning: float | None = None
+        self._worker = threading.Thread(
+            target=self._run,
+            name=f"cap-audit-{type(sink).__name__}",
+            daemon=True,
+        )
+        self._worker.start()
+
+    def offer(self, entry: dict[str, object]) -> bool:
+        """Queue ``entry`` without blocking; count a drop when full or closed."""
+
+        with self._condition:
+            if self._closed or len(self._pending) >= self._max_queue:
+                self.dropped += 1
+                return False
+            self._pending.append(entry)
+            self._condition.notify_all()
+            return True
+
+    def flush(self, timeout: float | None) -> bool:
+        """Wait until every queued event was handed to the sink."""
+
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._pending and not self._busy, timeout
+            )
+
+    def close(self, timeout: float | None) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._worker.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending or self._closed)
+                if not self._pending:
+                    return
+                entry = self._pending.popleft()
+                self._busy = True
+            try:
+                self.sink.emit(entry)
+            except Exception as exc:
+                self.failed += 1
+                self._warn(exc)
+            else:
+                self.delivered += 1
+            finally:
+                with self._condition:
+                    self._busy = False
+                    self._condition.notify_all()
+
+    def _warn(self, exc: Exception) -> None:
+        now = time.monotonic()
+        last = self._last_warning
+        if last is not None and now - last < _WARNING_INTERVAL_SECONDS:
+            return
+        self._last_warning = now
+        _LOG.warning("Cap audit sink %s failed: %s", type(self.sink).__name__, exc)
+
+
+class FanOutCapAuditSink:
+    """Sink that delivers every event to several sinks off the caller's thread.
+
+    Each downstream sink owns a bounded queue and a worker thread, so a slow
+    sink only loses its own events: once its queue is full, new events for it
+    are dropped and counted rather than blocking the ingest that emitted them.
+    """
+
+    def __init__(
+        self,
+        sinks: Sequence[CapAuditSink],
+        max_queue: int = DEFAULT_FANOUT_QUEUE_SIZE,
+    ) -> None:
+        self._lanes = tuple(_SinkLane(sink, max_queue) for sink in sinks)
+
+    def emit(self, entry: dict[str, object]) -> None:
+        for lane in self._lanes:
+            lane.offer(dict(entry))
+
+    @property
+    def dropped(self) -> int:
+        """Total events dropped across all downstream sinks."""
+
+        return sum(lane.dropped for lane in self._lanes)
+
+    def stats(self) -> list[dict[str, object]]:
+        """Per-sink delivery counters (sink class name, delivered/dropped/failed)."""
+
+        return [
+            {
+                "sink": type(lane.sink).__name__,
+                "delivered": lane.delivered,
+                "dropped": lane.dropped,
+                "failed": lane.failed,
+            }
+            for lane in self._lanes
+        ]
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait for queued events to reach their sinks; False on timeout."""
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for lane in self._lanes:
+            remaining = (
+                None if deadline is None else max(deadline - time.monotonic(), 0)
+            )
+            if not lane.flush(remaining):
+                return False
+        return True
+
+    def close(self, timeout: float | None = None) -> None:
+        """Deliver what is queued, then stop the worker threads."""
+
+        for lane in self._lanes:
+            lane.close(timeout)
+
+
+class UnixSocketCapAuditSink:
+    """Sink that streams events as JSON lines to a local Unix socket collector.
+
+    The connection is opened lazily and dropped on any error so the next
+    event reconnects; failures surface as :class:`OSError` for the caller
+    (normally a :class:`FanOutCapAuditSink` worker) to count and log.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        timeout: float = DEFAULT_SOCKET_TIMEOUT_SECONDS,
+    ) -> None:
+        if not hasattr(socket, "AF_UNIX"):  # pragma: no cover - non-POSIX platforms
+            raise OSError("Unix sockets are not supported on this platform.")
+        self._path = os.fspath(path)
+        self._timeout = timeout
+        self._socket: socket.socket | None = None
+        self._lock = threading.Lock()
+
+    def emit(self, entry: dict[str, object]) -> None:
+        line = (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+        with self._lock:
+            try:
+                if self._socket is None:
+                    self._socket = self._connect()
+                self._socket.sendall(line)
+            except OSError:
+                self._disconnect()
+                raise
+
+    def close(self) -> None:
+        with self._lock:
+            self._disconnect()
+
+    def _connect(self) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self._timeout)
+        try:
+            sock.connect(self._path)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    def _disconnect(self) -> None:
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+
+def configure_cap_audit_sinks_from_env() -> CapAuditSink | None:
+    """Install a file + socket fan-out sink when :data:`AUDIT_SOCKET_ENV` is set.
+
+    Returns the installed sink, or None when the default production sink is
+    left untouched.
+    """
+
+    socket_path = os.getenv(AUDIT_SOCKET_ENV, "").strip()
+    if not socket_path:
+        return None
+    sink = FanOutCapAuditSink(
+        [ProductionCapAuditSink(), UnixSocketCapAuditSink(socket_path)]
+    )
+    previous = get_production_cap_audit_sink()
+    set_production_cap_audit_sink(sink)
+    if isinstance(previous, FanOutCapAuditSink):
+        previous.close(_FLUSH_AT_EXIT_SECONDS)
+    return sink
+
+
+def _flush_installed_sink() -> None:
+    """Flush whichever fan-out sink is installed when the process exits."""
+
+    sink = get_production_cap_audit_sink()
+    if isinstance(sink, FanOutCapAuditSink):
+        sink.flush(_FLUSH_AT_EXIT_SECONDS)
+
+
+atexit.register(_flush_installed_sink)
@@ -6,9 +6,15 @@ from enum import Enum
 
 
 class CapReason(Enum):
-    """Enumerate count-based limits that can truncate parsing or ingestion."""
+    """Enumerate the count, structure, resource and encoding caps on ingestion."""
 
     MAX_HOSTS = "MAX_HOSTS"
     MAX_PORTS = "MAX_PORTS"
     MAX_FINDINGS = "MAX_FINDINGS"
     MAX_PAYLOAD_BYTES = "MAX_PAYLOAD_BYTES"
+    MAX_XML_DEPTH = "MAX_XML_DEPTH"
+    MAX_XML_ATTRIBUTES = "MAX_XML_ATTRIBUTES"
+    MAX_XML_TEXT_LENGTH = "MAX_XML_TEXT_LENGTH"
+    MAX_PARSE_MEMORY = "MAX_PARSE_MEMORY"
+    PARSE_DEADLINE = "PARSE_DEADLINE"
+    MAX_DECOMPRESSION_RATIO = "MAX_DECOMPRESSION_RATIO"
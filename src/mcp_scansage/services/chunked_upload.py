@@ -0,0 +1,308 @@
+"""Chunked uploads for Nmap XML payloads larger than one request.
+
+A client begins an upload, appends numbered chunks and commits. Each chunk
+is size-accounted and hashed incrementally (:class:`PayloadAccountant`) and
+fed straight into a streaming parse (:class:`NmapXmlStream`), so nothing is
+buffered server-side beyond the parser's bounded state. An interrupted
+client asks for the upload status and resumes from ``next_chunk_index``;
+re-sending the last acknowledged chunk is answered idempotently.
+
+Open uploads hold a parse memory reservation sized like a one-shot ingest
+of the declared ``total_bytes`` (or of ``max_xml_bytes`` when undeclared),
+so their number is capped (``SCANSAGE_MAX_UPLOAD_SESSIONS``) and idle
+uploads expire after ``SCANSAGE_UPLOAD_SESSION_TTL_S`` seconds.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Callable, Mapping
+
+from .nmap_ingest import NMAP_XML_FORMAT, build_ingest_response, payload_too_large
+from .nmap_limits import NmapLimitConfig, resolve_limit_config
+from .nmap_parser import MinimalNmapXmlParser, NmapXmlStream, get_configured_nmap_parser
+from .parse_memory import ParseCapacityError
+from .payload_stream import PayloadAccountant, PayloadSizeError
+
+MAX_UPLOAD_SESSIONS_ENV = "SCANSAGE_MAX_UPLOAD_SESSIONS"
+"""Env var capping concurrently open chunked uploads."""
+
+UPLOAD_SESSION_TTL_ENV = "SCANSAGE_UPLOAD_SESSION_TTL_S"
+"""Env var giving the idle time after which an open upload is dropped."""
+
+DEFAULT_MAX_UPLOAD_SESSIONS = 8
+"""Default cap on concurrently open chunked uploads."""
+
+DEFAULT_UPLOAD_SESSION_TTL_S = 300
+"""Default idle timeout for open uploads, in seconds."""
+
+
+class UploadNotFoundError(LookupError):
+    """Raised for unknown, expired, failed or already committed uploads."""
+
+
+class UploadChunkOrderError(ValueError):
+    """Raised when a chunk does not continue the acknowledged sequence."""
+
+    def __init__(self, next_chunk_index: int) -> None:
+        super().__init__("Chunk does not continue the upload.")
+        self.next_chunk_index = next_chunk_index
+
+
+@dataclass(frozen=True)
+class UploadConfig:
+    """Session cap and idle timeout for chunked uploads."""
+
+    max_sessions: int = DEFAULT_MAX_UPLOAD_SESSIONS
+    session_ttl_s: int = DEFAULT_UPLOAD_SESSION_TTL_S
+
+    @classmethod
+    def from_env(cls) -> "UploadConfig":
+        """Read both settings; invalid values keep the defaults."""
+
+        return cls(
+            max_sessions=_env_positive_int(
+                MAX_UPLOAD_SESSIONS_ENV, DEFAULT_MAX_UPLOAD_SESSIONS
+            ),
+            session_ttl_s=_env_positive_int(
+                UPLOAD_SESSION_TTL_ENV, DEFAULT_UPLOAD_SESSION_TTL_S
+            ),
+        )
+
+
+def _env_positive_int(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        value = int(raw.strip())
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+
+@dataclass(frozen=True)
+class UploadStatus:
+    """Acknowledged progress of one upload."""
+
+    upload_id: str
+    next_chunk_index: int
+    received_bytes: int
+    max_bytes: int
+
+
+class _UploadSession:
+    def __init__(
+        self,
+        upload_id: str,
+        format: str,
+        limits: NmapLimitConfig,
+        max_bytes: int,
+        stream: NmapXmlStream,
+        now: float,
+    ) -> None:
+        self.upload_id = upload_id
+        self.format = format
+        self.limits = limits
+        self.max_bytes = max_bytes
+        self.stream = stream
+        self.accountant = PayloadAccountant(limits.max_xml_bytes)
+        self.lock = threading.Lock()
+        self.next_chunk_index = 0
+        self.last_chunk: str | None = None
+        self.touched = now
+        self.closed = False
+
+    def status(self) -> UploadStatus:
+        return UploadStatus(
+            upload_id=self.upload_id,
+            next_chunk_index=self.next_chunk_index,
+            received_bytes=self.accountant.byte_count,
+            max_bytes=self.max_bytes,
+        )
+
+    def close(self) -> None:
+        """Mark the session finished and free its reservation (lock held)."""
+
+        self.closed = True
+        self.stream.release()
+
+
+class ChunkedUploadManager:
+    """Process-wide registry of open chunked uploads.
+
+    ``config`` defaults to :meth:`UploadConfig.from_env`, read on every call
+    so env changes apply to new uploads.
+    """
+
+    def __init__(
+        self,
+        config: UploadConfig | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._config = config
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._sessions: dict[str, _UploadSession] = {}
+
+    def begin(
+        self,
+        format: str,
+        limit_overrides: Mapping[str, int] | None = None,
+        total_bytes: int | None = None,
+    ) -> UploadStatus:
+        """Open an upload and reserve parse memory for it.
+
+        The reservation is admitted for ``total_bytes``, the size the client
+        declares for the whole payload, or for ``max_xml_bytes`` when it is
+        not declared. A declared size also becomes the upload's byte limit.
+
+        Raises:
+            ValueError: for unsupported formats or a non-streaming parser.
+            PayloadTooLargeError: when ``total_bytes`` exceeds ``max_xml_bytes``.
+            ParseCapacityError: when every upload slot or the parse memory
+                budget is taken.
+        """
+
+        if format != NMAP_XML_FORMAT:
+            raise ValueError("Unsupported format for chunked uploads.")
+        parser = get_configured_nmap_parser()
+        if not isinstance(parser, MinimalNmapXmlParser):
+            raise ValueError("Chunked uploads require the streaming XML parser.")
+        config = self._current_config()
+        self._expire(config)
+        limits = resolve_limit_config(limit_overrides)
+        if total_bytes is not None and total_bytes > limits.max_xml_bytes:
+            raise payload_too_large(limits, total_bytes)
+        max_bytes = total_bytes or limits.max_xml_bytes
+        stream = parser.open_stream(max_bytes, limits)
+        session = _UploadSession(
+            uuid.uuid4().hex, format, limits, max_bytes, stream, self._clock()
+        )
+        with self._lock:
+            if len(self._sessions) >= config.max_sessions:
+                stream.release()
+                raise ParseCapacityError("Every chunked upload slot is in use.")
+            self._sessions[session.upload_id] = session
+        return session.status()
+
+    def append(self, upload_id: str, chunk_index: int, data: str) -> UploadStatus:
+        """Account and parse chunk ``chunk_index`` of an upload.
+
+        Re-sending the last acknowledged chunk returns the current status.
+        Any size, parse or limit error ends the upload.
+
+        Raises:
+            UploadNotFoundError: when the upload is not open.
+            UploadChunkOrderError: when ``chunk_index`` is not the next one.
+        """
+
+        session = self._session(upload_id)
+        with session.lock:
+            if session.closed:
+                raise UploadNotFoundError("Upload is not open.")
+            session.touched = self._clock()
+            if (
+                chunk_index == session.next_chunk_index - 1
+                and data == session.last_chunk
+            ):
+                return session.status()
+            if chunk_index != session.next_chunk_index:
+                raise UploadChunkOrderError(session.next_chunk_index)
+            try:
+                session.accountant.add(data)
+                if session.accountant.byte_count > session.max_bytes:
+                    raise ValueError("Upload exceeds its declared total_bytes.")
+                session.stream.feed(data)
+            except PayloadSizeError as exc:
+                self._discard(session)
+                raise payload_too_large(session.limits, exc.byte_count) from exc
+            except Exception:
+                self._discard(session)
+                raise
+            session.next_chunk_index += 1
+            session.last_chunk = data
+            return session.status()
+
+    def commit(
+        self,
+        upload_id: str,
+        payload_sha256: str | None = None,
+        persist_record: bool = True,
+    ) -> dict[str, object]:
+        """Finish the parse and return the PUBLIC ingest response.
+
+        ``payload_sha256``, when given, must match the digest of the
+        acknowledged chunks. The upload is closed whatever the outcome.
+        """
+
+        session = self._session(upload_id)
+        with session.lock:
+            if session.closed:
+                raise UploadNotFoundError("Upload is not open.")
+            self._discard(session, release=False)
+            try:
+                digest = session.accountant.hexdigest()
+                if payload_sha256 is not None and payload_sha256 != digest:
+                    raise ValueError("Upload digest does not match its chunks.")
+                parser_result = session.stream.close()
+            finally:
+                session.close()
+        return build_ingest_response(
+            session.format,
+            parser_result,
+            session.accountant.byte_count,
+            digest,
+            session.limits,
+            persist_record,
+        )
+
+    def status(self, upload_id: str) -> UploadStatus:
+        """Return the acknowledged progress used to resume an upload."""
+
+        return self._session(upload_id).status()
+
+    def abort_all(self) -> None:
+        """Drop every open upload (tests and shutdown)."""
+
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            with session.lock:
+                session.close()
+
+    def _current_config(self) -> UploadConfig:
+        return self._config or UploadConfig.from_env()
+
+    def _session(self, upload_id: str) -> _UploadSession:
+        self._expire(self._current_config())
+        with self._lock:
+            session = self._sessions.get(upload_id)
+        if session is None:
+            raise UploadNotFoundError("Upload is not open.")
+        return session
+
+    def _discard(self, session: _UploadSession, release: bool = True) -> None:
+        with self._lock:
+            self._sessions.pop(session.upload_id, None)
+        if release:
+            session.close()
+
+    def _expire(self, config: UploadConfig) -> None:
+        cutoff = self._clock() - config.session_ttl_s
+        with self._lock:
+            expired = [s for s in self._sessions.values() if s.touched < cutoff]
+            for session in expired:
+                del self._sessions[session.upload_id]
+        for session in expired:
+            with session.lock:
+                session.close()
+
+
+UPLOAD_MANAGER = ChunkedUploadManager()
+"""Process-wide chunked upload registry used by the PUBLIC upload resources."""
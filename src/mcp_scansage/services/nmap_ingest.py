@@ -4,21 +4,55 @@ from __future__ import annotations
 
 import hashlib
 import uuid
-from typing import Mapping
+from contextlib import contextmanager
+from dataclasses import replace
+from typing import Iterator, Mapping
 
 from .cap_audit import record_cap_event
 from .cap_reason import CapReason
 from .nmap_ingest_store import persist_ingest_record
-from .nmap_limits import DEFAULT_NMAP_LIMITS, NmapLimitConfig
+from .nmap_limits import DEFAULT_NMAP_LIMITS, NmapLimitConfig, resolve_limit_config
 from .nmap_parser import (
+    MasscanJsonParser,
+    MasscanListParser,
+    MinimalNmapXmlParser,
+    NmapGrepableParser,
+    NmapLineParser,
     NmapParser,
     ParsedFinding,
     ParsedNmapResult,
     get_configured_nmap_parser,
 )
+from .payload_encoding import (
+    GZIP_BASE64_ENCODING,
+    PAYLOAD_ENCODINGS,
+    DecompressionRatioError,
+    GzipBase64Stream,
+)
+from .payload_stream import PayloadSizeError, PayloadStream
+from .scan_formats import (
+    AUTO_FORMAT,
+    MASSCAN_JSON_FORMAT,
+    MASSCAN_LIST_FORMAT,
+    NMAP_GREPABLE_FORMAT,
+    NMAP_XML_FORMAT,
+    SNIFF_CHARS,
+    SYNTHETIC_FORMAT,
+    resolve_format,
+)
+
+FORMAT_PARSERS: dict[str, type[NmapParser]] = {
+    NMAP_GREPABLE_FORMAT: NmapGrepableParser,
+    MASSCAN_JSON_FORMAT: MasscanJsonParser,
+    MASSCAN_LIST_FORMAT: MasscanListParser,
+}
+"""Parsers fixed by the format; other formats use the configured XML parser."""
+
+SUPPORTED_FORMATS = (AUTO_FORMAT, NMAP_XML_FORMAT, SYNTHETIC_FORMAT, *FORMAT_PARSERS)
+"""Formats accepted by :func:`ingest_nmap_public`."""
 
-NMAP_XML_FORMAT = "nmap_xml"
-"""Canonical format string for Nmap XML ingestion."""
+STREAMING_PARSERS = (MinimalNmapXmlParser, NmapLineParser)
+"""Parsers that consume payload text chunk by chunk (``parse_stream``)."""
 
 MAX_PAYLOAD_BYTES = DEFAULT_NMAP_LIMITS.max_xml_bytes
 """Default maximum allowed payload size in bytes for PUBLIC ingestion."""
@@ -39,32 +73,78 @@ def ingest_nmap_public(
     meta: Mapping[str, str] | None = None,
     parser: NmapParser | None = None,
     persist_record: bool = True,
+    limit_overrides: Mapping[str, int] | None = None,
+    payload_encoding: str | None = None,
 ) -> dict[str, object]:
     """
     Create a PUBLIC-safe ingestion summary for Nmap XML payloads.
 
     Args:
-        format: Expected to be :data:`NMAP_XML_FORMAT`.
-        payload: The raw XML text (bounded by MAX_PAYLOAD_BYTES).
+        format: One of :data:`SUPPORTED_FORMATS`; formats listed in
+            :data:`FORMAT_PARSERS` default to their own parser. ``auto``
+            sniffs the payload, and a named format the payload clearly does
+            not match raises :class:`FormatMismatchError` before parsing.
+        payload: The raw XML text (bounded by MAX_PAYLOAD_BYTES, or by the
+            lab profile's streamed size accountant).
         meta: Optional metadata (ignored for now to avoid echoing extra data).
+        limit_overrides: Optional per-request limits (e.g. a tenant's larger
+            caps) applied on top of the process-wide limit snapshot.
+        payload_encoding: ``identity`` (default) or ``gzip+base64``; caps and
+            the summary digest apply to the decompressed XML.
 
     Returns:
         A schema-compliant dictionary ready for PUBLIC consumption.
     """
 
-    if format not in (NMAP_XML_FORMAT, "synthetic_v1"):
+    if format not in SUPPORTED_FORMATS:
         raise ValueError("Unsupported format for PUBLIC ingestion.")
 
-    limit_config = NmapLimitConfig.from_env()
-    payload_bytes = payload.encode("utf-8")
-    byte_count = len(payload_bytes)
-    if byte_count > limit_config.max_xml_bytes:
-        _emit_payload_cap(limit_config, byte_count)
-        raise PayloadTooLargeError("Payload exceeds maximum allowed size.")
+    if payload_encoding not in (None, *PAYLOAD_ENCODINGS):
+        raise ValueError("Unsupported payload encoding.")
+
+    limit_config = resolve_limit_config(limit_overrides)
+    compressed: GzipBase64Stream | None = None
+    if payload_encoding == GZIP_BASE64_ENCODING:
+        compressed = GzipBase64Stream(
+            payload, limit_config.max_xml_bytes, limit_config.max_decompression_ratio
+        )
+        with _stream_caps(limit_config):
+            head = compressed.peek(SNIFF_CHARS)
+    else:
+        head = payload[:SNIFF_CHARS]
+    format = resolve_format(format, head)
+    parser = parser or _parser_for(format)
+    if compressed is not None:
+        parser_result, byte_count, digest = _parse_compressed(
+            compressed, compressed.max_inflated_bytes, parser, limit_config
+        )
+    elif limit_config.lab_profile and isinstance(parser, STREAMING_PARSERS):
+        parser_result, byte_count, digest = _parse_streamed(
+            PayloadStream(payload, limit_config.max_xml_bytes),
+            len(payload),
+            parser,
+            limit_config,
+        )
+    else:
+        parser_result, byte_count, digest = _parse_whole(payload, parser, limit_config)
+    return build_ingest_response(
+        format, parser_result, byte_count, digest, limit_config, persist_record
+    )
+
+
+def build_ingest_response(
+    format: str,
+    parser_result: ParsedNmapResult,
+    byte_count: int,
+    digest: str,
+    limit_config: NmapLimitConfig,
+    persist_record: bool = True,
+) -> dict[str, object]:
+    """Apply the findings cap, persist the record and build the response.
+
+    Shared by single-request ingests and committed chunked uploads.
+    """
 
-    digest = hashlib.sha256(payload_bytes).hexdigest()
-    parser = parser or get_configured_nmap_parser()
-    parser_result = parser.parse(payload_bytes)
     final_findings, metadata = _apply_findings_limit(parser_result, limit_config)
     findings_count = len(final_findings)
     ingest_id = uuid.uuid4().hex
@@ -101,6 +181,103 @@ def ingest_nmap_public(
     return response
 
 
+def _parser_for(format: str) -> NmapParser:
+    parser_cls = FORMAT_PARSERS.get(format)
+    return parser_cls() if parser_cls else get_configured_nmap_parser()
+
+
+def payload_too_large(
+    limit_config: NmapLimitConfig, byte_count: int
+) -> PayloadTooLargeError:
+    """Audit an oversized payload and return the error to raise."""
+
+    _emit_payload_cap(limit_config, byte_count)
+    return PayloadTooLargeError("Payload exceeds maximum allowed size.")
+
+
+def _buffered_limits(limit_config: NmapLimitConfig) -> NmapLimitConfig:
+    """Limits for parsers that hold the whole payload in memory.
+
+    The lab profile's larger payloads are only reachable through
+    :data:`STREAMING_PARSERS`; every other parser keeps the default byte cap.
+    """
+
+    if not limit_config.lab_profile:
+        return limit_config
+    max_xml_bytes = min(limit_config.max_xml_bytes, MAX_PAYLOAD_BYTES)
+    return replace(limit_config, max_xml_bytes=max_xml_bytes)
+
+
+def _parse_whole(
+    payload: str, parser: NmapParser, limit_config: NmapLimitConfig
+) -> tuple[ParsedNmapResult, int, str]:
+    """Default path: size, digest and parse over the whole encoded string."""
+
+    limit_config = _buffered_limits(limit_config)
+    payload_bytes = payload.encode("utf-8")
+    byte_count = len(payload_bytes)
+    if byte_count > limit_config.max_xml_bytes:
+        raise payload_too_large(limit_config, byte_count)
+    digest = hashlib.sha256(payload_bytes).hexdigest()
+    return parser.parse(payload_bytes, limits=limit_config), byte_count, digest
+
+
+def _parse_streamed(
+    stream: PayloadStream | GzipBase64Stream,
+    size_hint: int,
+    parser: MinimalNmapXmlParser | NmapLineParser,
+    limit_config: NmapLimitConfig,
+) -> tuple[ParsedNmapResult, int, str]:
+    """Streamed parse: size, digest and parse all advance chunk by chunk."""
+
+    # Admission is sized from ``size_hint``; the byte count is only known
+    # once the stream has been consumed.
+    with _stream_caps(limit_config):
+        parser_result = parser.parse_stream(stream, size_hint, limit_config)
+        stream.drain()
+    return parser_result, stream.byte_count, stream.hexdigest()
+
+
+def _parse_compressed(
+    stream: GzipBase64Stream,
+    size_hint: int,
+    parser: NmapParser,
+    limit_config: NmapLimitConfig,
+) -> tuple[ParsedNmapResult, int, str]:
+    """Inflate a ``gzip+base64`` payload into the parser.
+
+    Streaming parsers consume inflated blocks as they are produced and are
+    admitted for ``size_hint``, the most XML the caps let the payload
+    inflate to; other parsers receive the inflated text once it passed the
+    ratio cap and the buffered byte cap (:func:`_buffered_limits`), which
+    stops inflating as soon as it is crossed.
+    """
+
+    if isinstance(parser, STREAMING_PARSERS):
+        return _parse_streamed(stream, size_hint, parser, limit_config)
+    buffered = _buffered_limits(limit_config)
+    chunks: list[str] = []
+    with _stream_caps(limit_config):
+        for chunk in stream:
+            if stream.byte_count > buffered.max_xml_bytes:
+                raise payload_too_large(buffered, stream.byte_count)
+            chunks.append(chunk)
+    return _parse_whole("".join(chunks), parser, limit_config)
+
+
+@contextmanager
+def _stream_caps(limit_config: NmapLimitConfig) -> Iterator[None]:
+    """Turn streamed size and ratio violations into audited rejections."""
+
+    try:
+        yield
+    except PayloadSizeError as exc:
+        raise payload_too_large(limit_config, exc.byte_count) from exc
+    except DecompressionRatioError as exc:
+        _emit_ratio_cap(limit_config, exc)
+        raise PayloadTooLargeError("Payload expands beyond the allowed ratio.") from exc
+
+
 def stable_findings_sort_key(finding: ParsedFinding) -> tuple[int, int, str, str]:
     """Stable ordering key used before truncating findings."""
 
@@ -212,6 +389,24 @@ def _emit_cap_event(
     )
 
 
+def _emit_ratio_cap(
+    limit_config: NmapLimitConfig, exc: DecompressionRatioError
+) -> None:
+    """Log a cap event for a payload that inflates like a decompression bomb."""
+
+    limits = _build_cap_limits(limit_config)
+    limits["max_decompression_ratio"] = limit_config.max_decompression_ratio
+    record_cap_event(
+        reason=CapReason.MAX_DECOMPRESSION_RATIO.value,
+        limits=limits,
+        counts_seen={
+            "compressed_bytes": exc.compressed_bytes,
+            "decompressed_bytes": exc.decompressed_bytes,
+        },
+        counts_returned=_counts_returned_from_findings(()),
+    )
+
+
 def _emit_payload_cap(limit_config: NmapLimitConfig, payload_bytes: int) -> None:
     """Log a cap event for oversized payloads before rejecting."""
 
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, fields, replace
+from typing import Mapping
 
 DEFAULT_MAX_NMAP_XML_BYTES = 32_768
 """Conservative default for XML payload size in bytes."""
@@ -17,6 +19,54 @@ DEFAULT_MAX_NMAP_PORTS_PER_HOST = 128
 DEFAULT_MAX_NMAP_FINDINGS = 100
 """Default cap on the number of parsed findings reported."""
 
+DEFAULT_MAX_NMAP_XML_DEPTH = 64
+"""Default cap on element nesting depth (Nmap output stays well below 20)."""
+
+DEFAULT_MAX_NMAP_XML_ATTRIBUTES = 32
+"""Default cap on attributes carried by a single XML element."""
+
+DEFAULT_MAX_NMAP_XML_TEXT_LENGTH = 8_192
+"""Default cap on characters in one attribute value or text run."""
+
+DEFAULT_MAX_NMAP_PARSE_MEMORY_BYTES = 8 * 1024 * 1024
+"""Default estimated memory one XML parse may build before it is capped."""
+
+DEFAULT_MAX_NMAP_TOTAL_PARSE_MEMORY_BYTES = 64 * 1024 * 1024
+"""Default estimated memory all concurrent XML parses may hold together."""
+
+DEFAULT_NMAP_PARSE_DEFER_MS = 2_000
+"""Default time a new parse waits for parse memory before it is refused."""
+
+DEFAULT_NMAP_PARSE_DEADLINE_MS = 10_000
+"""Default wall-clock budget for one parse, checked between hosts and ports."""
+
+DEFAULT_MAX_NMAP_DECOMPRESSION_RATIO = 100
+"""Default cap on decompressed/compressed bytes for encoded payloads."""
+
+DEFAULT_LAB_MAX_NMAP_XML_BYTES = 64 * 1024 * 1024
+"""Lab-profile payload cap; only safe because lab payloads are streamed."""
+
+DEFAULT_LAB_MAX_NMAP_HOSTS = 4_096
+"""Lab-profile cap on hosts processed in a single payload."""
+
+DEFAULT_LAB_MAX_NMAP_PORTS_PER_HOST = 1_024
+"""Lab-profile cap on ports examined per host."""
+
+DEFAULT_LAB_NMAP_PARSE_DEADLINE_MS = 60_000
+"""Lab-profile wall-clock budget for one parse."""
+
+PROCESS_WIDE_LIMITS = frozenset({"max_total_parse_memory_bytes", "lab_profile"})
+"""Settings shared by every request, which per-request overrides cannot change."""
+
+AUTHORIZED_LAB_ENV = "SCANSAGE_AUTHORIZED_LAB"
+"""Env var that enables authorized lab mode."""
+
+
+def lab_mode_enabled() -> bool:
+    """Return True when authorized lab mode is on."""
+
+    return os.getenv(AUTHORIZED_LAB_ENV, "").lower() in {"1", "true", "yes"}
+
 
 def _env_int(
     name: str,
@@ -43,40 +93,113 @@ def _env_int(
 
 @dataclass(frozen=True)
 class NmapLimitConfig:
-    """Container describing every configurable ingest limit."""
+    """Container describing every configurable ingest limit.
+
+    ``lab_profile`` marks the large-payload profile (:data:`LAB_NMAP_LIMITS`).
+    """
 
     max_xml_bytes: int
     max_hosts: int
     max_ports_per_host: int
     max_findings: int
+    max_xml_depth: int = DEFAULT_MAX_NMAP_XML_DEPTH
+    max_xml_attributes: int = DEFAULT_MAX_NMAP_XML_ATTRIBUTES
+    max_xml_text_length: int = DEFAULT_MAX_NMAP_XML_TEXT_LENGTH
+    max_parse_memory_bytes: int = DEFAULT_MAX_NMAP_PARSE_MEMORY_BYTES
+    max_total_parse_memory_bytes: int = DEFAULT_MAX_NMAP_TOTAL_PARSE_MEMORY_BYTES
+    parse_defer_ms: int = DEFAULT_NMAP_PARSE_DEFER_MS
+    parse_deadline_ms: int = DEFAULT_NMAP_PARSE_DEADLINE_MS
+    max_decompression_ratio: int = DEFAULT_MAX_NMAP_DECOMPRESSION_RATIO
+    lab_profile: bool = False
 
     @classmethod
     def from_env(cls) -> "NmapLimitConfig":
-        """Return a limit set using the configured environment variables."""
+        """Return a limit set using the configured environment variables.
+
+        Unset variables fall back to :data:`DEFAULT_NMAP_LIMITS`, or to
+        :data:`LAB_NMAP_LIMITS` when authorized lab mode is on.
+        """
 
+        defaults = LAB_NMAP_LIMITS if lab_mode_enabled() else DEFAULT_NMAP_LIMITS
         return cls(
             max_xml_bytes=_env_int(
                 "SCANSAGE_MAX_NMAP_XML_BYTES",
-                DEFAULT_MAX_NMAP_XML_BYTES,
+                defaults.max_xml_bytes,
                 min_value=1,
             ),
             max_hosts=_env_int(
                 "SCANSAGE_MAX_NMAP_HOSTS",
-                DEFAULT_MAX_NMAP_HOSTS,
+                defaults.max_hosts,
                 min_value=1,
             ),
             max_ports_per_host=_env_int(
                 "SCANSAGE_MAX_NMAP_PORTS_PER_HOST",
-                DEFAULT_MAX_NMAP_PORTS_PER_HOST,
+                defaults.max_ports_per_host,
                 min_value=1,
             ),
             max_findings=_env_int(
                 "SCANSAGE_MAX_NMAP_FINDINGS",
-                DEFAULT_MAX_NMAP_FINDINGS,
+                defaults.max_findings,
+                min_value=1,
+            ),
+            max_xml_depth=_env_int(
+                "SCANSAGE_MAX_NMAP_XML_DEPTH",
+                defaults.max_xml_depth,
+                min_value=1,
+            ),
+            max_xml_attributes=_env_int(
+                "SCANSAGE_MAX_NMAP_XML_ATTRIBUTES",
+                defaults.max_xml_attributes,
+                min_value=1,
+            ),
+            max_xml_text_length=_env_int(
+                "SCANSAGE_MAX_NMAP_XML_TEXT_LENGTH",
+                defaults.max_xml_text_length,
+                min_value=1,
+            ),
+            max_parse_memory_bytes=_env_int(
+                "SCANSAGE_MAX_NMAP_PARSE_MEMORY_BYTES",
+                defaults.max_parse_memory_bytes,
+                min_value=1,
+            ),
+            max_total_parse_memory_bytes=_env_int(
+                "SCANSAGE_MAX_NMAP_TOTAL_PARSE_MEMORY_BYTES",
+                defaults.max_total_parse_memory_bytes,
                 min_value=1,
             ),
+            parse_defer_ms=_env_int(
+                "SCANSAGE_NMAP_PARSE_DEFER_MS",
+                defaults.parse_defer_ms,
+            ),
+            parse_deadline_ms=_env_int(
+                "SCANSAGE_NMAP_PARSE_DEADLINE_MS",
+                defaults.parse_deadline_ms,
+                min_value=1,
+            ),
+            max_decompression_ratio=_env_int(
+                "SCANSAGE_MAX_NMAP_DECOMPRESSION_RATIO",
+                defaults.max_decompression_ratio,
+                min_value=1,
+            ),
+            lab_profile=defaults.lab_profile,
         )
 
+    def with_overrides(self, overrides: Mapping[str, int]) -> "NmapLimitConfig":
+        """Return a copy with per-request limits applied (e.g. a tenant's caps).
+
+        Raises:
+            ValueError: for unknown or process-wide limit names, or
+                non-positive values.
+        """
+
+        known = {item.name for item in fields(self)} - PROCESS_WIDE_LIMITS
+        for name, value in overrides.items():
+            if name not in known:
+                raise ValueError("Unknown limit override.")
+            if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+                raise ValueError("Limit overrides must be positive integers.")
+        return replace(self, **overrides)
+
 
 DEFAULT_NMAP_LIMITS = NmapLimitConfig(
     DEFAULT_MAX_NMAP_XML_BYTES,
@@ -84,3 +207,64 @@ DEFAULT_NMAP_LIMITS = NmapLimitConfig(
     DEFAULT_MAX_NMAP_PORTS_PER_HOST,
     DEFAULT_MAX_NMAP_FINDINGS,
 )
+
+LAB_NMAP_LIMITS = replace(
+    DEFAULT_NMAP_LIMITS,
+    max_xml_bytes=DEFAULT_LAB_MAX_NMAP_XML_BYTES,
+    max_hosts=DEFAULT_LAB_MAX_NMAP_HOSTS,
+    max_ports_per_host=DEFAULT_LAB_MAX_NMAP_PORTS_PER_HOST,
+    parse_deadline_ms=DEFAULT_LAB_NMAP_PARSE_DEADLINE_MS,
+    lab_profile=True,
+)
+"""Large-payload profile used when authorized lab mode is on.
+
+Payloads are streamed: the size is accounted chunk by chunk, hosts are
+processed and discarded as they close, and findings past ``max_findings``
+are truncated with caps metadata instead of failing the ingest.
+``max_findings`` keeps its default: the public response schema allows at
+most 100 ``parsed_findings``.
+"""
+
+_SNAPSHOT: NmapLimitConfig | None = None
+_SNAPSHOT_LOCK = threading.Lock()
+
+
+def get_limit_config() -> NmapLimitConfig:
+    """Return the process-wide limit snapshot, reading the env on first use.
+
+    The environment is not consulted again until :func:`reload_limit_config`,
+    so every layer of one request sees the same limits.
+    """
+
+    global _SNAPSHOT
+    snapshot = _SNAPSHOT
+    if snapshot is None:
+        with _SNAPSHOT_LOCK:
+            if _SNAPSHOT is None:
+                _SNAPSHOT = NmapLimitConfig.from_env()
+            snapshot = _SNAPSHOT
+    return snapshot
+
+
+def reload_limit_config() -> NmapLimitConfig:
+    """Re-read the ``SCANSAGE_MAX_*`` env vars and swap in a new snapshot.
+
+    Requests already in flight keep the snapshot they resolved.
+    """
+
+    global _SNAPSHOT
+    config = NmapLimitConfig.from_env()
+    with _SNAPSHOT_LOCK:
+        _SNAPSHOT = config
+    return config
+
+
+def resolve_limit_config(
+    overrides: Mapping[str, int] | None = None,
+) -> NmapLimitConfig:
+    """Return the snapshot, with per-request ``overrides`` applied if given."""
+
+    config = get_limit_config()
+    if overrides:
+        return config.with_overrides(overrides)
+    return config
@@ -11,22 +11,40 @@ Real XML parsers must satisfy the following invariants:
 
 from __future__ import annotations
 
+import itertools
+import json
 import os
 import re
+import time
 import xml.etree.ElementTree as ET
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Protocol
+from typing import Any, Callable, Iterable, Iterator, Mapping, NoReturn, Protocol
 
 from .cap_audit import record_cap_event
 from .cap_reason import CapReason
-from .nmap_limits import NmapLimitConfig
-from .sanitizer import IDENTIFIER_PATTERN, redact_identifiers
+from .nmap_limits import (
+    NmapLimitConfig,
+    get_limit_config,
+)
+from .parse_memory import (
+    ATTRIBUTE_BYTES,
+    ATTRIBUTE_TABLE_BYTES,
+    ELEMENT_BYTES,
+    PARSE_MEMORY_GOVERNOR,
+    TEXT_BYTES,
+    ParseMemoryBudget,
+    ParseMemoryError,
+    estimate_text_bytes,
+)
+from .sanitizer import IDENTIFIER_PATTERN, SERVICE_FRAGMENT_CACHE, redact_identifiers
 
 try:
     from defusedxml.common import DefusedXmlException
-    from defusedxml.ElementTree import fromstring as _defused_fromstring
+    from defusedxml.ElementTree import DefusedXMLParser as _DefusedXMLParser
 except ImportError:  # pragma: no cover - optional dependency
-    _defused_fromstring = None  # type: ignore[assignment]
+    _DefusedXMLParser = None  # type: ignore[assignment,misc]
     DefusedXmlException = ET.ParseError  # type: ignore[assignment]
 
 _UNSAFE_XML_PATTERN = re.compile(
@@ -34,17 +52,173 @@ _UNSAFE_XML_PATTERN = re.compile(
 )
 """Regex that detects DTD declarations or external entity references."""
 
+_SCREEN_OVERLAP_CHARS = 64
+"""Characters of the previous chunk re-screened with the next one."""
+
+_HOST_TAG = "host"
+"""Element streamed and discarded one at a time by the lab-profile parser."""
+
+
+class XmlStructureError(ValueError):
+    """Raised while streaming when a structural XML limit is crossed."""
+
+    def __init__(self, reason: CapReason, observed: int) -> None:
+        super().__init__("XML payload exceeds structural limits.")
+        self.reason = reason
+        self.observed = observed
+
+
+class _StreamingTreeBuilder:
+    """Parser target that enforces structural limits and the memory budget.
+
+    Runs once per element and text chunk, so checks and the memory estimate
+    are inlined and the wrapped builder's methods are bound up front.
+    """
+
+    def __init__(self, budget: ParseMemoryBudget, limits: NmapLimitConfig) -> None:
+        builder = ET.TreeBuilder()
+        self._start = builder.start
+        self._end = builder.end
+        self._data = builder.data
+        self.close = builder.close
+        self._charge = budget.charge
+        self._depth = 0
+        self._text_run = 0
+        self._max_depth = limits.max_xml_depth
+        self._max_attributes = limits.max_xml_attributes
+        self._max_text = limits.max_xml_text_length
+
+    def start(self, tag: str, attrs: Mapping[str, str]) -> ET.Element:
+        depth = self._depth + 1
+        if depth > self._max_depth:
+            raise XmlStructureError(CapReason.MAX_XML_DEPTH, depth)
+        cost = ELEMENT_BYTES
+        if attrs:
+            if len(attrs) > self._max_attributes:
+                raise XmlStructureError(CapReason.MAX_XML_ATTRIBUTES, len(attrs))
+            cost += ATTRIBUTE_TABLE_BYTES + ATTRIBUTE_BYTES * len(attrs)
+            for value in attrs.values():
+                if len(value) > self._max_text:
+                    raise XmlStructureError(CapReason.MAX_XML_TEXT_LENGTH, len(value))
+                cost += len(value) if value.isascii() else 4 * len(value)
+        self._charge(cost)
+        self._depth = depth
+        self._text_run = 0
+        return self._start(tag, attrs)
+
+    def end(self, tag: str) -> ET.Element:
+        self._depth -= 1
+        self._text_run = 0
+        return self._end(tag)
+
+    def data(self, data: str) -> None:
+        run = self._text_run + len(data)
+        if run > self._max_text:
+            raise XmlStructureError(CapReason.MAX_XML_TEXT_LENGTH, run)
+        self._text_run = run
+        self._charge(TEXT_BYTES + (len(data) if data.isascii() else 4 * len(data)))
+        self._data(data)
+
+
+class _HostStreamingBuilder(_StreamingTreeBuilder):
+    """Streaming target that hands each finished ``<host>`` to a callback.
+
+    Once the callback returns, the host is detached from its parent and the
+    memory charged for its subtree is credited back, so the live tree holds
+    at most one host however large the document is.
+    """
+
+    def __init__(
+        self,
+        budget: ParseMemoryBudget,
+        limits: NmapLimitConfig,
+        on_host: Callable[[ET.Element], None],
+    ) -> None:
+        super().__init__(budget, limits)
+        self._budget = budget
+        self._on_host = on_host
+        self._stack: list[ET.Element] = []
+        self._host_marks: list[int] = []
+        self._after_host = False
+
+    def start(self, tag: str, attrs: Mapping[str, str]) -> ET.Element:
+        used = self._budget.used
+        self._after_host = False
+        element = super().start(tag, attrs)
+        self._stack.append(element)
+        if tag == _HOST_TAG:
+            self._host_marks.append(used)
+        return element
+
+    def end(self, tag: str) -> ET.Element:
+        element = super().end(tag)
+        self._stack.pop()
+        self._after_host = tag == _HOST_TAG
+        if self._after_host:
+            self._on_host(element)
+            if self._stack:
+                self._stack[-1].remove(element)
+            self._budget.credit(self._budget.used - self._host_marks.pop())
+        return element
+
+    def data(self, data: str) -> None:
+        # Text after </host> would become the detached host's tail; drop it.
+        if not self._after_host:
+            super().data(data)
+
+
+def _screen_xml_text(xml_text: str) -> None:
+    """Reject DTD and entity declarations before any XML is parsed."""
+
+    if _UNSAFE_XML_PATTERN.search(xml_text):
+        raise ValueError("XML payload contains forbidden declarations.")
+
+
+class _ChunkScreen:
+    """Run the declaration screen over chunks, overlapping chunk borders.
 
-def parse_xml_safely(xml_bytes: bytes) -> ET.Element:
+    Every forbidden declaration starts with ``<!DOCTYPE`` or ``<!ENTITY``,
+    so carrying a short tail of the previous chunk is enough to catch one
+    split across two chunks.
+    """
+
+    def __init__(self) -> None:
+        self._tail = ""
+
+    def feed(self, chunk: str) -> None:
+        window = self._tail + chunk
+        _screen_xml_text(window)
+        self._tail = window[-_SCREEN_OVERLAP_CHARS:]
+
+
+def _feed_xml(parser: ET.XMLParser, chunks: Iterable[str]) -> ET.Element:
+    try:
+        for chunk in chunks:
+            parser.feed(chunk)
+        return parser.close()
+    except (DefusedXmlException, ET.ParseError) as exc:
+        raise ValueError("Malformed XML payload.") from exc
+
+
+def parse_xml_safely(
+    xml_bytes: bytes,
+    limits: NmapLimitConfig | None = None,
+    budget: ParseMemoryBudget | None = None,
+) -> ET.Element:
     """
     Deserialize XML bytes using an XXE-safe boundary.
 
     Over-limit payloads, invalid UTF-8, and DTD/entity declarations raise a
     :class:`ValueError` with a sanitized message so errors can be surfaced safely.
+    ``limits`` defaults to the process-wide snapshot. The tree is built through
+    a streaming target that charges ``budget`` (a fresh per-parse budget when
+    omitted) and aborts with :class:`ParseMemoryError` once it is spent, or
+    with :class:`XmlStructureError` on excessive depth, attribute count or
+    text length.
     """
 
-    max_bytes = NmapLimitConfig.from_env().max_xml_bytes
-    if len(xml_bytes) > max_bytes:
+    limits = limits or get_limit_config()
+    if len(xml_bytes) > limits.max_xml_bytes:
         raise ValueError("XML payload exceeds the maximum allowed size.")
 
     try:
@@ -52,24 +226,28 @@ def parse_xml_safely(xml_bytes: bytes) -> ET.Element:
     except UnicodeDecodeError as exc:
         raise ValueError("XML payload is not valid UTF-8.") from exc
 
-    if _UNSAFE_XML_PATTERN.search(xml_text):
-        raise ValueError("XML payload contains forbidden declarations.")
-
-    parser = _defused_fromstring or ET.fromstring
-    try:
-        return parser(xml_text)
-    except (DefusedXmlException, ET.ParseError) as exc:
-        raise ValueError("Malformed XML payload.") from exc
+    _screen_xml_text(xml_text)
+    budget = budget or ParseMemoryBudget(limits.max_parse_memory_bytes)
+    budget.charge(len(xml_bytes) + estimate_text_bytes(xml_text))
+    parser_cls = _DefusedXMLParser or ET.XMLParser
+    parser = parser_cls(target=_StreamingTreeBuilder(budget, limits))
+    return _feed_xml(parser, (xml_text,))
 
 
 @dataclass(frozen=True)
 class ParsedFinding:
-    """Minimal PUBLIC-safe finding representation."""
+    """Minimal PUBLIC-safe finding representation.
+
+    ``title`` and ``detail`` are redacted on construction unless the caller
+    assembled them exclusively from already-redacted pieces joined by
+    separators that no identifier can span (``_redacted=True``).
+    """
 
     title: str
     detail: str
     confidence: str
     _sort_key: tuple[int, int, str, str] = field(default=(0, 0, "", ""))
+    _redacted: bool = field(default=False, repr=False, compare=False)
 
     def to_mapping(self) -> dict[str, str]:
         return {
@@ -79,6 +257,8 @@ class ParsedFinding:
         }
 
     def __post_init__(self) -> None:
+        if self._redacted:
+            return
         object.__setattr__(self, "title", redact_identifiers(self.title))
         object.__setattr__(self, "detail", redact_identifiers(self.detail))
 
@@ -119,9 +299,15 @@ class ParsedNmapResult:
 
 
 class NmapParser(Protocol):
-    """Parser contract that drivers must implement."""
+    """Parser contract that drivers must implement.
 
-    def parse(self, payload: bytes) -> ParsedNmapResult: ...
+    ``limits`` is the request's resolved limit set; parsers fall back to the
+    process-wide snapshot when it is omitted.
+    """
+
+    def parse(
+        self, payload: bytes, limits: NmapLimitConfig | None = None
+    ) -> ParsedNmapResult: ...
 
 
 class NoopNmapParser(NmapParser):
@@ -129,19 +315,35 @@ class NoopNmapParser(NmapParser):
 
     VERSION = "noop-0.1"
 
-    def parse(self, payload: bytes) -> ParsedNmapResult:
+    def parse(
+        self, payload: bytes, limits: NmapLimitConfig | None = None
+    ) -> ParsedNmapResult:
         return ParsedNmapResult(parsed=False, findings=(), parser_version=self.VERSION)
 
 
 class SyntheticNmapParser(NmapParser):
-    """Synthetic parser for developer payloads that already avoid identifiers."""
+    """Synthetic parser for developer payloads that already avoid identifiers.
+
+    Payloads made only of ``PORT_OPEN`` lines (space or tab padded, ``\\n`` or
+    ``\\r\\n`` separated, blank lines allowed) are validated and extracted in
+    one ``finditer`` pass over the whole text. Any other payload, including
+    one with identifier-bearing lines to skip, takes the line-by-line path;
+    both produce the same findings.
+    """
 
     VERSION = "synthetic_v1"
     _PORT_PATTERN = re.compile(
         r"^PORT_OPEN\s+(\d{1,5})/tcp\s+service=([a-z]+)$", re.IGNORECASE
     )
+    _BULK_LINE = re.compile(
+        r"[ \t]*(?:PORT_OPEN[ \t]+(\d{1,5})/tcp[ \t]+service=([a-z]+)[ \t]*)?"
+        r"\r?(?:\n|\Z)",
+        re.IGNORECASE,
+    )
 
-    def parse(self, payload: bytes) -> ParsedNmapResult:
+    def parse(
+        self, payload: bytes, limits: NmapLimitConfig | None = None
+    ) -> ParsedNmapResult:
         if not payload:
             return ParsedNmapResult(
                 parsed=False, findings=(), parser_version=self.VERSION
@@ -152,8 +354,47 @@ class SyntheticNmapParser(NmapParser):
         except UnicodeDecodeError as exc:
             raise ValueError("Synthetic payload is not valid UTF-8.") from exc
 
-        findings: list[ParsedFinding] = []
-        line_index = 0
+        ports = self._bulk_ports(text)
+        if ports is None:
+            ports = self._line_ports(text)
+        findings = tuple(
+            ParsedFinding(
+                title=f"Port {port} open",
+                detail=f"{service.lower()} service noted on TCP/{port}",
+                confidence="medium",
+                _sort_key=(0, line_index, int(port), service.lower()),
+                # Digits and ASCII letters only: nothing to redact.
+                _redacted=True,
+            )
+            for line_index, (port, service) in enumerate(ports)
+        )
+        parsed = bool(findings)
+        return ParsedNmapResult(
+            parsed=parsed, findings=findings, parser_version=self.VERSION
+        )
+
+    def _bulk_ports(self, text: str) -> list[tuple[str, str]] | None:
+        """Extract every ``(port, service)`` in one pass, or ``None``.
+
+        Matches must tile the text: a gap means a line the bulk pattern
+        rejects, which is left to :meth:`_line_ports` to skip or refuse.
+        """
+
+        ports: list[tuple[str, str]] = []
+        position = 0
+        for match in self._BULK_LINE.finditer(text):
+            if match.start() != position:
+                return None
+            position = match.end()
+            port, service = match.groups()
+            if port is not None:
+                ports.append((port, service))
+        if position != len(text):
+            return None
+        return ports
+
+    def _line_ports(self, text: str) -> list[tuple[str, str]]:
+        ports: list[tuple[str, str]] = []
         for line in text.splitlines():
             line = line.strip()
             if not line:
@@ -164,98 +405,124 @@ class SyntheticNmapParser(NmapParser):
             if not match:
                 raise ValueError("Synthetic payload line malformed.")
             port, service = match.groups()
-            sort_key = (0, line_index, int(port), service.lower())
-            line_index += 1
-            findings.append(
-                ParsedFinding(
-                    title=f"Port {port} open",
-                    detail=f"{service.lower()} service noted on TCP/{port}",
-                    confidence="medium",
-                    _sort_key=sort_key,
-                )
-            )
-
-        parsed = bool(findings)
-        return ParsedNmapResult(
-            parsed=parsed, findings=tuple(findings), parser_version=self.VERSION
-        )
+            ports.append((port, service))
+        return ports
 
 
 class SafeNmapXmlParser(NmapParser):
-    """Placeholder parser that enforces the XML safety boundary."""
+    """Placeholder parser that enforces the XML safety boundary.
+
+    The tree is built under a governor admission like any real parse, so the
+    aggregate parse memory budget applies to it too, and structural and
+    memory caps are audited the same way.
+    """
 
     VERSION = "safe-xml-0.1"
 
-    def parse(self, payload: bytes) -> ParsedNmapResult:
-        parse_xml_safely(payload)
+    def parse(
+        self, payload: bytes, limits: NmapLimitConfig | None = None
+    ) -> ParsedNmapResult:
+        limits = limits or get_limit_config()
+        with _admitted_tree(payload, limits, _LimitTracker(limits)):
+            pass
         return ParsedNmapResult(parsed=False, findings=(), parser_version=self.VERSION)
 
 
-class MinimalNmapXmlParser(NmapParser):
-    """Minimal real parser for a safe subset of Nmap XML."""
+def _open_port_finding(
+    protocol: str,
+    port_id: str,
+    detail_parts: list[str],
+    host_index: int,
+    port_index: int,
+    host_context: tuple[str, ...],
+) -> ParsedFinding:
+    """Build the PUBLIC finding for one open port of any scan format.
 
-    VERSION = "real-minimal-0.2"
+    ``detail_parts`` starts with the service name; ``host_context`` holds
+    already-redacted host entries.
+    """
+
+    # Identifiers never span spaces, "/", "=" or ";", so redacting each
+    # piece equals redacting the assembled detail. The service fragment
+    # repeats across ports and is memoized process-wide.
+    service_fragment = SERVICE_FRAGMENT_CACHE.redact(" ".join(detail_parts))
+    safe_port_id = redact_identifiers(port_id)
+    detail = f"{service_fragment} service noted on {protocol.upper()}/{safe_port_id}"
+    if host_context:
+        detail = f"{detail} host={'; '.join(host_context)}"
+    try:
+        port_number = int(port_id)
+    except ValueError:
+        port_number = 0
+    sort_key = (
+        host_index,
+        port_index,
+        port_number,
+        detail_parts[0].lower(),
+    )
+    return ParsedFinding(
+        title=f"Port {safe_port_id} open",
+        detail=detail,
+        confidence="medium",
+        _sort_key=sort_key,
+        _redacted=True,
+    )
 
-    def parse(self, payload: bytes) -> ParsedNmapResult:
-        root = parse_xml_safely(payload)
-        tracker = _LimitTracker(NmapLimitConfig.from_env())
-        findings = list(self._collect_findings(root, tracker))
 
-        parsed = bool(findings)
+class _TrackedNmapParser(NmapParser, ABC):
+    """Limit enforcement and port collection shared by the real parsers.
+
+    Subclasses turn one port entry of their format into a finding with
+    :meth:`_finding_from_port` (usually via :func:`_open_port_finding`); the
+    host, port, findings and deadline caps are applied here so every format
+    reports them identically.
+    """
+
+    VERSION = ""
+
+    def _result(
+        self, findings: list[ParsedFinding], tracker: _LimitTracker
+    ) -> ParsedNmapResult:
         cap_info = tracker.to_cap_info() if tracker.cap_reason else None
         return ParsedNmapResult(
-            parsed=parsed,
+            parsed=bool(findings),
             findings=tuple(findings),
             parser_version=self.VERSION,
             cap_info=cap_info,
         )
 
-    def _collect_findings(
-        self, root: ET.Element, tracker: _LimitTracker
-    ) -> list[ParsedFinding]:
-        findings: list[ParsedFinding] = []
-        for host_index, host in enumerate(root.findall(".//host")):
-            if tracker.hosts_processed >= tracker.max_hosts:
-                self._raise_limit(CapReason.MAX_HOSTS, tracker)
-            if not self._is_host_up(host):
-                continue
-            tracker.hosts_processed += 1
-            host_context = self._build_host_context(host)
-            ports = host.find("ports")
-            if ports is None:
-                continue
-            stop_due_to_findings = self._collect_ports(
-                ports, host_index, host_context, tracker, findings
-            )
-            if stop_due_to_findings:
-                break
-        return findings
+    def _start_host(self, tracker: _LimitTracker) -> None:
+        """Fail once ``max_hosts`` hosts were collected."""
 
-    @staticmethod
-    def _is_host_up(host: ET.Element) -> bool:
-        status = host.find("status")
-        if status is None:
-            return True
-        return status.get("state", "").lower() == "up"
+        if tracker.hosts_processed >= tracker.max_hosts:
+            self._raise_limit(CapReason.MAX_HOSTS, tracker)
 
     def _collect_ports(
         self,
-        ports: ET.Element,
+        ports: Iterable[Any],
         host_index: int,
         host_context: tuple[str, ...],
         tracker: _LimitTracker,
         findings: list[ParsedFinding],
+        ports_seen: int = 0,
     ) -> bool:
-        ports_seen = 0
-        for port_index, port_elem in enumerate(ports.findall("port")):
+        """Collect a host's port entries; True means stop collecting.
+
+        ``ports_seen`` continues the host's port count for formats that
+        report one port per record.
+        """
+
+        for port in ports:
+            self._check_deadline(tracker)
             if ports_seen >= tracker.max_ports_per_host:
                 self._raise_limit(CapReason.MAX_PORTS, tracker)
+            port_index = ports_seen
             ports_seen += 1
             tracker.ports_processed += 1
             if tracker.findings_processed >= tracker.max_findings:
-                self._raise_limit(CapReason.MAX_FINDINGS, tracker)
+                return self._findings_capped(tracker)
             finding = self._finding_from_port(
-                port_elem,
+                port,
                 host_index,
                 port_index,
                 host_context,
@@ -265,9 +532,186 @@ class MinimalNmapXmlParser(NmapParser):
             findings.append(finding)
             tracker.findings_processed += 1
             if tracker.findings_processed >= tracker.max_findings:
-                self._raise_limit(CapReason.MAX_FINDINGS, tracker)
+                return self._findings_capped(tracker)
         return False
 
+    @classmethod
+    def _findings_capped(cls, tracker: _LimitTracker) -> bool:
+        """Stop at the findings cap: truncate in the lab profile, else fail."""
+
+        if not tracker.config.lab_profile:
+            cls._raise_limit(CapReason.MAX_FINDINGS, tracker)
+        tracker.mark_limit(CapReason.MAX_FINDINGS)
+        return True
+
+    @staticmethod
+    @abstractmethod
+    def _finding_from_port(
+        port: Any,
+        host_index: int,
+        port_index: int,
+        host_context: tuple[str, ...],
+    ) -> ParsedFinding | None:
+        """Build the finding for one port entry, or ``None`` to skip it."""
+
+    @classmethod
+    def _check_deadline(cls, tracker: _LimitTracker) -> None:
+        """Cap the parse once it has run past the request's deadline."""
+
+        elapsed_ms = tracker.elapsed_ms()
+        if elapsed_ms > tracker.config.parse_deadline_ms:
+            tracker.observed = elapsed_ms
+            cls._raise_limit(CapReason.PARSE_DEADLINE, tracker)
+
+    @staticmethod
+    def _raise_limit(reason: CapReason, tracker: _LimitTracker) -> NoReturn:
+        tracker.mark_limit(reason)
+        limits = {
+            "max_payload_bytes": tracker.max_payload_bytes,
+            "max_hosts": tracker.max_hosts,
+            "max_ports_per_host": tracker.max_ports_per_host,
+            "max_findings": tracker.max_findings,
+        }
+        counts_seen = {
+            "hosts_processed": tracker.hosts_processed,
+            "ports_processed": tracker.ports_processed,
+            "findings_processed": tracker.findings_processed,
+        }
+        detail = _CAP_DETAIL_FIELDS.get(reason)
+        if detail is not None:
+            limit_name, seen_name = detail
+            limits[limit_name] = getattr(tracker.config, limit_name)
+            counts_seen[seen_name] = tracker.observed
+        record_cap_event(
+            reason=reason.value,
+            limits=limits,
+            counts_seen=counts_seen,
+            counts_returned={
+                "hosts_returned": 0,
+                "ports_returned": 0,
+                "findings_returned": 0,
+            },
+        )
+        if reason is CapReason.PARSE_DEADLINE:
+            raise ParserTimeoutError("XML parsing ran past its deadline.")
+        raise ParserLimitError("XML parsing limits exceeded.")
+
+
+@contextmanager
+def _admitted_tree(
+    payload: bytes, limits: NmapLimitConfig, tracker: _LimitTracker
+) -> Iterator[ET.Element]:
+    """Build the tree of ``payload`` under a governor admission held for the block.
+
+    Structural and memory caps hit while building raise the same audited
+    :class:`ParserLimitError` as the other parser caps.
+    """
+
+    with PARSE_MEMORY_GOVERNOR.admit(len(payload), limits) as budget:
+        try:
+            root = parse_xml_safely(payload, limits, budget)
+        except XmlStructureError as exc:
+            tracker.observed = exc.observed
+            _TrackedNmapParser._raise_limit(exc.reason, tracker)
+        except ParseMemoryError:
+            tracker.observed = budget.used
+            _TrackedNmapParser._raise_limit(CapReason.MAX_PARSE_MEMORY, tracker)
+        yield root
+
+
+class MinimalNmapXmlParser(_TrackedNmapParser):
+    """Minimal real parser for a safe subset of Nmap XML."""
+
+    VERSION = "real-minimal-0.2"
+
+    def parse(
+        self, payload: bytes, limits: NmapLimitConfig | None = None
+    ) -> ParsedNmapResult:
+        limits = limits or get_limit_config()
+        tracker = _LimitTracker(limits)
+        with _admitted_tree(payload, limits, tracker) as root:
+            self._check_deadline(tracker)
+            findings = list(self._collect_findings(root, tracker))
+        return self._result(findings, tracker)
+
+    def parse_stream(
+        self,
+        chunks: Iterable[str],
+        payload_bytes: int,
+        limits: NmapLimitConfig | None = None,
+    ) -> ParsedNmapResult:
+        """Parse XML text chunk by chunk, one host at a time.
+
+        Used by the lab profile; the caller accounts the payload size while
+        producing ``chunks`` and drains whatever is left once the findings
+        cap stops the parse. See :class:`NmapXmlStream`.
+        """
+
+        stream = self.open_stream(payload_bytes, limits)
+        try:
+            for chunk in chunks:
+                stream.feed(chunk)
+                if stream.stopped:
+                    break
+            return stream.close()
+        finally:
+            stream.release()
+
+    def open_stream(
+        self,
+        payload_bytes: int,
+        limits: NmapLimitConfig | None = None,
+        on_findings: Callable[[list[ParsedFinding]], None] | None = None,
+    ) -> NmapXmlStream:
+        """Start a push-style parse; ``payload_bytes`` sizes the admission.
+
+        ``on_findings`` receives each host's findings as soon as it closes.
+        """
+
+        return NmapXmlStream(
+            self, payload_bytes, limits or get_limit_config(), on_findings
+        )
+
+    def _collect_findings(
+        self, root: ET.Element, tracker: _LimitTracker
+    ) -> list[ParsedFinding]:
+        findings: list[ParsedFinding] = []
+        for host_index, host in enumerate(root.findall(".//host")):
+            self._check_deadline(tracker)
+            if self._collect_host(host, host_index, tracker, findings):
+                break
+        return findings
+
+    def _collect_host(
+        self,
+        host: ET.Element,
+        host_index: int,
+        tracker: _LimitTracker,
+        findings: list[ParsedFinding],
+    ) -> bool:
+        """Collect one host's findings; True means stop collecting."""
+
+        self._start_host(tracker)
+        if not self._is_host_up(host):
+            return False
+        tracker.hosts_processed += 1
+        host_context = tuple(
+            redact_identifiers(entry) for entry in self._build_host_context(host)
+        )
+        ports = host.find("ports")
+        if ports is None:
+            return False
+        return self._collect_ports(
+            ports.findall("port"), host_index, host_context, tracker, findings
+        )
+
+    @staticmethod
+    def _is_host_up(host: ET.Element) -> bool:
+        status = host.find("status")
+        if status is None:
+            return True
+        return status.get("state", "").lower() == "up"
+
     @staticmethod
     def _finding_from_port(
         port_elem: ET.Element,
@@ -295,26 +739,8 @@ class MinimalNmapXmlParser(NmapParser):
             value = service_elem.get(attr)
             if value:
                 detail_parts.append(value)
-        detail = (
-            f"{' '.join(detail_parts)} service noted on {protocol.upper()}/{port_id}"
-        )
-        if host_context:
-            detail = f"{detail} host={'; '.join(host_context)}"
-        try:
-            port_number = int(port_id)
-        except ValueError:
-            port_number = 0
-        sort_key = (
-            host_index,
-            port_index,
-            port_number,
-            service_name.lower(),
-        )
-        return ParsedFinding(
-            title=f"Port {port_id} open",
-            detail=detail,
-            confidence="medium",
-            _sort_key=sort_key,
+        return _open_port_finding(
+            protocol, port_id, detail_parts, host_index, port_index, host_context
         )
 
     @staticmethod
@@ -334,35 +760,459 @@ class MinimalNmapXmlParser(NmapParser):
                     context.append(f"hostname:{name}")
         return tuple(context)
 
+
+class NmapXmlStream:
+    """Push-style parse of one document fed as text chunks.
+
+    Chunks go through the declaration screen and straight into the parser.
+    Each ``<host>`` is collected as soon as it closes and then dropped, so
+    memory stays bounded by the largest host rather than the document. The
+    memory reservation is held until :meth:`close` or :meth:`release`, and
+    the parse deadline only runs while a chunk is being parsed, so a stream
+    can wait between chunks (e.g. for the next chunk of an upload).
+
+    Once the lab findings cap is reached (:attr:`stopped`), later chunks are
+    neither screened nor parsed: nothing in them can reach the result, so
+    the caller only has to account their size and digest.
+    """
+
+    def __init__(
+        self,
+        owner: MinimalNmapXmlParser,
+        payload_bytes: int,
+        limits: NmapLimitConfig,
+        on_findings: Callable[[list[ParsedFinding]], None] | None = None,
+    ) -> None:
+        self._owner = owner
+        self._on_findings = on_findings
+        self._tracker = _LimitTracker(limits)
+        self._findings: list[ParsedFinding] = []
+        self._host_indexes = itertools.count()
+        self._stopped = False
+        self._screen = _ChunkScreen()
+        self._budget = PARSE_MEMORY_GOVERNOR.reserve(payload_bytes, limits)
+        parser_cls = _DefusedXMLParser or ET.XMLParser
+        target = _HostStreamingBuilder(self._budget, limits, self._on_host)
+        self._parser = parser_cls(target=target)
+        self._tracker.pause()
+
+    def feed(self, chunk: str) -> None:
+        """Screen and parse one chunk; any error releases the stream."""
+
+        self._run(self._feed_chunk, chunk)
+
+    def close(self) -> ParsedNmapResult:
+        """Finish the document and return its findings."""
+
+        if not self._stopped:
+            self._run(self._parser.close)
+        self.release()
+        return self._owner._result(self._findings, self._tracker)
+
+    def release(self) -> None:
+        """Return the memory reservation (idempotent)."""
+
+        self._budget.release()
+
+    @property
+    def stopped(self) -> bool:
+        """True once the findings cap ended collection."""
+
+        return self._stopped
+
+    def _feed_chunk(self, chunk: str) -> None:
+        if self._stopped:
+            return
+        self._screen.feed(chunk)
+        self._parser.feed(chunk)
+
+    def _on_host(self, host: ET.Element) -> None:
+        host_index = next(self._host_indexes)
+        self._owner._check_deadline(self._tracker)
+        if self._stopped:
+            return
+        before = len(self._findings)
+        self._stopped = self._owner._collect_host(
+            host, host_index, self._tracker, self._findings
+        )
+        if self._on_findings is not None and len(self._findings) > before:
+            self._on_findings(self._findings[before:])
+
+    def _run(self, step: Callable[..., object], *args: str) -> None:
+        tracker = self._tracker
+        tracker.resume()
+        try:
+            try:
+                step(*args)
+            except (DefusedXmlException, ET.ParseError) as exc:
+                raise ValueError("Malformed XML payload.") from exc
+            except XmlStructureError as exc:
+                tracker.observed = exc.observed
+                self._owner._raise_limit(exc.reason, tracker)
+            except ParseMemoryError:
+                tracker.observed = self._budget.used
+                self._owner._raise_limit(CapReason.MAX_PARSE_MEMORY, tracker)
+        except Exception:
+            self.release()
+            raise
+        finally:
+            tracker.pause()
+
+
+def _iter_lines(chunks: Iterable[str]) -> Iterator[str]:
+    """Yield the lines of text arriving in ``chunks``, one line at a time.
+
+    Only the unfinished last line of a chunk is carried over, so memory is
+    bounded by the longest line rather than the payload.
+    """
+
+    pending = ""
+    for chunk in chunks:
+        text = pending + chunk
+        start = 0
+        while (end := text.find("\n", start)) != -1:
+            yield text[start:end]
+            start = end + 1
+        pending = text[start:]
+    if pending:
+        yield pending
+
+
+class NmapLineParser(_TrackedNmapParser):
+    """Shared streaming core for line-oriented scan formats.
+
+    Subclasses handle one line at a time in :meth:`_collect_line` with a
+    per-parse state from :meth:`_new_state`; no tree is built, so lines are
+    processed as they arrive and the payload is never split into a list.
+    """
+
+    FORMAT_LABEL = "Scan"
+
+    def parse(
+        self, payload: bytes, limits: NmapLimitConfig | None = None
+    ) -> ParsedNmapResult:
+        limits = limits or get_limit_config()
+        if len(payload) > limits.max_xml_bytes:
+            raise ValueError(
+                f"{self.FORMAT_LABEL} payload exceeds the maximum allowed size."
+            )
+        try:
+            text = payload.decode("utf-8")
+        except UnicodeDecodeError as exc:
+            raise ValueError(
+                f"{self.FORMAT_LABEL} payload is not valid UTF-8."
+            ) from exc
+        return self.parse_stream((text,), len(payload), limits)
+
+    def parse_stream(
+        self,
+        chunks: Iterable[str],
+        payload_bytes: int,
+        limits: NmapLimitConfig | None = None,
+    ) -> ParsedNmapResult:
+        """Parse text chunk by chunk; the caller accounts the payload size.
+
+        ``payload_bytes`` is accepted for parity with
+        :meth:`MinimalNmapXmlParser.parse_stream`; line parsers build no
+        tree and take no parse memory reservation.
+        """
+
+        tracker = _LimitTracker(limits or get_limit_config())
+        findings: list[ParsedFinding] = []
+        state = self._new_state()
+        for line in _iter_lines(chunks):
+            self._check_deadline(tracker)
+            line = line.strip()
+            if line and self._collect_line(line, state, tracker, findings):
+                break
+        return self._result(findings, tracker)
+
+    def _malformed(self) -> ValueError:
+        return ValueError(f"{self.FORMAT_LABEL} payload line malformed.")
+
+    def _new_state(self) -> Any:
+        return None
+
+    @abstractmethod
+    def _collect_line(
+        self,
+        line: str,
+        state: Any,
+        tracker: _LimitTracker,
+        findings: list[ParsedFinding],
+    ) -> bool:
+        """Collect one non-empty line's findings; True means stop collecting."""
+
+
+_GREPABLE_HOST_PATTERN = re.compile(r"Host: (\S+) \(([^)]*)\)")
+"""First tab-separated field of a grepable host line: address and hostname."""
+
+_GREPABLE_PORTS_KEY = "Ports"
+"""Field of a grepable host line that lists the host's ports."""
+
+_GREPABLE_PORT_SEPARATOR = re.compile(r",\s*(?=\d+/)")
+"""Separator between port entries (version text may itself contain commas)."""
+
+_GREPABLE_PORT_FIELDS = 7
+"""Slash-separated port entry fields, from the port number to the version."""
+
+
+class NmapGrepableParser(NmapLineParser):
+    """Parser for Nmap grepable output (``-oG``).
+
+    Each ``Host:`` line with a ``Ports:`` field is one host; ``Status:``
+    lines and ``#`` comments are skipped. Port entries become the same
+    findings as their XML counterparts, under the same caps and redaction.
+    """
+
+    VERSION = "grepable-0.1"
+    FORMAT_LABEL = "Grepable"
+
+    def _new_state(self) -> Iterator[int]:
+        return itertools.count()
+
+    def _collect_line(
+        self,
+        line: str,
+        host_indexes: Iterator[int],
+        tracker: _LimitTracker,
+        findings: list[ParsedFinding],
+    ) -> bool:
+        if line.startswith("#"):
+            return False
+        fields = line.split("\t")
+        match = _GREPABLE_HOST_PATTERN.fullmatch(fields[0])
+        if match is None:
+            raise self._malformed()
+        ports = self._ports_field(fields[1:])
+        if ports is None:
+            return False
+        self._start_host(tracker)
+        tracker.hosts_processed += 1
+        address, hostname = match.groups()
+        host_context = tuple(
+            redact_identifiers(entry)
+            for entry in self._build_host_context(address, hostname)
+        )
+        return self._collect_ports(
+            _GREPABLE_PORT_SEPARATOR.split(ports),
+            next(host_indexes),
+            host_context,
+            tracker,
+            findings,
+        )
+
     @staticmethod
-    def _raise_limit(reason: CapReason, tracker: _LimitTracker) -> None:
-        tracker.mark_limit(reason)
-        record_cap_event(
-            reason=reason.value,
-            limits={
-                "max_payload_bytes": tracker.max_payload_bytes,
-                "max_hosts": tracker.max_hosts,
-                "max_ports_per_host": tracker.max_ports_per_host,
-                "max_findings": tracker.max_findings,
-            },
-            counts_seen={
-                "hosts_processed": tracker.hosts_processed,
-                "ports_processed": tracker.ports_processed,
-                "findings_processed": tracker.findings_processed,
-            },
-            counts_returned={
-                "hosts_returned": 0,
-                "ports_returned": 0,
-                "findings_returned": 0,
-            },
+    def _ports_field(fields: list[str]) -> str | None:
+        for field_text in fields:
+            key, _, value = field_text.partition(": ")
+            if key == _GREPABLE_PORTS_KEY:
+                return value.strip()
+        return None
+
+    @staticmethod
+    def _build_host_context(address: str, hostname: str) -> tuple[str, ...]:
+        addr_type = "ipv6" if ":" in address else "ipv4"
+        context = [f"{addr_type}:{address}"]
+        if hostname:
+            context.append(f"hostname:{hostname}")
+        return tuple(context)
+
+    @staticmethod
+    def _finding_from_port(
+        port: str,
+        host_index: int,
+        port_index: int,
+        host_context: tuple[str, ...],
+    ) -> ParsedFinding | None:
+        fields = port.split("/")
+        if len(fields) < _GREPABLE_PORT_FIELDS:
+            raise ValueError("Grepable port entry malformed.")
+        port_id, state, protocol, _owner, service_name, _rpc, version = fields[
+            :_GREPABLE_PORT_FIELDS
+        ]
+        protocol = protocol.lower()
+        if protocol not in {"tcp", "udp"} or state.lower() != "open":
+            return None
+        if not port_id or not service_name:
+            return None
+        detail_parts = [service_name]
+        if version:
+            detail_parts.append(version)
+        return _open_port_finding(
+            protocol, port_id, detail_parts, host_index, port_index, host_context
         )
-        raise ParserLimitError("XML parsing limits exceeded.")
+
+
+_MASSCAN_SERVICE = "unknown"
+"""Service name for masscan ports (masscan does not fingerprint services)."""
+
+_MASSCAN_OPEN = "open"
+"""Port status reported for open ports in both masscan formats."""
+
+_MASSCAN_JSON_FRAMING = frozenset({"[", "]", ","})
+"""Lines that only frame the records of a masscan ``-oJ`` array."""
+
+_MASSCAN_BANNER = "banner"
+"""Record kind of a masscan ``-oL`` banner line."""
+
+_MASSCAN_LIST_STATUSES = frozenset({"open", "closed", _MASSCAN_BANNER})
+"""Record kinds of a masscan ``-oL`` line."""
+
+
+class _MasscanHost:
+    """Per-address state kept while a masscan payload streams."""
+
+    __slots__ = ("index", "context", "ports_seen")
+
+    def __init__(self, index: int, context: tuple[str, ...]) -> None:
+        self.index = index
+        self.context = context
+        self.ports_seen = 0
+
+
+class MasscanParser(NmapLineParser):
+    """Shared core for masscan output, which reports one port per record.
+
+    Records are grouped by address as they stream, so ``max_hosts`` counts
+    distinct addresses and ``max_ports_per_host`` their ports; the state
+    kept per address is bounded by ``max_hosts``. Banner records carry no
+    port state and are skipped. Masscan does not identify services, so
+    findings name the service ``unknown``.
+    """
+
+    VERSION = "masscan-0.1"
+    FORMAT_LABEL = "Masscan"
+
+    def _new_state(self) -> dict[str, _MasscanHost]:
+        return {}
+
+    @abstractmethod
+    def _records(self, line: str) -> Iterable[tuple[str, str, str, str]]:
+        """Return ``(address, status, protocol, port)`` records on ``line``."""
+
+    def _collect_line(
+        self,
+        line: str,
+        hosts: dict[str, _MasscanHost],
+        tracker: _LimitTracker,
+        findings: list[ParsedFinding],
+    ) -> bool:
+        for address, status, protocol, port_id in self._records(line):
+            host = hosts.get(address)
+            if host is None:
+                self._start_host(tracker)
+                tracker.hosts_processed += 1
+                addr_type = "ipv6" if ":" in address else "ipv4"
+                context = (redact_identifiers(f"{addr_type}:{address}"),)
+                host = hosts[address] = _MasscanHost(len(hosts), context)
+            stop = self._collect_ports(
+                ((status, protocol, port_id),),
+                host.index,
+                host.context,
+                tracker,
+                findings,
+                ports_seen=host.ports_seen,
+            )
+            host.ports_seen += 1
+            if stop:
+                return True
+        return False
+
+    @staticmethod
+    def _finding_from_port(
+        port: tuple[str, str, str],
+        host_index: int,
+        port_index: int,
+        host_context: tuple[str, ...],
+    ) -> ParsedFinding | None:
+        status, protocol, port_id = port
+        if status != _MASSCAN_OPEN or protocol not in {"tcp", "udp"}:
+            return None
+        return _open_port_finding(
+            protocol,
+            port_id,
+            [_MASSCAN_SERVICE],
+            host_index,
+            port_index,
+            host_context,
+        )
+
+
+class MasscanJsonParser(MasscanParser):
+    """Parser for masscan JSON output (``-oJ``, one record per line)."""
+
+    FORMAT_LABEL = "Masscan JSON"
+
+    def _records(self, line: str) -> Iterable[tuple[str, str, str, str]]:
+        line = line.strip(",")
+        if not line or line in _MASSCAN_JSON_FRAMING:
+            return ()
+        try:
+            record = json.loads(line)
+            address = record["ip"]
+            ports = record["ports"]
+            entries = [
+                (port["status"], port["proto"], port["port"])
+                for port in ports
+                if "status" in port
+            ]
+        except (ValueError, KeyError, TypeError) as exc:
+            raise self._malformed() from exc
+        if not isinstance(address, str) or not all(
+            isinstance(status, str)
+            and isinstance(protocol, str)
+            and isinstance(port_id, int)
+            for status, protocol, port_id in entries
+        ):
+            raise self._malformed()
+        return [
+            (address, status.lower(), protocol.lower(), str(port_id))
+            for status, protocol, port_id in entries
+        ]
+
+
+class MasscanListParser(MasscanParser):
+    """Parser for masscan list output (``-oL``).
+
+    Lines read ``<status> <protocol> <port> <address> <timestamp>``;
+    ``#`` lines are comments.
+    """
+
+    FORMAT_LABEL = "Masscan list"
+
+    def _records(self, line: str) -> Iterable[tuple[str, str, str, str]]:
+        if line.startswith("#"):
+            return ()
+        fields = line.split()
+        if len(fields) < 5 or fields[0] not in _MASSCAN_LIST_STATUSES:
+            raise self._malformed()
+        status, protocol, port_id, address = fields[:4]
+        if not port_id.isdigit():
+            raise self._malformed()
+        if status == _MASSCAN_BANNER:
+            return ()
+        return ((address, status, protocol.lower(), port_id),)
 
 
 class ParserLimitError(ValueError):
     """Raised when real XML parsing exceeds configured caps."""
 
 
+class ParserTimeoutError(ParserLimitError):
+    """Raised when real XML parsing runs past the request's deadline."""
+
+
+_CAP_DETAIL_FIELDS: dict[CapReason, tuple[str, str]] = {
+    CapReason.MAX_XML_DEPTH: ("max_xml_depth", "xml_depth"),
+    CapReason.MAX_XML_ATTRIBUTES: ("max_xml_attributes", "xml_attributes"),
+    CapReason.MAX_XML_TEXT_LENGTH: ("max_xml_text_length", "xml_text_length"),
+    CapReason.MAX_PARSE_MEMORY: ("max_parse_memory_bytes", "parse_memory_bytes"),
+    CapReason.PARSE_DEADLINE: ("parse_deadline_ms", "elapsed_ms"),
+}
+"""Extra limit/observed-value keys recorded for streaming caps."""
+
+
 class _LimitTracker:
     """Internal tracker that records how many elements were processed."""
 
@@ -371,6 +1221,10 @@ class _LimitTracker:
         self.max_ports_per_host = config.max_ports_per_host
         self.max_findings = config.max_findings
         self.max_payload_bytes = config.max_xml_bytes
+        self.config = config
+        self.observed = 0
+        self._started = time.monotonic()
+        self._paused_at: float | None = None
         self.hosts_processed = 0
         self.ports_processed = 0
         self.findings_processed = 0
@@ -385,6 +1239,21 @@ class _LimitTracker:
     def cap_reason(self) -> CapReason | None:
         return self._cap_reason
 
+    def pause(self) -> None:
+        """Stop the deadline clock until :meth:`resume`."""
+
+        self._paused_at = time.monotonic()
+
+    def resume(self) -> None:
+        if self._paused_at is not None:
+            self._started += time.monotonic() - self._paused_at
+            self._paused_at = None
+
+    def elapsed_ms(self) -> int:
+        """Milliseconds since the parse started (admission wait included)."""
+
+        return int((time.monotonic() - self._started) * 1000)
+
     def to_cap_info(self) -> CapInfo:
         """Expose the accumulated state as immutable metadata."""
 
@@ -406,9 +1275,6 @@ DEFAULT_PARSER: NmapParser = NoopNmapParser()
 XML_PARSER_ENV = "SCANSAGE_NMAP_XML_PARSER"
 """Env var used to opt into a safer XML parser implementation."""
 
-AUTHORIZED_LAB_ENV = "SCANSAGE_AUTHORIZED_LAB"
-"""Env var that enables authorized lab mode."""
-
 XML_PARSER_REGISTRY: dict[str, type[NmapParser]] = {
     "safe_xml": SafeNmapXmlParser,
     "real_minimal": MinimalNmapXmlParser,
@@ -416,18 +1282,14 @@ XML_PARSER_REGISTRY: dict[str, type[NmapParser]] = {
 """Registry enumerating supported XML parser implementations."""
 
 
-def _lab_mode_enabled() -> bool:
-    """Return True when authorized lab mode is on."""
-
-    return os.getenv(AUTHORIZED_LAB_ENV, "").lower() in {"1", "true", "yes"}
-
-
 def get_configured_nmap_parser() -> NmapParser:
     """
     Return the parser implementation requested via :mod:`XML_PARSER_ENV`.
 
     Authorized lab mode opts into :class:`MinimalNmapXmlParser` when the parser
     selection env var is absent; otherwise, fall back to :class:`NoopNmapParser`.
+    Lab mode is read from the :func:`get_limit_config` snapshot so the parser
+    and its limits always come from the same profile.
     """
 
     parser_choice = os.getenv(XML_PARSER_ENV)
@@ -436,7 +1298,7 @@ def get_configured_nmap_parser() -> NmapParser:
         if parser_cls:
             return parser_cls()
         raise ValueError("Requested parser is not supported.")
-    if _lab_mode_enabled():
+    if get_limit_config().lab_profile:
         parser_cls = XML_PARSER_REGISTRY.get("real_minimal")
         if parser_cls:
             return parser_cls()
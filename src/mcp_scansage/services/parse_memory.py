@@ -0,0 +1,218 @@
+"""Memory budgets for PUBLIC Nmap XML parses.
+
+Element counts and payload bytes do not bound RSS once several parses run at
+the same time, so parses also account an estimate of the tree they build.
+The XML boundary in :mod:`.nmap_parser` charges the estimate while the XML
+streams through its parser target (a fixed cost per element and attribute
+plus string sizes) against a per-parse budget. Each parse holds a
+reservation with the process-wide :class:`ParseMemoryGovernor`; new parses
+wait for capacity when the aggregate budget is exhausted and are refused
+once the deferral window ends.
+"""
+
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator
+
+from .nmap_limits import NmapLimitConfig, get_limit_config
+
+ELEMENT_BYTES = 96
+"""Estimated cost of one tree element (object plus its parent's child slot)."""
+
+ATTRIBUTE_TABLE_BYTES = 232
+"""Estimated cost of the attribute dict of an element that has attributes."""
+
+ATTRIBUTE_BYTES = 56
+"""Estimated per-attribute overhead (value string header and dict slot)."""
+
+TEXT_BYTES = 49
+"""Estimated string header for one text or tail chunk."""
+
+RESERVATION_FACTOR = 12
+"""Initial reservation per payload byte (typical Nmap XML tree expansion)."""
+
+RESERVATION_STEP_BYTES = 256 * 1024
+"""Granularity in which reservations are taken and extended."""
+
+
+class ParseMemoryError(ValueError):
+    """Raised when a parse outgrows its budget or cannot extend its reservation."""
+
+
+class ParseCapacityError(RuntimeError):
+    """Raised when a parse is not admitted before its deferral window closes."""
+
+
+def estimate_text_bytes(text: str) -> int:
+    """Estimate the characters of ``text`` (worst-case width for non-ASCII)."""
+
+    return len(text) if text.isascii() else 4 * len(text)
+
+
+class ParseMemoryBudget:
+    """Per-parse accountant, optionally backed by a governor reservation."""
+
+    def __init__(
+        self,
+        limit: int,
+        governor: ParseMemoryGovernor | None = None,
+        reserved: int = 0,
+    ) -> None:
+        self.limit = limit
+        self.used = 0
+        self._governor = governor
+        self._reserved = reserved
+        self._headroom = limit if governor is None else min(reserved, limit)
+
+    @property
+    def reserved(self) -> int:
+        return self._reserved
+
+    def charge(self, nbytes: int) -> None:
+        """Add ``nbytes`` to the estimate, extending the reservation if needed.
+
+        Raises:
+            ParseMemoryError: when the per-parse limit is crossed or the
+                governor has no capacity left for the extension.
+        """
+
+        used = self.used + nbytes
+        self.used = used
+        if used > self._headroom:
+            self._grow(used)
+
+    def credit(self, nbytes: int) -> None:
+        """Give back ``nbytes`` once the subtree they covered is discarded.
+
+        The reservation is kept, so a streaming parse reuses it for the next
+        subtree instead of returning it to the governor.
+        """
+
+        self.used -= nbytes
+
+    def release(self) -> None:
+        """Return the reservation to the governor (idempotent)."""
+
+        if self._governor is not None:
+            self._governor._release(self._reserved)
+            self._governor = None
+        self._reserved = 0
+
+    def _grow(self, used: int) -> None:
+        governor = self._governor
+        if used > self.limit or governor is None:
+            raise ParseMemoryError("XML parse exceeded its memory budget.")
+        step = min(
+            max(used - self._reserved, RESERVATION_STEP_BYTES),
+            self.limit - self._reserved,
+        )
+        if not governor.try_extend(step):
+            raise ParseMemoryError("Process parse memory budget is exhausted.")
+        self._reserved += step
+        self._headroom = self._reserved
+
+
+@dataclass(frozen=True)
+class ParseMemoryStats:
+    """Point-in-time counters for a :class:`ParseMemoryGovernor`."""
+
+    reserved_bytes: int
+    active_parses: int
+    deferred: int
+    rejected: int
+
+
+class ParseMemoryGovernor:
+    """Process-wide admission control over the aggregate parse memory budget.
+
+    ``capacity`` defaults to ``max_total_parse_memory_bytes`` from the limit
+    snapshot, read at every admission so a reload takes effect for new parses.
+    """
+
+    def __init__(self, capacity: int | None = None) -> None:
+        self._capacity = capacity
+        self._condition = threading.Condition()
+        self._reserved = 0
+        self._active = 0
+        self._deferred = 0
+        self._rejected = 0
+
+    def reserve(self, payload_bytes: int, limits: NmapLimitConfig) -> ParseMemoryBudget:
+        """Reserve memory for one parse, waiting up to ``parse_defer_ms``.
+
+        The caller must :meth:`~ParseMemoryBudget.release` the budget.
+
+        Raises:
+            ParseCapacityError: when the aggregate budget stays exhausted for
+                the whole deferral window.
+        """
+
+        wanted = min(
+            max(payload_bytes * RESERVATION_FACTOR, RESERVATION_STEP_BYTES),
+            limits.max_parse_memory_bytes,
+        )
+        reserved = self._acquire(wanted, limits.parse_defer_ms / 1000)
+        return ParseMemoryBudget(limits.max_parse_memory_bytes, self, reserved)
+
+    @contextmanager
+    def admit(
+        self, payload_bytes: int, limits: NmapLimitConfig
+    ) -> Iterator[ParseMemoryBudget]:
+        """Context-managed :meth:`reserve` that always releases the budget."""
+
+        budget = self.reserve(payload_bytes, limits)
+        try:
+            yield budget
+        finally:
+            budget.release()
+
+    def try_extend(self, nbytes: int) -> bool:
+        """Grow a running parse's reservation without waiting."""
+
+        with self._condition:
+            if not self._fits(nbytes):
+                return False
+            self._reserved += nbytes
+            return True
+
+    def stats(self) -> ParseMemoryStats:
+        with self._condition:
+            return ParseMemoryStats(
+                reserved_bytes=self._reserved,
+                active_parses=self._active,
+                deferred=self._deferred,
+                rejected=self._rejected,
+            )
+
+    def _capacity_bytes(self) -> int:
+        if self._capacity is not None:
+            return self._capacity
+        return get_limit_config().max_total_parse_memory_bytes
+
+    def _fits(self, nbytes: int) -> bool:
+        return self._reserved + nbytes <= self._capacity_bytes()
+
+    def _acquire(self, nbytes: int, timeout: float) -> int:
+        with self._condition:
+            nbytes = min(nbytes, self._capacity_bytes())
+            if not self._fits(nbytes):
+                self._deferred += 1
+                if not self._condition.wait_for(lambda: self._fits(nbytes), timeout):
+                    self._rejected += 1
+                    raise ParseCapacityError("Parser memory capacity is exhausted.")
+            self._reserved += nbytes
+            self._active += 1
+            return nbytes
+
+    def _release(self, nbytes: int) -> None:
+        with self._condition:
+            self._reserved -= nbytes
+            self._active -= 1
+            self._condition.notify_all()
+
+
+PARSE_MEMORY_GOVERNOR = ParseMemoryGovernor()
+"""Process-wide governor shared by every XML parse."""
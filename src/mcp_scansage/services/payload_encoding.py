@@ -0,0 +1,160 @@
+"""Decoding of compressed PUBLIC payloads (``payload_encoding``).
+
+Nmap XML compresses 10-20x, so clients may send ``gzip+base64`` instead of
+the raw text. The base64 layer is bounded by the request schema and decoded
+up front; the gzip layer is inflated in bounded blocks straight into the
+parser. Every inflated block is counted against ``max_xml_bytes`` before
+it is decoded, so an oversized payload stops early, and the ratio of
+inflated to consumed compressed bytes is capped so a decompression bomb is
+refused long before it reaches the size limit.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import codecs
+import zlib
+from collections import deque
+from contextlib import contextmanager
+from typing import Iterator
+
+from .payload_stream import PayloadAccountant
+
+IDENTITY_ENCODING = "identity"
+"""Payload is the XML text itself (default)."""
+
+GZIP_BASE64_ENCODING = "gzip+base64"
+"""Payload is base64 of a single gzip member holding the UTF-8 XML."""
+
+PAYLOAD_ENCODINGS = (IDENTITY_ENCODING, GZIP_BASE64_ENCODING)
+
+INPUT_BLOCK_BYTES = 16 * 1024
+"""Compressed bytes handed to the inflater per step."""
+
+OUTPUT_BLOCK_BYTES = 64 * 1024
+"""Most inflated bytes produced per step."""
+
+RATIO_FLOOR_BYTES = 64 * 1024
+"""Inflated size below which the ratio cap is not applied."""
+
+
+class DecompressionRatioError(ValueError):
+    """Raised when a payload inflates beyond the allowed ratio."""
+
+    def __init__(self, compressed_bytes: int, decompressed_bytes: int) -> None:
+        super().__init__("Compressed payload expands beyond the allowed ratio.")
+        self.compressed_bytes = compressed_bytes
+        self.decompressed_bytes = decompressed_bytes
+
+
+@contextmanager
+def _decode_errors() -> Iterator[None]:
+    try:
+        yield
+    except zlib.error as exc:
+        raise ValueError("Compressed payload is malformed.") from exc
+    except UnicodeDecodeError as exc:
+        raise ValueError("XML payload is not valid UTF-8.") from exc
+
+
+class GzipBase64Stream:
+    """Iterate the XML text of a ``gzip+base64`` payload in bounded chunks.
+
+    Exposes the same ``byte_count``/``hexdigest``/``drain`` surface as
+    :class:`~.payload_stream.PayloadStream`; both describe the decompressed
+    XML. Raises :class:`~.payload_stream.PayloadSizeError` once more than
+    ``max_bytes`` are inflated, :class:`DecompressionRatioError` for bombs
+    and :class:`ValueError` for malformed input.
+    """
+
+    def __init__(self, payload: str, max_bytes: int, max_ratio: int) -> None:
+        try:
+            self._compressed = base64.b64decode("".join(payload.split()), validate=True)
+        except binascii.Error as exc:
+            raise ValueError("Payload is not valid base64.") from exc
+        self._max_bytes = max_bytes
+        self._max_ratio = max_ratio
+        self._accountant = PayloadAccountant(max_bytes)
+        self._inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._offset = 0
+        self._peeked: deque[str] = deque()
+
+    @property
+    def compressed_bytes(self) -> int:
+        return len(self._compressed)
+
+    @property
+    def max_inflated_bytes(self) -> int:
+        """Upper bound on the XML bytes the size and ratio caps let through."""
+
+        ratio_bound = max(self._max_ratio * self.compressed_bytes, RATIO_FLOOR_BYTES)
+        return min(ratio_bound, self._max_bytes)
+
+    @property
+    def byte_count(self) -> int:
+        return self._accountant.byte_count
+
+    def __iter__(self) -> Iterator[str]:
+        while self._peeked:
+            yield self._peeked.popleft()
+        with _decode_errors():
+            while self._pending():
+                text = self._text.decode(self._inflate_block())
+                if text:
+                    yield text
+            self._finish()
+
+    def peek(self, min_chars: int) -> str:
+        """Inflate until ``min_chars`` characters (or all) are buffered.
+
+        Returns the buffered text, which iteration still yields first. The
+        inflated blocks are accounted and ratio-checked as usual.
+        """
+
+        buffered = sum(len(text) for text in self._peeked)
+        with _decode_errors():
+            while buffered < min_chars and self._pending():
+                text = self._text.decode(self._inflate_block())
+                if text:
+                    self._peeked.append(text)
+                    buffered += len(text)
+        return "".join(self._peeked)
+
+    def drain(self) -> None:
+        """Inflate and account the rest without handing it to anyone."""
+
+        for _ in self:
+            pass
+
+    def hexdigest(self) -> str:
+        return self._accountant.hexdigest()
+
+    def _pending(self) -> bool:
+        inflater = self._inflater
+        if inflater.eof:
+            return False
+        return self._offset < len(self._compressed) or bool(inflater.unconsumed_tail)
+
+    def _inflate_block(self) -> bytes:
+        inflater = self._inflater
+        if inflater.unconsumed_tail:
+            data = inflater.unconsumed_tail
+        else:
+            data = self._compressed[self._offset : self._offset + INPUT_BLOCK_BYTES]
+            self._offset += len(data)
+        out = inflater.decompress(data, OUTPUT_BLOCK_BYTES)
+        self._accountant.add_bytes(out)
+        consumed = self._offset - len(inflater.unconsumed_tail)
+        inflated = self._accountant.byte_count
+        if inflated > RATIO_FLOOR_BYTES and inflated > self._max_ratio * consumed:
+            raise DecompressionRatioError(consumed, inflated)
+        return out
+
+    def _finish(self) -> None:
+        if not self._inflater.eof:
+            raise ValueError("Compressed payload is truncated.")
+        if self._inflater.unused_data or self._offset < len(self._compressed):
+            raise ValueError("Compressed payload has trailing data.")
+        self._text.decode(b"", final=True)
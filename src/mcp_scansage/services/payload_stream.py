@@ -0,0 +1,96 @@
+"""Streaming size accountant for large PUBLIC payloads.
+
+The default profile checks payload size on the whole string (schema
+``maxLength`` plus ``len(payload.encode())``). The lab profile accepts
+payloads of tens of MB, so the text is instead handed to the parser in
+chunks: each chunk is encoded once to count its UTF-8 bytes and extend the
+SHA-256 digest, and the stream stops as soon as the byte limit is crossed,
+before the parser sees the offending chunk. No full encoded copy of the
+payload is ever materialized. Chunked uploads use the same
+:class:`PayloadAccountant` for chunks that arrive in separate requests.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Iterator
+
+DEFAULT_CHUNK_CHARS = 64 * 1024
+"""Characters handed to the parser per chunk."""
+
+
+class PayloadSizeError(ValueError):
+    """Raised when a streamed payload crosses its byte limit."""
+
+    def __init__(self, byte_count: int) -> None:
+        super().__init__("Payload exceeds maximum allowed size.")
+        self.byte_count = byte_count
+
+
+class PayloadAccountant:
+    """Incremental UTF-8 byte count and SHA-256 digest of a chunked payload."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self._max_bytes = max_bytes
+        self._digest = hashlib.sha256()
+        self.byte_count = 0
+
+    def add(self, chunk: str) -> None:
+        """Account ``chunk``; nothing is recorded when it crosses the limit.
+
+        Raises:
+            PayloadSizeError: when the payload would exceed ``max_bytes``.
+        """
+
+        self.add_bytes(chunk.encode("utf-8"))
+
+    def add_bytes(self, data: bytes) -> None:
+        """Account already encoded payload bytes (see :meth:`add`)."""
+
+        byte_count = self.byte_count + len(data)
+        if byte_count > self._max_bytes:
+            raise PayloadSizeError(byte_count)
+        self._digest.update(data)
+        self.byte_count = byte_count
+
+    def hexdigest(self) -> str:
+        return self._digest.hexdigest()
+
+
+class PayloadStream:
+    """Iterate ``text`` in chunks while accounting bytes and the digest.
+
+    Iterating raises :class:`PayloadSizeError` once more than ``max_bytes``
+    UTF-8 bytes have been seen. :meth:`drain` consumes whatever a consumer
+    left unread so :attr:`byte_count` and :meth:`hexdigest` cover the whole
+    payload.
+    """
+
+    def __init__(
+        self, text: str, max_bytes: int, chunk_chars: int = DEFAULT_CHUNK_CHARS
+    ) -> None:
+        self._text = text
+        self._chunk_chars = chunk_chars
+        self._offset = 0
+        self._accountant = PayloadAccountant(max_bytes)
+
+    @property
+    def byte_count(self) -> int:
+        return self._accountant.byte_count
+
+    def __iter__(self) -> Iterator[str]:
+        text = self._text
+        while self._offset < len(text):
+            chunk = text[self._offset : self._offset + self._chunk_chars]
+            self._accountant.add(chunk)
+            self._offset += len(chunk)
+            yield chunk
+
+    def drain(self) -> None:
+        """Account the rest of the payload without handing it to anyone."""
+
+        for _ in self:
+            pass
+
+    def hexdigest(self) -> str:
+        return self._accountant.hexdigest()
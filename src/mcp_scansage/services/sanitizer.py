@@ -3,6 +3,10 @@
 from __future__ import annotations
 
 import re
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Any, Mapping
 
 RAW_PATH_PATTERN = re.compile(r"(?i)(?:[A-Za-z]:\\\\|/home/|\./|\.\.)")
@@ -11,11 +15,25 @@ RAW_PATH_PATTERN = re.compile(r"(?i)(?:[A-Za-z]:\\\\|/home/|\./|\.\.)")
 IDENTIFIER_PATTERNS = [
     r"(?:\b(?:\d{1,3}\.){3}\d{1,3}\b)",
     r"(?:\b[0-9a-f]{1,4}(?::[0-9a-f]{1,4}){2,7}\b)",
-    r"(?:\b[0-9a-f]{1,4}(?::[0-9a-f]{1,4})*::(?:[0-9a-f]{1,4}(?::[0-9a-f]{1,4})*)?\b)",
+    r"(?:\b[0-9a-f]{1,4}(?::[0-9a-f]{1,4})?::(?:[0-9a-f]{1,4}(?::[0-9a-f]{1,4})*)?\b)",
     r"(?:\b(?:[0-9a-f]{2}[:-]){5}[0-9a-f]{2}\b)",
     r"(?:\b[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.[a-z]{2,}\b)",
 ]
-"""Regex fragments describing IPv4/IPv6/MAC/hostname identifiers to redact."""
+"""Regex fragments describing IPv4/IPv6/MAC/hostname identifiers to redact.
+
+The alternation runs on attacker-controlled strings, so every branch does
+bounded work per start position or consumes what it scans:
+
+* IPv4, full IPv6, MAC and the hostname label are fixed-width repetitions.
+* Compressed IPv6 allows at most one ``:group`` before ``::``. With two or
+  more, the full IPv6 branch (tried first) already matches at that position,
+  so the old unbounded ``(?::group)*`` only added an O(n) rescan per start.
+* The compressed IPv6 tail and the hostname TLD are unbounded, but the tail
+  always ends in a match that consumes it, and a TLD run is reachable from at
+  most 32 label starts (labels are <= 63 chars and start after ``-``).
+
+Total work is therefore O(n) in the input length.
+"""
 
 IDENTIFIER_PATTERN = re.compile("|".join(IDENTIFIER_PATTERNS), re.IGNORECASE)
 """Compiled pattern that matches any identifier-like fragment."""
@@ -24,12 +42,139 @@ IDENTIFIER_PATTERN = re.compile("|".join(IDENTIFIER_PATTERNS), re.IGNORECASE)
 def redact_identifiers(value: str) -> str:
     """Replace identifier tokens (IP/MAC/hostname) with a placeholder."""
 
+    # Fast path: every identifier branch needs "." (IPv4/hostname), ":" (IPv6/MAC)
+    # or "-" (MAC), so strings without any of them cannot match.
+    if "." not in value and ":" not in value and "-" not in value:
+        return value
     return IDENTIFIER_PATTERN.sub("[redacted]", value)
 
 
+DEFAULT_REDACTION_CACHE_ENTRIES = 4096
+"""Default cap on distinct fragments memoized by a :class:`RedactionCache`."""
+
+DEFAULT_REDACTION_CACHE_BYTES = 2_000_000
+"""Default cap on the estimated memory held by a :class:`RedactionCache`."""
+
+
+@dataclass(frozen=True)
+class RedactionCacheStats:
+    """Point-in-time counters for a :class:`RedactionCache`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class RedactionCache:
+    """Bounded LRU memo of :func:`redact_identifiers` for repeated fragments.
+
+    Entries are evicted least-recently-used first once either the entry cap or
+    the estimated byte cap is exceeded; fragments that alone exceed the byte
+    cap are redacted but never stored. Safe to share across threads.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_REDACTION_CACHE_ENTRIES,
+        max_bytes: int = DEFAULT_REDACTION_CACHE_BYTES,
+    ) -> None:
+        self._max_entries = max(max_entries, 0)
+        self._max_bytes = max(max_bytes, 0)
+        self._entries: OrderedDict[str, tuple[str, int]] = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def redact(self, value: str) -> str:
+        """Return ``redact_identifiers(value)``, scanning each fragment once."""
+
+        with self._lock:
+            cached = self._entries.get(value)
+            if cached is not None:
+                self._entries.move_to_end(value)
+                self._hits += 1
+                return cached[0]
+            self._misses += 1
+
+        redacted = redact_identifiers(value)
+        size = sys.getsizeof(value)
+        if redacted is not value:
+            size += sys.getsizeof(redacted)
+        if size > self._max_bytes or not self._max_entries:
+            return redacted
+
+        with self._lock:
+            if value not in self._entries:
+                self._entries[value] = (redacted, size)
+                self._bytes += size
+                self._evict()
+        return redacted
+
+    def stats(self) -> RedactionCacheStats:
+        with self._lock:
+            return RedactionCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                bytes=self._bytes,
+            )
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._hits = self._misses = self._evictions = 0
+
+    def _evict(self) -> None:
+        while self._entries and (
+            len(self._entries) > self._max_entries or self._bytes > self._max_bytes
+        ):
+            _, (_, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self._evictions += 1
+
+
+SERVICE_FRAGMENT_CACHE = RedactionCache()
+"""Process-wide memo for service product/version/extrainfo fragments."""
+
+
+SAFE_PUBLIC_VALUES = {
+    "payload_sha256": re.compile(r"[0-9a-f]{64}"),
+    "ingest_id": re.compile(
+        r"[0-9a-f]{32}|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
+    ),
+}
+"""Response keys whose values are safe by construction, with their shape.
+
+A value is only skipped when it is a string that fully matches the pattern
+(a hex SHA-256 digest, a UUID); anything else under these keys is scrubbed.
+"""
+
+
 def _scrub_value(value: str) -> str:
     """Remove raw path fragments from a single string."""
 
+    # Raw paths need "/", "\\" or "."; identifiers need ".", ":" or "-".
+    if (
+        "." not in value
+        and "/" not in value
+        and "\\" not in value
+        and ":" not in value
+        and "-" not in value
+    ):
+        return value
     scrubbed = RAW_PATH_PATTERN.sub("[redacted]", value)
     return redact_identifiers(scrubbed)
 
@@ -38,3 +183,54 @@ def sanitize_public_response(payload: Mapping[str, Any]) -> dict[str, str]:
     """Return a copy with every value stripped of raw path fragments."""
 
     return {key: _scrub_value(str(value)) for key, value in payload.items()}
+
+
+def sanitize_public_payload(payload: Any) -> Any:
+    """Recursively scrub strings in a nested PUBLIC payload, preserving types.
+
+    Dicts, lists and tuples are walked; non-string scalars and well-formed
+    :data:`SAFE_PUBLIC_VALUES` are kept as-is. Containers are copied only when
+    something inside them changed, so a clean payload is returned unchanged
+    (the very same object) without allocating.
+    """
+
+    if isinstance(payload, str):
+        return _scrub_value(payload)
+    if isinstance(payload, Mapping):
+        return _sanitize_mapping(payload)
+    if isinstance(payload, (list, tuple)):
+        return _sanitize_sequence(payload)
+    return payload
+
+
+def _sanitize_mapping(payload: Mapping[str, Any]) -> Any:
+    changed: dict[str, Any] | None = None
+    for key, value in payload.items():
+        # Exact-type check first: findings are mostly flat dicts of strings.
+        if type(value) is str:
+            safe = SAFE_PUBLIC_VALUES.get(key)
+            if safe is not None and safe.fullmatch(value):
+                continue
+            clean = _scrub_value(value)
+        else:
+            clean = sanitize_public_payload(value)
+        if clean is not value:
+            if changed is None:
+                changed = {}
+            changed[key] = clean
+    if changed is None:
+        return payload
+    return {key: changed.get(key, value) for key, value in payload.items()}
+
+
+def _sanitize_sequence(payload: list[Any] | tuple[Any, ...]) -> Any:
+    copy: list[Any] | None = None
+    for index, value in enumerate(payload):
+        clean = sanitize_public_payload(value)
+        if clean is not value:
+            if copy is None:
+                copy = list(payload)
+            copy[index] = clean
+    if copy is None:
+        return payload
+    return tuple(copy) if isinstance(payload, tuple) else copy
@@ -0,0 +1,89 @@
+"""Scan output formats accepted for ingestion, and cheap format sniffing.
+
+Clients name the format of their payload; a wrong name used to cost a full
+failed parse. :func:`sniff_format` looks only at the first
+:data:`SNIFF_CHARS` characters (XML markup, a JSON array or object, the
+grepable ``Host:`` lines, masscan list records) and :func:`resolve_format`
+uses it to pick the format for ``auto`` and to reject a named format that
+clearly does not match before any parser runs. Payloads the sniffer does
+not recognise keep the requested format and are left to the parser.
+"""
+
+from __future__ import annotations
+
+import re
+
+NMAP_XML_FORMAT = "nmap_xml"
+"""Canonical format string for Nmap XML ingestion."""
+
+NMAP_GREPABLE_FORMAT = "nmap_grepable"
+"""Format string for Nmap grepable output (``-oG``)."""
+
+MASSCAN_JSON_FORMAT = "masscan_json"
+"""Format string for masscan JSON output (``-oJ``)."""
+
+MASSCAN_LIST_FORMAT = "masscan_list"
+"""Format string for masscan list output (``-oL``)."""
+
+SYNTHETIC_FORMAT = "synthetic_v1"
+"""Format string for synthetic developer payloads."""
+
+AUTO_FORMAT = "auto"
+"""Requested format that asks the service to sniff the payload."""
+
+SNIFF_CHARS = 512
+"""Leading payload characters inspected by :func:`sniff_format`."""
+
+_LEADING_NOISE = "﻿ \t\r\n"
+"""Byte order mark and whitespace skipped before sniffing."""
+
+_XML_START = "<"
+_JSON_STARTS = ("[", "{")
+
+_MASSCAN_LIST_HEAD = re.compile(
+    r"#masscan|(?:open|closed|banner) [a-z]+ \d+ \S+ \d+", re.IGNORECASE
+)
+"""First line of masscan ``-oL`` output: its banner comment or a record."""
+
+_GREPABLE_HOST_LINE = re.compile(r"^Host: \S+ \(", re.MULTILINE)
+"""A grepable host line anywhere in the sniffed head."""
+
+
+class FormatMismatchError(ValueError):
+    """Raised when a payload does not match its requested format."""
+
+
+def sniff_format(head: str) -> str | None:
+    """Return the format ``head`` looks like, or ``None`` when unsure.
+
+    Only the first :data:`SNIFF_CHARS` characters are inspected.
+    """
+
+    text = head[:SNIFF_CHARS].lstrip(_LEADING_NOISE)
+    if text.startswith(_XML_START):
+        return NMAP_XML_FORMAT
+    if text.startswith(_JSON_STARTS):
+        return MASSCAN_JSON_FORMAT
+    if _MASSCAN_LIST_HEAD.match(text):
+        return MASSCAN_LIST_FORMAT
+    if _GREPABLE_HOST_LINE.search(text):
+        return NMAP_GREPABLE_FORMAT
+    return None
+
+
+def resolve_format(requested: str, head: str) -> str:
+    """Return the format to parse ``head``'s payload with.
+
+    Raises:
+        FormatMismatchError: when ``auto`` cannot detect a format, or the
+            payload clearly belongs to a format other than ``requested``.
+    """
+
+    detected = sniff_format(head)
+    if requested == AUTO_FORMAT:
+        if detected is None:
+            raise FormatMismatchError("Payload format could not be detected.")
+        return detected
+    if detected is not None and detected != requested:
+        raise FormatMismatchError("Payload does not match the requested format.")
+    return requested
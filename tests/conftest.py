@@ -0,0 +1,31 @@
+"""Shared pytest fixtures."""
+
+from __future__ import annotations
+
+from typing import Iterator
+
+import pytest
+
+from mcp_scansage.mcp.response_validation import reload_validation_config
+from mcp_scansage.mcp.schema_registry import reload_validator_backend
+from mcp_scansage.services.nmap_limits import reload_limit_config
+
+
+@pytest.fixture(autouse=True)
+def _fresh_limit_snapshot() -> Iterator[None]:
+    """Give every test config snapshots of the environment it starts and ends in.
+
+    Limits, the response validation mode and the schema validator backend are
+    resolved once per process, so tests that change ``SCANSAGE_MAX_*``,
+    ``SCANSAGE_RESPONSE_VALIDATION*`` or ``SCANSAGE_SCHEMA_VALIDATOR`` must call
+    ``reload_limit_config()``/``reload_validation_config()``/
+    ``reload_validator_backend()`` after ``setenv``.
+    """
+
+    reload_limit_config()
+    reload_validation_config()
+    reload_validator_backend()
+    yield
+    reload_limit_config()
+    reload_validation_config()
+    reload_validator_backend()
@@ -2,20 +2,33 @@
 
 from __future__ import annotations
 
+import json
 import logging
+import multiprocessing
+import os
 from pathlib import Path
 
 import pytest
 
+from mcp_scansage.services import audit_log
 from mcp_scansage.services.audit_log import (
+    MAX_AUDIT_RECORD_BYTES,
     AuditConfig,
     append_audit_event,
+    iter_audit_window,
+    next_audit_stamp,
     reset_audit_config,
     reset_audit_warning_state,
     set_audit_config,
     set_audit_warning_interval,
 )
 
+_WRITERS = 8
+_EVENTS_PER_WRITER = 150
+_needs_fork = pytest.mark.skipif(
+    not hasattr(os, "fork"), reason="multi-process stress test requires fork"
+)
+
 
 def _sample_event() -> dict[str, object]:
     return {
@@ -46,29 +59,128 @@ def test_append_rotates_when_limit_exceeded(tmp_path: Path) -> None:
     reset_audit_config()
 
 
-def test_append_handles_unwritable_file(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
-) -> None:
+def test_append_handles_unwritable_file(tmp_path: Path) -> None:
     audit_dir = tmp_path / "audit"
     audit_file = audit_dir / "audit.jsonl"
-    audit_dir.mkdir(parents=True, exist_ok=True)
-    audit_file.write_text("", encoding="utf-8")
+    # A directory in place of the log file makes every open() fail.
+    audit_file.mkdir(parents=True)
     config = AuditConfig(audit_file=audit_file, max_bytes=None)
     set_audit_config(config)
 
-    def fail_open(self: Path, *args: object, **kwargs: object) -> None:
-        raise OSError("no space")
+    append_audit_event(_sample_event())
 
-    monkeypatch.setattr(
-        "mcp_scansage.services.audit_log.Path.open",
-        fail_open,
-    )
+    assert audit_file.is_dir()
+    reset_audit_config()
+
+
+def test_oversized_events_leave_a_truncated_stub(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    audit_file = tmp_path / "audit" / "audit.jsonl"
+    set_audit_config(AuditConfig(audit_file=audit_file, max_bytes=None))
+    reset_audit_warning_state()
+    event = _sample_event()
+    event["padding"] = "x" * MAX_AUDIT_RECORD_BYTES
+
+    caplog.set_level(logging.WARNING)
+    append_audit_event(event)
+    append_audit_event(_sample_event())
+
+    stub, regular = _read_records(audit_file)
+    assert stub["event"] == "NMAP_INGEST_CAP_APPLIED"
+    assert stub["truncated"] is True
+    assert stub["original_bytes"] > MAX_AUDIT_RECORD_BYTES
+    assert "padding" not in stub
+    assert isinstance(stub["ts"], float) and stub["seq"] < regular["seq"]
+    assert "truncated" not in regular
+    assert any("Truncating audit event" in r.getMessage() for r in caplog.records)
+    reset_audit_warning_state()
+    reset_audit_config()
 
+
+@pytest.mark.skipif(audit_log.fcntl is None, reason="advisory locks need fcntl")
+def test_append_survives_lock_failures(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    audit_file = tmp_path / "audit" / "audit.jsonl"
+    set_audit_config(AuditConfig(audit_file=audit_file, max_bytes=None))
+    reset_audit_warning_state()
+
+    def refuse(fd: int, operation: int) -> None:
+        raise OSError(37, "No locks available")
+
+    monkeypatch.setattr(audit_log.fcntl, "flock", refuse)
+    caplog.set_level(logging.WARNING)
     append_audit_event(_sample_event())
 
+    assert len(_read_records(audit_file)) == 1
+    assert any("Unable to lock audit file" in r.getMessage() for r in caplog.records)
+    reset_audit_warning_state()
     reset_audit_config()
 
 
+def _write_events(audit_file: Path, max_bytes: int | None, writer: int) -> None:
+    set_audit_config(AuditConfig(audit_file=audit_file, max_bytes=max_bytes))
+    for seq in range(_EVENTS_PER_WRITER):
+        event = _sample_event()
+        event["writer"] = writer
+        event["seq"] = seq
+        event["padding"] = "x" * (512 + (seq % 7) * 64)
+        append_audit_event(event)
+
+
+def _run_writers(audit_file: Path, max_bytes: int | None) -> None:
+    context = multiprocessing.get_context("fork")
+    workers = [
+        context.Process(target=_write_events, args=(audit_file, max_bytes, idx))
+        for idx in range(_WRITERS)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=60)
+        assert worker.exitcode == 0
+
+
+def _read_records(*paths: Path) -> list[dict[str, object]]:
+    records = []
+    for path in paths:
+        if not path.exists():
+            continue
+        raw = path.read_text(encoding="utf-8")
+        assert not raw or raw.endswith("\n")
+        records.extend(json.loads(line) for line in raw.splitlines())
+    return records
+
+
+@_needs_fork
+def test_concurrent_writers_lose_no_lines(tmp_path: Path) -> None:
+    audit_file = tmp_path / "audit" / "audit.jsonl"
+
+    _run_writers(audit_file, max_bytes=None)
+
+    records = _read_records(audit_file)
+    seen = {(record["writer"], record["seq"]) for record in records}
+    assert len(records) == _WRITERS * _EVENTS_PER_WRITER
+    assert len(seen) == len(records)
+
+
+@_needs_fork
+def test_concurrent_writers_rotate_without_torn_lines(tmp_path: Path) -> None:
+    audit_file = tmp_path / "audit" / "audit.jsonl"
+    rotated = audit_file.with_name(audit_file.name + ".1")
+
+    _run_writers(audit_file, max_bytes=64_000)
+
+    records = _read_records(audit_file, rotated)
+    assert rotated.exists()
+    assert records
+    seen = {(record["writer"], record["seq"]) for record in records}
+    assert len(seen) == len(records)
+    # Rotation happens before an append, so the live file stays near the cap.
+    assert audit_file.stat().st_size < 64_000 + _WRITERS * MAX_AUDIT_RECORD_BYTES
+
+
 def test_warning_rate_limiting(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -116,3 +228,95 @@ def test_warning_rate_limiting(
     reset_audit_warning_state()
     set_audit_warning_interval(None)
     reset_audit_config()
+
+
+def test_append_stamps_events_with_time_and_sequence(tmp_path: Path) -> None:
+    audit_file = tmp_path / "audit" / "audit.jsonl"
+    set_audit_config(AuditConfig(audit_file=audit_file, max_bytes=None))
+
+    append_audit_event(_sample_event())
+    append_audit_event({**next_audit_stamp(), **_sample_event()})
+    append_audit_event(_sample_event())
+
+    records = _read_records(audit_file)
+    sequences = [record["seq"] for record in records]
+    assert all(isinstance(record["ts"], float) for record in records)
+    assert sequences == sorted(sequences)
+    assert len(set(sequences)) == 3
+    reset_audit_config()
+
+
+def _write_unstamped_events(audit_file: Path, count: int) -> None:
+    set_audit_config(AuditConfig(audit_file=audit_file, max_bytes=None))
+    for _ in range(count):
+        append_audit_event(_sample_event())
+
+
+@_needs_fork
+def test_stamps_identify_events_across_writer_processes(tmp_path: Path) -> None:
+    audit_file = tmp_path / "audit" / "audit.jsonl"
+    context = multiprocessing.get_context("fork")
+    workers = [
+        context.Process(target=_write_unstamped_events, args=(audit_file, 50))
+        for _ in range(2)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=60)
+        assert worker.exitcode == 0
+
+    records = _read_records(audit_file)
+    by_pid: dict[object, list[object]] = {}
+    for record in records:
+        by_pid.setdefault(record["pid"], []).append(record["seq"])
+    assert set(by_pid) == {worker.pid for worker in workers}
+    # Both writers count from the same point, so seq alone collides ...
+    assert by_pid[workers[0].pid] == by_pid[workers[1].pid]
+    # ... but (pid, seq) is unique and each writer's seq stays ordered.
+    assert len({(record["pid"], record["seq"]) for record in records}) == 100
+    assert all(seqs == sorted(seqs) for seqs in by_pid.values())
+
+
+def _write_stamped_segment(path: Path, count: int) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    lines = [
+        json.dumps({"event": "SAMPLE", "ts": 1_000.0 + idx, "seq": idx + 1})
+        for idx in range(count)
+    ]
+    # Legacy lines without stamps must be tolerated anywhere in the segment.
+    lines.insert(count // 2, json.dumps({"event": "LEGACY"}))
+    lines.insert(0, "not-json")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def test_iter_audit_window_returns_inclusive_range(tmp_path: Path) -> None:
+    segment = tmp_path / "audit.jsonl"
+    _write_stamped_segment(segment, 100)
+
+    window = list(iter_audit_window(segment, 1_010.0, 1_014.5))
+
+    assert [event["seq"] for event in window] == [11, 12, 13, 14, 15]
+    assert list(iter_audit_window(segment, 5_000.0)) == []
+    assert len(list(iter_audit_window(segment, 0.0))) == 100
+    assert list(iter_audit_window(tmp_path / "missing.jsonl", 0.0)) == []
+
+
+def test_iter_audit_window_decodes_logarithmically_many_lines(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    segment = tmp_path / "audit.jsonl"
+    _write_stamped_segment(segment, 20_000)
+    decoded: list[bytes] = []
+    original = audit_log._decode_line
+
+    def counting_decode(line: bytes) -> dict[str, object] | None:
+        decoded.append(line)
+        return original(line)
+
+    monkeypatch.setattr(audit_log, "_decode_line", counting_decode)
+
+    window = list(iter_audit_window(segment, 15_000.0, 15_009.0))
+
+    assert len(window) == 10
+    assert len(decoded) < 200
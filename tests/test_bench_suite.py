@@ -0,0 +1,145 @@
+"""Benchmark suite baseline handling: recording, tolerance and machine checks.
+
+Timings are replaced with canned results so these tests never depend on the
+speed of the machine running them.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+from mcp_scansage.services import nmap_ingest_store
+from mcp_scansage.services.nmap_parser import XML_PARSER_ENV
+
+BENCHMARKS_DIR = Path(__file__).resolve().parents[1] / "benchmarks"
+
+
+@pytest.fixture
+def suite(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> ModuleType:
+    monkeypatch.syspath_prepend(str(BENCHMARKS_DIR))
+    monkeypatch.delenv("SCANSAGE_BENCH_TOLERANCE", raising=False)
+    monkeypatch.setenv(XML_PARSER_ENV, "real_minimal")
+    monkeypatch.setattr(nmap_ingest_store, "STATE_DIR", tmp_path)
+    monkeypatch.setattr(nmap_ingest_store, "RECORD_FILE", tmp_path / "records.json")
+    module = importlib.import_module("run_suite")
+    monkeypatch.setattr(module, "_scaling_checks", lambda: iter(()))
+    return module
+
+
+def _fake_runs(
+    monkeypatch: pytest.MonkeyPatch, suite: ModuleType, *runs: dict[str, float]
+) -> list[Any]:
+    """Make successive ``run`` calls return the given relative timings."""
+
+    calls: list[Any] = []
+    pending = list(runs)
+
+    def run(only: str | None = None, names: Any = None) -> list[dict[str, Any]]:
+        calls.append(names)
+        timings = pending.pop(0) if len(pending) > 1 else pending[0]
+        return [
+            {"name": name, "seconds": value, "relative": value}
+            for name, value in timings.items()
+            if names is None or name in names
+        ]
+
+    monkeypatch.setattr(suite, "run", run)
+    return calls
+
+
+def _baseline(path: Path, suite: ModuleType, results: dict[str, float]) -> None:
+    document = {"machine": suite.machine_fingerprint(), "results": results}
+    path.write_text(json.dumps(document), encoding="utf-8")
+
+
+def test_update_records_the_machine_and_merges_cases(
+    monkeypatch: pytest.MonkeyPatch, suite: ModuleType, tmp_path: Path
+) -> None:
+    baseline = tmp_path / "baseline.json"
+    _baseline(baseline, suite, {"a": 1.0, "b": 2.0})
+    _fake_runs(monkeypatch, suite, {"b": 3.0})
+
+    assert suite.main(["--baseline", str(baseline), "--update-baseline"]) == 0
+
+    stored = json.loads(baseline.read_text(encoding="utf-8"))
+    assert stored["machine"] == suite.machine_fingerprint()
+    assert stored["results"] == {"a": 1.0, "b": 3.0}
+
+
+def test_confirmed_regression_fails_and_noise_does_not(
+    monkeypatch: pytest.MonkeyPatch,
+    suite: ModuleType,
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    baseline = tmp_path / "baseline.json"
+    _baseline(baseline, suite, {"fast": 1.0, "slow": 1.0})
+    argv = ["--baseline", str(baseline)]
+
+    calls = _fake_runs(monkeypatch, suite, {"fast": 1.1, "slow": 1.5})
+    assert suite.main(argv) == 1
+    assert calls == [None, ["slow"], ["slow"]]
+    assert "slow" in capsys.readouterr().err
+
+    _fake_runs(monkeypatch, suite, {"fast": 1.1, "slow": 1.5}, {"slow": 1.2})
+    assert suite.main(argv) == 0
+    assert suite.main([*argv, "--tolerance", "0.05"]) == 1
+    monkeypatch.setenv("SCANSAGE_BENCH_TOLERANCE", "0.6")
+    _fake_runs(monkeypatch, suite, {"fast": 1.1, "slow": 1.5})
+    assert suite.main(argv) == 0
+
+
+def test_baseline_from_another_machine_is_not_enforced(
+    monkeypatch: pytest.MonkeyPatch,
+    suite: ModuleType,
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(
+        json.dumps({"machine": {"host": "elsewhere"}, "results": {"a": 0.1}}),
+        encoding="utf-8",
+    )
+    _fake_runs(monkeypatch, suite, {"a": 5.0})
+
+    assert suite.main(["--baseline", str(baseline)]) == 0
+    assert "different machine" in capsys.readouterr().err
+    assert suite.main(["--baseline", str(tmp_path / "missing.json")]) == 0
+
+
+def test_stored_baseline_covers_every_case(suite: ModuleType) -> None:
+    stored = json.loads((BENCHMARKS_DIR / "baseline.json").read_text("utf-8"))
+    cases = {name for group in suite.CASE_GROUPS for name, _ in group()}
+
+    assert set(stored["results"]) == cases
+    assert {"parse_xml_safely", "nmap_ingest_resource.ingest"} <= cases
+
+
+def test_superlinear_growth_fails_once_confirmed(
+    monkeypatch: pytest.MonkeyPatch,
+    suite: ModuleType,
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    growths = {"linear": [4.0], "noisy": [12.0, 5.0], "quadratic": [16.0, 15.0, 14.0]}
+    checks = [(name, lambda size, name=name: name, 10) for name in growths]
+    monkeypatch.setattr(suite, "_scaling_checks", lambda: iter(checks))
+    monkeypatch.setattr(
+        suite, "_growth", lambda workload, size: growths[workload(size)].pop(0)
+    )
+    _fake_runs(monkeypatch, suite, {"a": 1.0})
+
+    assert suite.main(["--baseline", str(tmp_path / "missing.json")]) == 1
+
+    output = capsys.readouterr()
+    records = {record["name"]: record for record in json.loads(output.out)}
+    assert "Superlinear growth: quadratic" in output.err
+    assert "noisy" not in output.err
+    assert [records[name]["growth"] for name in growths] == [4.0, 5.0, 14.0]
+    assert records["quadratic"]["limit"] == 8.0
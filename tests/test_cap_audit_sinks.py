@@ -0,0 +1,234 @@
+"""Coverage for the asynchronous fan-out and Unix socket cap audit sinks."""
+
+from __future__ import annotations
+
+import json
+import socket
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from mcp_scansage.services import cap_audit, cap_audit_sinks
+from mcp_scansage.services.cap_audit import (
+    InMemoryCapAuditSink,
+    clear_cap_events,
+    record_cap_event,
+    set_production_cap_audit_sink,
+)
+from mcp_scansage.services.cap_audit_sinks import (
+    AUDIT_SOCKET_ENV,
+    FanOutCapAuditSink,
+    UnixSocketCapAuditSink,
+    configure_cap_audit_sinks_from_env,
+)
+
+_needs_unix_sockets = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="requires Unix domain sockets"
+)
+
+
+@pytest.fixture(autouse=True)
+def restore_production_sink() -> None:
+    original = cap_audit._PRODUCTION_SINK
+    clear_cap_events()
+    yield
+    set_production_cap_audit_sink(original)
+    clear_cap_events()
+
+
+class _BlockingSink:
+    """Sink that stalls until released, standing in for a slow collector."""
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.events: list[dict[str, object]] = []
+
+    def emit(self, entry: dict[str, object]) -> None:
+        self.release.wait(timeout=5)
+        self.events.append(entry)
+
+
+class _FailingSink:
+    def emit(self, entry: dict[str, object]) -> None:
+        raise OSError("collector unavailable")
+
+
+class _UnixCollector:
+    """Minimal line-oriented Unix socket server used as a local collector."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.lines: list[str] = []
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(str(path))
+        self._server.listen(1)
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def _serve(self) -> None:
+        connection, _ = self._server.accept()
+        with connection, connection.makefile("r", encoding="utf-8") as stream:
+            for line in stream:
+                self.lines.append(line)
+
+    def wait_for(self, count: int, timeout: float = 5.0) -> None:
+        deadline = time.monotonic() + timeout
+        while len(self.lines) < count and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def close(self) -> None:
+        self._server.close()
+
+
+def _record(reason: str = "MAX_FINDINGS") -> None:
+    record_cap_event(
+        reason=reason,
+        limits={"max_findings": 1},
+        counts_seen={"findings_processed": 2},
+        counts_returned={"findings_returned": 1},
+    )
+
+
+def test_fan_out_delivers_to_every_sink() -> None:
+    first: list[dict[str, object]] = []
+    second: list[dict[str, object]] = []
+    sink = FanOutCapAuditSink(
+        [InMemoryCapAuditSink(events=first), InMemoryCapAuditSink(events=second)]
+    )
+    set_production_cap_audit_sink(sink)
+
+    for _ in range(5):
+        _record()
+
+    assert sink.flush(timeout=5)
+    assert len(first) == len(second) == 5
+    assert first == second
+    assert sink.dropped == 0
+    sink.close(timeout=5)
+
+
+def test_slow_sink_drops_instead_of_blocking() -> None:
+    slow = _BlockingSink()
+    fast: list[dict[str, object]] = []
+    sink = FanOutCapAuditSink([slow, InMemoryCapAuditSink(events=fast)], max_queue=2)
+    set_production_cap_audit_sink(sink)
+
+    started = time.monotonic()
+    for _ in range(20):
+        _record()
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 1.0
+    assert sink.flush(timeout=0.05) is False
+    slow.release.set()
+    assert sink.flush(timeout=5)
+    stats = {entry["sink"]: entry for entry in sink.stats()}
+    assert len(fast) + stats["InMemoryCapAuditSink"]["dropped"] == 20
+    # One event in flight plus a full queue of two; the rest were dropped.
+    assert stats["_BlockingSink"]["dropped"] >= 17
+    assert len(slow.events) + stats["_BlockingSink"]["dropped"] == 20
+    assert sink.dropped == sum(entry["dropped"] for entry in stats.values())
+    sink.close(timeout=5)
+
+
+def test_failing_sink_is_isolated() -> None:
+    events: list[dict[str, object]] = []
+    sink = FanOutCapAuditSink([_FailingSink(), InMemoryCapAuditSink(events=events)])
+    set_production_cap_audit_sink(sink)
+
+    _record()
+    _record()
+
+    assert sink.flush(timeout=5)
+    assert len(events) == 2
+    assert sink.stats()[0]["failed"] == 2
+    sink.close(timeout=5)
+
+
+@_needs_unix_sockets
+def test_unix_socket_sink_streams_json_lines() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        # Keep the socket path short; Unix socket paths are length limited.
+        collector = _UnixCollector(Path(directory) / "audit.sock")
+        socket_sink = UnixSocketCapAuditSink(collector.path)
+        sink = FanOutCapAuditSink([socket_sink])
+        set_production_cap_audit_sink(sink)
+
+        _record("MAX_HOSTS")
+        _record("MAX_PORTS")
+        assert sink.flush(timeout=5)
+        collector.wait_for(2)
+
+        decoded = [json.loads(line) for line in collector.lines]
+        assert [event["cap_reason"] for event in decoded] == ["MAX_HOSTS", "MAX_PORTS"]
+        assert all("ts" in event and "seq" in event for event in decoded)
+        sink.close(timeout=5)
+        socket_sink.close()
+        collector.close()
+
+
+@_needs_unix_sockets
+def test_unix_socket_sink_counts_missing_collector(tmp_path: Path) -> None:
+    sink = FanOutCapAuditSink([UnixSocketCapAuditSink(tmp_path / "absent.sock")])
+    set_production_cap_audit_sink(sink)
+
+    _record()
+
+    assert sink.flush(timeout=5)
+    assert sink.stats()[0]["failed"] == 1
+    sink.close(timeout=5)
+
+
+def test_configure_from_env_installs_fan_out(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.delenv(AUDIT_SOCKET_ENV, raising=False)
+    assert configure_cap_audit_sinks_from_env() is None
+
+    monkeypatch.setenv(AUDIT_SOCKET_ENV, str(tmp_path / "collector.sock"))
+    sink = configure_cap_audit_sinks_from_env()
+
+    assert isinstance(sink, FanOutCapAuditSink)
+    assert cap_audit._PRODUCTION_SINK is sink
+    assert [entry["sink"] for entry in sink.stats()] == [
+        "ProductionCapAuditSink",
+        "UnixSocketCapAuditSink",
+    ]
+    sink.close(timeout=5)
+
+
+def test_reconfiguring_reuses_the_single_exit_flush(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    registered: list[object] = []
+    monkeypatch.setattr(
+        cap_audit_sinks.atexit, "register", lambda *args: registered.append(args)
+    )
+    monkeypatch.setenv(AUDIT_SOCKET_ENV, str(tmp_path / "collector.sock"))
+
+    first = configure_cap_audit_sinks_from_env()
+    second = configure_cap_audit_sinks_from_env()
+
+    assert registered == []
+    assert isinstance(first, FanOutCapAuditSink)
+    assert isinstance(second, FanOutCapAuditSink)
+    assert cap_audit._PRODUCTION_SINK is second
+    first.emit({"event": "late"})
+    assert first.dropped == 2
+    second.close(timeout=5)
+
+
+def test_exit_flush_drains_the_installed_sink() -> None:
+    blocking = _BlockingSink()
+    sink = FanOutCapAuditSink([blocking])
+    set_production_cap_audit_sink(sink)
+    _record()
+
+    blocking.release.set()
+    cap_audit_sinks._flush_installed_sink()
+
+    assert len(blocking.events) == 1
+    sink.close(timeout=5)
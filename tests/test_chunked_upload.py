@@ -0,0 +1,231 @@
+"""Chunked upload resources: begin, append, commit and resume."""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any, Iterator
+
+import pytest
+
+from mcp_scansage.mcp import reason_codes, server
+from mcp_scansage.services import nmap_ingest_store, parse_memory
+from mcp_scansage.services.cap_audit import clear_cap_events, get_cap_events
+from mcp_scansage.services.cap_reason import CapReason
+from mcp_scansage.services.chunked_upload import (
+    UPLOAD_MANAGER,
+    ChunkedUploadManager,
+    UploadConfig,
+    UploadNotFoundError,
+)
+from mcp_scansage.services.nmap_ingest import ingest_nmap_public
+from mcp_scansage.services.nmap_limits import reload_limit_config
+from mcp_scansage.services.nmap_parser import MinimalNmapXmlParser
+from mcp_scansage.services.parse_memory import ParseCapacityError
+
+PAYLOAD = (
+    "<nmaprun>"
+    + "".join(
+        f"<host><status state='up'/><ports><port protocol='tcp' portid='{port}'>"
+        "<state state='open'/><service name='ssh'/></port></ports></host>"
+        for port in range(1, 30)
+    )
+    + "</nmaprun>"
+)
+
+
+@pytest.fixture(autouse=True)
+def _streaming_parser(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.setenv("SCANSAGE_NMAP_XML_PARSER", "real_minimal")
+    nmap_ingest_store.clear_records()
+    clear_cap_events()
+    yield
+    UPLOAD_MANAGER.abort_all()
+    nmap_ingest_store.clear_records()
+    clear_cap_events()
+
+
+def _call(name: str, request: dict[str, Any]) -> Any:
+    return server.RESOURCE_REGISTRY[name](request)
+
+
+def _begin() -> str:
+    response = _call("public://nmap/uploads", {"format": "nmap_xml"})
+    assert response["next_chunk_index"] == 0
+    return response["upload_id"]
+
+
+def _append(upload_id: str, index: int, data: str) -> Any:
+    return _call(
+        "public://nmap/uploads/append",
+        {"upload_id": upload_id, "chunk_index": index, "data": data},
+    )
+
+
+def _chunks(text: str, size: int) -> list[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+def test_upload_matches_single_request_ingest() -> None:
+    upload_id = _begin()
+    for index, chunk in enumerate(_chunks(PAYLOAD, 97)):
+        ack = _append(upload_id, index, chunk)
+        assert ack["next_chunk_index"] == index + 1
+
+    digest = hashlib.sha256(PAYLOAD.encode()).hexdigest()
+    response = _call(
+        "public://nmap/uploads/commit",
+        {"upload_id": upload_id, "payload_sha256": digest},
+    )
+
+    single = ingest_nmap_public(
+        "nmap_xml", PAYLOAD, parser=MinimalNmapXmlParser(), persist_record=False
+    )
+    assert response["summary"] == single["summary"]
+    assert response["parsed_findings"] == single["parsed_findings"]
+    assert nmap_ingest_store.get_ingest(response["ingest_id"]) is not None
+    assert parse_memory.PARSE_MEMORY_GOVERNOR.stats().reserved_bytes == 0
+
+
+def test_interrupted_upload_resumes_from_last_acknowledged_chunk() -> None:
+    chunks = _chunks(PAYLOAD, 200)
+    upload_id = _begin()
+    first = _append(upload_id, 0, chunks[0])
+
+    assert _append(upload_id, 0, chunks[0]) == first
+    skipped = _append(upload_id, 2, chunks[2])
+    assert skipped["reason"] == reason_codes.UPLOAD_CHUNK_OUT_OF_ORDER
+    status = _call("public://nmap/uploads/{upload_id}", {"upload_id": upload_id})
+    assert status["next_chunk_index"] == 1
+    assert status["received_bytes"] == len(chunks[0].encode())
+
+    for index in range(status["next_chunk_index"], len(chunks)):
+        _append(upload_id, index, chunks[index])
+    response = _call("public://nmap/uploads/commit", {"upload_id": upload_id})
+
+    assert response["findings_count"] == 29
+
+
+def test_upload_over_the_byte_limit_is_rejected_and_closed(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("SCANSAGE_MAX_NMAP_XML_BYTES", "500")
+    reload_limit_config()
+    upload_id = _begin()
+    chunks = _chunks(PAYLOAD, 300)
+
+    assert "status" not in _append(upload_id, 0, chunks[0])
+    rejected = _append(upload_id, 1, chunks[1])
+
+    assert rejected["reason"] == reason_codes.PAYLOAD_TOO_LARGE
+    (event,) = get_cap_events()
+    assert event["cap_reason"] == CapReason.MAX_PAYLOAD_BYTES.value
+    assert _append(upload_id, 1, chunks[1])["reason"] == reason_codes.UPLOAD_NOT_FOUND
+    assert parse_memory.PARSE_MEMORY_GOVERNOR.stats().reserved_bytes == 0
+
+
+def test_commit_rejects_a_digest_mismatch() -> None:
+    upload_id = _begin()
+    _append(upload_id, 0, PAYLOAD)
+
+    response = _call(
+        "public://nmap/uploads/commit",
+        {"upload_id": upload_id, "payload_sha256": "0" * 64},
+    )
+
+    assert response["reason"] == reason_codes.INVALID_INPUT
+    status = _call("public://nmap/uploads/{upload_id}", {"upload_id": upload_id})
+    assert status["reason"] == reason_codes.UPLOAD_NOT_FOUND
+
+
+def test_declaration_split_across_chunks_is_rejected() -> None:
+    upload_id = _begin()
+    _append(upload_id, 0, "<?xml version='1.0'?><!DOC")
+
+    response = _append(upload_id, 1, "TYPE nmaprun [<!ENTITY x 'y'>]><nmaprun/>")
+
+    assert response["reason"] == reason_codes.INVALID_INPUT
+
+
+def test_uploads_require_the_streaming_parser(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.delenv("SCANSAGE_NMAP_XML_PARSER")
+    monkeypatch.delenv("SCANSAGE_AUTHORIZED_LAB", raising=False)
+
+    response = _call("public://nmap/uploads", {"format": "nmap_xml"})
+
+    assert response["reason"] == reason_codes.INVALID_INPUT
+
+
+def test_upload_slots_are_capped_and_idle_uploads_expire() -> None:
+    now = [0.0]
+    manager = ChunkedUploadManager(
+        UploadConfig(max_sessions=1, session_ttl_s=10), clock=lambda: now[0]
+    )
+    first = manager.begin("nmap_xml")
+
+    with pytest.raises(ParseCapacityError):
+        manager.begin("nmap_xml")
+    now[0] = 11.0
+    with pytest.raises(UploadNotFoundError):
+        manager.status(first.upload_id)
+    second = manager.begin("nmap_xml")
+
+    assert second.upload_id != first.upload_id
+    manager.abort_all()
+    assert parse_memory.PARSE_MEMORY_GOVERNOR.stats().reserved_bytes == 0
+
+
+def test_begin_admits_the_declared_total_size() -> None:
+    limits = reload_limit_config()
+    declared = len(PAYLOAD.encode())
+    manager = ChunkedUploadManager(UploadConfig(max_sessions=2))
+
+    status = manager.begin("nmap_xml", total_bytes=declared)
+    declared_reservation = parse_memory.PARSE_MEMORY_GOVERNOR.stats().reserved_bytes
+    manager.abort_all()
+    manager.begin("nmap_xml")
+    undeclared_reservation = parse_memory.PARSE_MEMORY_GOVERNOR.stats().reserved_bytes
+    manager.abort_all()
+
+    assert status.max_bytes == declared
+    assert declared_reservation == min(
+        max(
+            declared * parse_memory.RESERVATION_FACTOR,
+            parse_memory.RESERVATION_STEP_BYTES,
+        ),
+        limits.max_parse_memory_bytes,
+    )
+    assert undeclared_reservation == min(
+        limits.max_xml_bytes * parse_memory.RESERVATION_FACTOR,
+        limits.max_parse_memory_bytes,
+    )
+    assert undeclared_reservation > declared_reservation
+
+
+def test_begin_rejects_a_declared_size_over_the_byte_limit() -> None:
+    limits = reload_limit_config()
+
+    response = _call(
+        "public://nmap/uploads",
+        {"format": "nmap_xml", "total_bytes": limits.max_xml_bytes + 1},
+    )
+
+    assert response["reason"] == reason_codes.PAYLOAD_TOO_LARGE
+    (event,) = get_cap_events()
+    assert event["cap_reason"] == CapReason.MAX_PAYLOAD_BYTES.value
+    assert parse_memory.PARSE_MEMORY_GOVERNOR.stats().reserved_bytes == 0
+
+
+def test_chunks_past_the_declared_size_end_the_upload() -> None:
+    chunks = _chunks(PAYLOAD, 300)
+    response = _call(
+        "public://nmap/uploads", {"format": "nmap_xml", "total_bytes": 400}
+    )
+    upload_id = response["upload_id"]
+
+    assert response["max_bytes"] == 400
+    assert "reason" not in _append(upload_id, 0, chunks[0])
+    assert _append(upload_id, 1, chunks[1])["reason"] == reason_codes.INVALID_INPUT
+    assert _append(upload_id, 1, chunks[1])["reason"] == reason_codes.UPLOAD_NOT_FOUND
+    assert parse_memory.PARSE_MEMORY_GOVERNOR.stats().reserved_bytes == 0
@@ -2,10 +2,22 @@
 
 from __future__ import annotations
 
+import hashlib
+import importlib.util
+import io
 import json
+import os
 import subprocess
 import sys
 from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+from mcp_scansage.services.nmap_parser import ParserTimeoutError
+from mcp_scansage.services.parse_memory import ParseCapacityError
+
+SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "dry_run_ingest.py"
 
 
 def _sample_payload(tmp_path: Path) -> Path:
@@ -47,3 +59,203 @@ def test_dry_run_ingest_outputs_sanitized(tmp_path: Path) -> None:
         caps = metadata.get("caps")
         if caps:
             assert "cap_reason" in caps
+
+
+def _stream_xml(hosts: int) -> str:
+    return (
+        "<nmaprun>"
+        + "".join(
+            f"<host><address addr='192.0.2.{index}' addrtype='ipv4'/><ports>"
+            f"<port protocol='tcp' portid='{22 + index}'><state state='open'/>"
+            "<service name='ssh'/></port></ports></host>"
+            for index in range(hosts)
+        )
+        + "</nmaprun>"
+    )
+
+
+def _stream_process(*flags: str) -> subprocess.Popen[str]:
+    return subprocess.Popen(
+        [sys.executable, "scripts/dry_run_ingest.py", "-", *flags],
+        cwd=Path(__file__).resolve().parents[1],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+
+
+def test_stdin_mode_emits_findings_then_summary() -> None:
+    payload = _stream_xml(3)
+    process = _stream_process()
+    stdout, _ = process.communicate(payload, timeout=30)
+
+    lines = [json.loads(line) for line in stdout.splitlines()]
+    assert process.returncode == 0
+    assert "192.0.2." not in stdout
+    assert [line["finding"]["title"] for line in lines[:-1]] == [
+        "Port 22 open",
+        "Port 23 open",
+        "Port 24 open",
+    ]
+    summary = lines[-1]
+    assert summary["findings_count"] == 3
+    assert summary["summary"]["payload_bytes"] == len(payload.encode())
+    assert (
+        summary["summary"]["payload_sha256"]
+        == hashlib.sha256(payload.encode()).hexdigest()
+    )
+
+
+def test_stdin_mode_reports_hosts_before_eof() -> None:
+    process = _stream_process()
+    assert process.stdin is not None and process.stdout is not None
+    try:
+        process.stdin.write(_stream_xml(1).removesuffix("</nmaprun>"))
+        process.stdin.flush()
+        first = json.loads(process.stdout.readline())
+        assert first["finding"]["title"] == "Port 22 open"
+        process.stdin.write("</nmaprun>")
+        process.stdin.close()
+        assert json.loads(process.stdout.readline())["findings_count"] == 1
+    finally:
+        process.kill()
+        process.wait()
+
+
+def test_stdin_mode_rejects_malformed_xml() -> None:
+    process = _stream_process()
+    stdout, _ = process.communicate("<nmaprun><host>", timeout=30)
+
+    assert process.returncode == 1
+    assert "error" in json.loads(stdout.splitlines()[-1])
+
+
+def test_stdin_mode_truncates_findings_like_the_response() -> None:
+    process = _stream_process("--lab", "--limit", "max_findings=2")
+    stdout, _ = process.communicate(_stream_xml(3), timeout=30)
+
+    lines = [json.loads(line) for line in stdout.splitlines()]
+    assert process.returncode == 0
+    assert [line["finding"]["title"] for line in lines[:-1]] == [
+        "Port 22 open",
+        "Port 23 open",
+    ]
+    summary = lines[-1]
+    assert summary["findings_count"] == 2
+    assert summary["metadata"]["caps"]["cap_reason"] == "MAX_FINDINGS"
+
+
+def test_stdin_mode_lab_flag_raises_the_byte_limit() -> None:
+    payload = _stream_xml(400)
+    assert len(payload.encode()) > 32_768
+
+    default = _stream_process()
+    default_out, _ = default.communicate(payload, timeout=30)
+    lab = _stream_process("--lab")
+    lab_out, _ = lab.communicate(payload, timeout=30)
+
+    assert default.returncode == 1
+    assert "error" in json.loads(default_out.splitlines()[-1])
+    lines = [json.loads(line) for line in lab_out.splitlines()]
+    assert lab.returncode == 0
+    assert len(lines) == 101
+    assert lines[-1]["findings_count"] == 100
+
+
+def _load_script() -> ModuleType:
+    spec = importlib.util.spec_from_file_location("dry_run_ingest", SCRIPT)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class _FailingStream:
+    def __init__(self, error: Exception) -> None:
+        self.error = error
+        self.released = False
+
+    def feed(self, text: str) -> None:
+        raise self.error
+
+    def release(self) -> None:
+        self.released = True
+
+
+class _FailingParser:
+    def __init__(self, error: Exception, at_open: bool) -> None:
+        self.stream = _FailingStream(error)
+        self.at_open = at_open
+
+    def open_stream(self, *args: object, **kwargs: object) -> _FailingStream:
+        if self.at_open:
+            raise self.stream.error
+        return self.stream
+
+
+@pytest.mark.parametrize(
+    ("error", "at_open"),
+    [
+        (ParseCapacityError("Parse capacity is exhausted."), True),
+        (ParserTimeoutError("Parse deadline exceeded."), False),
+    ],
+)
+def test_stdin_mode_reports_capacity_and_deadline_errors(
+    error: Exception, at_open: bool
+) -> None:
+    script = _load_script()
+    parser = _FailingParser(error, at_open)
+    out = io.StringIO()
+
+    code = script.stream_ingest(io.BytesIO(b"<nmaprun>"), out, parser)
+
+    assert code == 1
+    assert json.loads(out.getvalue()) == {"error": str(error)}
+    assert parser.stream.released is not at_open
+
+
+def test_batch_mode_reports_each_file_and_aggregates(tmp_path: Path) -> None:
+    for name, hosts in (("a.xml", 1), ("b.xml", 2), ("c.xml", 3)):
+        (tmp_path / name).write_text(_stream_xml(hosts), encoding="utf-8")
+    (tmp_path / "broken.xml").write_text("<nmaprun><host>", encoding="utf-8")
+    (tmp_path / "notes.txt").write_text("skipped", encoding="utf-8")
+
+    result = subprocess.run(
+        [sys.executable, "scripts/dry_run_ingest.py", str(tmp_path), "--workers", "2"],
+        cwd=Path(__file__).resolve().parents[1],
+        env={**os.environ, "SCANSAGE_MAX_NMAP_HOSTS": "2"},
+        capture_output=True,
+        text=True,
+    )
+
+    lines = [json.loads(line) for line in result.stdout.splitlines()]
+    records = {line["file"]: line for line in lines[:-1]}
+    report = lines[-1]["report"]
+    assert result.returncode == 1
+    assert sorted(records) == ["a.xml", "b.xml", "broken.xml", "c.xml"]
+    assert records["b.xml"]["findings_count"] == 2
+    assert records["c.xml"]["cap_reasons"] == ["MAX_HOSTS"]
+    assert "error" in records["broken.xml"]
+    assert report["files"] == 4
+    assert report["failed"] == 2
+    assert report["findings_count"] == 3
+    assert report["cap_reasons"] == {"MAX_HOSTS": 1}
+    assert len(report["slowest"]) == 4
+    assert report["throughput_mb_s"] >= 0
+
+
+def test_batch_file_that_cannot_be_read_is_one_failed_record(
+    tmp_path: Path,
+) -> None:
+    script = _load_script()
+    (tmp_path / "ok.xml").write_text(_stream_xml(1), encoding="utf-8")
+
+    missing = script.ingest_file("gone.xml", tmp_path / "gone.xml", "minimal_xml")
+    ok = script.ingest_file("ok.xml", tmp_path / "ok.xml", "minimal_xml")
+    report = script.batch_report([missing, ok], 1.0, 1)
+
+    assert missing["error"] == "File could not be read."
+    assert missing["payload_bytes"] == 0
+    assert ok["findings_count"] == 1
+    assert report["files"] == 2
+    assert report["failed"] == 1
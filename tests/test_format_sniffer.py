@@ -0,0 +1,147 @@
+"""Format sniffing: ``auto`` routing and early rejection of mismatches."""
+
+from __future__ import annotations
+
+import base64
+import gzip
+import json
+from typing import Any, Iterator
+
+import pytest
+
+from mcp_scansage.mcp import reason_codes, schema_registry, server
+from mcp_scansage.services import nmap_ingest_store
+from mcp_scansage.services.nmap_ingest import ingest_nmap_public
+from mcp_scansage.services.nmap_parser import NmapGrepableParser, NoopNmapParser
+from mcp_scansage.services.scan_formats import (
+    SNIFF_CHARS,
+    FormatMismatchError,
+    resolve_format,
+    sniff_format,
+)
+
+NMAP_XML = (
+    "<?xml version='1.0'?><nmaprun><host><status state='up'/><ports>"
+    "<port protocol='tcp' portid='22'><state state='open'/>"
+    "<service name='ssh'/></port></ports></host></nmaprun>"
+)
+
+GREPABLE = (
+    "# Nmap 7.94 scan initiated as: nmap -oG -\n"
+    "Host: 192.0.2.10 ()\tPorts: 22/open/tcp//ssh///, 443/open/tcp//https///\n"
+)
+
+MASSCAN_JSON = "[\n{}\n]\n".format(
+    json.dumps(
+        {"ip": "192.0.2.10", "ports": [{"port": 22, "proto": "tcp", "status": "open"}]}
+    )
+)
+
+MASSCAN_LIST = "#masscan\nopen tcp 22 192.0.2.10 1792195200\n# end\n"
+
+
+@pytest.fixture(autouse=True)
+def _clear_records() -> Iterator[None]:
+    nmap_ingest_store.clear_records()
+    yield
+    nmap_ingest_store.clear_records()
+
+
+def _ingest(request: dict[str, Any]) -> Any:
+    return server.RESOURCE_REGISTRY["public://nmap/ingest"](request)
+
+
+@pytest.mark.parametrize(
+    ("head", "expected"),
+    [
+        (NMAP_XML, "nmap_xml"),
+        ("﻿\n  <nmaprun/>", "nmap_xml"),
+        (GREPABLE, "nmap_grepable"),
+        (MASSCAN_JSON, "masscan_json"),
+        ("\n{ }", "masscan_json"),
+        (MASSCAN_LIST, "masscan_list"),
+        ("open tcp 80 192.0.2.1 1792195200", "masscan_list"),
+        ("PORT_OPEN 22/tcp service=ssh", None),
+        ("", None),
+    ],
+)
+def test_sniff_format_reads_only_the_head(head: str, expected: str | None) -> None:
+    assert sniff_format(head) == expected
+    assert sniff_format("x" * SNIFF_CHARS + "\n" + head) is None
+
+
+def test_resolve_format_keeps_unrecognised_payloads_for_the_parser() -> None:
+    assert resolve_format("synthetic_v1", "PORT_OPEN 22/tcp service=ssh") == (
+        "synthetic_v1"
+    )
+    assert resolve_format("auto", GREPABLE) == "nmap_grepable"
+    with pytest.raises(FormatMismatchError):
+        resolve_format("auto", "PORT_OPEN 22/tcp service=ssh")
+    with pytest.raises(FormatMismatchError):
+        resolve_format("nmap_xml", MASSCAN_JSON)
+
+
+@pytest.mark.parametrize(
+    ("payload", "detected"),
+    [
+        (GREPABLE, "nmap_grepable"),
+        (MASSCAN_JSON, "masscan_json"),
+        (MASSCAN_LIST, "masscan_list"),
+    ],
+)
+def test_auto_routes_to_the_sniffed_parser(payload: str, detected: str) -> None:
+    explicit = _ingest({"format": detected, "payload": payload})
+    auto = _ingest({"format": "auto", "payload": payload})
+
+    schema_registry.validate("nmap_ingest_public_response_v0.2", auto)
+    assert auto["format"] == detected
+    assert auto["parsed_findings"] == explicit["parsed_findings"]
+
+
+def test_auto_detects_xml_for_the_configured_parser(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("SCANSAGE_NMAP_XML_PARSER", "real_minimal")
+
+    response = _ingest({"format": "auto", "payload": NMAP_XML})
+
+    assert response["format"] == "nmap_xml"
+    assert response["findings_count"] == 1
+
+
+def test_mismatch_is_rejected_before_the_parser_runs() -> None:
+    class _Refusing(NoopNmapParser):
+        def parse(self, payload: bytes, limits: object = None) -> Any:
+            raise AssertionError("parser must not run")
+
+    with pytest.raises(FormatMismatchError):
+        ingest_nmap_public(
+            "nmap_grepable", NMAP_XML, parser=_Refusing(), persist_record=False
+        )
+
+    response = _ingest({"format": "masscan_json", "payload": GREPABLE})
+    undetected = _ingest({"format": "auto", "payload": "not a scan"})
+
+    assert response["reason"] == reason_codes.FORMAT_MISMATCH
+    assert undetected["reason"] == reason_codes.FORMAT_MISMATCH
+    assert nmap_ingest_store.list_ingests() == []
+
+
+def test_auto_sniffs_inside_compressed_payloads() -> None:
+    encoded = base64.b64encode(gzip.compress(GREPABLE.encode())).decode("ascii")
+
+    response = _ingest(
+        {"format": "auto", "payload": encoded, "payload_encoding": "gzip+base64"}
+    )
+    mismatch = _ingest(
+        {
+            "format": "masscan_list",
+            "payload": encoded,
+            "payload_encoding": "gzip+base64",
+        }
+    )
+
+    assert response["format"] == "nmap_grepable"
+    assert response["parser_version"] == NmapGrepableParser.VERSION
+    assert response["findings_count"] == 2
+    assert mismatch["reason"] == reason_codes.FORMAT_MISMATCH
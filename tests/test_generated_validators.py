@@ -0,0 +1,189 @@
+"""Differential tests: generated validators must agree with Draft7Validator."""
+
+from __future__ import annotations
+
+import copy
+import random
+import signal
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Iterator
+
+import pytest
+from jsonschema import Draft7Validator
+
+from mcp_scansage.mcp import generated_validators, schema_registry, server
+from mcp_scansage.services.nmap_ingest import ingest_nmap_public
+from mcp_scansage.services.nmap_parser import MinimalNmapXmlParser
+
+ROOT = Path(__file__).resolve().parents[1]
+FIXTURE_DIR = ROOT / "tests" / "fixtures" / "nmap_xml"
+
+REPLACEMENTS: tuple[Any, ...] = (
+    None,
+    True,
+    False,
+    0,
+    1,
+    -1,
+    1.0,
+    1.5,
+    "",
+    "x",
+    "nmap_xml",
+    "low",
+    "MAX_FINDINGS",
+    "a" * 64,
+    "z" * 300,
+    [],
+    [{}],
+    {},
+)
+"""Values substituted at every node to probe type/const/enum/length keywords."""
+
+
+def _generated_accepts(name: str, instance: Any) -> bool:
+    try:
+        generated_validators.VALIDATORS[name](instance)
+    except schema_registry.SchemaValidationError:
+        return False
+    return True
+
+
+def _assert_same_verdict(name: str, instance: Any) -> None:
+    expected = Draft7Validator(schema_registry.get_schema(name)).is_valid(instance)
+    assert _generated_accepts(name, instance) is expected, (name, instance)
+
+
+def _mutations(value: Any) -> Iterator[Any]:
+    """Yield single-edit variants of ``value`` (replace, drop, add, resize)."""
+
+    for replacement in REPLACEMENTS:
+        yield replacement
+    if isinstance(value, dict):
+        yield {**value, "unexpected": "x"}
+        for key in value:
+            yield {k: v for k, v in value.items() if k != key}
+            for variant in _mutations(value[key]):
+                yield {**value, key: variant}
+    elif isinstance(value, list):
+        yield value * 101 if value else [None]
+        yield (value or [{}]) * 1001
+        for index, item in enumerate(value[:2]):
+            for variant in _mutations(item):
+                yield [*value[:index], variant, *value[index + 1 :]]
+
+
+def _corpus() -> list[Any]:
+    corpus: list[Any] = [
+        schema_registry.get_example(name) for name in schema_registry.EXAMPLE_FILES
+    ]
+    parser = MinimalNmapXmlParser()
+    for fixture in sorted(FIXTURE_DIR.glob("*.xml")):
+        payload = fixture.read_text(encoding="utf-8")
+        try:
+            response = ingest_nmap_public(
+                "nmap_xml", payload, parser=parser, persist_record=False
+            )
+        except ValueError:
+            continue
+        corpus.append(response)
+    return corpus
+
+
+@pytest.mark.parametrize("name", sorted(schema_registry.SCHEMA_FILES))
+def test_generated_validator_matches_draft7_on_examples_and_mutations(
+    name: str,
+) -> None:
+    """Every example, fixture response and single-edit mutation agrees."""
+
+    checked = 0
+    for instance in _corpus():
+        _assert_same_verdict(name, instance)
+        for variant in _mutations(instance):
+            _assert_same_verdict(name, variant)
+            checked += 1
+    assert checked > 1_000
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_generated_validator_matches_draft7_on_random_edits(seed: int) -> None:
+    """Stacked random edits of valid responses keep both validators in step."""
+
+    rng = random.Random(seed)
+    name = "nmap_ingest_public_response_v0.2"
+    base = schema_registry.get_example("nmap_ingest_public_response_example_v0.2")
+    for _ in range(300):
+        instance = copy.deepcopy(base)
+        for _ in range(rng.randint(1, 4)):
+            instance = rng.choice(list(_mutations(instance)))
+        _assert_same_verdict(name, instance)
+
+
+def test_validate_uses_generated_backend_by_default(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.delenv(schema_registry.SCHEMA_VALIDATOR_ENV, raising=False)
+    schema_registry.reload_validator_backend()
+    calls: list[Any] = []
+    name = "nmap_parsed_findings_v0.1"
+    monkeypatch.setattr(schema_registry, "_GENERATED", {name: calls.append})
+
+    schema_registry.validate(name, {"anything": True})
+    monkeypatch.setenv(
+        schema_registry.SCHEMA_VALIDATOR_ENV, schema_registry.JSONSCHEMA_BACKEND
+    )
+    schema_registry.validate(name, {"anything": True})
+    schema_registry.reload_validator_backend()
+    with pytest.raises(schema_registry.SchemaValidationError):
+        schema_registry.validate(name, {"anything": True})
+
+    # The env is only read again on reload, as on SIGHUP.
+    assert calls == [{"anything": True}, {"anything": True}]
+    assert schema_registry.get_validator_backend() == (
+        schema_registry.JSONSCHEMA_BACKEND
+    )
+
+
+def test_backend_is_snapshotted_at_startup_and_on_sighup(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv(schema_registry.SCHEMA_VALIDATOR_ENV, " JSONSchema ")
+    schema_registry.precompile_validators()
+    jsonschema_backend = schema_registry.get_validator_backend()
+
+    monkeypatch.setenv(schema_registry.SCHEMA_VALIDATOR_ENV, "generated")
+    before_signal = schema_registry.get_validator_backend()
+    server._reload_on_signal(getattr(signal, "SIGHUP", 1), None)
+
+    assert jsonschema_backend == before_signal == schema_registry.JSONSCHEMA_BACKEND
+    assert schema_registry.get_validator_backend() == (
+        schema_registry.GENERATED_BACKEND
+    )
+
+
+def test_stale_generated_validator_falls_back_to_draft7(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    name = "nmap_ingest_input_v0.1"
+    monkeypatch.setitem(generated_validators.SCHEMA_DIGESTS, name, "0" * 64)
+    monkeypatch.setattr(schema_registry, "_GENERATED", {})
+
+    assert schema_registry.get_generated_validator(name) is None
+    with pytest.raises(schema_registry.SchemaValidationError):
+        schema_registry.validate(name, {"format": "nmap_xml"})
+
+
+def test_generated_module_is_up_to_date() -> None:
+    """The committed module must match a fresh run of the generator."""
+
+    result = subprocess.run(
+        [sys.executable, "tools/generate_schema_validators.py", "--check"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert result.returncode == 0, result.stdout
@@ -0,0 +1,179 @@
+"""Masscan JSON (-oJ) and list (-oL) ingestion on the line streaming core."""
+
+from __future__ import annotations
+
+import json
+import tracemalloc
+from typing import Iterator
+
+import pytest
+
+from mcp_scansage.mcp import reason_codes, schema_registry, server
+from mcp_scansage.services import nmap_ingest_store
+from mcp_scansage.services.cap_audit import clear_cap_events, get_cap_events
+from mcp_scansage.services.cap_reason import CapReason
+from mcp_scansage.services.nmap_ingest import ingest_nmap_public
+from mcp_scansage.services.nmap_limits import (
+    AUTHORIZED_LAB_ENV,
+    get_limit_config,
+    reload_limit_config,
+)
+from mcp_scansage.services.nmap_parser import (
+    MasscanJsonParser,
+    MasscanListParser,
+    MasscanParser,
+    ParserLimitError,
+)
+
+RECORDS = [
+    ("192.0.2.10", "tcp", 443),
+    ("192.0.2.11", "tcp", 22),
+    ("192.0.2.10", "tcp", 80),
+    ("2001:db8::7", "udp", 53),
+]
+
+MASSCAN_JSON = "\n".join(
+    ["["]
+    + [
+        json.dumps(
+            {
+                "ip": ip,
+                "timestamp": "1792195200",
+                "ports": [{"port": port, "proto": proto, "status": "open"}],
+            }
+        )
+        + ","
+        for ip, proto, port in RECORDS
+    ]
+    + [
+        json.dumps(
+            {
+                "ip": "192.0.2.10",
+                "ports": [{"port": 80, "proto": "tcp", "service": {"name": "http"}}],
+            }
+        ),
+        "]",
+    ]
+)
+
+MASSCAN_LIST = "\n".join(
+    ["#masscan"]
+    + [f"open {proto} {port} {ip} 1792195200" for ip, proto, port in RECORDS]
+    + ["banner tcp 80 192.0.2.10 1792195200 http Server: nginx", "# end"]
+)
+
+
+@pytest.fixture(autouse=True)
+def _clean_state() -> Iterator[None]:
+    nmap_ingest_store.clear_records()
+    clear_cap_events()
+    yield
+    nmap_ingest_store.clear_records()
+    clear_cap_events()
+
+
+def test_json_and_list_outputs_yield_the_same_findings() -> None:
+    from_json = MasscanJsonParser().parse(MASSCAN_JSON.encode())
+    from_list = MasscanListParser().parse(MASSCAN_LIST.encode())
+
+    findings = [f.to_mapping() for f in from_json.findings]
+    assert findings == [f.to_mapping() for f in from_list.findings]
+    assert [f["title"] for f in findings] == [
+        "Port 443 open",
+        "Port 22 open",
+        "Port 80 open",
+        "Port 53 open",
+    ]
+    assert findings[3]["detail"].startswith("unknown service noted on UDP/53 ")
+    assert "192.0.2." not in json.dumps(findings)
+    assert "2001:db8" not in json.dumps(findings)
+
+
+@pytest.mark.parametrize(
+    ("overrides", "reason"),
+    [
+        ({"max_hosts": 2}, CapReason.MAX_HOSTS),
+        ({"max_ports_per_host": 1}, CapReason.MAX_PORTS),
+    ],
+)
+def test_records_are_grouped_by_address_for_caps(
+    overrides: dict[str, int], reason: CapReason
+) -> None:
+    limits = get_limit_config().with_overrides(overrides)
+
+    with pytest.raises(ParserLimitError):
+        MasscanListParser().parse(MASSCAN_LIST.encode(), limits)
+
+    (event,) = get_cap_events()
+    assert event["cap_reason"] == reason.value
+    assert event["counts_seen"]["hosts_processed"] == 2
+
+
+@pytest.mark.parametrize(
+    ("parser", "payload"),
+    [
+        (
+            MasscanJsonParser(),
+            '{"ip": "192.0.2.1", "ports": '
+            '[{"port": "x", "proto": "tcp", "status": "open"}]}',
+        ),
+        (MasscanJsonParser(), "{not json"),
+        (MasscanListParser(), "open tcp 80 192.0.2.1"),
+        (MasscanListParser(), "open tcp http 192.0.2.1 1792195200"),
+        (MasscanListParser(), MASSCAN_JSON),
+    ],
+)
+def test_malformed_records_are_rejected(parser, payload: str) -> None:
+    with pytest.raises(ValueError):
+        parser.parse(payload.encode())
+
+
+def test_chunked_stream_uses_constant_memory() -> None:
+    limits = get_limit_config().with_overrides(
+        {"max_hosts": 64, "max_ports_per_host": 1_000_000}
+    )
+
+    def chunks(records: int) -> Iterator[str]:
+        line = "closed tcp {port} 192.0.2.{host} 1792195200\n"
+        for start in range(0, records, 500):
+            yield "".join(
+                line.format(port=index % 65535 + 1, host=index % 64)
+                for index in range(start, start + 500)
+            )
+
+    peaks = []
+    for records in (5_000, 20_000):
+        tracemalloc.start()
+        try:
+            result = MasscanListParser().parse_stream(chunks(records), 0, limits)
+            peaks.append(tracemalloc.get_traced_memory()[1])
+        finally:
+            tracemalloc.stop()
+        assert result.findings_count == 0
+
+    assert peaks[1] < peaks[0] * 1.5
+
+
+def test_ingest_routes_masscan_formats(monkeypatch: pytest.MonkeyPatch) -> None:
+    resource = server.RESOURCE_REGISTRY["public://nmap/ingest"]
+
+    from_json = resource({"format": "masscan_json", "payload": MASSCAN_JSON})
+    from_list = resource({"format": "masscan_list", "payload": MASSCAN_LIST})
+    mismatch = resource({"format": "masscan_list", "payload": MASSCAN_JSON})
+    monkeypatch.setenv(AUTHORIZED_LAB_ENV, "1")
+    reload_limit_config()
+    streamed = ingest_nmap_public("masscan_list", MASSCAN_LIST, persist_record=False)
+
+    schema_registry.validate("nmap_ingest_public_response_v0.2", from_json)
+    assert from_json["parser_version"] == MasscanJsonParser.VERSION
+    assert from_json["findings_count"] == from_list["findings_count"] == 4
+    assert streamed["parsed_findings"] == from_list["parsed_findings"]
+    assert mismatch["reason"] == reason_codes.FORMAT_MISMATCH
+
+
+def test_masscan_core_requires_a_record_reader() -> None:
+    class _NoRecords(MasscanParser):
+        pass
+
+    with pytest.raises(TypeError, match="_records"):
+        _NoRecords()
@@ -0,0 +1,129 @@
+"""Nmap grepable output (-oG): parser, caps and the ingest format."""
+
+from __future__ import annotations
+
+import json
+from typing import Iterator
+
+import pytest
+
+from mcp_scansage.mcp import reason_codes, schema_registry, server
+from mcp_scansage.services import nmap_ingest_store
+from mcp_scansage.services.cap_audit import clear_cap_events, get_cap_events
+from mcp_scansage.services.cap_reason import CapReason
+from mcp_scansage.services.nmap_limits import get_limit_config
+from mcp_scansage.services.nmap_parser import (
+    MinimalNmapXmlParser,
+    NmapGrepableParser,
+    NmapLineParser,
+    ParserLimitError,
+)
+
+GREPABLE = "\n".join(
+    [
+        "# Nmap 7.94 scan initiated Sat Oct 17 02:00:00 2026 as: nmap -sV -oG -",
+        "Host: 192.0.2.10 (db.example.internal)\tStatus: Up",
+        "Host: 192.0.2.10 (db.example.internal)\tPorts: "
+        "22/open/tcp//ssh//OpenSSH 9.6/, 5432/open/tcp//postgresql///, "
+        "8080/closed/tcp//http-proxy///\tIgnored State: filtered (997)",
+        "Host: 2001:db8::7 ()\tStatus: Up",
+        "Host: 2001:db8::7 ()\tPorts: 53/open/udp//domain//dnsmasq 2.90/",
+        "Host: 192.0.2.11 ()\tStatus: Down",
+        "# Nmap done at Sat Oct 17 02:00:09 2026 -- 3 IP addresses scanned",
+    ]
+)
+
+EQUIVALENT_XML = """<nmaprun>
+<host><status state="up"/><address addr="192.0.2.10" addrtype="ipv4"/>
+<hostnames><hostname name="db.example.internal"/></hostnames><ports>
+<port protocol="tcp" portid="22"><state state="open"/>
+<service name="ssh" product="OpenSSH" version="9.6"/></port>
+<port protocol="tcp" portid="5432"><state state="open"/>
+<service name="postgresql"/></port>
+<port protocol="tcp" portid="8080"><state state="closed"/>
+<service name="http-proxy"/></port></ports></host>
+<host><status state="up"/><address addr="2001:db8::7" addrtype="ipv6"/><ports>
+<port protocol="udp" portid="53"><state state="open"/>
+<service name="domain" product="dnsmasq" version="2.90"/></port></ports></host>
+<host><status state="down"/><address addr="192.0.2.11" addrtype="ipv4"/></host>
+</nmaprun>"""
+
+
+@pytest.fixture(autouse=True)
+def _clean_state() -> Iterator[None]:
+    nmap_ingest_store.clear_records()
+    clear_cap_events()
+    yield
+    nmap_ingest_store.clear_records()
+    clear_cap_events()
+
+
+def _limits(**overrides: int):
+    return get_limit_config().with_overrides(overrides)
+
+
+def test_findings_match_the_equivalent_xml_scan() -> None:
+    grepable = NmapGrepableParser().parse(GREPABLE.encode())
+    xml = MinimalNmapXmlParser().parse(EQUIVALENT_XML.encode())
+
+    assert grepable.parsed is True
+    assert grepable.parser_version == NmapGrepableParser.VERSION
+    assert [f.to_mapping() for f in grepable.findings] == [
+        f.to_mapping() for f in xml.findings
+    ]
+    text = json.dumps([f.to_mapping() for f in grepable.findings])
+    for identifier in ("192.0.2.10", "2001:db8::7", "db.example.internal"):
+        assert identifier not in text
+
+
+@pytest.mark.parametrize(
+    ("overrides", "reason"),
+    [
+        ({"max_hosts": 1}, CapReason.MAX_HOSTS),
+        ({"max_ports_per_host": 2}, CapReason.MAX_PORTS),
+        ({"max_findings": 2}, CapReason.MAX_FINDINGS),
+    ],
+)
+def test_caps_are_enforced_like_the_xml_parser(
+    overrides: dict[str, int], reason: CapReason
+) -> None:
+    with pytest.raises(ParserLimitError):
+        NmapGrepableParser().parse(GREPABLE.encode(), _limits(**overrides))
+
+    (event,) = get_cap_events()
+    assert event["cap_reason"] == reason.value
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        b"Nmap scan report for 192.0.2.10",
+        b"Host: 192.0.2.10 ()\tPorts: 22/open/tcp",
+        b"Host: 192.0.2.10 ()\tPorts: 22/open/tcp//\xff//",
+    ],
+)
+def test_malformed_grepable_payloads_are_rejected(payload: bytes) -> None:
+    with pytest.raises(ValueError):
+        NmapGrepableParser().parse(payload)
+
+
+def test_ingest_resource_routes_the_grepable_format() -> None:
+    resource = server.RESOURCE_REGISTRY["public://nmap/ingest"]
+
+    response = resource({"format": "nmap_grepable", "payload": GREPABLE})
+    malformed = resource({"format": "nmap_grepable", "payload": "not grepable"})
+
+    schema_registry.validate("nmap_ingest_public_response_v0.2", response)
+    assert response["format"] == "nmap_grepable"
+    assert response["findings_count"] == 3
+    assert malformed["reason"] == reason_codes.INVALID_INPUT
+    listed = server.RESOURCE_REGISTRY["public://nmap/ingests"]({})
+    assert listed["ingests"][0]["parser_version"] == NmapGrepableParser.VERSION
+
+
+def test_line_parser_core_requires_the_format_hooks() -> None:
+    class _NoHooks(NmapLineParser):
+        pass
+
+    with pytest.raises(TypeError, match="_collect_line, _finding_from_port"):
+        _NoHooks()
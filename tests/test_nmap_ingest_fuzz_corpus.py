@@ -9,6 +9,9 @@ from pathlib import Path
 import pytest
 
 from mcp_scansage.mcp import reason_codes, schema_registry, server
+from mcp_scansage.services.cap_audit import clear_cap_events, get_cap_events
+from mcp_scansage.services.cap_reason import CapReason
+from mcp_scansage.services.nmap_limits import reload_limit_config
 
 FIXTURE_DIR = Path(__file__).resolve().parent / "fixtures" / "nmap_xml"
 PUBLIC_SCHEMA = "nmap_ingest_public_response_v0.2"
@@ -79,6 +82,7 @@ def test_caps_metadata_deterministic_for_noisy_payload(
     monkeypatch.setenv("SCANSAGE_MAX_NMAP_HOSTS", "10")
     monkeypatch.setenv("SCANSAGE_MAX_NMAP_PORTS_PER_HOST", "5")
     monkeypatch.delenv("SCANSAGE_AUTHORIZED_LAB", raising=False)
+    reload_limit_config()
 
     resource = server.RESOURCE_REGISTRY[RESOURCE_NAME]
     payload = _load_fixture("caps_trigger.xml")
@@ -92,3 +96,77 @@ def test_caps_metadata_deterministic_for_noisy_payload(
 
     serialized = json.dumps(first)
     _assert_no_identifiers(serialized)
+
+
+@pytest.mark.parametrize(
+    ("fixture_name", "cap_reason", "limit_key", "seen_key"),
+    [
+        ("deep_nesting.xml", CapReason.MAX_XML_DEPTH, "max_xml_depth", "xml_depth"),
+        (
+            "attribute_flood.xml",
+            CapReason.MAX_XML_ATTRIBUTES,
+            "max_xml_attributes",
+            "xml_attributes",
+        ),
+        (
+            "giant_extrainfo.xml",
+            CapReason.MAX_XML_TEXT_LENGTH,
+            "max_xml_text_length",
+            "xml_text_length",
+        ),
+        (
+            "giant_script_output.xml",
+            CapReason.MAX_XML_TEXT_LENGTH,
+            "max_xml_text_length",
+            "xml_text_length",
+        ),
+    ],
+)
+@pytest.mark.parametrize("parser", ["real_minimal", "safe_xml"])
+def test_structural_limits_cap_during_streaming(
+    monkeypatch: pytest.MonkeyPatch,
+    fixture_name: str,
+    cap_reason: CapReason,
+    limit_key: str,
+    seen_key: str,
+    parser: str,
+) -> None:
+    """Depth, attribute-count and text-length caps stop the parse and audit it."""
+
+    monkeypatch.setenv("SCANSAGE_NMAP_XML_PARSER", parser)
+    clear_cap_events()
+
+    response = server.RESOURCE_REGISTRY[RESOURCE_NAME](
+        {"format": "nmap_xml", "payload": _load_fixture(fixture_name)}
+    )
+
+    assert response["reason"] == reason_codes.INVALID_INPUT
+    (event,) = get_cap_events()
+    assert event["cap_reason"] == cap_reason.value
+    assert event["counts_seen"][seen_key] > event["limits"][limit_key]
+    assert event["counts_seen"]["findings_processed"] == 0
+    _assert_no_identifiers(json.dumps(event))
+    clear_cap_events()
+
+
+def test_structural_limits_follow_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Raising the caps lets the same payloads through the parser."""
+
+    monkeypatch.setenv("SCANSAGE_NMAP_XML_PARSER", "real_minimal")
+    monkeypatch.setenv("SCANSAGE_MAX_NMAP_XML_DEPTH", "128")
+    monkeypatch.setenv("SCANSAGE_MAX_NMAP_XML_ATTRIBUTES", "64")
+    monkeypatch.setenv("SCANSAGE_MAX_NMAP_XML_TEXT_LENGTH", "16384")
+    reload_limit_config()
+    clear_cap_events()
+    resource = server.RESOURCE_REGISTRY[RESOURCE_NAME]
+
+    for fixture_name in (
+        "deep_nesting.xml",
+        "attribute_flood.xml",
+        "giant_script_output.xml",
+    ):
+        response = resource(
+            {"format": "nmap_xml", "payload": _load_fixture(fixture_name)}
+        )
+        assert response["findings_count"] == 1, fixture_name
+    assert get_cap_events() == []
@@ -2,16 +2,25 @@
 
 from __future__ import annotations
 
+import itertools
 import json
+import signal
 
 import pytest
 
 from mcp_scansage.mcp import reason_codes, server
-from mcp_scansage.services import nmap_ingest_store
+from mcp_scansage.services import nmap_ingest_store, nmap_parser
 from mcp_scansage.services.cap_audit import EVENT_NAME, clear_cap_events, get_cap_events
 from mcp_scansage.services.cap_reason import CapReason
 from mcp_scansage.services.nmap_ingest import PayloadTooLargeError, ingest_nmap_public
-from mcp_scansage.services.nmap_limits import DEFAULT_NMAP_LIMITS, NmapLimitConfig
+from mcp_scansage.services.nmap_limits import (
+    DEFAULT_NMAP_LIMITS,
+    NmapLimitConfig,
+    get_limit_config,
+    reload_limit_config,
+    resolve_limit_config,
+)
+from mcp_scansage.services.nmap_parser import ParserTimeoutError
 
 RESOURCE_NAME = "public://nmap/ingest"
 PUBLIC_SCHEMA = "nmap_ingest_public_response_v0.2"
@@ -73,6 +82,7 @@ def _configure_caps_env(
     monkeypatch.setenv("SCANSAGE_MAX_NMAP_HOSTS", str(host_limit))
     monkeypatch.setenv("SCANSAGE_MAX_NMAP_PORTS_PER_HOST", str(ports_limit))
     monkeypatch.delenv("SCANSAGE_AUTHORIZED_LAB", raising=False)
+    reload_limit_config()
 
 
 def _assert_cap_event_structure(event: dict[str, object]) -> None:
@@ -80,12 +90,18 @@ def _assert_cap_event_structure(event: dict[str, object]) -> None:
 
     assert set(event.keys()) == {
         "event",
+        "ts",
+        "pid",
+        "seq",
         "cap_reason",
         "limits",
         "counts_seen",
         "counts_returned",
     }
     assert event["event"] == EVENT_NAME
+    assert isinstance(event["ts"], float)
+    assert isinstance(event["pid"], int)
+    assert isinstance(event["seq"], int)
 
 
 def test_oversized_payload_rejected_and_not_persisted() -> None:
@@ -248,6 +264,7 @@ def test_invalid_env_values_default_to_safe_limits(
         monkeypatch.setenv(key, invalid_value if key == env_var else value)
     monkeypatch.setenv("SCANSAGE_NMAP_XML_PARSER", "real_minimal")
     monkeypatch.delenv("SCANSAGE_AUTHORIZED_LAB", raising=False)
+    reload_limit_config()
 
     resource = server.RESOURCE_REGISTRY[RESOURCE_NAME]
     payload = _build_hosts(6, 2)
@@ -258,3 +275,109 @@ def test_invalid_env_values_default_to_safe_limits(
     assert getattr(DEFAULT_NMAP_LIMITS, limit_key)
     serialized = json.dumps(response)
     assert "192.0.2." not in serialized
+
+
+def test_limit_snapshot_ignores_env_until_reload(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Limits are read once; env edits only apply after an explicit reload."""
+
+    monkeypatch.setenv("SCANSAGE_MAX_NMAP_FINDINGS", "7")
+    snapshot = reload_limit_config()
+    monkeypatch.setenv("SCANSAGE_MAX_NMAP_FINDINGS", "9")
+
+    assert get_limit_config() is snapshot
+    assert get_limit_config().max_findings == 7
+    assert reload_limit_config().max_findings == 9
+    assert get_limit_config().max_findings == 9
+
+
+def test_limit_overrides_replace_only_named_limits() -> None:
+    config = resolve_limit_config({"max_findings": 500})
+
+    assert config.max_findings == 500
+    assert config.max_hosts == get_limit_config().max_hosts
+    assert resolve_limit_config() is get_limit_config()
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [{"max_widgets": 5}, {"max_hosts": 0}, {"max_hosts": "10"}, {"max_hosts": True}],
+)
+def test_invalid_limit_overrides_rejected(overrides: dict[str, object]) -> None:
+    with pytest.raises(ValueError):
+        DEFAULT_NMAP_LIMITS.with_overrides(overrides)  # type: ignore[arg-type]
+
+
+def test_resource_limit_overrides_lift_env_caps(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A resource registered with overrides is not bound by the env caps."""
+
+    _configure_caps_env(monkeypatch, findings_limit=2)
+    payload = _build_hosts(2, 3)
+    request = {"format": "nmap_xml", "payload": payload}
+
+    default_response = server.RESOURCE_REGISTRY[RESOURCE_NAME](request)
+    tenant_response = server.NmapIngestResource({"max_findings": 10})(request)
+
+    assert default_response["reason"] == reason_codes.INVALID_INPUT
+    assert [event["cap_reason"] for event in get_cap_events()] == ["MAX_FINDINGS"]
+    assert tenant_response["findings_count"] == 6
+
+
+def test_reload_signal_handler_refreshes_snapshot(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("SCANSAGE_MAX_NMAP_HOSTS", "3")
+    reload_limit_config()
+    monkeypatch.setenv("SCANSAGE_MAX_NMAP_HOSTS", "4")
+
+    server._reload_on_signal(getattr(signal, "SIGHUP", 1), None)
+
+    assert get_limit_config().max_hosts == 4
+
+
+def _ticking_clock(monkeypatch: pytest.MonkeyPatch, step: float) -> None:
+    """Make every monotonic read in the parser advance by ``step`` seconds."""
+
+    ticks = itertools.count()
+    monkeypatch.setattr(
+        nmap_parser.time, "monotonic", lambda: next(ticks) * step, raising=True
+    )
+
+
+def test_parse_deadline_caps_with_progress_counts(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A parse past its deadline stops between ports and reports how far it got."""
+
+    _ticking_clock(monkeypatch, 0.01)
+    limits = DEFAULT_NMAP_LIMITS.with_overrides({"parse_deadline_ms": 45})
+
+    with pytest.raises(ParserTimeoutError):
+        nmap_parser.MinimalNmapXmlParser().parse(_build_hosts(4, 3).encode(), limits)
+
+    (event,) = get_cap_events()
+    assert event["cap_reason"] == CapReason.PARSE_DEADLINE.value
+    assert event["limits"]["parse_deadline_ms"] == 45
+    assert event["counts_seen"]["elapsed_ms"] > 45
+    assert event["counts_seen"]["hosts_processed"] >= 1
+    assert 0 < event["counts_seen"]["ports_processed"] < 12
+
+
+def test_parse_deadline_maps_to_stable_reason_code(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _configure_caps_env(monkeypatch, findings_limit=50)
+    monkeypatch.setenv("SCANSAGE_NMAP_PARSE_DEADLINE_MS", "45")
+    reload_limit_config()
+    _ticking_clock(monkeypatch, 0.01)
+    request = {"format": "nmap_xml", "payload": _build_hosts(4, 3)}
+
+    response = server.RESOURCE_REGISTRY[RESOURCE_NAME](request)
+    patient = server.NmapIngestResource({"parse_deadline_ms": 60_000})(request)
+
+    assert response["reason"] == reason_codes.PARSE_DEADLINE_EXCEEDED
+    assert "192.0.2." not in json.dumps(response)
+    assert patient["findings_count"] == 12
@@ -6,6 +6,7 @@ import pytest
 
 from mcp_scansage.mcp import reason_codes, schema_registry, server
 from mcp_scansage.services import nmap_ingest_store
+from mcp_scansage.services.nmap_limits import reload_limit_config
 from mcp_scansage.services.nmap_parser import MinimalNmapXmlParser
 
 RESOURCE_NAME = "public://nmap/ingest"
@@ -36,6 +37,7 @@ def _run_ingest_with_parser(
         monkeypatch.setenv("SCANSAGE_AUTHORIZED_LAB", "1")
     else:
         monkeypatch.delenv("SCANSAGE_AUTHORIZED_LAB", raising=False)
+    reload_limit_config()
     resource = server.RESOURCE_REGISTRY[RESOURCE_NAME]
     return resource({"format": "nmap_xml", "payload": payload})
 
@@ -207,6 +209,7 @@ def test_capped_response_persists_and_stays_redacted(
     monkeypatch.setenv("SCANSAGE_MAX_NMAP_HOSTS", "10")
     monkeypatch.setenv("SCANSAGE_MAX_NMAP_PORTS_PER_HOST", "8")
     monkeypatch.delenv("SCANSAGE_AUTHORIZED_LAB", raising=False)
+    reload_limit_config()
 
     payload = _build_hosts_payload(5, 1)
     response = _run_ingest_with_parser(monkeypatch, payload, "real_minimal")
@@ -2,7 +2,11 @@
 
 import json
 
+import pytest
+from synthetic_payload import generate_synthetic_payload
+
 from mcp_scansage.mcp import reason_codes, schema_registry, server
+from mcp_scansage.services.nmap_parser import SyntheticNmapParser
 
 
 def _synthetic_request(payload: str) -> dict[str, object]:
@@ -48,3 +52,45 @@ def test_synthetic_input_example_validates_schema() -> None:
 
     example = schema_registry.get_example("nmap_ingest_input_example_v0.2")
     schema_registry.validate("nmap_ingest_input_v0.2", example)
+
+
+def test_generated_payload_is_seeded_and_sized() -> None:
+    """The generator is deterministic per seed and stays within the size."""
+
+    payload = generate_synthetic_payload(10_000, seed=7)
+
+    assert payload == generate_synthetic_payload(10_000, seed=7)
+    assert payload != generate_synthetic_payload(10_000, seed=8)
+    assert 9_950 < len(payload.encode()) <= 10_000
+    result = SyntheticNmapParser().parse(payload.encode())
+    assert result.findings_count == payload.count("\n") + 1
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        generate_synthetic_payload(5_000, seed=1),
+        "\r\n  PORT_OPEN 22/tcp\tservice=SSH \r\n\nport_open 080/TCP service=http\n",
+        generate_synthetic_payload(5_000, seed=2, identifier_every=3),
+        "PORT_OPEN 22/tcp service=ssh\x0bPORT_OPEN 23/tcp service=telnet",
+    ],
+)
+def test_bulk_and_line_paths_agree(payload: str) -> None:
+    """The one-pass bulk path returns what the line-by-line path returns."""
+
+    parser = SyntheticNmapParser()
+    bulk = parser._bulk_ports(payload)
+
+    assert bulk is None or bulk == parser._line_ports(payload)
+    assert parser.parse(payload.encode()).findings
+    if "ip=" not in payload and "\x0b" not in payload:
+        assert bulk is not None
+
+
+def test_bulk_path_still_rejects_malformed_lines() -> None:
+    """A malformed line after valid ones falls back and is refused."""
+
+    payload = generate_synthetic_payload(2_000) + "\nPORT_OPEN 22/udp service=dns"
+
+    with pytest.raises(ValueError, match="malformed"):
+        SyntheticNmapParser().parse(payload.encode())
@@ -99,3 +99,35 @@ def test_service_rejects_payload_over_limit() -> None:
     payload = "A" * (MAX_PAYLOAD_BYTES + 1)
     with pytest.raises(PayloadTooLargeError):
         ingest_nmap_public("nmap_xml", payload)
+
+
+def test_ingest_response_scrubs_nested_identifiers(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Identifiers anywhere in the response are redacted before it is returned."""
+
+    leaked = deepcopy(
+        schema_registry.get_example("nmap_ingest_public_response_example_v0.2")
+    )
+    leaked["ingest_id"] = "web01.example.com"
+    leaked["parsed_findings"][0]["detail"] = (
+        "ssh on TCP/22 host=ipv4:192.0.2.7; mac:00:11:22:33:44:55"
+    )
+    leaked["next_steps"].append("Re-scan db01.example.com over fe80::1:2:3")
+
+    def fake_ingest(*args: object, **kwargs: object) -> dict[str, object]:
+        return deepcopy(leaked)
+
+    monkeypatch.setattr(server, "ingest_nmap_public", fake_ingest)
+    resource = server.RESOURCE_REGISTRY[RESOURCE_NAME]
+    response = resource(deepcopy(schema_registry.get_example(INPUT_EXAMPLE)))
+
+    schema_registry.validate(PUBLIC_SCHEMA, response)
+    assert "web01" not in response["ingest_id"]
+    assert response["summary"] == leaked["summary"]
+    assert response["parsed_findings"][0]["detail"] == (
+        "ssh on TCP/22 host=ipv4:[redacted]; mac:[redacted]"
+    )
+    serialized = _serialize_response(response)
+    for pattern in (IPv4_PATTERN, IPv6_PATTERN, MAC_PATTERN, HOSTNAME_PATTERN):
+        assert not pattern.search(serialized)
@@ -0,0 +1,225 @@
+"""Lab-mode large payload profile and streamed ingestion."""
+
+from __future__ import annotations
+
+import base64
+import gzip
+import hashlib
+from typing import Iterator
+
+import pytest
+
+from mcp_scansage.mcp import reason_codes, server
+from mcp_scansage.services import nmap_ingest_store
+from mcp_scansage.services.cap_audit import clear_cap_events, get_cap_events
+from mcp_scansage.services.cap_reason import CapReason
+from mcp_scansage.services.nmap_limits import (
+    AUTHORIZED_LAB_ENV,
+    DEFAULT_NMAP_LIMITS,
+    LAB_NMAP_LIMITS,
+    NmapLimitConfig,
+    reload_limit_config,
+)
+from mcp_scansage.services.nmap_parser import (
+    MinimalNmapXmlParser,
+    NmapXmlStream,
+    NoopNmapParser,
+    ParserLimitError,
+    get_configured_nmap_parser,
+)
+from mcp_scansage.services.payload_stream import PayloadSizeError, PayloadStream
+
+RESOURCE_NAME = "public://nmap/ingest"
+
+
+@pytest.fixture(autouse=True)
+def _isolate(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.delenv("SCANSAGE_NMAP_XML_PARSER", raising=False)
+    nmap_ingest_store.clear_records()
+    clear_cap_events()
+    yield
+    nmap_ingest_store.clear_records()
+    clear_cap_events()
+
+
+@pytest.fixture
+def lab_mode(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(AUTHORIZED_LAB_ENV, "1")
+    reload_limit_config()
+
+
+def _hosts_payload(host_count: int, ports_per_host: int = 2) -> str:
+    host = "<host><status state='up'/><ports>{}</ports></host>"
+    port = (
+        "<port protocol='tcp' portid='{}'><state state='open'/>"
+        "<service name='http' product='lab'/></port>"
+    )
+    ports = "".join(port.format(n) for n in range(1, ports_per_host + 1))
+    return "<nmaprun>" + host.format(ports) * host_count + "</nmaprun>"
+
+
+def test_lab_mode_selects_large_profile(
+    monkeypatch: pytest.MonkeyPatch, lab_mode: None
+) -> None:
+    assert NmapLimitConfig.from_env() == LAB_NMAP_LIMITS
+
+    monkeypatch.setenv("SCANSAGE_MAX_NMAP_XML_BYTES", "100000")
+    config = NmapLimitConfig.from_env()
+
+    assert config.lab_profile
+    assert config.max_xml_bytes == 100_000
+    assert config.max_hosts == LAB_NMAP_LIMITS.max_hosts
+
+
+def test_parser_selection_follows_the_limit_snapshot(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv(AUTHORIZED_LAB_ENV, "1")
+    assert isinstance(get_configured_nmap_parser(), NoopNmapParser)
+
+    reload_limit_config()
+    assert isinstance(get_configured_nmap_parser(), MinimalNmapXmlParser)
+
+    monkeypatch.delenv(AUTHORIZED_LAB_ENV)
+    assert isinstance(get_configured_nmap_parser(), MinimalNmapXmlParser)
+
+
+def test_lab_profile_cannot_be_toggled_per_request() -> None:
+    with pytest.raises(ValueError):
+        DEFAULT_NMAP_LIMITS.with_overrides({"lab_profile": 1})
+
+
+def test_lab_resource_streams_payload_past_schema_length(lab_mode: None) -> None:
+    payload = _hosts_payload(400)
+    assert len(payload) > 32_768
+
+    response = server.RESOURCE_REGISTRY[RESOURCE_NAME](
+        {"format": "nmap_xml", "payload": payload}
+    )
+
+    encoded = payload.encode("utf-8")
+    assert response["summary"]["payload_bytes"] == len(encoded)
+    assert response["summary"]["payload_sha256"] == hashlib.sha256(encoded).hexdigest()
+    assert response["findings_count"] == LAB_NMAP_LIMITS.max_findings
+    caps = response["metadata"]["caps"]
+    assert caps["cap_reason"] == CapReason.MAX_FINDINGS.value
+    assert caps["counts"]["findings_processed"] == LAB_NMAP_LIMITS.max_findings
+
+
+def test_lab_stream_stops_parsing_at_the_findings_cap(
+    monkeypatch: pytest.MonkeyPatch, lab_mode: None
+) -> None:
+    hosts_seen = []
+    on_host = NmapXmlStream._on_host
+
+    def counting_on_host(stream: NmapXmlStream, host: object) -> None:
+        hosts_seen.append(host)
+        on_host(stream, host)
+
+    monkeypatch.setattr(NmapXmlStream, "_on_host", counting_on_host)
+    # The tail past the cap is never parsed, so even malformed XML there is
+    # only counted towards the size and digest.
+    payload = _hosts_payload(2_000)[: -len("</nmaprun>")] + "<host><unclosed>"
+
+    response = server.RESOURCE_REGISTRY[RESOURCE_NAME](
+        {"format": "nmap_xml", "payload": payload}
+    )
+
+    encoded = payload.encode("utf-8")
+    assert response["findings_count"] == LAB_NMAP_LIMITS.max_findings
+    assert response["summary"]["payload_bytes"] == len(encoded)
+    assert response["summary"]["payload_sha256"] == hashlib.sha256(encoded).hexdigest()
+    assert response["metadata"]["caps"]["cap_reason"] == CapReason.MAX_FINDINGS.value
+    # Only the chunk that crossed the cap is parsed past it.
+    assert len(hosts_seen) < 2_000 // 4
+
+
+def test_lab_alias_resource_streams_large_payload(lab_mode: None) -> None:
+    response = server.RESOURCE_REGISTRY["ingest_nmap_xml"](
+        {"payload": _hosts_payload(400)}
+    )
+
+    assert response["findings_count"] == LAB_NMAP_LIMITS.max_findings
+
+
+def test_lab_oversize_payload_is_rejected_by_the_stream(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv(AUTHORIZED_LAB_ENV, "1")
+    monkeypatch.setenv("SCANSAGE_MAX_NMAP_XML_BYTES", "40000")
+    reload_limit_config()
+
+    response = server.RESOURCE_REGISTRY[RESOURCE_NAME](
+        {"format": "nmap_xml", "payload": _hosts_payload(400)}
+    )
+
+    assert response["reason"] == reason_codes.PAYLOAD_TOO_LARGE
+    (event,) = get_cap_events()
+    assert event["cap_reason"] == CapReason.MAX_PAYLOAD_BYTES.value
+    assert event["counts_seen"]["payload_bytes"] > 40_000
+    assert not nmap_ingest_store.list_ingests()
+
+
+@pytest.mark.parametrize("compressed", [False, True])
+def test_lab_buffered_parsers_keep_the_default_byte_cap(
+    lab_mode: None, compressed: bool
+) -> None:
+    text = "PORT_OPEN 22/tcp service=ssh\n" * 4_000
+    assert len(text) > DEFAULT_NMAP_LIMITS.max_xml_bytes
+    request = {
+        "format": "synthetic_v1",
+        "payload": text,
+        "meta": {"parser": "synthetic_v1"},
+    }
+    if compressed:
+        request["payload"] = base64.b64encode(gzip.compress(text.encode())).decode()
+        request["payload_encoding"] = "gzip+base64"
+
+    response = server.RESOURCE_REGISTRY[RESOURCE_NAME](request)
+
+    assert response["reason"] == reason_codes.PAYLOAD_TOO_LARGE
+    (event,) = get_cap_events()
+    assert event["cap_reason"] == CapReason.MAX_PAYLOAD_BYTES.value
+    assert event["limits"]["max_payload_bytes"] == DEFAULT_NMAP_LIMITS.max_xml_bytes
+    # Inflation stops at the cap instead of buffering the whole payload.
+    assert compressed is (event["counts_seen"]["payload_bytes"] < len(text))
+    assert not nmap_ingest_store.list_ingests()
+
+
+def test_default_profile_still_enforces_schema_length() -> None:
+    response = server.RESOURCE_REGISTRY[RESOURCE_NAME](
+        {"format": "nmap_xml", "payload": _hosts_payload(400)}
+    )
+
+    assert response["reason"] == reason_codes.INVALID_INPUT
+
+
+def test_streamed_parse_memory_is_bounded_by_one_host() -> None:
+    payload = _hosts_payload(2_000, ports_per_host=1)
+    limits = LAB_NMAP_LIMITS.with_overrides(
+        {"max_findings": 5_000, "max_parse_memory_bytes": 64 * 1024}
+    )
+
+    with pytest.raises(ParserLimitError):
+        MinimalNmapXmlParser().parse(payload.encode(), limits)
+    result = MinimalNmapXmlParser().parse_stream(
+        PayloadStream(payload, limits.max_xml_bytes, chunk_chars=4_096),
+        len(payload),
+        limits,
+    )
+
+    assert result.findings_count == 2_000
+    assert result.cap_info is None
+
+
+def test_payload_stream_accounts_bytes_and_digest() -> None:
+    text = "é" * 10 + "x" * 100
+    stream = PayloadStream(text, max_bytes=1_000, chunk_chars=7)
+
+    assert "".join(stream) == text
+    assert stream.byte_count == len(text.encode())
+    assert stream.hexdigest() == hashlib.sha256(text.encode()).hexdigest()
+
+    with pytest.raises(PayloadSizeError) as excinfo:
+        PayloadStream(text, max_bytes=50, chunk_chars=7).drain()
+    assert excinfo.value.byte_count > 50
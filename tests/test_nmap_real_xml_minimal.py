@@ -1,12 +1,14 @@
 """Regression tests for the minimal real Nmap XML parser path."""
 
 import json
+import xml.etree.ElementTree as ET
 from pathlib import Path
 
 import pytest
 
 from mcp_scansage.mcp import reason_codes, schema_registry, server
 from mcp_scansage.services.nmap_parser import MinimalNmapXmlParser
+from mcp_scansage.services.sanitizer import SERVICE_FRAGMENT_CACHE, redact_identifiers
 
 RESOURCE_NAME = "public://nmap/ingest"
 PUBLIC_SCHEMA = "nmap_ingest_public_response_v0.2"
@@ -292,3 +294,94 @@ def test_real_parser_redacts_service_attributes(
     schema_registry.validate(PUBLIC_SCHEMA, response)
     serialized = json.dumps(response)
     assert identifier not in serialized
+
+
+def _reference_details(payload: str) -> list[str]:
+    """Rebuild details the pre-memoization way: redact the assembled string."""
+
+    details = []
+    for host in ET.fromstring(payload).iter("host"):
+        status = host.find("status")
+        if status is not None and status.get("state", "").lower() != "up":
+            continue
+        context = [
+            f"{address.get('addrtype', '').lower()}:{address.get('addr')}"
+            for address in host.findall("address")
+            if address.get("addr")
+            and address.get("addrtype", "").lower() in {"ipv4", "ipv6", "mac"}
+        ]
+        context.extend(
+            f"hostname:{hostname.get('name')}"
+            for hostname in host.iter("hostname")
+            if hostname.get("name")
+        )
+        for port in host.iter("port"):
+            state = port.find("state")
+            service = port.find("service")
+            protocol = port.get("protocol", "").lower()
+            if (
+                protocol not in {"tcp", "udp"}
+                or state is None
+                or state.get("state", "").lower() != "open"
+                or not port.get("portid")
+                or service is None
+                or not service.get("name")
+            ):
+                continue
+            parts = [service.get("name")] + [
+                service.get(attr)
+                for attr in ("product", "version", "extrainfo", "hostname", "ostype")
+                if service.get(attr)
+            ]
+            detail = (
+                f"{' '.join(parts)} service noted on "
+                f"{protocol.upper()}/{port.get('portid')}"
+            )
+            if context:
+                detail = f"{detail} host={'; '.join(context)}"
+            details.append(redact_identifiers(detail))
+    return details
+
+
+@pytest.mark.parametrize(
+    "fixture_name",
+    ["real_parser_example.xml", "strange_service_names.xml", "duplicate_tags.xml"],
+)
+def test_piecewise_redaction_matches_whole_detail_redaction(fixture_name: str) -> None:
+    """Memoized per-fragment redaction must equal redacting the full detail."""
+
+    payload = _load_fixture(fixture_name)
+    result = MinimalNmapXmlParser().parse(payload.encode("utf-8"))
+
+    details = [finding.detail for finding in result.findings]
+    assert details == _reference_details(payload)
+
+
+def test_service_fragments_are_memoized_across_ports() -> None:
+    """Repeated product/version fragments are scanned once per process."""
+
+    ports = "\n".join(
+        f"""      <port protocol="tcp" portid="{number}">
+        <state state="open"/>
+        <service name="http" product="nginx" version="1.21.6"/>
+      </port>"""
+        for number in range(8000, 8020)
+    )
+    payload = f"""<nmaprun>
+  <host>
+    <address addr="192.0.2.5" addrtype="ipv4"/>
+    <ports>
+{ports}
+    </ports>
+  </host>
+</nmaprun>"""
+    SERVICE_FRAGMENT_CACHE.clear()
+
+    result = MinimalNmapXmlParser().parse(payload.encode("utf-8"))
+
+    stats = SERVICE_FRAGMENT_CACHE.stats()
+    assert len(result.findings) == 20
+    assert stats.misses == 1
+    assert stats.hits == 19
+    assert stats.hit_rate == pytest.approx(0.95)
+    assert all("192.0.2.5" not in finding.detail for finding in result.findings)
@@ -0,0 +1,112 @@
+"""Generated Nmap XML corpora: generator shape and parser scaling.
+
+Scaling is asserted on work counts, which are deterministic; the timed
+check lives in ``benchmarks/run_suite.py``.
+"""
+
+from __future__ import annotations
+
+import json
+import xml.etree.ElementTree as ET
+
+import pytest
+from synthetic_payload import (
+    NmapXmlCorpusSpec,
+    generate_nmap_xml,
+)
+
+from mcp_scansage.services import nmap_parser
+from mcp_scansage.services.nmap_limits import DEFAULT_NMAP_LIMITS, NmapLimitConfig
+from mcp_scansage.services.nmap_parser import MinimalNmapXmlParser
+from mcp_scansage.services.sanitizer import IDENTIFIER_PATTERN
+
+SCALE_FACTOR = 8
+"""Size ratio between the small and large scaling documents."""
+
+
+def _limits(document: bytes, spec: NmapXmlCorpusSpec) -> NmapLimitConfig:
+    return DEFAULT_NMAP_LIMITS.with_overrides(
+        {
+            "max_xml_bytes": len(document),
+            "max_hosts": spec.hosts,
+            "max_findings": spec.hosts * spec.ports_per_host + 1,
+            "max_parse_memory_bytes": 1 << 30,
+        }
+    )
+
+
+def _parse_work(hosts: int) -> tuple[int, int]:
+    """Return ``(elements built, findings built)`` for a generated document."""
+
+    spec = NmapXmlCorpusSpec(hosts=hosts, down_host_ratio=0.0, script_output_bytes=64)
+    document = generate_nmap_xml(spec).encode()
+    start = nmap_parser._StreamingTreeBuilder.start
+    elements = 0
+
+    def counting_start(
+        builder: nmap_parser._StreamingTreeBuilder, tag: str, attrs: dict[str, str]
+    ) -> ET.Element:
+        nonlocal elements
+        elements += 1
+        return start(builder, tag, attrs)
+
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(nmap_parser._StreamingTreeBuilder, "start", counting_start)
+        result = MinimalNmapXmlParser().parse(document, _limits(document, spec))
+    return elements, result.findings_count
+
+
+def test_generator_is_seeded_and_shaped_by_the_spec() -> None:
+    spec = NmapXmlCorpusSpec(
+        hosts=200,
+        ports_per_host=3,
+        down_host_ratio=0.25,
+        service_variety=12,
+        script_output_bytes=300,
+        seed=5,
+    )
+    document = generate_nmap_xml(spec)
+    root = ET.fromstring(document)
+    up = [
+        host
+        for host in root.iter("host")
+        if host.find("status").get("state") == "up"  # type: ignore[union-attr]
+    ]
+    services = {
+        (service.get("product"), service.get("version"))
+        for service in root.iter("service")
+    }
+
+    assert document == generate_nmap_xml(spec)
+    assert document != generate_nmap_xml(NmapXmlCorpusSpec(hosts=200, seed=6))
+    assert len(root.findall("host")) == 200
+    assert 120 < len(up) < 180
+    assert len(services) == 12
+    assert all(len(s.get("output", "")) == 300 for s in root.iter("script"))
+    assert all(len(host.find("ports")) == 3 for host in up)  # type: ignore[arg-type]
+
+
+def test_generated_identifiers_never_reach_findings() -> None:
+    spec = NmapXmlCorpusSpec(hosts=40, script_output_bytes=80)
+    document = generate_nmap_xml(spec).encode()
+
+    result = MinimalNmapXmlParser().parse(document, _limits(document, spec))
+
+    assert IDENTIFIER_PATTERN.search(document.decode())
+    assert result.findings_count == 40 * spec.ports_per_host
+    assert not IDENTIFIER_PATTERN.search(
+        json.dumps([finding.to_mapping() for finding in result.findings])
+    )
+
+
+def test_minimal_parser_work_per_host_is_constant() -> None:
+    small = _parse_work(150)
+    double = _parse_work(150 * 2)
+    large = _parse_work(150 * SCALE_FACTOR)
+
+    block_elements = double[0] - small[0]
+    # Every extra block of 150 hosts builds exactly the same elements and
+    # findings, so the parse does a fixed amount of work per host.
+    assert block_elements > 0
+    assert large[0] - small[0] == (SCALE_FACTOR - 1) * block_elements
+    assert large[1] == SCALE_FACTOR * small[1] > 0
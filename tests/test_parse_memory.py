@@ -0,0 +1,180 @@
+"""Per-parse memory budgets and the process-wide parse memory governor."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Iterator
+
+import pytest
+
+from mcp_scansage.mcp import reason_codes, server
+from mcp_scansage.services import nmap_parser, parse_memory
+from mcp_scansage.services.cap_audit import clear_cap_events, get_cap_events
+from mcp_scansage.services.cap_reason import CapReason
+from mcp_scansage.services.nmap_ingest import ingest_nmap_public
+from mcp_scansage.services.nmap_limits import DEFAULT_NMAP_LIMITS, NmapLimitConfig
+from mcp_scansage.services.nmap_parser import (
+    MinimalNmapXmlParser,
+    ParserLimitError,
+    SafeNmapXmlParser,
+    parse_xml_safely,
+)
+from mcp_scansage.services.parse_memory import (
+    RESERVATION_STEP_BYTES,
+    ParseCapacityError,
+    ParseMemoryBudget,
+    ParseMemoryError,
+    ParseMemoryGovernor,
+)
+
+PAYLOAD = (
+    "<nmaprun>"
+    + "".join(
+        f'<host><ports><port protocol="tcp" portid="{port}">'
+        '<state state="open"/><service name="http"/></port></ports></host>'
+        for port in range(1, 40)
+    )
+    + "</nmaprun>"
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_events() -> Iterator[None]:
+    clear_cap_events()
+    yield
+    clear_cap_events()
+
+
+def _limits(**overrides: int) -> NmapLimitConfig:
+    return DEFAULT_NMAP_LIMITS.with_overrides(overrides)
+
+
+def test_budget_charges_elements_attributes_and_text() -> None:
+    budget = ParseMemoryBudget(limit=1 << 20)
+
+    parse_xml_safely(b'<a x="1">hi<b/></a>', budget=budget)
+
+    expected_tree = (
+        2 * parse_memory.ELEMENT_BYTES
+        + parse_memory.ATTRIBUTE_TABLE_BYTES
+        + parse_memory.ATTRIBUTE_BYTES
+        + 1
+        + parse_memory.TEXT_BYTES
+        + 2
+    )
+    assert budget.used == expected_tree + 2 * len(b'<a x="1">hi<b/></a>')
+
+
+def test_budget_aborts_parse_once_spent() -> None:
+    full = ParseMemoryBudget(limit=1 << 20)
+    parse_xml_safely(PAYLOAD.encode(), budget=full)
+    budget = ParseMemoryBudget(limit=full.used // 2)
+
+    with pytest.raises(ParseMemoryError):
+        parse_xml_safely(PAYLOAD.encode(), budget=budget)
+
+    assert budget.limit < budget.used < budget.limit + 1_024
+
+
+def test_parser_reports_parse_memory_cap() -> None:
+    limits = _limits(max_parse_memory_bytes=4_096)
+
+    with pytest.raises(ParserLimitError):
+        MinimalNmapXmlParser().parse(PAYLOAD.encode(), limits)
+
+    (event,) = get_cap_events()
+    assert event["cap_reason"] == CapReason.MAX_PARSE_MEMORY.value
+    assert event["limits"]["max_parse_memory_bytes"] == 4_096
+    assert event["counts_seen"]["parse_memory_bytes"] > 4_096
+    assert parse_memory.PARSE_MEMORY_GOVERNOR.stats().reserved_bytes == 0
+
+
+def test_governor_releases_reservation_after_ingest() -> None:
+    response = ingest_nmap_public(
+        "nmap_xml", PAYLOAD, parser=MinimalNmapXmlParser(), persist_record=False
+    )
+
+    assert response["findings_count"] == 39
+    stats = parse_memory.PARSE_MEMORY_GOVERNOR.stats()
+    assert (stats.reserved_bytes, stats.active_parses) == (0, 0)
+
+
+def test_safe_parser_is_admitted_by_the_governor(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    governor = ParseMemoryGovernor(capacity=RESERVATION_STEP_BYTES)
+    monkeypatch.setattr(nmap_parser, "PARSE_MEMORY_GOVERNOR", governor)
+    limits = _limits(parse_defer_ms=10)
+
+    with governor.admit(1, limits):
+        with pytest.raises(ParseCapacityError):
+            SafeNmapXmlParser().parse(PAYLOAD.encode(), limits)
+    result = SafeNmapXmlParser().parse(PAYLOAD.encode(), limits)
+
+    assert result.parsed is False
+    stats = governor.stats()
+    assert (stats.rejected, stats.reserved_bytes, stats.active_parses) == (1, 0, 0)
+
+
+def test_governor_defers_parse_until_capacity_frees() -> None:
+    governor = ParseMemoryGovernor(capacity=RESERVATION_STEP_BYTES)
+    limits = _limits(parse_defer_ms=5_000)
+    admitted = threading.Event()
+
+    def second_parse() -> None:
+        with governor.admit(1, limits):
+            admitted.set()
+
+    with governor.admit(1, limits):
+        worker = threading.Thread(target=second_parse)
+        worker.start()
+        time.sleep(0.05)
+        assert not admitted.is_set()
+    worker.join(5)
+
+    assert admitted.is_set()
+    stats = governor.stats()
+    assert (stats.deferred, stats.rejected, stats.reserved_bytes) == (1, 0, 0)
+
+
+def test_governor_refuses_parse_after_deferral_window() -> None:
+    governor = ParseMemoryGovernor(capacity=RESERVATION_STEP_BYTES)
+    limits = _limits(parse_defer_ms=10)
+
+    with governor.admit(1, limits):
+        with pytest.raises(ParseCapacityError):
+            with governor.admit(1, limits):
+                pass
+
+    assert governor.stats().rejected == 1
+
+
+def test_running_parse_cannot_extend_past_aggregate_budget() -> None:
+    governor = ParseMemoryGovernor(capacity=RESERVATION_STEP_BYTES)
+
+    with governor.admit(1, _limits()) as budget:
+        with pytest.raises(ParseMemoryError):
+            budget.charge(RESERVATION_STEP_BYTES + 1)
+
+    assert governor.stats().reserved_bytes == 0
+
+
+def test_total_parse_memory_cannot_be_overridden_per_request() -> None:
+    with pytest.raises(ValueError):
+        DEFAULT_NMAP_LIMITS.with_overrides({"max_total_parse_memory_bytes": 1})
+
+
+def test_server_maps_capacity_refusal_to_reason_code(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def refuse(*args: object, **kwargs: object) -> dict[str, object]:
+        raise ParseCapacityError("busy")
+
+    monkeypatch.setattr(server, "ingest_nmap_public", refuse)
+
+    response = server.RESOURCE_REGISTRY["public://nmap/ingest"](
+        {"format": "nmap_xml", "payload": "<nmaprun/>"}
+    )
+
+    assert response["reason"] == reason_codes.PARSE_CAPACITY_EXHAUSTED
@@ -0,0 +1,176 @@
+"""Compressed payloads: gzip+base64 decoding, size and ratio caps."""
+
+from __future__ import annotations
+
+import base64
+import gzip
+from typing import Iterable, Iterator
+
+import pytest
+
+from mcp_scansage.mcp import reason_codes, server
+from mcp_scansage.services.cap_audit import clear_cap_events, get_cap_events
+from mcp_scansage.services.cap_reason import CapReason
+from mcp_scansage.services.nmap_ingest import PayloadTooLargeError, ingest_nmap_public
+from mcp_scansage.services.nmap_limits import NmapLimitConfig
+from mcp_scansage.services.nmap_parser import (
+    MinimalNmapXmlParser,
+    NoopNmapParser,
+    ParsedNmapResult,
+)
+from mcp_scansage.services.payload_encoding import (
+    RATIO_FLOOR_BYTES,
+    GzipBase64Stream,
+)
+from mcp_scansage.services.payload_stream import PayloadSizeError
+
+PAYLOAD = (
+    "<nmaprun>"
+    + "".join(
+        f"<host><status state='up'/><ports><port protocol='tcp' portid='{port}'>"
+        "<state state='open'/><service name='http' product='nginx'/></port>"
+        "</ports></host>"
+        for port in range(1, 60)
+    )
+    + "</nmaprun>"
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_events() -> Iterator[None]:
+    clear_cap_events()
+    yield
+    clear_cap_events()
+
+
+def _encode(text: str) -> str:
+    return base64.b64encode(gzip.compress(text.encode("utf-8"))).decode("ascii")
+
+
+def _ingest(payload: str, **kwargs: object) -> dict[str, object]:
+    return ingest_nmap_public(
+        "nmap_xml",
+        payload,
+        parser=kwargs.pop("parser", MinimalNmapXmlParser()),
+        persist_record=False,
+        payload_encoding="gzip+base64",
+        **kwargs,  # type: ignore[arg-type]
+    )
+
+
+def test_compressed_payload_matches_plain_ingest() -> None:
+    plain = ingest_nmap_public(
+        "nmap_xml", PAYLOAD, parser=MinimalNmapXmlParser(), persist_record=False
+    )
+
+    compressed = _ingest(_encode(PAYLOAD))
+
+    assert len(_encode(PAYLOAD)) < len(PAYLOAD) // 5
+    assert compressed["summary"] == plain["summary"]
+    assert compressed["parsed_findings"] == plain["parsed_findings"]
+
+
+def test_non_streaming_parser_gets_the_inflated_text() -> None:
+    response = _ingest(_encode(PAYLOAD), parser=NoopNmapParser())
+
+    assert response["summary"]["payload_bytes"] == len(PAYLOAD)
+
+
+def test_size_cap_applies_to_inflated_bytes_and_stops_early() -> None:
+    text = "<nmaprun>" + "<x/>" * 200_000 + "</nmaprun>"
+    stream = GzipBase64Stream(_encode(text), max_bytes=100_000, max_ratio=10_000)
+
+    with pytest.raises(PayloadTooLargeError):
+        _ingest(_encode(text), limit_overrides={"max_decompression_ratio": 10_000})
+    with pytest.raises(PayloadSizeError):
+        stream.drain()
+
+    (event,) = get_cap_events()
+    assert event["cap_reason"] == CapReason.MAX_PAYLOAD_BYTES.value
+    assert stream.byte_count < 100_000
+
+
+def test_inflated_bound_follows_the_ratio_and_size_caps() -> None:
+    payload = _encode(PAYLOAD)
+    compressed = GzipBase64Stream(payload, 10**9, 1000).compressed_bytes
+
+    assert GzipBase64Stream(payload, 10**9, 1000).max_inflated_bytes == (
+        1000 * compressed
+    )
+    assert GzipBase64Stream(payload, 10**9, 1).max_inflated_bytes == (RATIO_FLOOR_BYTES)
+    assert GzipBase64Stream(payload, 1000, 1000).max_inflated_bytes == 1000
+
+
+class _HintRecordingParser(MinimalNmapXmlParser):
+    def __init__(self) -> None:
+        super().__init__()
+        self.size_hints: list[int] = []
+
+    def parse_stream(
+        self,
+        chunks: Iterable[str],
+        payload_bytes: int,
+        limits: NmapLimitConfig | None = None,
+    ) -> ParsedNmapResult:
+        self.size_hints.append(payload_bytes)
+        return super().parse_stream(chunks, payload_bytes, limits)
+
+
+def test_compressed_payload_is_admitted_for_its_inflated_bound() -> None:
+    payload = _encode(PAYLOAD)
+    parser = _HintRecordingParser()
+
+    _ingest(payload, parser=parser, limit_overrides={"max_xml_bytes": 8_000_000})
+
+    compressed = GzipBase64Stream(payload, 8_000_000, 100).compressed_bytes
+    assert parser.size_hints == [max(100 * compressed, RATIO_FLOOR_BYTES)]
+    assert parser.size_hints[0] >= len(PAYLOAD) > len(payload)
+
+
+def test_decompression_bomb_is_refused_by_ratio() -> None:
+    bomb = "<nmaprun>" + "<x/>" * 1_000_000 + "</nmaprun>"
+
+    with pytest.raises(PayloadTooLargeError):
+        _ingest(_encode(bomb), limit_overrides={"max_xml_bytes": 8_000_000})
+
+    (event,) = get_cap_events()
+    assert event["cap_reason"] == CapReason.MAX_DECOMPRESSION_RATIO.value
+    assert event["limits"]["max_decompression_ratio"] == 100
+    seen = event["counts_seen"]
+    assert seen["decompressed_bytes"] > 100 * seen["compressed_bytes"]
+    assert seen["decompressed_bytes"] < 1_000_000
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        "not base64!",
+        base64.b64encode(b"plain text").decode(),
+        _encode(PAYLOAD)[:-12],
+        base64.b64encode(gzip.compress(b"<a/>") + b"junk").decode(),
+        base64.b64encode(gzip.compress(b"<a>\xff</a>")).decode(),
+    ],
+)
+def test_malformed_compressed_payloads_are_invalid_input(payload: str) -> None:
+    response = server.RESOURCE_REGISTRY["public://nmap/ingest"](
+        {"format": "nmap_xml", "payload": payload, "payload_encoding": "gzip+base64"}
+    )
+
+    assert response["reason"] == reason_codes.INVALID_INPUT
+
+
+def test_resources_accept_payload_encoding(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("SCANSAGE_NMAP_XML_PARSER", "real_minimal")
+    request = {"payload": _encode(PAYLOAD), "payload_encoding": "gzip+base64"}
+
+    alias = server.RESOURCE_REGISTRY["ingest_nmap_xml"](request)
+    ingest = server.RESOURCE_REGISTRY["public://nmap/ingest"](
+        {"format": "nmap_xml", **request}
+    )
+
+    unknown = server.RESOURCE_REGISTRY["public://nmap/ingest"](
+        {"format": "nmap_xml", "payload": "<a/>", "payload_encoding": "zstd"}
+    )
+
+    assert alias["findings_count"] == ingest["findings_count"] == 59
+    assert unknown["reason"] == reason_codes.INVALID_INPUT
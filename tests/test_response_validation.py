@@ -0,0 +1,178 @@
+"""Response validation modes: strict, sampled and off."""
+
+from __future__ import annotations
+
+import json
+import signal
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from jsonschema import Draft7Validator
+
+from mcp_scansage.mcp import reason_codes, schema_registry, server
+from mcp_scansage.mcp.response_validation import (
+    OFF_MODE,
+    RESPONSE_SAMPLE_EVERY_ENV,
+    RESPONSE_VALIDATION_ENV,
+    RESPONSE_VALIDATOR,
+    SAMPLED_MODE,
+    STRICT_MODE,
+    VIOLATION_EVENT,
+    ResponseValidationConfig,
+    ResponseValidator,
+    get_validation_config,
+    reload_validation_config,
+)
+from mcp_scansage.services.audit_log import (
+    AuditConfig,
+    reset_audit_config,
+    set_audit_config,
+)
+
+FIXTURE_DIR = Path(__file__).resolve().parent / "fixtures" / "nmap_xml"
+PUBLIC_SCHEMA = "nmap_ingest_public_response_v0.2"
+VALID_RESPONSE = schema_registry.get_example("nmap_ingest_public_response_example_v0.2")
+INVALID_RESPONSE = {**VALID_RESPONSE, "parsed_findings": [{"title": "x"}]}
+
+
+@pytest.fixture
+def audit_file(tmp_path: Path) -> Iterator[Path]:
+    path = tmp_path / "audit.jsonl"
+    set_audit_config(AuditConfig(audit_file=path, max_bytes=None))
+    yield path
+    reset_audit_config()
+
+
+def _events(path: Path) -> list[dict[str, object]]:
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+@pytest.mark.parametrize(
+    ("mode", "every", "expected"),
+    [
+        (None, None, ResponseValidationConfig(STRICT_MODE, 100)),
+        ("SAMPLED", "7", ResponseValidationConfig(SAMPLED_MODE, 7)),
+        ("off", "0", ResponseValidationConfig(OFF_MODE, 1)),
+        ("lenient", "many", ResponseValidationConfig(STRICT_MODE, 100)),
+    ],
+)
+def test_config_from_env(
+    monkeypatch: pytest.MonkeyPatch,
+    mode: str | None,
+    every: str | None,
+    expected: ResponseValidationConfig,
+) -> None:
+    for env, value in (
+        (RESPONSE_VALIDATION_ENV, mode),
+        (RESPONSE_SAMPLE_EVERY_ENV, every),
+    ):
+        if value is None:
+            monkeypatch.delenv(env, raising=False)
+        else:
+            monkeypatch.setenv(env, value)
+
+    assert ResponseValidationConfig.from_env() == expected
+
+
+def test_check_uses_the_snapshot_until_reload(
+    monkeypatch: pytest.MonkeyPatch, audit_file: Path
+) -> None:
+    monkeypatch.setenv(RESPONSE_VALIDATION_ENV, OFF_MODE)
+    reload_validation_config()
+    monkeypatch.setenv(RESPONSE_VALIDATION_ENV, STRICT_MODE)
+    validator = ResponseValidator()
+
+    assert validator.check(PUBLIC_SCHEMA, INVALID_RESPONSE)
+    assert get_validation_config().mode == OFF_MODE
+
+    server._reload_on_signal(getattr(signal, "SIGHUP", 1), None)
+
+    assert get_validation_config().mode == STRICT_MODE
+    assert not validator.check(PUBLIC_SCHEMA, INVALID_RESPONSE)
+
+
+def test_sampled_mode_validates_one_in_n(audit_file: Path) -> None:
+    validator = ResponseValidator()
+    config = ResponseValidationConfig(SAMPLED_MODE, 3)
+
+    verdicts = [
+        validator.check(PUBLIC_SCHEMA, INVALID_RESPONSE, config) for _ in range(7)
+    ]
+
+    assert verdicts == [False, True, True, False, True, True, False]
+    stats = validator.stats()
+    assert (stats.validated, stats.skipped, stats.violations) == (3, 4, 3)
+    events = _events(audit_file)
+    assert [event["event"] for event in events] == [VIOLATION_EVENT] * 3
+    assert events[0]["schema"] == PUBLIC_SCHEMA
+    assert events[0]["mode"] == SAMPLED_MODE
+    assert "parsed_findings" not in json.dumps(events)
+
+
+def test_off_mode_skips_validation(audit_file: Path) -> None:
+    validator = ResponseValidator()
+    config = ResponseValidationConfig(OFF_MODE)
+
+    assert validator.check(PUBLIC_SCHEMA, INVALID_RESPONSE, config)
+    assert validator.stats().skipped == 1
+    assert _events(audit_file) == []
+
+
+def test_strict_mode_counts_clean_responses(audit_file: Path) -> None:
+    validator = ResponseValidator()
+
+    assert validator.check(PUBLIC_SCHEMA, VALID_RESPONSE, ResponseValidationConfig())
+    assert validator.stats().validated == 1
+    assert validator.stats().violations == 0
+
+
+@pytest.mark.parametrize(
+    ("mode", "expect_error"), [(STRICT_MODE, True), (OFF_MODE, False)]
+)
+def test_ingest_resource_honours_mode(
+    monkeypatch: pytest.MonkeyPatch,
+    audit_file: Path,
+    mode: str,
+    expect_error: bool,
+) -> None:
+    monkeypatch.setenv(RESPONSE_VALIDATION_ENV, mode)
+    reload_validation_config()
+    monkeypatch.setattr(
+        server, "ingest_nmap_public", lambda *args, **kwargs: dict(INVALID_RESPONSE)
+    )
+    RESPONSE_VALIDATOR.reset()
+
+    response = server.RESOURCE_REGISTRY["public://nmap/ingest"](
+        {"format": "nmap_xml", "payload": "<nmaprun/>"}
+    )
+
+    if expect_error:
+        assert response["reason"] == reason_codes.RESPONSE_VALIDATION_FAILED
+        assert RESPONSE_VALIDATOR.stats().violations == 1
+    else:
+        assert response["parsed_findings"] == [{"title": "x"}]
+        assert RESPONSE_VALIDATOR.stats().skipped == 1
+
+
+@pytest.mark.parametrize("fixture", sorted(p.name for p in FIXTURE_DIR.glob("*.xml")))
+def test_responses_meet_contract_with_validation_off(
+    monkeypatch: pytest.MonkeyPatch, fixture: str
+) -> None:
+    """Contract test backing ``off`` mode: built responses satisfy the schema."""
+
+    monkeypatch.setenv(RESPONSE_VALIDATION_ENV, OFF_MODE)
+    monkeypatch.setenv("SCANSAGE_NMAP_XML_PARSER", "real_minimal")
+    reload_validation_config()
+    payload = (FIXTURE_DIR / fixture).read_text(encoding="utf-8")
+
+    response = server.RESOURCE_REGISTRY["public://nmap/ingest"](
+        {"format": "nmap_xml", "payload": payload}
+    )
+
+    if response.get("status"):
+        assert response["reason"] != reason_codes.RESPONSE_VALIDATION_FAILED
+        return
+    Draft7Validator(schema_registry.get_schema(PUBLIC_SCHEMA)).validate(response)
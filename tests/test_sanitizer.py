@@ -0,0 +1,247 @@
+"""Equivalence and complexity tests for identifier redaction."""
+
+from __future__ import annotations
+
+import random
+import re
+from pathlib import Path
+
+import pytest
+
+from mcp_scansage.services.sanitizer import (
+    IDENTIFIER_PATTERN,
+    IDENTIFIER_PATTERNS,
+    RAW_PATH_PATTERN,
+    RedactionCache,
+    redact_identifiers,
+    sanitize_public_payload,
+    sanitize_public_response,
+)
+
+FIXTURE_DIR = Path(__file__).resolve().parent / "fixtures" / "nmap_xml"
+_ATTRIBUTE_VALUE = re.compile(r'"([^"]*)"')
+
+LEGACY_IDENTIFIER_PATTERN = re.compile(
+    "|".join(
+        [
+            r"(?:\b(?:\d{1,3}\.){3}\d{1,3}\b)",
+            r"(?:\b[0-9a-f]{1,4}(?::[0-9a-f]{1,4}){2,7}\b)",
+            r"(?:\b[0-9a-f]{1,4}(?::[0-9a-f]{1,4})*::"
+            r"(?:[0-9a-f]{1,4}(?::[0-9a-f]{1,4})*)?\b)",
+            r"(?:\b(?:[0-9a-f]{2}[:-]){5}[0-9a-f]{2}\b)",
+            r"(?:\b[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.[a-z]{2,}\b)",
+        ]
+    ),
+    re.IGNORECASE,
+)
+"""The pre-hardening alternation (unbounded ``::`` prefix) used as the oracle."""
+
+
+def _reference_redact(value: str) -> str:
+    return IDENTIFIER_PATTERN.sub("[redacted]", value)
+
+
+def _corpus_strings() -> list[str]:
+    """Every attribute value and line from the noisy XML fixtures."""
+
+    strings: list[str] = []
+    for path in sorted(FIXTURE_DIR.glob("*.xml")):
+        text = path.read_text(encoding="utf-8")
+        strings.append(text)
+        strings.extend(text.splitlines())
+        strings.extend(_ATTRIBUTE_VALUE.findall(text))
+    return strings
+
+
+_DEFAULT_ALPHABET = "0123456789abcdefxyzABCDEF.:- _/;=ıſK٠"
+
+
+def _random_strings(count: int, alphabet: str = _DEFAULT_ALPHABET) -> list[str]:
+    rng = random.Random(1234)
+    return [
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["Port 22 open", "ssh service noted on TCP/22", "", "Request failed validation"],
+)
+def test_separator_free_strings_skip_the_regex(value: str) -> None:
+    assert redact_identifiers(value) is value
+
+
+def test_redaction_matches_regex_on_fixture_corpus() -> None:
+    for value in _corpus_strings():
+        assert redact_identifiers(value) == _reference_redact(value)
+
+
+def test_redaction_matches_regex_on_random_strings() -> None:
+    for value in _random_strings(5_000):
+        assert redact_identifiers(value) == _reference_redact(value)
+
+
+def test_hardened_pattern_matches_legacy_on_fixture_corpus() -> None:
+    for value in _corpus_strings():
+        assert IDENTIFIER_PATTERN.sub("[redacted]", value) == (
+            LEGACY_IDENTIFIER_PATTERN.sub("[redacted]", value)
+        )
+
+
+def test_hardened_pattern_matches_legacy_on_ipv6_heavy_strings() -> None:
+    for value in _random_strings(20_000, alphabet="0123456789abcdefAg::::...-- _x"):
+        assert redact_identifiers(value) == (
+            LEGACY_IDENTIFIER_PATTERN.sub("[redacted]", value)
+        )
+
+
+@pytest.mark.parametrize("branch", IDENTIFIER_PATTERNS)
+def test_identifier_branches_cannot_backtrack_before_compression(branch: str) -> None:
+    # Unbounded repetition is only allowed after a compressed IPv6 "::",
+    # where it consumes what it scans; anything before it is fixed-width.
+    prefix = branch.split(")?::", 1)[0]
+
+    assert "*" not in prefix
+    assert "+" not in prefix
+
+
+def test_compressed_ipv6_branch_allows_one_group_before_the_gap() -> None:
+    (branch,) = [branch for branch in IDENTIFIER_PATTERNS if ")?::" in branch]
+
+    assert branch.startswith(r"(?:\b[0-9a-f]{1,4}(?::[0-9a-f]{1,4})?::")
+
+
+def test_redaction_cache_counts_hits_and_misses() -> None:
+    cache = RedactionCache(max_entries=8)
+
+    first = cache.redact("OpenSSH 8.9 web01.example.com")
+    second = cache.redact("OpenSSH 8.9 web01.example.com")
+    cache.redact("nginx 1.21")
+
+    stats = cache.stats()
+    assert first == second == redact_identifiers("OpenSSH 8.9 web01.example.com")
+    assert (stats.hits, stats.misses, stats.entries) == (1, 2, 2)
+    assert stats.hit_rate == pytest.approx(1 / 3)
+
+
+def test_redaction_cache_evicts_least_recently_used() -> None:
+    cache = RedactionCache(max_entries=2)
+
+    cache.redact("alpha 1.0")
+    cache.redact("beta 2.0")
+    cache.redact("alpha 1.0")
+    cache.redact("gamma 3.0")
+    cache.redact("alpha 1.0")
+
+    stats = cache.stats()
+    assert stats.entries == 2
+    assert stats.evictions == 1
+    assert stats.hits == 2
+
+
+def test_redaction_cache_respects_memory_cap() -> None:
+    cache = RedactionCache(max_entries=1_000, max_bytes=2_000)
+
+    for index in range(100):
+        cache.redact(f"product-{index} version {index}.0")
+    cache.redact("x." * 5_000)
+
+    stats = cache.stats()
+    assert 0 < stats.bytes <= 2_000
+    assert stats.evictions > 0
+    assert stats.entries < 100
+
+
+def _nested_response() -> dict[str, object]:
+    return {
+        "operation": "nmap_ingest",
+        "ingest_id": "0" * 32,
+        "summary": {"payload_bytes": 42, "payload_sha256": "a" * 64, "parsed": True},
+        "next_steps": ["Await a dedicated parser before acting on any findings."],
+        "findings_count": 2,
+        "parsed_findings": [
+            {"title": "Port 22 open", "severity": "info", "detail": "ssh on TCP/22"},
+            {"title": "Port 80 open", "severity": "info", "detail": "http on TCP/80"},
+        ],
+        "metadata": {"caps": {"findings_truncated": False, "limits": (1, 2)}},
+    }
+
+
+def test_sanitize_public_payload_returns_clean_payload_unchanged() -> None:
+    payload = _nested_response()
+
+    assert sanitize_public_payload(payload) is payload
+
+
+def test_sanitize_public_payload_copies_only_changed_paths() -> None:
+    payload = _nested_response()
+    findings = payload["parsed_findings"]
+    findings[1]["detail"] = "http on TCP/80 host=ipv4:192.0.2.7 via /home/scan"
+
+    sanitized = sanitize_public_payload(payload)
+
+    assert sanitized is not payload
+    assert sanitized["parsed_findings"][1]["detail"] == (
+        "http on TCP/80 host=ipv4:[redacted] via [redacted]scan"
+    )
+    assert sanitized["parsed_findings"][0] is findings[0]
+    assert sanitized["summary"] is payload["summary"]
+    assert sanitized["metadata"] is payload["metadata"]
+    assert sanitized["metadata"]["caps"]["limits"] == (1, 2)
+    assert sanitized["findings_count"] == 2
+    assert "192.0.2.7" in findings[1]["detail"]
+
+
+def test_sanitize_public_payload_skips_safe_keys_and_preserves_types() -> None:
+    digest = "ab" * 32
+    payload = {
+        "payload_sha256": digest,
+        "ingest_id": "12345678-9abc-def0-1234-56789abcdef0",
+        "count": 3,
+        "ratio": 0.5,
+        "flag": None,
+        "pair": ("10.0.0.1", 7),
+    }
+
+    sanitized = sanitize_public_payload(payload)
+
+    assert sanitized["payload_sha256"] == digest
+    assert sanitized["ingest_id"] == payload["ingest_id"]
+    assert sanitized["pair"] == ("[redacted]", 7)
+    assert isinstance(sanitized["pair"], tuple)
+    assert (sanitized["count"], sanitized["ratio"], sanitized["flag"]) == (3, 0.5, None)
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["deadbeef.example.com", "10.0.0.1", "AB" * 32, "ab" * 32 + " 10.0.0.1"],
+)
+def test_sanitize_public_payload_scrubs_malformed_safe_keys(value: str) -> None:
+    payload = {"payload_sha256": value, "nested": {"ingest_id": value}}
+
+    sanitized = sanitize_public_payload(payload)
+
+    assert (
+        sanitized["payload_sha256"]
+        == sanitize_public_response(payload)["payload_sha256"]
+    )
+    assert sanitized["nested"]["ingest_id"] == sanitized["payload_sha256"]
+    assert "example.com" not in str(sanitized) and "10.0.0.1" not in str(sanitized)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_sanitize_public_payload_matches_flat_sanitizer(seed: int) -> None:
+    rng = random.Random(seed)
+    alphabet = "ab01:./-\\ eh"
+    payload = {
+        f"k{index}": "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 24)))
+        for index in range(500)
+    }
+
+    assert sanitize_public_payload(payload) == sanitize_public_response(payload)
+    for value in payload.values():
+        expected = IDENTIFIER_PATTERN.sub(
+            "[redacted]", RAW_PATH_PATTERN.sub("[redacted]", value)
+        )
+        assert sanitize_public_payload(value) == expected
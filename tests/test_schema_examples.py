@@ -5,12 +5,18 @@ from mcp_scansage.mcp import schema_registry
 SCHEMA_EXAMPLE_MAP = {
     "nmap_ingest_input_v0.1": "nmap_ingest_input_example_min",
     "nmap_ingest_input_v0.2": "nmap_ingest_input_example_v0.2",
+    "nmap_ingest_input_v0.3": "nmap_ingest_input_example_v0.3",
     "nmap_ingest_nmap_xml_input_v0.1": "nmap_ingest_nmap_xml_input_example_min",
     "nmap_ingest_public_response_v0.1": "nmap_ingest_public_response_example_min",
     "nmap_ingest_public_response_v0.2": "nmap_ingest_public_response_example_v0.2",
     "nmap_ingests_list_response_v0.1": "nmap_ingests_list_response_example_min",
     "nmap_ingest_get_response_v0.1": "nmap_ingest_get_response_example_min",
     "nmap_parsed_findings_v0.1": "nmap_parsed_findings_example_min",
+    "nmap_upload_begin_input_v0.1": "nmap_upload_begin_input_example_min",
+    "nmap_upload_chunk_input_v0.1": "nmap_upload_chunk_input_example_min",
+    "nmap_upload_commit_input_v0.1": "nmap_upload_commit_input_example_min",
+    "nmap_upload_status_input_v0.1": "nmap_upload_status_input_example_min",
+    "nmap_upload_status_response_v0.1": "nmap_upload_status_response_example_min",
 }
 
 
@@ -20,3 +26,17 @@ def test_all_examples_validate_against_their_schemas() -> None:
     for schema_name, example_name in SCHEMA_EXAMPLE_MAP.items():
         example = schema_registry.get_example(example_name)
         schema_registry.validate(schema_name, example)
+
+
+def test_validators_are_compiled_once_and_cached() -> None:
+    """Validation reuses one compiled validator per schema name."""
+
+    assert schema_registry.precompile_validators() == len(schema_registry.SCHEMA_FILES)
+    validator = schema_registry.get_validator("nmap_ingest_input_v0.1")
+
+    schema_registry.validate(
+        "nmap_ingest_input_v0.1",
+        schema_registry.get_example("nmap_ingest_input_example_min"),
+    )
+
+    assert schema_registry.get_validator("nmap_ingest_input_v0.1") is validator
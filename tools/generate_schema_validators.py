@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+"""Generate specialized Python validators from the JSON schemas in ``schemas/``.
+
+The output module (``src/mcp_scansage/mcp/generated_validators.py``) contains
+one straight-line function per registered schema. It implements only the
+Draft 7 keywords our schemas use, with jsonschema's semantics (``format`` is
+an annotation, ``$ref`` siblings are ignored, booleans are not integers);
+any other keyword aborts generation instead of being skipped silently.
+
+Usage:
+    python tools/generate_schema_validators.py           # rewrite the module
+    python tools/generate_schema_validators.py --check   # exit 1 when stale
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Any, Mapping
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from mcp_scansage.mcp import schema_registry  # noqa: E402
+
+LINE_LENGTH = 88
+"""Matches the ruff line length so the output is already formatter-clean."""
+
+OUTPUT_PATH = ROOT / "src" / "mcp_scansage" / "mcp" / "generated_validators.py"
+
+TYPE_CHECKS = {
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, list)",
+    "string": "isinstance({v}, str)",
+    "integer": "_is_integer({v})",
+    "number": "_is_number({v})",
+    "boolean": "isinstance({v}, bool)",
+    "null": "{v} is None",
+}
+
+KEYWORD_TYPES = {
+    "const": None,
+    "enum": None,
+    "minLength": "string",
+    "maxLength": "string",
+    "pattern": "string",
+    "minimum": "number",
+    "maximum": "number",
+    "minItems": "array",
+    "maxItems": "array",
+    "items": "array",
+    "required": "object",
+    "properties": "object",
+    "additionalProperties": "object",
+}
+"""Supported assertion keywords and the instance type each one applies to."""
+
+ANNOTATIONS = {"$comment", "$schema", "title", "description", "format", "examples"}
+"""Keywords that never affect Draft 7 validation (no format checker is used)."""
+
+CONTAINERS = {"type", "definitions", "$defs"}
+"""Keywords handled outside the per-keyword dispatch."""
+
+HEADER = '''"""Specialized validators for the JSON schemas in ``schemas/``.
+
+Generated by ``tools/generate_schema_validators.py``; do not edit by hand.
+"""
+
+# ruff: noqa: C901 - generated validators are deliberately straight-line code.
+
+from __future__ import annotations
+
+import numbers
+import re
+from typing import Any, Callable, NoReturn
+
+from jsonschema import ValidationError
+
+_MISSING = object()
+
+
+def _fail(base: str, suffix: str, message: str) -> NoReturn:
+    raise ValidationError(f"{base}{suffix}: {message}")
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, numbers.Number) and not isinstance(value, bool)
+
+
+def _is_integer(value: Any) -> bool:
+    # Draft 7 treats integral floats such as 1.0 as integers.
+    if isinstance(value, float):
+        return value.is_integer()
+    return isinstance(value, int) and not isinstance(value, bool)
+'''
+
+
+class _Function:
+    """Lines and local-name counter for one generated function."""
+
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+        self.counter = 0
+
+    def fresh(self, prefix: str) -> str:
+        self.counter += 1
+        return f"{prefix}{self.counter}"
+
+
+COMPARISONS = {
+    "minLength": ("len({v}) < {x}", "is too short"),
+    "maxLength": ("len({v}) > {x}", "is too long"),
+    "minimum": ("{v} < {x}", "is less than the minimum of {x}"),
+    "maximum": ("{v} > {x}", "is more than the maximum of {x}"),
+    "minItems": ("len({v}) < {x}", "is too short"),
+    "maxItems": ("len({v}) > {x}", "is too long"),
+}
+"""Keywords that reduce to a single comparison, with their failure message."""
+
+
+class _Generator:
+    """Emit the validator functions and constants for one registered schema."""
+
+    def __init__(self, name: str, schema: Mapping[str, Any]) -> None:
+        self.name = name
+        self.root = schema
+        self.slug = re.sub(r"\W", "_", name)
+        self.constants: list[str] = []
+        self.functions: list[str] = []
+        self.refs: dict[str, str] = {}
+        self.handlers = {
+            "const": self.emit_const,
+            "enum": self.emit_enum,
+            "pattern": self.emit_pattern,
+            "items": self.emit_items,
+            "required": self.emit_required,
+            "properties": self.emit_properties,
+            "additionalProperties": self.emit_additional,
+        }
+
+    def constant_name(self, kind: str) -> str:
+        return f"_{kind}_{self.slug.upper()}_{len(self.constants) + 1}"
+
+    def keys_constant(self, values: list[str]) -> str:
+        name = self.constant_name("KEYS")
+        body = "".join(f"        {_literal(value)},\n" for value in values)
+        self.constants.append(f"{name} = frozenset(\n    {{\n{body}    }}\n)")
+        return name
+
+    def build(self) -> str:
+        entry = f"validate_{self.slug}"
+        self.emit_function(entry, self.root, public=True)
+        return entry
+
+    def emit_function(
+        self, func_name: str, schema: Mapping[str, Any], *, public: bool = False
+    ) -> None:
+        function = _Function()
+        self.emit(function, schema, "v", [], 1)
+        lines = []
+        if public:
+            lines.append(f'def {func_name}(instance: Any, p: str = "$") -> None:')
+            lines.append(f'    """Validate ``instance`` against ``{self.name}``."""')
+            lines.append("")
+            lines.append("    v = instance")
+        else:
+            lines.append(f"def {func_name}(v: Any, p: str) -> None:")
+        lines.extend(function.lines or ["    return None"])
+        self.functions.append("\n".join(lines) + "\n")
+
+    def ref_function(self, ref: str) -> str:
+        if ref not in self.refs:
+            match = re.fullmatch(r"#/(definitions|\$defs)/(\w+)", ref)
+            if match is None:
+                raise NotImplementedError(f"{self.name}: unsupported $ref {ref!r}")
+            self.refs[ref] = f"_{self.slug}__{match.group(2)}"
+            target = self.root[match.group(1)][match.group(2)]
+            self.emit_function(self.refs[ref], target)
+        return self.refs[ref]
+
+    def emit(
+        self,
+        function: _Function,
+        schema: Mapping[str, Any],
+        var: str,
+        path: list[str],
+        depth: int,
+    ) -> None:
+        out = function.lines
+        pad = "    " * depth
+        ref = schema.get("$ref")
+        if ref is not None:
+            # Draft 7 ignores every keyword next to "$ref".
+            target = self.ref_function(ref)
+            args = f"{var}, {_path_expr(path, prefix='p')}"
+            call = f"{pad}{target}({args})"
+            out.extend(
+                [call]
+                if _fits(call)
+                else [f"{pad}{target}(", f"{pad}    {args}", f"{pad})"]
+            )
+            return
+        unknown = set(schema) - set(KEYWORD_TYPES) - ANNOTATIONS - CONTAINERS
+        if unknown:
+            raise NotImplementedError(f"{self.name}: unsupported {sorted(unknown)}")
+
+        declared = schema.get("type")
+        types = [declared] if isinstance(declared, str) else declared
+        if types is not None:
+            checks = [TYPE_CHECKS[t].format(v=var) for t in types]
+            check = " or ".join(checks)
+            if len(checks) > 1 or not re.fullmatch(r"\w+\(.*\)", check):
+                check = f"({check})"
+            out.append(f"{pad}if not {check}:")
+            self.fail(out, depth + 1, path, f"is not of type {types!r}")
+
+        for keyword, applies_to in KEYWORD_TYPES.items():
+            if keyword not in schema:
+                continue
+            if applies_to is None or types == [applies_to]:
+                self.emit_keyword(function, keyword, schema, var, path, depth)
+                continue
+            if types is not None and not _type_overlaps(applies_to, types):
+                continue
+            out.append(f"{pad}if {TYPE_CHECKS[applies_to].format(v=var)}:")
+            self.emit_keyword(function, keyword, schema, var, path, depth + 1)
+
+    def emit_keyword(
+        self,
+        function: _Function,
+        keyword: str,
+        schema: Mapping[str, Any],
+        var: str,
+        path: list[str],
+        depth: int,
+    ) -> None:
+        comparison = COMPARISONS.get(keyword)
+        if comparison is None:
+            self.handlers[keyword](function, schema, var, path, depth)
+            return
+        limit = _literal(schema[keyword])
+        condition, message = comparison
+        function.lines.append(f"{'    ' * depth}if {condition.format(v=var, x=limit)}:")
+        self.fail(function.lines, depth + 1, path, message.format(x=limit))
+
+    def emit_const(self, function, schema, var, path, depth) -> None:
+        value = schema["const"]
+        function.lines.append(f"{'    ' * depth}if {_mismatch(var, value)}:")
+        self.fail(function.lines, depth + 1, path, f"was expected to be {value!r}")
+
+    def emit_enum(self, function, schema, var, path, depth) -> None:
+        values = list(schema["enum"])
+        if all(isinstance(value, str) for value in values):
+            name = self.constant_name("ENUM")
+            items = [_literal(value) for value in values]
+            if len(items) > 1:
+                body = "".join(f"    {item},\n" for item in items)
+                self.constants.append(f"{name} = (\n{body})")
+            else:
+                self.constants.append(f"{name} = ({items[0]},)")
+            condition = f"{var} not in {name}"
+        else:
+            condition = " and ".join(f"({_mismatch(var, v)})" for v in values)
+        function.lines.append(f"{'    ' * depth}if {condition}:")
+        self.fail(function.lines, depth + 1, path, "is not one of the allowed values")
+
+    def emit_pattern(self, function, schema, var, path, depth) -> None:
+        name = self.constant_name("PATTERN")
+        self.constants.append(f"{name} = re.compile({_literal(schema['pattern'])})")
+        function.lines.append(f"{'    ' * depth}if not {name}.search({var}):")
+        self.fail(function.lines, depth + 1, path, "does not match the pattern")
+
+    def emit_items(self, function, schema, var, path, depth) -> None:
+        items = schema["items"]
+        if not isinstance(items, Mapping):
+            raise NotImplementedError(f"{self.name}: tuple-form items")
+        index, item = function.fresh("i"), function.fresh("v")
+        body = _Function()
+        body.counter = function.counter
+        self.emit(body, items, item, [*path, f"[{{{index}}}]"], depth + 1)
+        function.counter = body.counter
+        if body.lines:
+            pad = "    " * depth
+            function.lines.append(f"{pad}for {index}, {item} in enumerate({var}):")
+            function.lines.extend(body.lines)
+
+    def emit_required(self, function, schema, var, path, depth) -> None:
+        name = self.keys_constant(list(schema["required"]))
+        function.lines.append(f"{'    ' * depth}if not {name} <= {var}.keys():")
+        self.fail(function.lines, depth + 1, path, "is missing a required property")
+
+    def emit_properties(self, function, schema, var, path, depth) -> None:
+        pad = "    " * depth
+        for key, subschema in schema["properties"].items():
+            child = function.fresh("v")
+            body = _Function()
+            body.counter = function.counter
+            self.emit(body, subschema, child, [*path, f".{key}"], depth + 1)
+            function.counter = body.counter
+            if not body.lines:
+                continue
+            function.lines.append(
+                f"{pad}{child} = {var}.get({_literal(key)}, _MISSING)"
+            )
+            function.lines.append(f"{pad}if {child} is not _MISSING:")
+            function.lines.extend(body.lines)
+
+    def emit_additional(self, function, schema, var, path, depth) -> None:
+        additional = schema["additionalProperties"]
+        if additional is True or additional == {}:
+            return
+        if additional is not False:
+            raise NotImplementedError(f"{self.name}: schema additionalProperties")
+        name = self.keys_constant(list(schema.get("properties", {})))
+        function.lines.append(f"{'    ' * depth}if not {var}.keys() <= {name}:")
+        self.fail(function.lines, depth + 1, path, "has unexpected properties")
+
+    def fail(self, out: list[str], depth: int, path: list[str], message: str) -> None:
+        pad = "    " * depth
+        out.append(f"{pad}_fail(")
+        out.append(f"{pad}    p,")
+        out.append(f"{pad}    {_path_expr(path)},")
+        out.append(f"{pad}    {_literal(message)},")
+        out.append(f"{pad})")
+
+
+def _literal(value: Any) -> str:
+    """Python source for a JSON scalar, using double-quoted strings."""
+
+    if isinstance(value, str):
+        return json.dumps(value)
+    return repr(value)
+
+
+def _mismatch(var: str, value: Any) -> str:
+    """Condition that is true when ``var`` is not JSON-equal to ``value``."""
+
+    if isinstance(value, str):
+        return f"{var} != {_literal(value)}"
+    if value is None or isinstance(value, bool):
+        return f"{var} is not {value!r}"
+    if isinstance(value, (int, float)):
+        return f"isinstance({var}, bool) or {var} != {value!r}"
+    raise NotImplementedError(f"unsupported const/enum value {value!r}")
+
+
+def _fits(line: str) -> bool:
+    return len(line) <= LINE_LENGTH
+
+
+def _dict_entry(key: str, value: str) -> str:
+    """One dict display entry, parenthesizing values that overflow the line."""
+
+    line = f"    {_literal(key)}: {value},"
+    if _fits(line):
+        return line + "\n"
+    return f"    {_literal(key)}: (\n        {value}\n    ),\n"
+
+
+def _type_overlaps(applies_to: str, types: list[str]) -> bool:
+    if applies_to in types:
+        return True
+    return applies_to == "number" and "integer" in types
+
+
+def _path_expr(path: list[str], prefix: str = "") -> str:
+    """Python expression for the JSON path suffix (plus ``prefix`` if given)."""
+
+    suffix = "".join(path)
+    dynamic = "{" in suffix
+    if prefix:
+        if not suffix:
+            return prefix
+        return (
+            f'f"{{{prefix}}}{suffix}"' if dynamic else f"{prefix} + {_literal(suffix)}"
+        )
+    return f'f"{suffix}"' if dynamic else _literal(suffix)
+
+
+def generate_module_source() -> str:
+    """Return the full source of the generated validators module."""
+
+    constants: list[str] = []
+    functions: list[str] = []
+    entries: list[tuple[str, str]] = []
+    for name in schema_registry.SCHEMA_FILES:
+        generator = _Generator(name, schema_registry.get_schema(name))
+        entries.append((name, generator.build()))
+        constants.extend(generator.constants)
+        functions.extend(generator.functions)
+
+    parts = [HEADER]
+    parts.append("\n".join(constants) + "\n")
+    parts.append("\n\n".join(functions))
+    table = "".join(f'    "{name}": {entry},\n' for name, entry in entries)
+    digests = "".join(
+        _dict_entry(name, _literal(schema_registry.schema_digest(name)))
+        for name, _ in entries
+    )
+    parts.append(
+        "VALIDATORS: dict[str, Callable[[Any], None]] = {\n" + table + "}\n"
+        '"""Generated validator per ``schema_registry.SCHEMA_FILES`` name."""\n'
+    )
+    parts.append(
+        "SCHEMA_DIGESTS = {\n" + digests + "}\n"
+        '"""Digest of each schema at generation time, used to detect staleness."""\n'
+    )
+    return "\n\n".join(parts)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit non-zero when the generated module is out of date.",
+    )
+    args = parser.parse_args(argv)
+    source = generate_module_source()
+    if args.check:
+        exists = OUTPUT_PATH.exists()
+        if not exists or OUTPUT_PATH.read_text(encoding="utf-8") != source:
+            sys.stdout.write(f"{OUTPUT_PATH.relative_to(ROOT)} is out of date.\n")
+            return 1
+        return 0
+    OUTPUT_PATH.write_text(source, encoding="utf-8")
+    sys.stdout.write(f"Wrote {OUTPUT_PATH.relative_to(ROOT)}\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())